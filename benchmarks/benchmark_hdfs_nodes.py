@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 23:59:12 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Benchmark of the field selective decoding of the NameNode JMX LiveNodes (see lib_hdfs_nodes.py) against fully decoding
+it with the JSON backend the plugins used previously (see lib_json.py), on generated payloads of each of the given
+numbers of datanodes (see lib_fixtures.py)
+
+Decodes the field used by each of the HDFS plugins:
+
+    usedSpace   - check_hadoop_hdfs_balance.py
+    numBlocks   - check_hadoop_datanodes_block_balance.py
+    lastContact - check_hadoop_datanode_last_contact.py
+
+and iterates the node names and values as the plugins do, --runs times taking the fastest, then again under tracemalloc
+for the peak memory allocated, and outputs a table of the times, peak memory and the savings.
+
+Also verifies both return identical node names and values, exiting CRITICAL if not.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import os
+import sys
+import time
+import tracemalloc
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+plugins_dir = os.path.dirname(srcdir)
+sys.path.append(libdir)
+sys.path.append(plugins_dir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon import CLI
+    from harisekhon.utils import log, log_option, qquit, validate_int
+    from lib_hdfs_nodes import decode_nodes
+    from lib_json import BACKENDS, get_backend
+    import lib_fixtures
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+FIELDS = ('usedSpace', 'numBlocks', 'lastContact')
+
+
+class BenchmarkHdfsNodes(CLI):
+
+    def __init__(self):
+        # Python 2.x
+        super(BenchmarkHdfsNodes, self).__init__()
+        # Python 3.x
+        # super().__init__()
+        self.timeout_default = 3600
+        self.backend = None
+        self.loads = None
+        self.runs = None
+        self.payloads = []
+
+    def add_options(self):
+        self.add_opt('-n', '--nodes', default='5000,20000',
+                     help='Comma separated numbers of datanodes in the generated LiveNodes payloads ' + \
+                          '(default: 5000,20000)')
+        self.add_opt('-b', '--backend', default='auto',
+                     help='JSON backend to fully decode with, one of: auto, {0} '.format(', '.join(BACKENDS)) + \
+                          '(default: auto, the first installed as used by the plugins)')
+        self.add_opt('-r', '--runs', default=5,
+                     help='Number of timed decodes per payload per field, the fastest is taken (default: 5)')
+
+    def process_options(self):
+        self.no_args()
+        backend = self.get_opt('backend')
+        if backend != 'auto' and backend not in BACKENDS:
+            self.usage("invalid backend '{0}', must be one of: auto, {1}".format(backend, ', '.join(BACKENDS)))
+        try:
+            (self.backend, self.loads) = get_backend(backend)
+        except ImportError as _:
+            self.usage(_)
+        log_option('backend', self.backend)
+        runs = self.get_opt('runs')
+        validate_int(runs, 'runs', 1, 1000)
+        self.runs = int(runs)
+        nodes = [_.strip() for _ in self.get_opt('nodes').split(',') if _.strip()]
+        if not nodes:
+            self.usage('no --nodes given')
+        for num_nodes in nodes:
+            validate_int(num_nodes, 'nodes', 1, 1000000)
+        log.info('generating payloads')
+        for num_nodes in nodes:
+            namenode_info = lib_fixtures.namenode_info(int(num_nodes))
+            self.payloads.append((int(num_nodes), namenode_info['beans'][0]['LiveNodes']))
+
+    def full_decode(self, content, field):
+        data = self.loads(content)
+        return [(_, data[_][field]) for _ in data]
+
+    @staticmethod
+    def field_decode(content, field):
+        return list(decode_nodes(content, [field]).items(field))
+
+    def time_decode(self, func, content, field):
+        fastest = None
+        result = None
+        for _ in range(self.runs):
+            start = time.perf_counter()
+            result = func(content, field)
+            secs = time.perf_counter() - start
+            if fastest is None or secs < fastest:
+                fastest = secs
+        return (result, fastest)
+
+    @staticmethod
+    def peak_memory(func, content, field):
+        tracemalloc.start()
+        try:
+            func(content, field)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def run(self):
+        mismatches = []
+        totals = {'full_secs': 0.0, 'field_secs': 0.0, 'full_mem': 0, 'field_mem': 0}
+        print('{0:>8} {1:>10} {2:<12} {3:>12} {4:>12} {5:>8} {6:>11} {7:>11} {8:>8}'\
+              .format('Nodes', 'Size', 'Field', self.backend, 'decode_nodes', 'Speedup',
+                      self.backend + ' mem', 'fields mem', 'Saving'))
+        for (num_nodes, content) in self.payloads:
+            for field in FIELDS:
+                (expected, full_secs) = self.time_decode(self.full_decode, content, field)
+                (result, field_secs) = self.time_decode(self.field_decode, content, field)
+                if result != expected:
+                    log.info('%s %s nodes mismatch:\n%s: %s\ndecode_nodes: %s',
+                             field, num_nodes, self.backend, expected[:10], result[:10])
+                    mismatches.append('{0} {1} nodes'.format(field, num_nodes))
+                full_mem = self.peak_memory(self.full_decode, content, field)
+                field_mem = self.peak_memory(self.field_decode, content, field)
+                totals['full_secs'] += full_secs
+                totals['field_secs'] += field_secs
+                totals['full_mem'] += full_mem
+                totals['field_mem'] += field_mem
+                print(('{0:>8} {1:>8.1f}MB {2:<12} {3:>10.1f}ms {4:>10.1f}ms {5:>7.1f}x ' + \
+                       '{6:>9.1f}MB {7:>9.1f}MB {8:>7.1f}x')\
+                      .format(num_nodes, len(content) / 1024.0 / 1024, field, full_secs * 1000, field_secs * 1000,
+                              full_secs / field_secs, full_mem / 1024.0 / 1024, field_mem / 1024.0 / 1024,
+                              full_mem / field_mem))
+        print()
+        if mismatches:
+            qquit('CRITICAL', 'decode_nodes results differ from {0} for: {1}'\
+                              .format(self.backend, ', '.join(mismatches)))
+        qquit('OK', 'decode_nodes {0:.1f}x speedup and {1:.1f}x less peak memory vs {2} over all payloads'\
+                    .format(totals['full_secs'] / totals['field_secs'], totals['full_mem'] / totals['field_mem'],
+                            self.backend))
+
+
+if __name__ == '__main__':
+    BenchmarkHdfsNodes().main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 22:41:07 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Benchmark of the event driven HTML extraction (see lib_html_extract.py) used by the HBase Master UI plugins against
+the BeautifulSoup DOM parsing they used previously, on generated cluster-scale pages (see lib_fixtures.py)
+
+    master-status snapshot  - every metric of lib_hbase_master_status.py, ie. the RegionServers base stats table,
+                              Regions in Transition table and balancer warning
+    master-status RIT       - just the Regions in Transition table, eg. check_hbase_num_regions_in_transition.py
+    master-status version   - the attributes table at the end of the page, check_hbase_master_version.py
+    table.jsp compaction    - the Table Attributes table, check_hbase_table_compaction_in_progress.py
+
+Runs each --runs times taking the fastest, and outputs a table of parse times and speedup.
+
+Also verifies both extract identical results, exiting CRITICAL if not.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import os
+import re
+import sys
+import time
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+plugins_dir = os.path.dirname(srcdir)
+sys.path.append(libdir)
+sys.path.append(plugins_dir)
+try:
+    # pylint: disable=wrong-import-position
+    from bs4 import BeautifulSoup
+    from harisekhon import CLI
+    from harisekhon.utils import log, qquit, validate_int
+    from lib_html_extract import extract_table, heading_regex, id_regex, Row
+    import lib_hbase_master_status
+    import lib_fixtures
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+
+def soup_rows(table):
+    return [Row([_.get_text().strip() for _ in row.find_all('th')],
+                [_.get_text().strip() for _ in row.find_all('td')])
+            for row in table.find_all('tr')]
+
+
+def soup_table_after_heading(soup, text):
+    for heading in soup.find_all('h2'):
+        if heading.get_text().strip() == text:
+            return soup_rows(heading.find_next('table'))
+    return None
+
+
+def soup_master_status(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    regionservers = []
+    for row in soup_rows(soup.find('div', {'id': 'tab_baseStats'}).find('table'))[1:]:
+        if not row.td[0].startswith('Total:'):
+            regionservers.append([row.td[0], int(float(row.td[-2])), int(row.td[-1])])
+    div = soup.find('div', {'class': 'alert alert-warning'}, string=re.compile('balancer', re.I))
+    return {
+        'regionservers': regionservers,
+        'regions_in_transition': soup_regions_in_transition(content, soup),
+        'balancer_warning': ' '.join(div.get_text().split()) if div is not None else None,
+    }
+
+
+def soup_regions_in_transition(content, soup=None):
+    if soup is None:
+        soup = BeautifulSoup(content, 'html.parser')
+    rows = soup_table_after_heading(soup, 'Regions in Transition')
+    return summarize_regions_in_transition(rows)
+
+
+def summarize_regions_in_transition(rows):
+    if rows is None:
+        return (0, 0, None)
+    count = stuck = longest = None
+    for row in rows:
+        if not row.td:
+            continue
+        if row.td[0] == 'Regions in Transition':
+            count = int(row.td[1])
+        elif row.td[0].startswith('Regions in Transition for more than '):
+            stuck = int(row.td[1])
+        elif longest is None or int(row.td[2]) > longest:
+            longest = int(row.td[2])
+    return (count, stuck, longest)
+
+
+def extract_master_status(content):
+    snapshot = lib_hbase_master_status.parse_master_status(content)
+    rit = snapshot['regions_in_transition']
+    snapshot['regions_in_transition'] = (rit['count'], rit['stuck'], rit['longest_time'])
+    return {
+        'regionservers': snapshot['regionservers'],
+        'regions_in_transition': snapshot['regions_in_transition'],
+        'balancer_warning': snapshot['balancer']['warning'],
+    }
+
+
+def extract_regions_in_transition(content):
+    return summarize_regions_in_transition(extract_table(content, lib_hbase_master_status.RIT_REGEX))
+
+
+def soup_version(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    return version_from_rows(soup_rows(soup.find('table', {'id': 'attributes_table'})))
+
+
+def extract_version(content):
+    return version_from_rows(extract_table(content, id_regex('attributes_table', 'table')))
+
+
+def version_from_rows(rows):
+    for row in rows:
+        if row.td and row.td[0] == 'HBase Version':
+            return row.td[1].split(',')[0]
+    return None
+
+
+def soup_compaction(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    return compaction_from_rows(soup_table_after_heading(soup, 'Table Attributes'))
+
+
+def extract_compaction(content):
+    return compaction_from_rows(extract_table(content, heading_regex('Table Attributes')))
+
+
+def compaction_from_rows(rows):
+    for row in rows:
+        if row.td and row.td[0] == 'Compaction':
+            return row.td[1]
+    return None
+
+
+class BenchmarkHtmlExtract(CLI):
+
+    def __init__(self):
+        # Python 2.x
+        super(BenchmarkHtmlExtract, self).__init__()
+        # Python 3.x
+        # super().__init__()
+        self.timeout_default = 3600
+        self.runs = None
+        self.cases = []
+
+    def add_options(self):
+        self.add_opt('-s', '--regionservers', default=1000,
+                     help='Number of RegionServers in the generated HBase Master UI page (default: 1000)')
+        self.add_opt('-i', '--regions-in-transition', default=100,
+                     help='Number of regions in transition in the generated HBase Master UI page (default: 100)')
+        self.add_opt('-g', '--table-regions', default=10000,
+                     help='Number of regions in the generated HBase table.jsp page (default: 10000)')
+        self.add_opt('-r', '--runs', default=3,
+                     help='Number of timed parses per case, the fastest is taken (default: 3)')
+
+    def process_options(self):
+        self.no_args()
+        for (name, minimum) in (('regionservers', 1), ('regions_in_transition', 0), ('table_regions', 1)):
+            validate_int(self.get_opt(name), name.replace('_', ' '), minimum, 1000000)
+        runs = self.get_opt('runs')
+        validate_int(runs, 'runs', 1, 1000)
+        self.runs = int(runs)
+        log.info('generating pages')
+        master_status = lib_fixtures.hmaster_status(int(self.get_opt('regionservers')),
+                                                    int(self.get_opt('regions_in_transition')),
+                                                    balancer_enabled=False).encode('utf-8')
+        table_jsp = lib_fixtures.hbase_table(int(self.get_opt('table_regions')), compaction='MAJOR').encode('utf-8')
+        self.cases = [
+            ('master-status snapshot', master_status, soup_master_status, extract_master_status),
+            ('master-status RIT', master_status, soup_regions_in_transition, extract_regions_in_transition),
+            ('master-status version', master_status, soup_version, extract_version),
+            ('table.jsp compaction', table_jsp, soup_compaction, extract_compaction),
+        ]
+
+    def time_parse(self, func, content):
+        fastest = None
+        result = None
+        for _ in range(self.runs):
+            start = time.perf_counter()
+            result = func(content)
+            secs = time.perf_counter() - start
+            if fastest is None or secs < fastest:
+                fastest = secs
+        return (result, fastest)
+
+    def run(self):
+        mismatches = []
+        total_soup = 0.0
+        total_extract = 0.0
+        print('{0:<24} {1:>10} {2:>14} {3:>14} {4:>10}'.format('Case', 'Size', 'BeautifulSoup', 'extract', 'Speedup'))
+        for (name, content, soup_func, extract_func) in self.cases:
+            (expected, soup_secs) = self.time_parse(soup_func, content)
+            (result, extract_secs) = self.time_parse(extract_func, content)
+            if result != expected:
+                log.info('%s mismatch:\nBeautifulSoup: %s\nextract: %s', name, expected, result)
+                mismatches.append(name)
+            total_soup += soup_secs
+            total_extract += extract_secs
+            print('{0:<24} {1:>8.1f}MB {2:>12.1f}ms {3:>12.1f}ms {4:>9.1f}x'\
+                  .format(name, len(content) / 1024.0 / 1024, soup_secs * 1000, extract_secs * 1000,
+                          soup_secs / extract_secs))
+        print()
+        if mismatches:
+            qquit('CRITICAL', 'extraction results differ from BeautifulSoup for: {0}'.format(', '.join(mismatches)))
+        qquit('OK', 'HTML extraction {0:.1f}x faster than BeautifulSoup over all cases'\
+                    .format(total_soup / total_extract))
+
+
+if __name__ == '__main__':
+    BenchmarkHtmlExtract().main()
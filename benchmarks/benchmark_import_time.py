@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 15:31:08 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Benchmark of the cold start import time of every Python Nagios Plugin, failing if any goes over its budget
+
+Runs each check_*.py plugin with --help under 'python -X importtime', which imports everything the plugin imports at
+the top level and then exits without doing any work, and totals the cumulative import time of the top level imports.
+
+Each plugin is run once to warm the .pyc and OS file caches and then --runs times, taking the fastest.
+
+The default --budget applies to every plugin, --budget-file can give per plugin overrides as a JSON dict of
+plugin filename to milliseconds, eg. {"check_kafka.py": 400}
+
+Exits CRITICAL listing the plugins over budget and their heaviest imports, so startup regressions such as a new top
+level import of a heavy module show up in the tests instead of as slower checks.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon import CLI
+    from harisekhon.utils import log_option, ERRORS, qquit, validate_file, validate_int, plural
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+plugins_dir = os.path.dirname(srcdir)
+
+# import time:       123 |        456 |   module.name
+IMPORT_TIME_REGEX = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)')
+
+
+class BenchmarkImportTime(CLI):
+
+    def __init__(self):
+        # Python 2.x
+        super(BenchmarkImportTime, self).__init__()
+        # Python 3.x
+        # super().__init__()
+        self.timeout_default = 3600
+        self.budget = None
+        self.budgets = {}
+        self.runs = None
+        self.top = None
+        self.plugins = []
+
+    def add_options(self):
+        self.add_opt('-b', '--budget', default=300,
+                     help='Max cumulative import time per plugin in milliseconds (default: 300)')
+        self.add_opt('-B', '--budget-file',
+                     help='JSON file of per plugin budget overrides in milliseconds, eg. {"check_kafka.py": 400}')
+        self.add_opt('-r', '--runs', default=3,
+                     help='Number of timed runs per plugin, the fastest is taken (default: 3)')
+        self.add_opt('-T', '--top', default=5,
+                     help='Number of heaviest imports to list for each plugin over budget (default: 5)')
+
+    def process_options(self):
+        budget = self.get_opt('budget')
+        validate_int(budget, 'budget', 1, 100000)
+        self.budget = int(budget)
+        budget_file = self.get_opt('budget_file')
+        if budget_file:
+            validate_file(budget_file, 'budget')
+            with open(budget_file) as filehandle:
+                try:
+                    self.budgets = json.load(filehandle)
+                except ValueError as _:
+                    self.usage("invalid budget file '{0}': {1}".format(budget_file, _))
+        runs = self.get_opt('runs')
+        validate_int(runs, 'runs', 1, 100)
+        self.runs = int(runs)
+        top = self.get_opt('top')
+        validate_int(top, 'top', 0, 1000)
+        self.top = int(top)
+        # plugins given as args, otherwise all of them
+        self.plugins = self.args or sorted(glob.glob(os.path.join(plugins_dir, 'check_*.py')))
+        for plugin in self.plugins:
+            validate_file(plugin, 'plugin')
+        self.plugins = [os.path.abspath(_) for _ in self.plugins]
+        log_option('number of plugins', len(self.plugins))
+
+    @staticmethod
+    def import_times(plugin):
+        """Returns a tuple of exit code, total microseconds and a list of (cumulative microseconds, module)
+        for the top level imports"""
+        proc = subprocess.Popen([sys.executable, '-X', 'importtime', plugin, '--help'],
+                                stdin=subprocess.DEVNULL,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE,
+                                cwd=plugins_dir)
+        (_, stderr) = proc.communicate()
+        imports = []
+        for line in stderr.decode('utf-8', 'replace').split('\n'):
+            match = IMPORT_TIME_REGEX.match(line)
+            # indentation of the module name is the import depth, only count top level imports, nested imports are
+            # already included in their parent's cumulative time
+            if match and len(match.group(3)) == 1:
+                imports.append((int(match.group(2)), match.group(4)))
+        return (proc.returncode, sum([_[0] for _ in imports]), imports)
+
+    def benchmark(self, plugin):
+        # warm up .pyc and OS caches
+        self.import_times(plugin)
+        results = [self.import_times(plugin) for _ in range(self.runs)]
+        return min(results, key=lambda _: _[1])
+
+    def run(self):
+        over_budget = []
+        failed = []
+        slowest = (0, None)
+        for plugin in self.plugins:
+            name = os.path.basename(plugin)
+            budget = int(self.budgets.get(name, self.budget))
+            (returncode, total, imports) = self.benchmark(plugin)
+            millisecs = total / 1000.0
+            status = 'OK'
+            if returncode not in (ERRORS['OK'], ERRORS['UNKNOWN']):
+                # --help exits UNKNOWN, anything else means the plugin failed to import
+                # so its import time would be meaningless
+                status = 'IMPORT FAILED'
+                failed.append(name)
+            elif millisecs > budget:
+                status = 'OVER BUDGET'
+                over_budget.append((name, millisecs, budget, imports))
+            if millisecs > slowest[0]:
+                slowest = (millisecs, name)
+            print('{0:<60} {1:>8.1f} ms  {2}'.format(name, millisecs, status))
+        if failed:
+            print()
+            qquit('UNKNOWN', '{0} plugin{1} failed to import: {2}'\
+                             .format(len(failed), plural(failed), ', '.join(failed)))
+        if over_budget:
+            print()
+            for (name, millisecs, budget, imports) in over_budget:
+                print('{0} {1:.1f} ms > {2} ms budget, heaviest imports:'.format(name, millisecs, budget))
+                for (microsecs, module) in sorted(imports, reverse=True)[:self.top]:
+                    print('    {0:>8.1f} ms  {1}'.format(microsecs / 1000.0, module))
+            print()
+            qquit('CRITICAL', '{0} plugin{1} over import time budget: {2}'\
+                              .format(len(over_budget), plural(over_budget), ', '.join([_[0] for _ in over_budget])))
+        qquit('OK', 'all {0} plugin{1} within import time budget, slowest {2} at {3:.1f} ms'\
+                    .format(len(self.plugins), plural(self.plugins), slowest[1], slowest[0]))
+
+
+if __name__ == '__main__':
+    BenchmarkImportTime().main()
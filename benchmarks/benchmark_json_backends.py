@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 18:34:52 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Benchmark of the installed JSON decoder backends (see lib_json.py) on cluster-scale API payloads
+
+Decodes each payload with each backend --runs times, taking the fastest, and outputs a table of decode times and
+speedup relative to the standard library json module, to pick the backend per deployment.
+
+Payloads default to synthetic ones generated at the given scale (see lib_fixtures.py):
+
+    NameNodeInfo           - NameNode JMX bean with --nodes datanodes
+    NameNodeInfo LiveNodes - the JSON string embedded in the above, which the HDFS plugins decode a second time
+    Yarn apps              - Resource Manager running apps with --apps apps
+    Presto queries         - Presto coordinator queries with --queries queries
+
+or real responses saved from your clusters can be given as file arguments instead, eg.
+
+    curl -s http://namenode:50070/jmx?qry=Hadoop:service=NameNode,name=NameNodeInfo > NameNodeInfo.json
+
+Also verifies every backend decodes each payload identically to the standard library, exiting CRITICAL if not.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import json
+import os
+import sys
+import time
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+plugins_dir = os.path.dirname(srcdir)
+sys.path.append(libdir)
+sys.path.append(plugins_dir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon import CLI
+    from harisekhon.utils import log, log_option, qquit, validate_file, validate_int
+    from lib_json import BACKENDS, get_backends, get_loads
+    import lib_fixtures
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+
+class BenchmarkJsonBackends(CLI):
+
+    def __init__(self):
+        # Python 2.x
+        super(BenchmarkJsonBackends, self).__init__()
+        # Python 3.x
+        # super().__init__()
+        self.timeout_default = 3600
+        self.backends = []
+        self.runs = None
+        self.payloads = []
+
+    def add_options(self):
+        self.add_opt('-b', '--backends', default=','.join(get_backends()),
+                     help='Comma separated list of JSON backends to compare, json is always included as the ' + \
+                          'baseline (default: all installed: {0})'.format(','.join(get_backends())))
+        self.add_opt('-n', '--nodes', default=5000,
+                     help='Number of datanodes in the generated NameNodeInfo payload (default: 5000)')
+        self.add_opt('-a', '--apps', default=10000,
+                     help='Number of apps in the generated Yarn apps payload (default: 10000)')
+        self.add_opt('-q', '--queries', default=10000,
+                     help='Number of queries in the generated Presto queries payload (default: 10000)')
+        self.add_opt('-r', '--runs', default=5,
+                     help='Number of timed decodes per payload per backend, the fastest is taken (default: 5)')
+
+    def process_options(self):
+        backends = [_.strip() for _ in self.get_opt('backends').split(',') if _.strip()]
+        for backend in backends:
+            if backend not in BACKENDS:
+                self.usage("invalid backend '{0}', must be one of: {1}".format(backend, ', '.join(BACKENDS)))
+            if get_loads(backend) is None:
+                self.usage("backend '{0}' is not installed".format(backend))
+        # standard library is the baseline, always first
+        self.backends = ['json'] + [_ for _ in backends if _ != 'json']
+        log_option('backends', self.backends)
+        runs = self.get_opt('runs')
+        validate_int(runs, 'runs', 1, 1000)
+        self.runs = int(runs)
+        if self.args:
+            for filename in self.args:
+                validate_file(filename, 'payload')
+                with open(filename, 'rb') as filehandle:
+                    self.payloads.append((os.path.basename(filename), filehandle.read()))
+            return
+        for name in ('nodes', 'apps', 'queries'):
+            validate_int(self.get_opt(name), name, 1, 10000000)
+        log.info('generating payloads')
+        namenode_info = lib_fixtures.namenode_info(int(self.get_opt('nodes')))
+        self.payloads = [
+            ('NameNodeInfo', json.dumps(namenode_info).encode('utf-8')),
+            ('NameNodeInfo LiveNodes', namenode_info['beans'][0]['LiveNodes'].encode('utf-8')),
+            ('Yarn apps', json.dumps(lib_fixtures.yarn_apps(int(self.get_opt('apps')))).encode('utf-8')),
+            ('Presto queries', json.dumps(lib_fixtures.presto_queries(int(self.get_opt('queries')))).encode('utf-8')),
+        ]
+
+    def time_decode(self, loads, payload):
+        fastest = None
+        for _ in range(self.runs):
+            start = time.perf_counter()
+            loads(payload)
+            secs = time.perf_counter() - start
+            if fastest is None or secs < fastest:
+                fastest = secs
+        return fastest
+
+    def run(self):
+        mismatches = []
+        totals = dict([(_, 0.0) for _ in self.backends])
+        print('{0:<24} {1:>10}  '.format('Payload', 'Size') + \
+              ''.join(['{0:>22}'.format(_) for _ in self.backends]))
+        for (name, payload) in self.payloads:
+            expected = json.loads(payload)
+            row = '{0:<24} {1:>8.1f}MB  '.format(name, len(payload) / 1024.0 / 1024)
+            baseline = None
+            for backend in self.backends:
+                loads = get_loads(backend)
+                if loads(payload) != expected:
+                    mismatches.append('{0} {1}'.format(backend, name))
+                secs = self.time_decode(loads, payload)
+                totals[backend] += secs
+                if baseline is None:
+                    baseline = secs
+                row += '{0:>12.1f}ms ({1:>4.1f}x)'.format(secs * 1000, baseline / secs)
+            print(row)
+        print()
+        if mismatches:
+            qquit('CRITICAL', 'backends decoded differently to the json standard library: {0}'\
+                              .format(', '.join(mismatches)))
+        fastest = min(self.backends, key=lambda _: totals[_])
+        qquit('OK', 'fastest JSON backend is {0}, {1:.1f}x faster than json standard library over all payloads'\
+                    .format(fastest, totals['json'] / totals[fastest]))
+
+
+if __name__ == '__main__':
+    BenchmarkJsonBackends().main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 19:05:13 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Offline benchmark of the plugins' response parsing at cluster scale, without any real cluster
+
+Starts a local stub HTTP server serving synthetic payloads generated at realistic scale (see lib_fixtures.py):
+
+    NameNode JMX NameNodeInfo  with --nodes datanodes              (default: 5000)
+    Yarn Resource Manager apps with --apps running apps            (default: 100000)
+    HBase Master UI            with --regionservers RegionServers  (default: 1000)
+    Presto coordinator queries with --queries queries              (default: 50000)
+
+then runs each plugin against it end to end, exactly as Nagios would, and reports per plugin:
+
+    wall time        - of the whole plugin process, including interpreter startup and imports
+    decode / parse   - time in JSON decoding and the plugin's parse_json() / parse(), from --timings where supported
+    peak RSS         - max resident memory of the plugin process
+    payload RSS      - peak RSS minus that of the same plugin against a minimal payload, ie. the memory cost of the
+                       response size, which is what regresses when a parsing path stops streaming or copies data
+
+Each plugin is run --runs times, taking the fastest and smallest.
+
+Exits UNKNOWN if any plugin fails to parse its payload, otherwise OK with the slowest plugin, so it can be run
+routinely to catch parsing regressions. Use --json to output the results as JSON to record or compare over time.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon import CLI
+    from harisekhon.utils import log, log_option, qquit, validate_int, validate_regex, plural, ERRORS
+    import lib_fixtures
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+plugins_dir = os.path.dirname(srcdir)
+
+# (payload, plugin, args)
+SUITE = (
+    ('NameNodeInfo', 'check_hadoop_hdfs_balance.py', []),
+    ('NameNodeInfo', 'check_hadoop_datanodes_block_balance.py', []),
+    ('NameNodeInfo', 'check_hadoop_datanode_last_contact.py', ['--node', 'datanode00001.example.com']),
+    ('NameNodeInfo', 'check_hadoop_hdfs_space.py', []),
+    ('NameNodeInfo', 'check_hadoop_namenode_failed_namedirs.py', []),
+    ('Yarn apps', 'check_hadoop_yarn_long_running_apps.py', ['--limit', '1000000']),
+    ('Yarn apps', 'check_hadoop_yarn_long_running_spark_shells.py', ['--limit', '1000000']),
+    ('HBase Master UI', 'check_hbase_region_balance.py', []),
+    ('HBase Master UI', 'check_hbase_regionservers_requests_balance.py', []),
+    # parses the Master UI page rather than JMX, /jmx is the NameNodeInfo payload here
+    ('HBase Master UI', 'check_hbase_num_regions_in_transition.py', ['--source', 'html']),
+    ('Presto queries', 'check_presto_queries.py', ['--failed']),
+    ('Presto queries', 'check_presto_unfinished_queries.py', []),
+)
+
+# dns_time=0.235ms
+TIMINGS_REGEX = re.compile(r'\b(\w+)_time=(\d+(?:\.\d+)?)ms')
+
+# Runs the plugin given as the first arg and reports its own peak RSS on stderr on exit.
+#
+# The peak RSS from wait4() / RUSAGE_CHILDREN can't be used as Linux carries it over from the forking parent across
+# exec, so it would be at least the size of this benchmark process holding all the payloads. VmHWM is per address
+# space so starts afresh at exec.
+PEAK_RSS_LAUNCHER = """
+import os, resource, runpy, sys
+plugin = sys.argv[1]
+sys.argv = sys.argv[1:]
+sys.path.insert(0, os.path.dirname(plugin))
+try:
+    runpy.run_path(plugin, run_name='__main__')
+finally:
+    peak_rss_kb = None
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    peak_rss_kb = int(line.split()[1])
+    if peak_rss_kb is None:
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == 'darwin':
+            peak_rss_kb //= 1024
+    sys.stderr.write('\\npeak_rss_kb=%s\\n' % peak_rss_kb)
+"""
+
+PEAK_RSS_REGEX = re.compile(r'^peak_rss_kb=(\d+)$', re.M)
+
+# CRITICAL / WARNING are legitimate results against synthetic data, anything else such as UNKNOWN or a traceback, which
+# also exits 1, is a failure to parse
+STATUS_REGEX = re.compile(r'^(OK|WARNING|CRITICAL)\b')
+
+
+def generate_payloads(nodes, apps, regionservers, queries):
+    """Returns a tuple of a dict of URL path to (content type, content) for the FixtureServer and a dict of payload
+    name to size"""
+    content_type = 'application/json'
+    payloads = {
+        '/jmx': (content_type, json.dumps(lib_fixtures.namenode_info(nodes)).encode('utf-8')),
+        '/ws/v1/cluster/apps': (content_type, json.dumps(lib_fixtures.yarn_apps(apps)).encode('utf-8')),
+        '/master-status': ('text/html;charset=utf-8',
+                           # scale regions in transition too, a large cluster in trouble has hundreds
+                           lib_fixtures.hmaster_status(regionservers, max(regionservers // 10, 1)).encode('utf-8')),
+        '/v1/query': (content_type, json.dumps(lib_fixtures.presto_queries(queries)).encode('utf-8')),
+    }
+    sizes = {
+        'NameNodeInfo': len(payloads['/jmx'][1]),
+        'Yarn apps': len(payloads['/ws/v1/cluster/apps'][1]),
+        'HBase Master UI': len(payloads['/master-status'][1]),
+        'Presto queries': len(payloads['/v1/query'][1]),
+    }
+    return (payloads, sizes)
+
+
+class BenchmarkParse(CLI):
+
+    def __init__(self):
+        # Python 2.x
+        super(BenchmarkParse, self).__init__()
+        # Python 3.x
+        # super().__init__()
+        self.timeout_default = 3600
+        self.scale = {}
+        self.runs = None
+        self.plugin_timeout = None
+        self.suite = SUITE
+        self.json = False
+
+    def add_options(self):
+        self.add_opt('-n', '--nodes', default=5000,
+                     help='Number of datanodes in the NameNodeInfo payload (default: 5000)')
+        self.add_opt('-a', '--apps', default=100000,
+                     help='Number of running apps in the Yarn apps payload (default: 100000)')
+        self.add_opt('-s', '--regionservers', default=1000,
+                     help='Number of RegionServers in the HBase Master UI payload (default: 1000)')
+        self.add_opt('-q', '--queries', default=50000,
+                     help='Number of queries in the Presto queries payload (default: 50000)')
+        self.add_opt('-i', '--include', metavar='regex',
+                     help='Only run plugins whose filename matches this regex')
+        self.add_opt('-r', '--runs', default=1,
+                     help='Number of runs per plugin, the fastest is taken (default: 1)')
+        self.add_opt('--plugin-timeout', default=300,
+                     help='Timeout in secs passed to each plugin (default: 300)')
+        self.add_opt('-j', '--json', action='store_true', help='Output results as JSON')
+
+    def process_options(self):
+        self.no_args()
+        for name in ('nodes', 'apps', 'regionservers', 'queries'):
+            value = self.get_opt(name)
+            validate_int(value, name, 1, 10000000)
+            self.scale[name] = int(value)
+        include = self.get_opt('include')
+        if include:
+            validate_regex(include, 'include')
+            include = re.compile(include)
+            self.suite = [_ for _ in SUITE if include.search(_[1])]
+            if not self.suite:
+                self.usage('--include regex matches none of the plugins: {0}'\
+                           .format(', '.join([_[1] for _ in SUITE])))
+        runs = self.get_opt('runs')
+        validate_int(runs, 'runs', 1, 100)
+        self.runs = int(runs)
+        plugin_timeout = self.get_opt('plugin_timeout')
+        validate_int(plugin_timeout, 'plugin timeout', 1, 86400)
+        self.plugin_timeout = int(plugin_timeout)
+        self.json = self.get_opt('json')
+        log_option('number of plugins', len(self.suite))
+
+    def run_plugin(self, plugin, args, port):
+        """Returns a dict of the returncode, output, wall time in secs, peak RSS in MB and --timings phases in ms"""
+        cmd = [sys.executable, '-c', PEAK_RSS_LAUNCHER, os.path.join(plugins_dir, plugin),
+               '--host', '127.0.0.1', '--port', str(port), '--timeout', str(self.plugin_timeout)] + args
+        log.debug('running plugin: %s', ' '.join(cmd[3:]))
+        environ = dict(os.environ)
+        # picked up by plugins with TimingsMixin, ignored by the rest
+        environ['NAGIOS_PLUGINS_TIMINGS'] = '1'
+        # each run must parse the response, not get it from the cache
+        environ.pop('NAGIOS_PLUGINS_CACHE_TTL', None)
+        start = time.time()
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                env=environ, cwd=plugins_dir)
+        (stdout, stderr) = proc.communicate()
+        wall = time.time() - start
+        stdout = stdout.decode('utf-8', 'replace').strip()
+        stderr = stderr.decode('utf-8', 'replace')
+        match = PEAK_RSS_REGEX.search(stderr)
+        rss = int(match.group(1)) / 1024.0 if match else 0.0
+        # output the last line of the plugin, or the error if it crashed
+        output = stdout or PEAK_RSS_REGEX.sub('', stderr).strip()
+        last_line = output.split('\n')[-1] if output else ''
+        return {
+            'returncode': proc.returncode,
+            'output': last_line,
+            'wall': wall,
+            'rss': rss,
+            'timings': dict([(name, float(ms)) for (name, ms) in TIMINGS_REGEX.findall(last_line.split('|')[-1])]),
+        }
+
+    def benchmark(self, plugin, args, port):
+        results = [self.run_plugin(plugin, args, port) for _ in range(self.runs)]
+        result = min(results, key=lambda _: _['wall'])
+        result['rss'] = min([_['rss'] for _ in results])
+        return result
+
+    def run(self):
+        log.info('generating payloads')
+        (payloads, sizes) = generate_payloads(**self.scale)
+        (baseline_payloads, _) = generate_payloads(1, 1, 1, 1)
+        server = lib_fixtures.FixtureServer(payloads).start()
+        baseline_server = lib_fixtures.FixtureServer(baseline_payloads).start()
+        log.info('serving payloads on port %s, baseline payloads on port %s', server.port, baseline_server.port)
+        results = []
+        try:
+            for (payload, plugin, args) in self.suite:
+                result = self.benchmark(plugin, args, server.port)
+                baseline = self.benchmark(plugin, args, baseline_server.port)
+                result.update({
+                    'plugin': plugin,
+                    'payload': payload,
+                    'payload_mb': sizes[payload] / 1024.0 / 1024,
+                    'payload_rss': max(result['rss'] - baseline['rss'], 0.0),
+                })
+                results.append(result)
+                if not self.json:
+                    self.print_result(result, header=len(results) == 1)
+        finally:
+            server.stop()
+            baseline_server.stop()
+        self.report(results)
+
+    @staticmethod
+    def parsed(result):
+        return result['returncode'] in (ERRORS['OK'], ERRORS['WARNING'], ERRORS['CRITICAL']) and \
+               STATUS_REGEX.match(result['output'])
+
+    def print_result(self, result, header=False):
+        row_format = '{0:<50} {1:<16} {2:>8} {3:>8} {4:>10} {5:>10} {6:>10} {7:>10} {8:>11}'
+        if header:
+            print(row_format.format('Plugin', 'Payload', 'Size MB', 'Status',
+                                    'Wall ms', 'Decode ms', 'Parse ms', 'Peak RSS', 'Payload RSS'))
+        timings = result['timings']
+        print(row_format.format(result['plugin'],
+                                result['payload'],
+                                '{0:.1f}'.format(result['payload_mb']),
+                                result['output'].split(':')[0] if self.parsed(result) else 'FAILED',
+                                '{0:.0f}'.format(result['wall'] * 1000),
+                                '{0:.1f}'.format(timings['decode']) if 'decode' in timings else '-',
+                                '{0:.1f}'.format(timings['parse']) if 'parse' in timings else '-',
+                                '{0:.1f}MB'.format(result['rss']),
+                                '{0:.1f}MB'.format(result['payload_rss'])))
+
+    def report(self, results):
+        failed = [_ for _ in results if not self.parsed(_)]
+        if self.json:
+            print(json.dumps({'scale': self.scale, 'results': results}, indent=4, sort_keys=True))
+        else:
+            print()
+            for result in failed:
+                print('{0}: {1}'.format(result['plugin'], result['output']))
+        if failed:
+            qquit('UNKNOWN', '{0} plugin{1} failed to parse: {2}'\
+                             .format(len(failed), plural(failed), ', '.join([_['plugin'] for _ in failed])))
+        slowest = max(results, key=lambda _: _['wall'])
+        hungriest = max(results, key=lambda _: _['payload_rss'])
+        qquit('OK', '{0} plugin{1} parsed cluster-scale payloads, slowest {2} at {3:.0f} ms, '\
+                    .format(len(results), plural(results), slowest['plugin'], slowest['wall'] * 1000) + \
+                    'most memory {0} at {1:.1f}MB for the payload'\
+                    .format(hungriest['plugin'], hungriest['payload_rss']))
+
+
+if __name__ == '__main__':
+    BenchmarkParse().main()
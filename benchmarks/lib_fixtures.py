@@ -0,0 +1,683 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 18:21:36 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library of synthetic cluster-scale API payloads for the benchmarks, and a local stub HTTP server to serve them
+
+Generates responses in the same structure as the real APIs return, with the same fields and value types, at any
+scale. Generation is seeded so the payloads are identical from run to run and comparable between benchmarks.
+
+    namenode_info  - NameNode JMX NameNodeInfo bean, including the LiveNodes JSON string embedded within it
+    yarn_apps      - Yarn Resource Manager /ws/v1/cluster/apps
+    hmaster_status - HBase Master UI /master-status HTML page
+    hbase_table    - HBase Master UI /table.jsp?name=<table> HTML page
+    presto_queries - Presto coordinator /v1/query
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import json
+import random
+import threading
+try:
+    # pylint: disable=ungrouped-imports
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer  # pylint: disable=import-error
+    from SocketServer import ThreadingMixIn  # pylint: disable=import-error
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+SEED = 42
+
+# epoch millis all generated timestamps are relative to
+NOW_MILLIS = 1792310400000
+
+TERABYTE = 1024 ** 4
+
+
+def namenode_info(num_nodes=5000, seed=SEED):
+    rand = random.Random(seed)
+    live_nodes = {}
+    total_capacity = 0
+    total_used = 0
+    total_blocks = 0
+    for i in range(num_nodes):
+        ip = '10.{0}.{1}.{2}'.format(i // 65536 % 256, i // 256 % 256, i % 256)
+        hostname = 'datanode{0:05d}.example.com'.format(i)
+        capacity = 12 * 4 * TERABYTE
+        used = int(capacity * rand.uniform(0.40, 0.80))
+        non_dfs_used = int(capacity * rand.uniform(0.001, 0.01))
+        num_blocks = rand.randint(200000, 400000)
+        total_capacity += capacity
+        total_used += used
+        total_blocks += num_blocks
+        live_nodes['{0}:50010'.format(hostname)] = {
+            'infoAddr': '{0}:50075'.format(ip),
+            'infoSecureAddr': '{0}:0'.format(ip),
+            'xferaddr': '{0}:50010'.format(ip),
+            'lastContact': rand.randint(0, 3),
+            'usedSpace': used,
+            'adminState': 'In Service',
+            'nonDfsUsedSpace': non_dfs_used,
+            'capacity': capacity,
+            'numBlocks': num_blocks,
+            'version': '2.7.3.2.6.5.0-292',
+            'used': used,
+            'remaining': capacity - used - non_dfs_used,
+            'blockScheduled': rand.randint(0, 10),
+            'blockPoolUsed': used,
+            'blockPoolUsedPercent': 100.0 * used / capacity,
+            'volfails': 0,
+        }
+    return {
+        'beans': [
+            {
+                'name': 'Hadoop:service=NameNode,name=NameNodeInfo',
+                'modelerType': 'org.apache.hadoop.hdfs.server.namenode.FSNamesystem',
+                'Threads': 512,
+                'Version': '2.7.3.2.6.5.0-292, r3091053c59a62c82d82c9f778c48bde5ef0a89a1',
+                'Used': total_used,
+                'Free': total_capacity - total_used,
+                'Safemode': '',
+                'NonDfsUsedSpace': 0,
+                'PercentUsed': 100.0 * total_used / total_capacity,
+                'BlockPoolUsedSpace': total_used,
+                'PercentBlockPoolUsed': 100.0 * total_used / total_capacity,
+                'PercentRemaining': 100.0 * (total_capacity - total_used) / total_capacity,
+                'CacheCapacity': 0,
+                'CacheUsed': 0,
+                'TotalBlocks': total_blocks // 3,
+                'TotalFiles': total_blocks // 3,
+                'NumberOfMissingBlocks': 0,
+                'NumberOfMissingBlocksWithReplicationFactorOne': 0,
+                # JMX returns these as JSON encoded strings within the JSON response
+                'LiveNodes': json.dumps(live_nodes),
+                'DeadNodes': '{}',
+                'DecomNodes': '{}',
+                'BlockPoolId': 'BP-1473985934-10.0.0.1-1492012345678',
+                'NameDirStatuses': json.dumps({
+                    'active': {
+                        '/hadoop/hdfs/namenode': 'IMAGE_AND_EDITS',
+                        '/hadoop2/hdfs/namenode': 'IMAGE_AND_EDITS',
+                    },
+                    'failed': {}
+                }),
+                'NodeUsage': json.dumps({
+                    'nodeUsage': {
+                        'min': '40.01%',
+                        'median': '60.00%',
+                        'max': '79.99%',
+                        'stdDev': '11.55%',
+                    }
+                }),
+                'NameJournalStatus': '[]',
+                'JournalTransactionInfo': json.dumps({'LastAppliedOrWrittenTxId': '987654321',
+                                                      'MostRecentCheckpointTxId': '987000000'}),
+                'NNStarted': 'Mon Oct 12 09:00:00 UTC 2026',
+                'CompileInfo': '2018-05-11T07:53Z by jenkins from (HEAD detached at 3091053)',
+                'CorruptFiles': '[]',
+                'DistinctVersionCount': 1,
+                'DistinctVersions': [{'key': '2.7.3.2.6.5.0-292', 'value': num_nodes}],
+                'SoftwareVersion': '2.7.3.2.6.5.0-292',
+                'RollingUpgradeStatus': None,
+                'Total': total_capacity,
+            }
+        ]
+    }
+
+
+def yarn_apps(num_apps=100000, seed=SEED):
+    rand = random.Random(seed)
+    queues = ['default', 'etl', 'adhoc', 'reporting', 'llap', 'streaming']
+    app_types = ['MAPREDUCE', 'SPARK', 'TEZ', 'YARN']
+    apps = []
+    for i in range(num_apps):
+        app_id = 'application_1792310400000_{0:06d}'.format(i)
+        app_type = rand.choice(app_types)
+        if app_type == 'SPARK' and rand.random() < 0.1:
+            name = rand.choice(['Spark shell', 'PySparkShell'])
+        else:
+            name = '{0} job {1}'.format(app_type.lower(), rand.randint(1, 5000))
+        elapsed = rand.randint(1000, 3 * 86400 * 1000)
+        allocated_mb = rand.choice([2048, 4096, 8192]) * rand.randint(1, 50)
+        apps.append({
+            'id': app_id,
+            'user': 'user{0}'.format(rand.randint(1, 200)),
+            'name': name,
+            'queue': rand.choice(queues),
+            'state': 'RUNNING',
+            'finalStatus': 'UNDEFINED',
+            'progress': round(rand.uniform(0, 100), 6),
+            'trackingUI': 'ApplicationMaster',
+            'trackingUrl': 'http://resourcemanager.example.com:8088/proxy/{0}/'.format(app_id),
+            'diagnostics': '',
+            'clusterId': 1792310400000,
+            'applicationType': app_type,
+            'applicationTags': '',
+            'priority': 0,
+            'startedTime': NOW_MILLIS - elapsed,
+            'finishedTime': 0,
+            'elapsedTime': elapsed,
+            'amContainerLogs': 'http://nodemanager{0:05d}.example.com:8042/node/containerlogs/' \
+                               .format(rand.randint(0, 4999)) + \
+                               'container_e01_1792310400000_{0:06d}_01_000001/hdfs'.format(i),
+            'amHostHttpAddress': 'nodemanager{0:05d}.example.com:8042'.format(rand.randint(0, 4999)),
+            'allocatedMB': allocated_mb,
+            'allocatedVCores': allocated_mb // 2048,
+            'runningContainers': allocated_mb // 2048,
+            'memorySeconds': allocated_mb * elapsed // 1000,
+            'vcoreSeconds': allocated_mb // 2048 * elapsed // 1000,
+            'queueUsagePercentage': round(rand.uniform(0, 5), 6),
+            'clusterUsagePercentage': round(rand.uniform(0, 1), 6),
+            'preemptedResourceMB': 0,
+            'preemptedResourceVCores': 0,
+            'numNonAMContainerPreempted': 0,
+            'numAMContainerPreempted': 0,
+            'logAggregationStatus': 'NOT_START',
+            'unmanagedApplication': False,
+            'amNodeLabelExpression': '',
+        })
+    return {'apps': {'app': apps}}
+
+
+def presto_queries(num_queries=50000, seed=SEED):
+    rand = random.Random(seed)
+    states = ['FINISHED'] * 80 + ['FAILED'] * 5 + ['RUNNING'] * 10 + ['QUEUED'] * 4 + ['PLANNING']
+    error_codes = [
+        {'code': 1, 'name': 'SYNTAX_ERROR', 'type': 'USER_ERROR'},
+        {'code': 4, 'name': 'PERMISSION_DENIED', 'type': 'USER_ERROR'},
+        {'code': 65536, 'name': 'GENERIC_INTERNAL_ERROR', 'type': 'INTERNAL_ERROR'},
+        {'code': 131073, 'name': 'EXCEEDED_GLOBAL_MEMORY_LIMIT', 'type': 'INSUFFICIENT_RESOURCES'},
+    ]
+    queries = []
+    for i in range(num_queries):
+        query_id = '20261018_{0:06d}_{1:05d}_abcde'.format(i // 100, i)
+        user = 'user{0}'.format(rand.randint(1, 200))
+        state = rand.choice(states)
+        elapsed = rand.randint(10, 600000)
+        query = {
+            'queryId': query_id,
+            'session': {
+                'queryId': query_id,
+                'transactionId': 'c2b5a4d0-{0:04x}-4f1e-9a8b-{1:012x}'.format(i % 65536, i),
+                'clientTransactionSupport': True,
+                'user': user,
+                'principal': '{0}@EXAMPLE.COM'.format(user),
+                'source': rand.choice(['presto-cli', 'presto-jdbc', 'superset', 'airflow']),
+                'catalog': 'hive',
+                'schema': rand.choice(['default', 'warehouse', 'staging']),
+                'timeZoneKey': 0,
+                'locale': 'en_US',
+                'remoteUserAddress': '10.1.{0}.{1}'.format(rand.randint(0, 255), rand.randint(1, 254)),
+                'userAgent': 'StatementClientV1/0.214',
+                'startTime': NOW_MILLIS - elapsed,
+                'systemProperties': {},
+                'catalogProperties': {},
+                'preparedStatements': {},
+            },
+            'state': state,
+            'memoryPool': rand.choice(['general', 'reserved']),
+            'scheduled': state != 'QUEUED',
+            'self': 'http://presto-coordinator.example.com:8080/v1/query/{0}'.format(query_id),
+            'query': 'SELECT col{0}, count(*) FROM warehouse.table{1} WHERE dt = \'2026-10-{2:02d}\' '\
+                     .format(rand.randint(1, 50), rand.randint(1, 500), rand.randint(1, 18)) + \
+                     'GROUP BY 1 ORDER BY 2 DESC LIMIT {0}'.format(rand.randint(10, 1000)),
+            'queryStats': {
+                'createTime': '2026-10-18T{0:02d}:{1:02d}:{2:02d}.000Z'.format(i // 3600 % 24, i // 60 % 60, i % 60),
+                'endTime': '2026-10-18T{0:02d}:{1:02d}:{2:02d}.000Z'.format(i // 3600 % 24, i // 60 % 60, i % 60),
+                'elapsedTime': '{0:.2f}s'.format(elapsed / 1000.0),
+                'executionTime': '{0:.2f}s'.format(elapsed / 1000.0 * 0.9),
+                'totalDrivers': rand.randint(1, 5000),
+                'queuedDrivers': 0,
+                'runningDrivers': 0,
+                'completedDrivers': rand.randint(1, 5000),
+                'rawInputDataSize': '{0}MB'.format(rand.randint(1, 100000)),
+                'rawInputPositions': rand.randint(1, 10 ** 9),
+                'cumulativeUserMemory': rand.uniform(0, 10 ** 12),
+                'userMemoryReservation': '0B',
+                'totalMemoryReservation': '0B',
+                'peakUserMemoryReservation': '{0}MB'.format(rand.randint(1, 10000)),
+                'totalCpuTime': '{0:.2f}s'.format(rand.uniform(0, 10000)),
+                'totalScheduledTime': '{0:.2f}s'.format(rand.uniform(0, 10000)),
+                'fullyBlocked': False,
+                'blockedReasons': [],
+                'progressPercentage': 100.0 if state == 'FINISHED' else rand.uniform(0, 100),
+            },
+        }
+        if state == 'FAILED':
+            query['errorType'] = rand.choice(error_codes)['type']
+            query['errorCode'] = rand.choice(error_codes)
+        queries.append(query)
+    return queries
+
+
+def hmaster_status(num_regionservers=1000, num_regions_in_transition=50, balancer_enabled=True, seed=SEED):
+    """Returns the HBase 1.4 Master UI page, with the RegionServer tabs each listing every RegionServer"""
+    rand = random.Random(seed)
+    servers = []
+    for i in range(num_regionservers):
+        servers.append({
+            'name': 'regionserver{0:04d}.example.com,16020,{1}'.format(i, 1792310400000 + i),
+            'host': 'regionserver{0:04d}.example.com'.format(i),
+            'requests': rand.randint(0, 50000),
+            'regions': rand.randint(150, 250),
+            'used_heap': rand.randint(4000, 30000),
+            'store_files': rand.randint(300, 1500),
+        })
+    html = ["""<!DOCTYPE html>
+<?xml version="1.0" encoding="UTF-8" ?>
+<html lang="en">
+  <head>
+    <meta charset="utf-8">
+    <title>Master: hmaster.example.com</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link href="/static/css/bootstrap.min.css" rel="stylesheet">
+    <link href="/static/css/bootstrap-theme.min.css" rel="stylesheet">
+    <link href="/static/css/hbase.css" rel="stylesheet">
+  </head>
+  <body>
+    <div class="navbar  navbar-fixed-top navbar-default">
+      <div class="container-fluid">
+        <div class="navbar-header">
+          <a href="/master-status"><img src="/static/hbase_logo_small.png" alt="HBase Logo"/></a>
+        </div>
+        <div class="collapse navbar-collapse">
+          <ul class="nav navbar-nav">
+            <li class="active"><a href="/">Home</a></li>
+            <li><a href="/tablesDetailed.jsp">Table Details</a></li>
+            <li><a href="/procedures.jsp">Procedures &amp; Locks</a></li>
+            <li><a href="/logs/">Local Logs</a></li>
+            <li><a href="/logLevel">Log Level</a></li>
+            <li><a href="/dump">Debug Dump</a></li>
+            <li><a href="/jmx">Metrics Dump</a></li>
+            <li><a href="/conf">HBase Configuration</a></li>
+          </ul>
+        </div>
+      </div>
+    </div>
+    <div class="container-fluid content">
+      <div class="row inner_header">
+        <div class="page-header">
+          <h1>Master <small>hmaster.example.com</small></h1>
+        </div>
+      </div>
+"""]
+    if not balancer_enabled:
+        html.append("""      <div class="alert alert-warning">
+        The Load Balancer is not enabled which will eventually cause performance degradation in HBase as Regions
+        will not be distributed across all RegionServers. The balancer is only expected to be disabled during
+        rolling upgrade scenarios.
+      </div>
+""")
+    html.append("""      <div class="row">
+        <section>
+          <h2>Region Servers</h2>
+          <div class="tabbable">
+            <ul class="nav nav-pills">
+              <li class="active"><a href="#tab_baseStats" data-toggle="tab">Base Stats</a></li>
+              <li class=""><a href="#tab_memoryStats" data-toggle="tab">Memory</a></li>
+              <li class=""><a href="#tab_requestStats" data-toggle="tab">Requests</a></li>
+              <li class=""><a href="#tab_storeStats" data-toggle="tab">Storefiles</a></li>
+              <li class=""><a href="#tab_compactStas" data-toggle="tab">Compactions</a></li>
+            </ul>
+            <div class="tab-content" style="padding-bottom: 9px; border-bottom: 1px solid #ddd;">
+              <div class="tab-pane active" id="tab_baseStats">
+<table class="table table-striped">
+<tr>
+    <th>ServerName</th>
+    <th>Start time</th>
+    <th>Last contact</th>
+    <th>Version</th>
+    <th>Requests Per Second</th>
+    <th>Num. Regions</th>
+</tr>
+""")
+    for server in servers:
+        html.append("""<tr>
+    <td><a href="//{host}:16030/rs-status">{name}</a></td>
+    <td>Mon Oct 12 09:00:00 UTC 2026</td>
+    <td>{last_contact} s</td>
+    <td>1.4.13</td>
+    <td>{requests}</td>
+    <td>{regions}</td>
+</tr>
+""".format(last_contact=rand.randint(0, 3), **server))
+    html.append("""<tr><td>Total:{num_servers}</td>
+<td></td>
+<td></td>
+<td></td>
+<td>{requests}</td>
+<td>{regions}</td>
+</tr>
+</table>
+              </div>
+              <div class="tab-pane" id="tab_memoryStats">
+<table class="table table-striped">
+<tr>
+    <th>ServerName</th>
+    <th>Used Heap</th>
+    <th>Max Heap</th>
+    <th>Memstore Size</th>
+</tr>
+""".format(num_servers=num_regionservers,
+           requests=sum([_['requests'] for _ in servers]),
+           regions=sum([_['regions'] for _ in servers])))
+    for server in servers:
+        html.append("""<tr>
+    <td><a href="//{host}:16030/rs-status">{name}</a></td>
+    <td>{used_heap} MB</td>
+    <td>31.00 GB</td>
+    <td>{memstore} MB</td>
+</tr>
+""".format(memstore=rand.randint(0, 4000), **server))
+    html.append("""</table>
+              </div>
+              <div class="tab-pane" id="tab_requestStats">
+<table class="table table-striped">
+<tr>
+    <th>ServerName</th>
+    <th>Request Per Second</th>
+    <th>Read Request Count</th>
+    <th>Write Request Count</th>
+</tr>
+""")
+    for server in servers:
+        html.append("""<tr>
+    <td><a href="//{host}:16030/rs-status">{name}</a></td>
+    <td>{requests}</td>
+    <td>{reads}</td>
+    <td>{writes}</td>
+</tr>
+""".format(reads=rand.randint(0, 10 ** 10), writes=rand.randint(0, 10 ** 10), **server))
+    html.append("""</table>
+              </div>
+              <div class="tab-pane" id="tab_storeStats">
+<table class="table table-striped">
+<tr>
+    <th>ServerName</th>
+    <th>Num. Stores</th>
+    <th>Num. Storefiles</th>
+    <th>Storefile Size Uncompressed</th>
+    <th>Storefile Size</th>
+    <th>Index Size</th>
+    <th>Bloom Size</th>
+</tr>
+""")
+    for server in servers:
+        html.append("""<tr>
+    <td><a href="//{host}:16030/rs-status">{name}</a></td>
+    <td>{stores}</td>
+    <td>{store_files}</td>
+    <td>{uncompressed} MB</td>
+    <td>{size} MB</td>
+    <td>{index} KB</td>
+    <td>{bloom} KB</td>
+</tr>
+""".format(stores=server['regions'] * 2,
+           uncompressed=server['store_files'] * 900,
+           size=server['store_files'] * 300,
+           index=rand.randint(1000, 100000),
+           bloom=rand.randint(1000, 100000),
+           **server))
+    html.append("""</table>
+              </div>
+              <div class="tab-pane" id="tab_compactStas">
+<table class="table table-striped">
+<tr>
+    <th>ServerName</th>
+    <th>Num. Compacting KVs</th>
+    <th>Num. Compacted KVs</th>
+    <th>Remaining KVs</th>
+    <th>Compaction Progress</th>
+</tr>
+""")
+    for server in servers:
+        compacting = rand.randint(10 ** 6, 10 ** 9)
+        compacted = rand.randint(0, compacting)
+        html.append("""<tr>
+    <td><a href="//{host}:16030/rs-status">{name}</a></td>
+    <td>{compacting}</td>
+    <td>{compacted}</td>
+    <td>{remaining}</td>
+    <td>{progress:.2f}%</td>
+</tr>
+""".format(compacting=compacting,
+           compacted=compacted,
+           remaining=compacting - compacted,
+           progress=100.0 * compacted / compacting,
+           **server))
+    html.append("""</table>
+              </div>
+            </div>
+          </div>
+        </section>
+        <section>
+          <h2>Dead Region Servers</h2>
+          <table class="table table-striped">
+            <tr><th></th><th>ServerName</th><th>Stop time</th></tr>
+            <tr><th>Total: </th><td>servers: 0</td><th></th></tr>
+          </table>
+        </section>
+""")
+    if num_regions_in_transition:
+        html.append("""        <section>
+          <h2>Regions in Transition</h2>
+          <table class="table table-striped" id="rit">
+            <tr><th>Region</th><th>State</th><th>RIT time (ms)</th></tr>
+""")
+        over_threshold = 0
+        for i in range(num_regions_in_transition):
+            rit_time = rand.randint(100, 600000)
+            if rit_time > 60000:
+                over_threshold += 1
+            server = rand.choice(servers)
+            html.append("""            <tr><td>{region:032x}</td><td>table{table}, region {i}, state=PENDING_OPEN, \
+ts=Sun Oct 18 09:00:00 UTC 2026 ({secs}s ago), server={server}</td><td>{rit_time}</td></tr>
+""".format(region=rand.getrandbits(128),
+           table=rand.randint(1, 500),
+           i=i,
+           secs=rit_time // 1000,
+           server=server['name'],
+           rit_time=rit_time))
+        html.append("""            <tr><td>Regions in Transition for more than 60000 milliseconds</td>
+                <td>{over_threshold}</td><td></td></tr>
+            <tr><td>Regions in Transition</td><td>{num}</td><td></td></tr>
+          </table>
+        </section>
+""".format(over_threshold=over_threshold, num=num_regions_in_transition))
+    html.append("""        <section>
+          <h2>Software Attributes</h2>
+          <table id="attributes_table" class="table table-striped">
+            <tr><th>Attribute Name</th><th>Value</th><th>Description</th></tr>
+            <tr><td>HBase Version</td><td>1.4.13, revision=38bf65a22b7e9320f07aeb27677e4533b9a77ef4</td>
+                <td>HBase version and revision</td></tr>
+            <tr><td>HBase Compiled</td><td>Sun Feb 23 02:06:36 PST 2020, apurtell</td>
+                <td>When HBase version was compiled and by whom</td></tr>
+            <tr><td>Hadoop Version</td><td>2.7.7, revision=c1aad84bd27cd79c3d1a7dd58202a8c3ee1ed3ac</td>
+                <td>Hadoop version and revision</td></tr>
+            <tr><td>ZooKeeper Quorum</td><td>zk1.example.com:2181,zk2.example.com:2181,zk3.example.com:2181</td>
+                <td>Addresses of all registered ZK servers.</td></tr>
+            <tr><td>Cluster Key</td><td>zk1.example.com,zk2.example.com,zk3.example.com:2181:/hbase</td>
+                <td>Key to add this cluster as a peer for replication.</td></tr>
+            <tr><td>HBase Root Directory</td><td>hdfs://nameservice1/hbase</td>
+                <td>Location of HBase home directory</td></tr>
+            <tr><td>Load average</td><td>{load_avg:.2f}</td>
+                <td>Average number of regions per regionserver. Naive computation.</td></tr>
+            <tr><td>Coprocessors</td><td>[]</td><td>Coprocessors currently loaded by the master</td></tr>
+            <tr><td>Load Balancer</td><td>org.apache.hadoop.hbase.master.balancer.StochasticLoadBalancer</td>
+                <td>LoadBalancer to be used in the Master</td></tr>
+          </table>
+        </section>
+      </div>
+    </div>
+    <script src="/static/js/jquery.min.js" type="text/javascript"></script>
+    <script src="/static/js/bootstrap.min.js" type="text/javascript"></script>
+    <script src="/static/js/tab.js" type="text/javascript"></script>
+  </body>
+</html>
+""".format(load_avg=sum([_['regions'] for _ in servers]) / max(num_regionservers, 1)))
+    return ''.join(html)
+
+
+def hbase_table(num_regions=10000, compaction='NONE', table='t1', seed=SEED):
+    """Returns the HBase 1.4 Master UI table.jsp page for a table, listing every region"""
+    rand = random.Random(seed)
+    html = ["""<!DOCTYPE html>
+<?xml version="1.0" encoding="UTF-8" ?>
+<html lang="en">
+  <head>
+    <meta charset="utf-8">
+    <title>Table: {table}</title>
+    <link href="/static/css/bootstrap.min.css" rel="stylesheet">
+    <link href="/static/css/hbase.css" rel="stylesheet">
+  </head>
+  <body>
+    <div class="container-fluid content">
+      <div class="row inner_header">
+        <div class="page-header">
+          <h1>Table <small>{table}</small></h1>
+        </div>
+      </div>
+      <div class="row">
+        <h2>Table Attributes</h2>
+        <table class="table table-striped">
+          <tr>
+            <th>Attribute Name</th>
+            <th>Value</th>
+            <th>Description</th>
+          </tr>
+          <tr>
+            <td>Enabled</td>
+            <td>true</td>
+            <td>Is the table enabled</td>
+          </tr>
+          <tr>
+            <td>Compaction</td>
+            <td>
+{compaction}
+            </td>
+            <td>Is the table compacting</td>
+          </tr>
+        </table>
+        <h2>Table Regions</h2>
+        <table class="table table-striped">
+          <tr>
+            <th>Name</th>
+            <th>Region Server</th>
+            <th>ReadRequests</th>
+            <th>WriteRequests</th>
+            <th>StorefileSize</th>
+            <th>Num.Storefiles</th>
+            <th>MemSize</th>
+            <th>Locality</th>
+            <th>Start Key</th>
+            <th>End Key</th>
+          </tr>
+""".format(table=table, compaction=compaction)]
+    step = 2 ** 32 // max(num_regions, 1)
+    for i in range(num_regions):
+        start_key = '{0:08x}'.format(i * step) if i else ''
+        end_key = '{0:08x}'.format((i + 1) * step) if i < num_regions - 1 else ''
+        html.append("""          <tr>
+            <td>{table},{start_key},1792310400000.{region:032x}.</td>
+            <td><a href="//{server}:16030/">{server}:16030</a></td>
+            <td>{reads}</td>
+            <td>{writes}</td>
+            <td>{size} MB</td>
+            <td>{store_files}</td>
+            <td>{memsize} MB</td>
+            <td>{locality:.2f}</td>
+            <td>{start_key}</td>
+            <td>{end_key}</td>
+          </tr>
+""".format(table=table,
+           start_key=start_key,
+           end_key=end_key,
+           region=rand.getrandbits(128),
+           server='regionserver{0:04d}.example.com'.format(rand.randint(0, 999)),
+           reads=rand.randint(0, 10 ** 9),
+           writes=rand.randint(0, 10 ** 9),
+           size=rand.randint(0, 10000),
+           store_files=rand.randint(1, 20),
+           memsize=rand.randint(0, 128),
+           locality=rand.random()))
+    html.append("""        </table>
+      </div>
+    </div>
+  </body>
+</html>
+""")
+    return ''.join(html)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FixtureServer(object):
+    """Local stub HTTP server serving fixed payloads by URL path, ignoring any query string
+
+    payloads is a dict of path to (content type, bytes), the server binds to a free port on localhost"""
+
+    def __init__(self, payloads, host='127.0.0.1', port=0):
+        self.payloads = payloads
+        self.server = _ThreadingHTTPServer((host, port), self._handler())
+        self.host = host
+        self.port = self.server.server_address[1]
+        self.thread = None
+
+    def _handler(self):
+        payloads = self.payloads
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                path = self.path.split('?', 1)[0]
+                if path not in payloads:
+                    self.send_error(404)
+                    return
+                (content_type, content) = payloads[path]
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -29,7 +29,8 @@ limitation of the Ambari API as documented here:
 
     https://issues.apache.org/jira/browse/AMBARI-24144
 
-See also check_hadoop_hdfs_rack_resilience.py for clusters without Ambari
+See also check_hadoop_hdfs_rack_resilience.py for clusters without Ambari, which shares the same rack analysis
+(see lib_hdfs_racks.py)
 
 Tested on Hortonworks HDP 2.6 with Ambari 2.6
 
@@ -51,17 +52,19 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import validate_chars, plural, ERRORS
+    from harisekhon.utils import validate_chars, ERRORS
     from harisekhon import RestNagiosPlugin
+    from lib_hdfs_racks import HdfsRackResilienceMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.3'
+__version__ = '0.4'
 
 
-class CheckAmbariClusterHdfsRackResilience(RestNagiosPlugin):
+class CheckAmbariClusterHdfsRackResilience(TimingsMixin, HdfsRackResilienceMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -106,25 +109,7 @@ class CheckAmbariClusterHdfsRackResilience(RestNagiosPlugin):
             if rack not in racks:
                 racks[rack] = []
             racks[rack].append(host_name)
-        num_racks = len(racks)
-        self.msg = '{} rack{} configured'.format(num_racks, plural(num_racks))
-        if num_racks < 2:
-            self.warning()
-            self.msg += ' (no rack resilience!)'
-        default_rack = '/default-rack'
-        num_nodes_left_in_default_rack = 0
-        if default_rack in racks:
-            self.warning()
-            num_nodes_left_in_default_rack = len(racks[default_rack])
-            msg = "{num} node{plural} left in '{default_rack}'!"\
-                  .format(num=num_nodes_left_in_default_rack,
-                          plural=plural(num_nodes_left_in_default_rack),
-                          default_rack=default_rack)
-            if self.verbose:
-                msg += ' [{}]'.format(', '.join(racks[default_rack]))
-            self.msg = msg + ' - ' + self.msg
-        self.msg += ' | hdfs_racks={};2 nodes_in_default_rack={};0'\
-                    .format(num_racks, num_nodes_left_in_default_rack)
+        self.check_rack_resilience(racks)
 
 
 if __name__ == '__main__':
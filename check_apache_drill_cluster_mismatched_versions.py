@@ -41,6 +41,9 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -50,7 +53,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckApacheDrillClusterMismatchedVersions(RestNagiosPlugin):
+class CheckApacheDrillClusterMismatchedVersions(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -64,6 +67,14 @@ class CheckApacheDrillClusterMismatchedVersions(RestNagiosPlugin):
         self.auth = False
         self.msg = 'Apache Drill message not defined'
 
+    def add_options(self):
+        super(CheckApacheDrillClusterMismatchedVersions, self).add_options()
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckApacheDrillClusterMismatchedVersions, self).process_options()
+        self.process_cache_options()
+
     def parse_json(self, json_data):
         mismatched_versions = json_data['mismatchedVersions']
         if mismatched_versions:
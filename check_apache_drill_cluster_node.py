@@ -45,6 +45,9 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
     from harisekhon.utils import ERRORS, validate_host
 except ImportError:
     print(traceback.format_exc(), end='')
@@ -54,7 +57,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3'
 
 
-class CheckApacheDrillClusterNode(RestNagiosPlugin):
+class CheckApacheDrillClusterNode(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -72,11 +75,13 @@ class CheckApacheDrillClusterNode(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckApacheDrillClusterNode, self).add_options()
+        self.add_cache_options()
         self.add_opt('-n', '--node', help='Node to check is seen in cluster (hostname or IP as seen in --list)')
         self.add_opt('-l', '--list', action='store_true', help='List nodes and exit')
 
     def process_options(self):
         super(CheckApacheDrillClusterNode, self).process_options()
+        self.process_cache_options()
         self.node = self.get_opt('node')
         self.list_nodes = self.get_opt('list')
         if not self.list_nodes:
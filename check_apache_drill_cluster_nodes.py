@@ -43,6 +43,9 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
     from harisekhon.utils import log
 except ImportError:
     print(traceback.format_exc(), end='')
@@ -52,7 +55,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3'
 
 
-class CheckApacheDrillClusterNodes(RestNagiosPlugin):
+class CheckApacheDrillClusterNodes(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -68,10 +71,12 @@ class CheckApacheDrillClusterNodes(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckApacheDrillClusterNodes, self).add_options()
+        self.add_cache_options()
         self.add_thresholds(default_warning=2)
 
     def process_options(self):
         super(CheckApacheDrillClusterNodes, self).process_options()
+        self.process_cache_options()
         self.validate_thresholds(simple='lower', positive=True, optional=True)
 
     def parse_json(self, json_data):
@@ -42,6 +42,9 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
     from harisekhon.utils import log, UnknownError
 except ImportError:
     print(traceback.format_exc(), end='')
@@ -51,7 +54,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckApacheDrillClusterNodesOffline(RestNagiosPlugin):
+class CheckApacheDrillClusterNodesOffline(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -67,10 +70,12 @@ class CheckApacheDrillClusterNodesOffline(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckApacheDrillClusterNodesOffline, self).add_options()
+        self.add_cache_options()
         self.add_thresholds(default_warning=0)
 
     def process_options(self):
         super(CheckApacheDrillClusterNodesOffline, self).process_options()
+        self.process_cache_options()
         self.validate_thresholds(simple='upper', positive=True, optional=True)
 
     def parse_json(self, json_data):
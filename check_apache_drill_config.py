@@ -36,6 +36,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import UnknownError, ERRORS, isList, support_msg_api, validate_chars, validate_regex
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -44,7 +45,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckApacheDrillConfig(RestNagiosPlugin):
+class CheckApacheDrillConfig(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -38,6 +38,9 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -47,7 +50,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckApacheDrillEncryptionEnabled(RestNagiosPlugin):
+class CheckApacheDrillEncryptionEnabled(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -61,6 +64,14 @@ class CheckApacheDrillEncryptionEnabled(RestNagiosPlugin):
         self.auth = False
         self.msg = 'Apache Drill message not defined'
 
+    def add_options(self):
+        super(CheckApacheDrillEncryptionEnabled, self).add_options()
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckApacheDrillEncryptionEnabled, self).process_options()
+        self.process_cache_options()
+
     def parse_json(self, json_data):
         user_encryption_enabled = json_data['userEncryptionEnabled']
         bit_encryption_enabled = json_data['bitEncryptionEnabled']
@@ -42,7 +42,8 @@ import re
 import sys
 import traceback
 try:
-    from bs4 import BeautifulSoup
+    from lib_lazy_import import lazy_from_import
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
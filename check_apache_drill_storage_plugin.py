@@ -35,6 +35,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import UnknownError, CriticalError, ERRORS, isList, support_msg_api
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -43,7 +44,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckApacheDrillStoragePlugin(RestNagiosPlugin):
+class CheckApacheDrillStoragePlugin(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
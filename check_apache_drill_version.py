@@ -38,6 +38,9 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestVersionNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -47,7 +50,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckApacheDrillVersion(RestVersionNagiosPlugin):
+class CheckApacheDrillVersion(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestVersionNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -61,6 +64,14 @@ class CheckApacheDrillVersion(RestVersionNagiosPlugin):
         self.auth = False
         self.msg = 'Apache Drill message not defined'
 
+    def add_options(self):
+        super(CheckApacheDrillVersion, self).add_options()
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckApacheDrillVersion, self).process_options()
+        self.process_cache_options()
+
     # must be a method for inheritance to work
     def parse_json(self, json_data):  # pylint: disable=no-self-use
         return json_data['currentVersion']
@@ -56,6 +56,7 @@ try:
     from harisekhon.utils import ERRORS, CriticalError, UnknownError, support_msg_api
     from harisekhon.utils import isList, validate_chars, plural, log_option
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -64,7 +65,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4.3'
 
 
-class CheckAtlasEntity(RestNagiosPlugin):
+class CheckAtlasEntity(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
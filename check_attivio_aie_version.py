@@ -36,7 +36,8 @@ import traceback
 try:
     import requests
     #from requests.auth import HTTPBasicAuth
-    from bs4 import BeautifulSoup
+    from lib_lazy_import import lazy_from_import
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -45,7 +45,8 @@ import os
 import sys
 import traceback
 from math import ceil
-import boto3
+from lib_lazy_import import lazy_import
+boto3 = lazy_import('boto3')
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
@@ -50,8 +50,9 @@ import traceback
 from datetime import datetime
 from io import StringIO
 from math import floor
-import boto3
-from botocore.exceptions import ClientError
+from lib_lazy_import import lazy_import
+boto3 = lazy_import('boto3')
+botocore_exceptions = lazy_import('botocore.exceptions')
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
@@ -106,7 +107,7 @@ class AWSuserLastUsed(NagiosPlugin):
             time.sleep(1)
         try:
             result = iam.get_credential_report()
-        except ClientError as _:
+        except botocore_exceptions.ClientError as _:
             raise
         csv_content = result['Content']
         log.debug('%s', csv_content)
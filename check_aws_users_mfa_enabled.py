@@ -48,8 +48,9 @@ import sys
 import time
 import traceback
 from io import StringIO
-import boto3
-from botocore.exceptions import ClientError
+from lib_lazy_import import lazy_import
+boto3 = lazy_import('boto3')
+botocore_exceptions = lazy_import('botocore.exceptions')
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
@@ -93,7 +94,7 @@ class AWSUsersMFA(NagiosPlugin):
             time.sleep(1)
         try:
             result = iam.get_credential_report()
-        except ClientError as _:
+        except botocore_exceptions.ClientError as _:
             raise
         csv_content = result['Content']
         log.debug('%s', csv_content)
@@ -37,6 +37,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import isStr, CriticalError
     from harisekhon.nagiosplugin import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -45,7 +46,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.7.1'
 
 
-class CheckConsulLeaderElected(RestNagiosPlugin):
+class CheckConsulLeaderElected(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         super(CheckConsulLeaderElected, self).__init__()
@@ -43,6 +43,7 @@ try:
     from harisekhon.utils import isStr, isList, support_msg_api, validate_chars, validate_regex, log
     from harisekhon.utils import CriticalError, UnknownError
     from harisekhon.nagiosplugin import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -51,7 +52,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckConsulServiceLeaderElected(RestNagiosPlugin):
+class CheckConsulServiceLeaderElected(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         super(CheckConsulServiceLeaderElected, self).__init__()
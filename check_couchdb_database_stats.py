@@ -50,6 +50,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import UnknownError, ERRORS, validate_chars, isList
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -58,7 +59,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4'
 
 
-class CheckCouchDBDatabaseStats(RestNagiosPlugin):
+class CheckCouchDBDatabaseStats(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
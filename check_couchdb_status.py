@@ -38,6 +38,7 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -47,7 +48,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckCouchdbStatus(RestNagiosPlugin):
+class CheckCouchdbStatus(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -45,6 +45,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -54,7 +55,7 @@ __version__ = '0.5'
 
 
 # pylint: disable=too-few-public-methods
-class CheckDockerAPIPing(DockerNagiosPlugin):
+class CheckDockerAPIPing(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
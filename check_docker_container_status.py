@@ -56,6 +56,7 @@ try:
     from harisekhon.utils import log, jsonpp, CriticalError, sec2human
     from harisekhon.utils import validate_chars
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -64,7 +65,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3'
 
 
-class CheckDockerContainerStatus(DockerNagiosPlugin):
+class CheckDockerContainerStatus(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
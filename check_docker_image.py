@@ -49,6 +49,7 @@ try:
     from harisekhon.utils import log, jsonpp, CriticalError, UnknownError, support_msg_api
     from harisekhon.utils import validate_chars
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -57,7 +58,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.6.0'
 
 
-class CheckDockerImage(DockerNagiosPlugin):
+class CheckDockerImage(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -43,6 +43,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, jsonpp
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -52,7 +53,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckDockerSwarmEnabled(DockerNagiosPlugin):
+class CheckDockerSwarmEnabled(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -41,6 +41,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, jsonpp, CriticalError
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -50,7 +51,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckDockerSwarmError(DockerNagiosPlugin):
+class CheckDockerSwarmError(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
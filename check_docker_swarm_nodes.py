@@ -43,6 +43,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, jsonpp, CriticalError
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -51,7 +52,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckDockerSwarmNodes(DockerNagiosPlugin):
+class CheckDockerSwarmNodes(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -60,6 +60,7 @@ try:
     from harisekhon.utils import log, jsonpp, CriticalError, UnknownError, sec2human, support_msg_api
     from harisekhon.utils import validate_chars, validate_int
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -68,7 +69,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.5'
 
 
-class CheckDockerSwarmServiceStatus(DockerNagiosPlugin):
+class CheckDockerSwarmServiceStatus(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
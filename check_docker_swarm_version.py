@@ -46,6 +46,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, CriticalError, UnknownError, validate_regex, isVersion, support_msg_api
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -54,7 +55,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4'
 
 
-class CheckDockerSwarmVersion(DockerNagiosPlugin):
+class CheckDockerSwarmVersion(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -47,6 +47,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, UnknownError, validate_regex, isVersionLax, support_msg_api, jsonpp
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -55,7 +56,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4'
 
 
-class CheckDockerVersion(DockerNagiosPlugin):
+class CheckDockerVersion(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -45,6 +45,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log
     from harisekhon import DockerNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -53,7 +54,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckDockerVolumes(DockerNagiosPlugin):
+class CheckDockerVolumes(TimingsMixin, DockerNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -21,6 +21,9 @@ Nagios Plugin to check Elasticsearch for slow tasks via the API
 
 Thresholds apply to the number of seconds a task has been runnning for
 
+Nodes are decoded from the response one at a time as it downloads, so memory stays flat on large clusters with many
+tasks (uses the ijson module if installed)
+
 Tested on Elasticsearch 6.0, 6.1, 6.2, 6.3, 6.4, 6.5, 6.6
 
 """
@@ -38,17 +41,23 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import ERRORS
+    from harisekhon.utils import ERRORS, UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_json_stream import StreamingJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.3.1'
+
 
+class CheckElasticsearchTasksSlow(StreamingJsonMixin, TimingsMixin, RestNagiosPlugin):
 
-class CheckElasticsearchTasksSlow(RestNagiosPlugin):
+    json_stream_prefix = 'nodes.*'
+    json_stream_keys = True
+    json_stream_check_containers = True
 
     def __init__(self):
         # Python 2.x
@@ -91,8 +100,42 @@ class CheckElasticsearchTasksSlow(RestNagiosPlugin):
         self.validate_thresholds(simple='upper', positive=True, integer=False)
 
     def parse_json(self, json_data):
+        if not isinstance(json_data, dict) or 'nodes' not in json_data:
+            self.raise_missing_nodes()
+        if not isinstance(json_data['nodes'], dict):
+            self.raise_non_dict_nodes()
+        self.parse_json_stream(iter(json_data['nodes'].items()))
+
+    def iter_validated_nodes(self, nodes):
+        """Yields the nodes, applying the same validation as parse_json() to the streamed response as soon as the
+        nodes field is seen and once they have all been consumed"""
+        for node in nodes:
+            self.validate_nodes_stream()
+            yield node
+        self.validate_nodes_stream()
+
+    def validate_nodes_stream(self):
+        containers = self.json_stream_containers
+        # nodes were passed from parse_json() having already been validated
+        if containers is None:
+            return
+        if 'nodes' not in containers:
+            self.raise_missing_nodes()
+        if containers['nodes'] != 'start_map':
+            self.raise_non_dict_nodes()
+
+    @staticmethod
+    def raise_missing_nodes():
+        raise UnknownError("'nodes' field not returned by Elasticsearch. {0}".format(support_msg_api()))
+
+    @staticmethod
+    def raise_non_dict_nodes():
+        raise UnknownError('non-dict returned for json_data[nodes] by Elasticsearch. {0}'.format(support_msg_api()))
+
+    def parse_json_stream(self, nodes):
+        nodes = self.iter_validated_nodes(nodes)
         if self.get_opt('list_tasks'):
-            self.list_tasks(json_data)
+            self.list_tasks(nodes)
         num_warning = 0
         num_critical = 0
         warning_threshold = self.get_threshold('warning').get_simple()
@@ -100,12 +143,10 @@ class CheckElasticsearchTasksSlow(RestNagiosPlugin):
         # convert threshold in secs to nanos to compare with running time
         warn_nanos = warning_threshold * 1000 * 1000 * 1000
         crit_nanos = critical_threshold * 1000 * 1000 * 1000
-        nodes = json_data['nodes']
         selected_node = self.get_opt('node')
         #found_node = 0
         num_tasks = 0
-        for node_id in nodes:
-            node = nodes[node_id]
+        for (node_id, node) in nodes:
             if selected_node:
                 if selected_node not in (node_id, node['host'], node['ip'].split(':')[0], node['name']):
                     continue
@@ -138,15 +179,13 @@ class CheckElasticsearchTasksSlow(RestNagiosPlugin):
                             critical_threshold=critical_threshold)
         self.msg += ' | num_tasks={} warning_tasks={} critical_tasks={}'.format(num_tasks, num_warning, num_critical)
 
-    def list_tasks(self, json_data):
+    def list_tasks(self, nodes):
         print('Elasticsearch {}tasks:\n'.format(self.search_type))
         print('=' * 80)
         format_string = '{: <10}\t{: <10}\t{: <20}\t{: <30}\t{}'
         print(format_string.format('Node', 'Task ID', 'Running Time in Nanos', 'Action', 'Description'))
         print('=' * 80)
-        nodes = json_data['nodes']
-        for node_id in nodes:
-            node = nodes[node_id]
+        for (_, node) in nodes:
             tasks = node['tasks']
             for task_id in tasks:
                 task = tasks[task_id]
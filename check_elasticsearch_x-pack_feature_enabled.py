@@ -40,6 +40,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import ERRORS, validate_alnum
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -48,7 +49,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckElasticsearchXPackFeatureEnabled(RestNagiosPlugin):
+class CheckElasticsearchXPackFeatureEnabled(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
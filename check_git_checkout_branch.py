@@ -37,7 +37,8 @@ import os
 import re
 import sys
 import traceback
-import git
+from lib_lazy_import import lazy_import
+git = lazy_import('git')
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
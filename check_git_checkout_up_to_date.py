@@ -39,7 +39,8 @@ from __future__ import print_function
 import os
 import sys
 import traceback
-import git
+from lib_lazy_import import lazy_import
+git = lazy_import('git')
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
@@ -34,7 +34,8 @@ from __future__ import unicode_literals
 import os
 import sys
 import traceback
-import git
+from lib_lazy_import import lazy_import
+git = lazy_import('git')
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
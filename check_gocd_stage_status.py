@@ -38,6 +38,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import validate_chars, UnknownError
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -46,7 +47,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckGoCDStageStatus(RestNagiosPlugin):
+class CheckGoCDStageStatus(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
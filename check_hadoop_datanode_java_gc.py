@@ -21,6 +21,14 @@ Nagios Plugin to check Hadoop DataNode Java GC last duration via JMX API
 
 Thresholds apply to Java Garbage Collection last duration in seconds
 
+With --rate checks the percentage of time spent in GC and the collections per minute since the previous run instead,
+with the thresholds applying to the GC time percentage (see lib_java_gc.py)
+
+With --namenode discovers all the live DataNodes from the NameNode JMX NameNodeInfo bean and sweeps each of their GC and
+heap JMX beans concurrently instead of checking --host, with a deadline per DataNode, outputting the number of
+DataNodes over the thresholds, the max / p95 / median distribution and the worst --top DataNodes. Optional
+--heap-warning / --heap-critical thresholds apply to the percentage of max heap used by each DataNode
+
 Tested on Apache Hadoop 2.8
 
 """
@@ -30,6 +38,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import json
 import os
 import sys
 import traceback
@@ -38,13 +47,15 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
+    from harisekhon.utils import validate_host, validate_port, CriticalError
     from check_hadoop_namenode_java_gc import CheckHadoopNameNodeJavaGC
+    from lib_hdfs_nodes import decode_nodes
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.1'
+__version__ = '0.4'
 
 
 class CheckHadoopDataNodeJavaGC(CheckHadoopNameNodeJavaGC):
@@ -55,7 +66,55 @@ class CheckHadoopDataNodeJavaGC(CheckHadoopNameNodeJavaGC):
         # Python 3.x
         # super().__init__()
         self.name = ['Hadoop DataNode', 'Hadoop']
+        self.default_host = 'localhost'
         self.default_port = 50075
+        self.gc_sweep_role = 'DataNode'
+        self.namenode_path = '/jmx?qry=Hadoop:service=NameNode,name=NameNodeInfo'
+
+    def add_options(self):
+        super(CheckHadoopDataNodeJavaGC, self).add_options()
+        self.add_opt('-N', '--namenode', metavar='host[:port]',
+                     help='NameNode to discover all live DataNodes from to sweep instead of checking --host ' + \
+                          '(default port: 50070)')
+        self.add_gc_sweep_options()
+
+    def process_options(self):
+        namenode = self.get_opt('namenode')
+        if namenode:
+            if self.get_opt('hosts') or self.get_opt('hosts_file'):
+                self.usage('--namenode cannot be combined with --hosts / --hosts-file')
+            (host, _, port) = namenode.partition(':')
+            validate_host(host, 'NameNode')
+            if port:
+                validate_port(port, 'NameNode')
+            self.gc_sweep = (host, int(port or 50070))
+        super(CheckHadoopDataNodeJavaGC, self).process_options()
+        if self.gc_sweep:
+            self.process_gc_sweep_options()
+
+    def run(self):
+        if self.gc_sweep:
+            self.record_sweep_request(super(CheckHadoopDataNodeJavaGC, self).run)
+            self.sweep_gc(self.get_datanodes())
+        else:
+            super(CheckHadoopDataNodeJavaGC, self).run()
+
+    def get_datanodes(self):
+        """Returns a list of (host, http port) of the live DataNodes from the NameNode"""
+        content = self.query_sweep_master(self.namenode_path, 'NameNode')
+        try:
+            live_nodes = json.loads(content)['beans'][0]['LiveNodes']
+            nodes = decode_nodes(live_nodes, ['infoAddr'], strict=False)
+        except (ValueError, KeyError, IndexError, TypeError) as _:
+            raise CriticalError('failed to parse LiveNodes from NameNode: {0}'.format(_))
+        datanodes = []
+        for (name, info_addr) in nodes.items('infoAddr'):
+            # infoAddr is the DataNode's web UI ip:port, default to --port for older Hadoop versions without it
+            port = self.port
+            if info_addr and ':' in info_addr:
+                port = info_addr.rsplit(':', 1)[1]
+            datanodes.append((name.split(':')[0], port))
+        return datanodes
 
 
 if __name__ == '__main__':
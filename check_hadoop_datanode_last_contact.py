@@ -33,7 +33,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import json
 import os
 import sys
 import traceback
@@ -45,15 +44,19 @@ try:
     from harisekhon.utils import log, isInt, validate_chars, plural
     from harisekhon.utils import ERRORS, UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_hdfs_nodes import decode_nodes
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.7.1'
+__version__ = '0.8.0'
 
 
-class CheckHadoopDatanodeLastContact(RestNagiosPlugin):
+class CheckHadoopDatanodeLastContact(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -71,6 +74,7 @@ class CheckHadoopDatanodeLastContact(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckHadoopDatanodeLastContact, self).add_options()
+        self.add_cache_options()
         self.add_opt('-n', '--node', '--datanode',
                      help='Datanode hostname to check for, must match exactly what the Namenode ' \
                         + 'sees, use --list-nodes to see the list of datanodes')
@@ -79,6 +83,7 @@ class CheckHadoopDatanodeLastContact(RestNagiosPlugin):
 
     def process_options(self):
         super(CheckHadoopDatanodeLastContact, self).process_options()
+        self.process_cache_options()
         self.datanode = self.get_opt('node')
         self.list_nodes = self.get_opt('list_nodes')
         if not self.list_nodes:
@@ -114,35 +119,43 @@ class CheckHadoopDatanodeLastContact(RestNagiosPlugin):
                 print(datanode)
             sys.exit(ERRORS['UNKNOWN'])
 
+    def find_last_contact(self, nodes):
+        """return the last contact of the datanode in the decoded nodes, or None if not found"""
+        last_contact_secs = None
+        for (item, last_contact) in nodes.items('lastContact'):
+            if self.match_datanode(self.datanode, item):
+                if last_contact is None:
+                    raise KeyError('lastContact')
+                last_contact_secs = last_contact
+        return last_contact_secs
+
     def parse_json(self, json_data):
         log.info('parsing response')
         try:
             live_nodes_str = json_data['beans'][0]['LiveNodes']
             dead_nodes_str = json_data['beans'][0]['DeadNodes']
             decom_nodes_str = json_data['beans'][0]['DecomNodes']
-            live_nodes = json.loads(live_nodes_str)
-            dead_nodes = json.loads(dead_nodes_str)
-            decom_nodes = json.loads(decom_nodes_str)
+            # DecomNodes don't have lastContact, only the matching datanode's is required
+            live_nodes = decode_nodes(live_nodes_str, ['lastContact'], strict=False)
+            dead_nodes = decode_nodes(dead_nodes_str, ['lastContact'], strict=False)
+            decom_nodes = decode_nodes(decom_nodes_str, ['lastContact'], strict=False)
             self.print_nodes(live_nodes=live_nodes,
                              dead_nodes=dead_nodes,
                              decom_nodes=decom_nodes)
-            last_contact_secs = None
-            for item in live_nodes:
-                if self.match_datanode(self.datanode, item):
-                    last_contact_secs = live_nodes[item]['lastContact']
+            last_contact_secs = self.find_last_contact(live_nodes)
             # always check decom and dead nodes regardless if last_contact_secs was found in live nodes
             # gives an additional safety check to escalate to warning / critical
             self.msg = ''
-            for item in decom_nodes:
-                if self.match_datanode(self.datanode, item):
-                    last_contact_secs = decom_nodes[item]['lastContact']
-                    self.warning()
-                    self.msg = 'Decommissioning '
-            for item in dead_nodes:
-                if self.match_datanode(self.datanode, item):
-                    last_contact_secs = dead_nodes[item]['lastContact']
-                    self.critical()
-                    self.msg = 'Dead '
+            last_contact = self.find_last_contact(decom_nodes)
+            if last_contact is not None:
+                last_contact_secs = last_contact
+                self.warning()
+                self.msg = 'Decommissioning '
+            last_contact = self.find_last_contact(dead_nodes)
+            if last_contact is not None:
+                last_contact_secs = last_contact
+                self.critical()
+                self.msg = 'Dead '
             if last_contact_secs is None:
                 raise UnknownError("datanode '{0}' is not present in any of the live, ".format(self.datanode) + \
                                    "decommissioning or dead node lists!")
@@ -34,7 +34,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import json
 import os
 import sys
 import traceback
@@ -46,15 +45,19 @@ try:
     from harisekhon.utils import log, plural, isInt
     from harisekhon.utils import CriticalError, UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_hdfs_nodes import decode_nodes
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.5.1'
+__version__ = '0.6.0'
 
 
-class CheckHadoopDatanodesBlockBalance(RestNagiosPlugin):
+class CheckHadoopDatanodesBlockBalance(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -70,25 +73,26 @@ class CheckHadoopDatanodesBlockBalance(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckHadoopDatanodesBlockBalance, self).add_options()
+        self.add_cache_options()
         self.add_thresholds(default_warning=10, default_critical=30, percent=True)
 
     def process_options(self):
         super(CheckHadoopDatanodesBlockBalance, self).process_options()
+        self.process_cache_options()
         self.validate_thresholds()
 
     def parse_json(self, json_data):
         log.info('parsing response')
         try:
             live_nodes = json_data['beans'][0]['LiveNodes']
-            live_node_data = json.loads(live_nodes)
+            live_node_data = decode_nodes(live_nodes, ['numBlocks'])
             num_datanodes = len(live_node_data)
             if num_datanodes < 1:
                 raise CriticalError("no live datanodes returned by JMX API from namenode '{0}:{1}'"\
                                     .format(self.host, self.port))
             max_blocks = 0
             min_blocks = None
-            for datanode in live_node_data:
-                blocks = live_node_data[datanode]['numBlocks']
+            for (datanode, blocks) in live_node_data.items('numBlocks'):
                 if not isInt(blocks):
                     raise UnknownError('numBlocks {} is not an integer! {}'.format(blocks, support_msg_api()))
                 blocks = int(blocks)
@@ -37,7 +37,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import json
 import os
 import sys
 import traceback
@@ -49,15 +48,19 @@ try:
     from harisekhon.utils import log, plural, isInt
     from harisekhon.utils import CriticalError, UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_hdfs_nodes import decode_nodes
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.5.1'
+__version__ = '0.6.0'
 
 
-class CheckHadoopHDFSBalance(RestNagiosPlugin):
+class CheckHadoopHDFSBalance(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -73,25 +76,26 @@ class CheckHadoopHDFSBalance(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckHadoopHDFSBalance, self).add_options()
+        self.add_cache_options()
         self.add_thresholds(default_warning=10, default_critical=30, percent=True)
 
     def process_options(self):
         super(CheckHadoopHDFSBalance, self).process_options()
+        self.process_cache_options()
         self.validate_thresholds()
 
     def parse_json(self, json_data):
         log.info('parsing response')
         try:
             live_nodes = json_data['beans'][0]['LiveNodes']
-            live_node_data = json.loads(live_nodes)
+            live_node_data = decode_nodes(live_nodes, ['usedSpace'])
             num_datanodes = len(live_node_data)
             if num_datanodes < 1:
                 raise CriticalError("no live datanodes returned by JMX API from namenode '{0}:{1}'"\
                                     .format(self.host, self.port))
             min_space = None
             max_space = 0
-            for datanode in live_node_data:
-                used_space = live_node_data[datanode]['usedSpace']
+            for (datanode, used_space) in live_node_data.items('usedSpace'):
                 if not isInt(used_space):
                     raise UnknownError('usedSpace {} is not an integer! {}'.format(used_space, support_msg_api()))
                 used_space = int(used_space)
@@ -117,8 +121,7 @@ class CheckHadoopHDFSBalance(RestNagiosPlugin):
                 self.msg += ', min used space = {0}, max used space = {1}'.format(min_space, max_space)
             if self.verbose and (self.is_warning() or self.is_critical()):
                 self.msg += ' [imbalanced nodes: '
-                for datanode in live_node_data:
-                    used_space = live_node_data[datanode]['usedSpace']
+                for (datanode, used_space) in live_node_data.items('usedSpace'):
                     if (used_space / max_space * 100) > self.thresholds['warning']['upper']:
                         self.msg += '{0}({1:.2f%}),'.format(datanode, used_space)
                 self.msg = self.msg.rstrip(',') + ']'
@@ -44,6 +44,9 @@ try:
     from harisekhon.utils import log, plural
     from harisekhon.utils import UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -53,7 +56,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckHadoopHDFSCorruptFiles(RestNagiosPlugin):
+class CheckHadoopHDFSCorruptFiles(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -67,6 +70,14 @@ class CheckHadoopHDFSCorruptFiles(RestNagiosPlugin):
         self.auth = False
         self.msg = 'Message Not Defined'
 
+    def add_options(self):
+        super(CheckHadoopHDFSCorruptFiles, self).add_options()
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckHadoopHDFSCorruptFiles, self).process_options()
+        self.process_cache_options()
+
     def parse_json(self, json_data):
         log.info('parsing response')
         try:
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 23:52:16 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Nagios Plugin to check several HDFS health dimensions from a single fetch of the NameNode JMX NameNodeInfo bean
+
+Runs any selected subset of these checks, each with its own thresholds, against the one NameNodeInfo response:
+
+    space            - check_hadoop_hdfs_space.py
+    balance          - check_hadoop_hdfs_balance.py
+    block-balance    - check_hadoop_datanodes_block_balance.py
+    last-contact     - check_hadoop_datanode_last_contact.py (requires --datanode)
+    corrupt-files    - check_hadoop_hdfs_corrupt_files.py
+    failed-namedirs  - check_hadoop_namenode_failed_namedirs.py
+
+On a large cluster the bean is many MB, mostly the JSON strings embedded in it such as LiveNodes. Instead of each of
+the plugins above downloading and decoding it, the response and each embedded JSON string are decoded only once and
+shared by all the checks, which are run in-process with their usual logic and output. The node lists are only scanned
+for the fields each check uses (see lib_hdfs_nodes.py).
+
+Returns one combined result of the worst status, each check's message and all their perfdata, or with --passive
+outputs a Nagios passive check result per check instead, to write to the Nagios / Icinga external command file.
+
+Tested on Apache Hadoop 2.7, 2.8
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import functools
+import json
+import os
+import sys
+import time
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import log, log_option, qquit, plural, validate_chars, ERRORS
+    from harisekhon import RestNagiosPlugin
+    from lib_json import FastJsonMixin, use_json_backend
+    from lib_multi_host import PERFDATA_REGEX, STATUS_PRECEDENCE
+    from lib_plugin_runner import PluginLoader, PluginLoadError, run_in_process
+    from lib_response_cache import ResponseCacheMixin
+    from lib_timings import TimingsMixin
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+# check name, plugin module, passive service description, whether it takes thresholds
+CHECKS = (
+    ('space', 'check_hadoop_hdfs_space', 'HDFS Space', True),
+    ('balance', 'check_hadoop_hdfs_balance', 'HDFS Balance', True),
+    ('block-balance', 'check_hadoop_datanodes_block_balance', 'HDFS Block Balance', True),
+    ('last-contact', 'check_hadoop_datanode_last_contact', 'HDFS Datanode Last Contact', True),
+    ('corrupt-files', 'check_hadoop_hdfs_corrupt_files', 'HDFS Corrupt Files', False),
+    ('failed-namedirs', 'check_hadoop_namenode_failed_namedirs', 'HDFS NameNode Failed Dirs', False),
+)
+
+DEFAULT_CHECKS = ('space', 'balance', 'block-balance', 'corrupt-files', 'failed-namedirs')
+
+
+def shared_loads(loads):
+    """Returns a json.loads() which decodes each distinct JSON string only once, returning the same decoded object to
+    every caller, eg. the embedded LiveNodes for each of the checks using it if it isn't in the usual format for
+    lib_hdfs_nodes.py to scan"""
+    decoded = {}
+
+    @functools.wraps(loads)
+    def _loads(content, **kwargs):
+        if [_ for _ in kwargs.values() if _ is not None]:
+            return loads(content, **kwargs)
+        # the checks all share the one response so this is normally an identity match without comparing content
+        if content not in decoded:
+            decoded[content] = loads(content)
+        return decoded[content]
+    return _loads
+
+
+class CheckHadoopHDFSHealth(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
+
+    def __init__(self):
+        # Python 2.x
+        super(CheckHadoopHDFSHealth, self).__init__()
+        # Python 3.x
+        # super().__init__()
+        self.name = ['Hadoop NameNode', 'Hadoop']
+        self.path = '/jmx?qry=Hadoop:service=NameNode,name=NameNodeInfo'
+        self.default_port = 50070
+        self.json = True
+        self.auth = False
+        self.checks = []
+        self.loader = PluginLoader()
+        self.passive = False
+        self.passive_host = None
+        self.msg = 'Message Not Defined'
+
+    def add_options(self):
+        super(CheckHadoopHDFSHealth, self).add_options()
+        self.add_cache_options()
+        self.add_opt('-k', '--checks', metavar='check1,check2,...',
+                     help='Checks to run, any of: {0} '.format(', '.join([_[0] for _ in CHECKS])) + \
+                          '(default: {0}, plus last-contact if --datanode is given)'.format(','.join(DEFAULT_CHECKS)))
+        for (name, module, _, thresholds) in CHECKS:
+            if thresholds:
+                self.add_opt('--{0}-warning'.format(name), metavar='threshold',
+                             help='Warning threshold for the {0} check (default: as per {1}.py)'.format(name, module))
+                self.add_opt('--{0}-critical'.format(name), metavar='threshold',
+                             help='Critical threshold for the {0} check (default: as per {1}.py)'.format(name, module))
+        self.add_opt('-n', '--datanode', help='Datanode hostname for the last-contact check, must match exactly ' + \
+                                              'what the NameNode sees')
+        self.add_opt('--passive', action='store_true',
+                     help='Output a Nagios passive check result per check instead of one combined result')
+        self.add_opt('--passive-host', help='Host name for the passive check results (default: --host)')
+
+    def process_options(self):
+        super(CheckHadoopHDFSHealth, self).process_options()
+        self.process_cache_options()
+        names = [_[0] for _ in CHECKS]
+        datanode = self.get_opt('datanode')
+        checks = self.get_opt('checks')
+        if checks:
+            checks = [_.strip() for _ in checks.split(',') if _.strip()]
+        else:
+            checks = list(DEFAULT_CHECKS)
+            if datanode:
+                checks.append('last-contact')
+        for check in checks:
+            if check not in names:
+                self.usage("invalid check '{0}', must be one of: {1}".format(check, ', '.join(names)))
+        if 'last-contact' in checks:
+            validate_chars(datanode, 'datanode', 'A-Za-z0-9:_.-')
+        # run in the order of CHECKS regardless of the order given
+        self.checks = [_ for _ in CHECKS if _[0] in checks]
+        log_option('checks', ','.join([_[0] for _ in self.checks]))
+        self.passive = self.get_opt('passive')
+        self.passive_host = self.get_opt('passive_host') or self.host
+
+    def check_argv(self, name, module, thresholds):
+        argv = [module + '.py', '--host', self.host, '--port', str(self.port)]
+        if thresholds:
+            for threshold in ('warning', 'critical'):
+                value = self.get_opt('{0}_{1}'.format(name.replace('-', '_'), threshold))
+                if value is not None:
+                    argv += ['--' + threshold, value]
+        if name == 'last-contact':
+            argv += ['--node', self.get_opt('datanode')]
+        if self.verbose:
+            argv += ['-v'] * self.verbose
+        return argv
+
+    def run_check(self, name, module, thresholds, json_data):
+        """Runs the check's plugin in-process on the already decoded bean and returns a PluginResult"""
+        try:
+            plugin_class = self.loader.load(module + '.py').main_class
+        except PluginLoadError as _:
+            qquit('UNKNOWN', "failed to load check '{0}': {1}".format(name, _))
+
+        def prepare(plugin):
+            # skips the plugin's own request and decoding of the response
+            plugin.run = functools.partial(plugin.parse_json, json_data)
+
+        result = run_in_process(plugin_class, self.check_argv(name, module, thresholds), prepare)
+        result.name = name
+        log.info("check '%s' returned %s in %.3f secs", name, result.status, result.runtime)
+        return result
+
+    def parse_json(self, json_data):
+        # json.loads() here is FastJsonMixin's backend
+        with use_json_backend(shared_loads(json.loads)):
+            results = [self.run_check(name, module, thresholds, json_data)
+                       for (name, module, _, thresholds) in self.checks]
+        worst = 'OK'
+        for result in results:
+            status = result.status if result.status in STATUS_PRECEDENCE else 'UNKNOWN'
+            if STATUS_PRECEDENCE.index(status) > STATUS_PRECEDENCE.index(worst):
+                worst = status
+        if self.passive:
+            self.output_passive(results)
+            sys.exit(ERRORS[worst])
+        getattr(self, worst.lower())()
+        num_ok = len([_ for _ in results if _.status == 'OK'])
+        self.msg = 'HDFS {0}/{1} check{2} OK - '.format(num_ok, len(results), plural(results))
+        self.msg += ', '.join(['{0} {1}: {2}'.format(_.name, _.status, strip_status(_.message, _.status))
+                               for _ in results])
+        perfdata = []
+        seen = set()
+        for result in results:
+            # num_datanodes is output by both of the balance checks
+            for (label, value) in PERFDATA_REGEX.findall(result.perfdata):
+                if label not in seen:
+                    seen.add(label)
+                    perfdata.append('{0}={1}'.format(label, value))
+        if perfdata:
+            self.msg += ' | ' + ' '.join(perfdata)
+
+    def output_passive(self, results):
+        timestamp = int(time.time())
+        services = dict([(_[0], _[2]) for _ in CHECKS])
+        for result in results:
+            print('[{timestamp}] PROCESS_SERVICE_CHECK_RESULT;{host};{service};{returncode};{output}'\
+                  .format(timestamp=timestamp,
+                          host=self.passive_host,
+                          service=services[result.name],
+                          returncode=result.returncode,
+                          output=result.output.strip().replace('\n', '\\n')))
+
+
+def strip_status(message, status):
+    """Returns the message without the leading 'STATUS: ' the plugin output it with"""
+    prefix = status + ': '
+    if message.startswith(prefix):
+        return message[len(prefix):]
+    return message
+
+
+if __name__ == '__main__':
+    CheckHadoopHDFSHealth().main()
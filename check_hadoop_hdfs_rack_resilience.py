@@ -22,6 +22,12 @@ from the 'hdfs dfsadmin' command
 
 The 'hdfs' command must be in the $PATH and you should execute this program as the 'hdfs' superuser
 
+With --namenode gets the rack information from the NameNode JMX instead of the 'hdfs' command, avoiding starting a JVM
+on every check. The topology is cached on local disk for --topology-cache-ttl secs, keyed on a fingerprint of the
+NameNode's live / dead / decommissioning DataNode counts, so while these don't change each check only queries one small
+JMX bean (see lib_hdfs_racks.py). Requires a Hadoop version whose NameNode JMX LiveNodes include each DataNode's rack
+location
+
 See also check_ambari_cluster_hdfs_rack_resilience.py - it's a cleaner way of checking this via the Ambari API
 on Hortonworks HDP clusters
 
@@ -34,8 +40,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import json
 import os
-import re
 import subprocess
 import sys
 import time
@@ -45,43 +51,66 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import log
-    from harisekhon.utils import CriticalError, UnknownError, support_msg
-    from harisekhon.utils import ip_regex, host_regex, plural
+    import requests
+    from harisekhon.utils import log, log_option, validate_host, validate_port, validate_int
+    from harisekhon.utils import CriticalError
     from harisekhon import NagiosPlugin
+    from lib_hdfs_racks import HdfsRackResilienceMixin, parse_jmx_topology, parse_topology, topology_fingerprint
+    from lib_hdfs_racks import JMX_FS_STATE_PATH, JMX_LIVE_NODES_PATH, TOPOLOGY_CACHE_VERSION
+    from lib_response_cache import ResponseCache, DEFAULT_CACHE_DIR
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.1'
+__version__ = '0.2'
 
 
-class CheckHadoopHdfsRackResilience(NagiosPlugin):
+class CheckHadoopHdfsRackResilience(HdfsRackResilienceMixin, NagiosPlugin):
 
     def __init__(self):
         # Python 2.x
         super(CheckHadoopHdfsRackResilience, self).__init__()
         # Python 3.x
         # super().__init__()
+        self.namenode = None
+        self.protocol = 'http'
+        self.topology_cache_ttl = 3600
         self.query_time = None
         self.msg = 'HDFS Rack Resilience Msg not defined yet'
 
     def add_options(self):
         super(CheckHadoopHdfsRackResilience, self).add_options()
+        self.add_opt('-N', '--namenode', metavar='host[:port]',
+                     help="NameNode to get the rack information from via JMX instead of the 'hdfs' command " + \
+                          '(default port: 50070)')
+        self.add_opt('-S', '--ssl', action='store_true', help='Use SSL to connect to the NameNode')
+        self.add_opt('--topology-cache-ttl', metavar='secs', default=3600,
+                     help='Max secs to reuse the rack information cached from the NameNode while its DataNode ' + \
+                          'counts are unchanged, 0 = disabled (default: 3600)')
 
     def process_options(self):
         super(CheckHadoopHdfsRackResilience, self).process_options()
         #self.no_args()
+        namenode = self.get_opt('namenode')
+        if namenode:
+            (host, _, port) = namenode.partition(':')
+            validate_host(host, 'NameNode')
+            if port:
+                validate_port(port, 'NameNode')
+            self.namenode = (host, int(port or 50070))
+            if self.get_opt('ssl'):
+                self.protocol = 'https'
+            ttl = self.get_opt('topology_cache_ttl')
+            validate_int(ttl, 'topology cache ttl', 0, 86400)
+            self.topology_cache_ttl = int(ttl)
 
     def get_rack_info(self):
-        rack_regex = re.compile(r'^Rack:\s+(.+?)\s*$')
-        node_regex = re.compile(r'^\s+({ip})(?::\d+)?\s+\(({host})\)\s*$'.format(ip=ip_regex, host=host_regex))
-        #node_regex = re.compile(r'^\s+(.*?).*\s+\((.*?)\)\s*'.format(ip=ip_regex))
         start = time.time()
         cmd = 'hdfs dfsadmin -printTopology'
         log.debug('cmd: ' + cmd)
-        proc = subprocess.Popen(cmd.split(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        proc = subprocess.Popen(cmd.split(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                universal_newlines=True)
         (stdout, _) = proc.communicate()
         self.query_time = time.time() - start
         log.debug('stdout: ' + str(stdout))
@@ -89,60 +118,61 @@ class CheckHadoopHdfsRackResilience(NagiosPlugin):
         log.debug('returncode: ' + str(returncode))
         if returncode != 0 or (stdout is not None and 'Error' in stdout):
             raise CriticalError('hdfs command returncode: {0}, output: {1}'.format(returncode, stdout))
-        lines = str(stdout).split('\n')
-
-        racks = {}
-        rack = None
-        for line in lines:
-            match = rack_regex.match(line)
-            if match:
-                rack = match.group(1)
-                log.info('found rack: %s', rack)
-                continue
-            # ignore early warning lines sometimes output by JVM
-            # only continue from point where we find at least first Rack definition
-            if not rack:
-                continue
-            match = node_regex.match(line)
-            if match:
-                #ip = match.group(1)
-                host = match.group(2)
-                log.info('found host: %s', host)
-                # already checked above
-                #if not rack:
-                #    raise UnknownError('node regex matched before rack was detected!! {}'.format(support_msg()))
-                if rack not in racks:
-                    racks[rack] = []
-                racks[rack].append(host)
-            elif not line:
-                continue
-            else:
-                raise UnknownError('parsing error. {}'.format(support_msg()))
-        if not rack:
-            raise UnknownError('no rack information found - parse error. {}'.format(support_msg()))
+        return parse_topology(stdout)
+
+    def get_jmx(self, path):
+        url = '{0}://{1}:{2}{3}'.format(self.protocol, self.namenode[0], self.namenode[1], path)
+        log.debug('GET %s', url)
+        try:
+            req = requests.get(url, timeout=self.timeout / 2)
+        except requests.exceptions.RequestException as _:
+            raise CriticalError('failed to query NameNode: {0}'.format(_))
+        if req.status_code != 200:
+            raise CriticalError('NameNode returned {0} {1}'.format(req.status_code, req.reason))
+        try:
+            return json.loads(req.content)
+        except ValueError as _:
+            raise CriticalError('invalid JSON returned by NameNode: {0}'.format(_))
+
+    def get_topology_cache(self):
+        if not self.topology_cache_ttl:
+            return None
+        cache_dir = os.getenv('NAGIOS_PLUGINS_CACHE_DIR', DEFAULT_CACHE_DIR)
+        log_option('cache dir', cache_dir)
+        try:
+            return ResponseCache(cache_dir)
+        except (OSError, ValueError) as _:
+            log.warning('failed to use cache dir for the rack topology, fetching it every run: %s', _)
+            return None
+
+    def get_jmx_rack_info(self):
+        start = time.time()
+        cache = self.get_topology_cache()
+        if cache is None:
+            racks = parse_jmx_topology(self.get_jmx(JMX_LIVE_NODES_PATH))
+        else:
+            fingerprint = topology_fingerprint(self.get_jmx(JMX_FS_STATE_PATH))
+            key = cache.key('{0}://{1}:{2}#topology#{3}'.format(self.protocol, self.namenode[0], self.namenode[1],
+                                                                fingerprint))
+            # held while fetching so concurrent checks wait for the first one's topology instead of each fetching
+            with cache.lock(key):
+                cached = cache.get_data(key, self.topology_cache_ttl)
+                if cached is not None and cached.get('version') == TOPOLOGY_CACHE_VERSION:
+                    log.info('using cached rack topology for DataNodes fingerprint %s', fingerprint)
+                    racks = cached['racks']
+                else:
+                    racks = parse_jmx_topology(self.get_jmx(JMX_LIVE_NODES_PATH))
+                    cache.put_data(key, JMX_LIVE_NODES_PATH, {'version': TOPOLOGY_CACHE_VERSION, 'racks': racks})
+        self.query_time = time.time() - start
         return racks
 
     def run(self):
-        racks = self.get_rack_info()
-        num_racks = len(racks)
-        self.msg = '{} rack{} configured'.format(num_racks, plural(num_racks))
-        if num_racks < 2:
-            self.warning()
-            self.msg += ' (no rack resilience!)'
-        default_rack = '/default-rack'
-        num_nodes_left_in_default_rack = 0
-        if default_rack in racks:
-            self.warning()
-            num_nodes_left_in_default_rack = len(racks[default_rack])
-            msg = "{num} node{plural} left in '{default_rack}'!"\
-                  .format(num=num_nodes_left_in_default_rack,
-                          plural=plural(num_nodes_left_in_default_rack),
-                          default_rack=default_rack)
-            if self.verbose:
-                msg += ' [{}]'.format(', '.join(racks[default_rack]))
-            self.msg = msg + ' - ' + self.msg
-        self.msg += ' | hdfs_racks={};2 nodes_in_default_rack={};0 query_time={:.2f}s'\
-                    .format(num_racks, num_nodes_left_in_default_rack, self.query_time)
+        if self.namenode:
+            racks = self.get_jmx_rack_info()
+        else:
+            racks = self.get_rack_info()
+        self.check_rack_resilience(racks)
+        self.msg += ' query_time={:.2f}s'.format(self.query_time)
 
 
 if __name__ == '__main__':
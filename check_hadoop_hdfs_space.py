@@ -50,6 +50,9 @@ try:
     from harisekhon.utils import log, isFloat, isInt
     from harisekhon.utils import UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -58,7 +61,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4.1'
 
 
-class CheckHadoopHDFSBalance(RestNagiosPlugin):
+class CheckHadoopHDFSBalance(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -74,10 +77,12 @@ class CheckHadoopHDFSBalance(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckHadoopHDFSBalance, self).add_options()
+        self.add_cache_options()
         self.add_thresholds(default_warning=80, default_critical=90, percent=True)
 
     def process_options(self):
         super(CheckHadoopHDFSBalance, self).process_options()
+        self.process_cache_options()
         self.validate_thresholds()
 
     def parse_json(self, json_data):
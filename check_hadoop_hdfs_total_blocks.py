@@ -44,6 +44,9 @@ try:
     from harisekhon.utils import log, isInt
     from harisekhon.utils import UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -53,7 +56,7 @@ __version__ = '0.4'
 
 
 # pylint: disable=too-few-public-methods
-class CheckHadoopHDFSTotalBlocks(RestNagiosPlugin):
+class CheckHadoopHDFSTotalBlocks(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -69,10 +72,12 @@ class CheckHadoopHDFSTotalBlocks(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckHadoopHDFSTotalBlocks, self).add_options()
+        self.add_cache_options()
         self.add_thresholds()
 
     def process_options(self):
         super(CheckHadoopHDFSTotalBlocks, self).process_options()
+        self.process_cache_options()
         self.validate_thresholds()
 
     def parse_json(self, json_data):
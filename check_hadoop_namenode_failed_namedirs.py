@@ -40,6 +40,9 @@ try:
     from harisekhon.utils import log, plural
     from harisekhon.utils import UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -49,7 +52,7 @@ __version__ = '0.4'
 
 
 # pylint: disable=too-few-public-methods
-class CheckHadoopFailedNameDirs(RestNagiosPlugin):
+class CheckHadoopFailedNameDirs(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -63,6 +66,14 @@ class CheckHadoopFailedNameDirs(RestNagiosPlugin):
         self.auth = False
         self.msg = 'Message Not Defined'
 
+    def add_options(self):
+        super(CheckHadoopFailedNameDirs, self).add_options()
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckHadoopFailedNameDirs, self).process_options()
+        self.process_cache_options()
+
     def parse_json(self, json_data):
         log.info('parsing response')
         try:
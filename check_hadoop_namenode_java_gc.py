@@ -21,6 +21,11 @@ Nagios Plugin to check Hadoop NameNode Java GC last duration via JMX API
 
 Thresholds apply to Java Garbage Collection last duration in seconds
 
+With --rate checks the percentage of time spent in GC and the collections per minute since the previous run instead,
+with the thresholds applying to the GC time percentage (see lib_java_gc.py)
+
+Queries only the java.lang:type=GarbageCollector JMX beans rather than the whole of /jmx
+
 Tested on Apache Hadoop 2.8
 
 """
@@ -38,17 +43,20 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import isInt, UnknownError
+    from harisekhon.utils import UnknownError
     from harisekhon import RestNagiosPlugin
+    from lib_java_gc import JavaGCMixin, JMX_GC_PATH, parse_jmx_collectors
+    from lib_multi_host import MultiHostMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.1'
+__version__ = '0.2'
 
 
-class CheckHadoopNameNodeJavaGC(RestNagiosPlugin):
+class CheckHadoopNameNodeJavaGC(TimingsMixin, MultiHostMixin, JavaGCMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -56,7 +64,7 @@ class CheckHadoopNameNodeJavaGC(RestNagiosPlugin):
         # Python 3.x
         # super().__init__()
         self.name = ['Hadoop NameNode', 'Hadoop']
-        self.path = '/jmx'
+        self.path = JMX_GC_PATH
         self.default_port = 50070
         self.json = True
         self.auth = False
@@ -64,19 +72,20 @@ class CheckHadoopNameNodeJavaGC(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckHadoopNameNodeJavaGC, self).add_options()
+        self.add_gc_options()
         self.add_thresholds(default_warning=5, default_critical=10)
 
     def process_options(self):
         super(CheckHadoopNameNodeJavaGC, self).process_options()
+        self.process_gc_options()
         self.validate_thresholds(integer=False)
 
     def parse_json(self, json_data):
-        gc_times = []
-        for bean in json_data['beans']:
-            if 'name' in bean and bean['name'][:37] == 'java.lang:type=GarbageCollector,name=':
-                last_gc_info = bean['LastGcInfo']
-                if last_gc_info and 'duration' in last_gc_info and isInt(last_gc_info['duration']):
-                    gc_times.append(int(last_gc_info['duration']))
+        collectors = parse_jmx_collectors(json_data)
+        if self.rate:
+            self.check_gc_rate(collectors)
+            return
+        gc_times = [_.last_duration for _ in collectors if _.last_duration is not None]
         if not gc_times:
             raise UnknownError('no Java GC times found')
         gc_millis = max(gc_times)
@@ -38,6 +38,9 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import UnknownError
     from harisekhon import RestVersionNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -47,7 +50,7 @@ __version__ = '0.2'
 
 
 # pylint: disable=too-few-public-methods
-class CheckHadoopNameNodeVersion(RestVersionNagiosPlugin):
+class CheckHadoopNameNodeVersion(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestVersionNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -61,6 +64,14 @@ class CheckHadoopNameNodeVersion(RestVersionNagiosPlugin):
         self.auth = False
         self.ok()
 
+    def add_options(self):
+        super(CheckHadoopNameNodeVersion, self).add_options()
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckHadoopNameNodeVersion, self).process_options()
+        self.process_cache_options()
+
     # must override, cannot change to @staticmethod
     def parse_json(self, json_data):  # pylint: disable=no-self-use
         data = json_data['beans'][0]
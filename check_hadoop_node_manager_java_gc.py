@@ -21,6 +21,14 @@ Nagios Plugin to check Hadoop Yarn Node Manager Java GC last duration via JMX AP
 
 Thresholds apply to Java Garbage Collection last duration in seconds
 
+With --rate checks the percentage of time spent in GC and the collections per minute since the previous run instead,
+with the thresholds applying to the GC time percentage (see lib_java_gc.py)
+
+With --resource-manager discovers all the running and unhealthy NodeManagers from the Resource Manager REST API and
+sweeps each of their GC and heap JMX beans concurrently instead of checking --host, with a deadline per NodeManager,
+outputting the number of NodeManagers over the thresholds, the max / p95 / median distribution and the worst --top
+NodeManagers. Optional --heap-warning / --heap-critical thresholds apply to the percentage of max heap used by each
+
 Tested on Apache Hadoop 2.8
 
 """
@@ -30,6 +38,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import json
 import os
 import sys
 import traceback
@@ -38,13 +47,14 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
+    from harisekhon.utils import validate_host, validate_port, CriticalError
     from check_hadoop_namenode_java_gc import CheckHadoopNameNodeJavaGC
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.5'
 
 
 class CheckHadoopNodeManagerJavaGC(CheckHadoopNameNodeJavaGC):
@@ -55,13 +65,59 @@ class CheckHadoopNodeManagerJavaGC(CheckHadoopNameNodeJavaGC):
         # Python 3.x
         # super().__init__()
         self.name = ['Hadoop Yarn Node Manager', 'Hadoop']
+        self.default_host = 'localhost'
         self.default_port = 8042
+        self.gc_sweep_role = 'NodeManager'
+        self.resource_manager_path = '/ws/v1/cluster/nodes'
 
     def add_options(self):
         # This is what I meant to do pylint, set the default thresholds lower
         super(CheckHadoopNameNodeJavaGC, self).add_options()  # pylint: disable=bad-super-call
+        self.add_gc_options()
+        self.add_opt('-R', '--resource-manager', metavar='host[:port]',
+                     help='Resource Manager to discover all running NodeManagers from to sweep instead of checking ' + \
+                          '--host (default port: 8088)')
+        self.add_gc_sweep_options()
         self.add_thresholds(default_warning=5, default_critical=10)
 
+    def process_options(self):
+        resource_manager = self.get_opt('resource_manager')
+        if resource_manager:
+            if self.get_opt('hosts') or self.get_opt('hosts_file'):
+                self.usage('--resource-manager cannot be combined with --hosts / --hosts-file')
+            (host, _, port) = resource_manager.partition(':')
+            validate_host(host, 'Resource Manager')
+            if port:
+                validate_port(port, 'Resource Manager')
+            self.gc_sweep = (host, int(port or 8088))
+        super(CheckHadoopNodeManagerJavaGC, self).process_options()
+        if self.gc_sweep:
+            self.process_gc_sweep_options()
+
+    def run(self):
+        if self.gc_sweep:
+            self.record_sweep_request(super(CheckHadoopNodeManagerJavaGC, self).run)
+            self.sweep_gc(self.get_node_managers())
+        else:
+            super(CheckHadoopNodeManagerJavaGC, self).run()
+
+    def get_node_managers(self):
+        """Returns a list of (host, http port) of the running and unhealthy NodeManagers from the Resource Manager"""
+        content = self.query_sweep_master(self.resource_manager_path, 'Resource Manager')
+        try:
+            # 'nodes' is null rather than an empty list when there are no NodeManagers
+            nodes = (json.loads(content)['nodes'] or {}).get('node') or []
+            node_managers = []
+            for node in nodes:
+                # unhealthy NodeManagers are still running and their GC may be why they're unhealthy
+                if node['state'] not in ('RUNNING', 'UNHEALTHY'):
+                    continue
+                (host, _, port) = node['nodeHTTPAddress'].rpartition(':')
+                node_managers.append((host, port))
+        except (ValueError, KeyError, TypeError, AttributeError) as _:
+            raise CriticalError('failed to parse nodes from Resource Manager: {0}'.format(_))
+        return node_managers
+
 
 if __name__ == '__main__':
     CheckHadoopNodeManagerJavaGC().main()
@@ -56,6 +56,7 @@ try:
     from harisekhon.utils import log, isInt, isList, validate_chars, validate_int, validate_regex
     from harisekhon.utils import ERRORS, CriticalError, UnknownError, jsonpp
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -64,7 +65,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.7.2'
 
 
-class CheckHadoopYarnAppLastFinishedState(RestNagiosPlugin):
+class CheckHadoopYarnAppLastFinishedState(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -50,6 +50,7 @@ try:
     from harisekhon.utils import log, isInt, isList, validate_chars, validate_int, validate_regex
     from harisekhon.utils import ERRORS, CriticalError, UnknownError, jsonpp
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -58,7 +59,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.7.3'
 
 
-class CheckHadoopYarnAppRunning(RestNagiosPlugin):
+class CheckHadoopYarnAppRunning(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
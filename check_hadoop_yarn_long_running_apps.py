@@ -31,6 +31,9 @@ Use the --exclude regex to exclude intentionally long running applications
 
 Applications called llap\d+ are implicitly skipped
 
+The apps are decoded from the Resource Manager's response one at a time as it downloads, so memory stays flat even
+with thousands of running apps (uses the ijson module if installed)
+
 Tested on HDP 2.6.1 and Apache Hadoop 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8
 
 """
@@ -50,17 +53,22 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, isInt, isList, validate_int, validate_regex
-    from harisekhon.utils import ERRORS, UnknownError
+    from harisekhon.utils import ERRORS, UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_json_stream import StreamingJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.8.2'
+__version__ = '0.9.1'
+
 
+class CheckHadoopYarnLongRunningApps(StreamingJsonMixin, TimingsMixin, RestNagiosPlugin):
 
-class CheckHadoopYarnLongRunningApps(RestNagiosPlugin):
+    json_stream_prefix = 'apps.app.item'
+    json_stream_check_containers = True
 
     def __init__(self):
         # Python 2.x
@@ -128,33 +136,60 @@ class CheckHadoopYarnLongRunningApps(RestNagiosPlugin):
         self.validate_thresholds(optional=True)
 
     def parse_json(self, json_data):
-        app_list = self.get_app_list(json_data)
-        (num_apps_breaching_sla, matching_apps, max_elapsed, max_threshold_msg) = self.check_app_elapsed_times(app_list)
+        self.parse_json_stream(iter(self.get_app_list(json_data)))
+
+    def parse_json_stream(self, apps):
+        if self.list_apps:
+            app_list = list(apps)
+            self.validate_app_stream()
+            self.print_apps(app_list)
+            sys.exit(ERRORS['UNKNOWN'])
+        (num_apps_breaching_sla, matching_apps, max_elapsed, max_threshold_msg, num_apps) = \
+                                                                                self.check_app_elapsed_times(apps)
+        self.validate_app_stream()
         self.msg += '{0}, checked {1} out of {2} running apps'\
-                   .format(num_apps_breaching_sla, matching_apps, len(app_list)) + \
+                   .format(num_apps_breaching_sla, matching_apps, num_apps) + \
                    ', max elapsed app time = {0} secs{1}'\
                    .format(max_elapsed, max_threshold_msg)
         self.msg += ' | num_apps_breaching_SLA={0} max_elapsed_app_time={1}{2}'\
                     .format(num_apps_breaching_sla, max_elapsed, self.get_perf_thresholds())
 
+    def get_host_info(self):
+        if self.verbose:
+            return " at '{0}:{1}'".format(self.host, self.port)
+        return ''
+
     def get_app_list(self, json_data):
         apps = json_data['apps']
         app_list = []
         if apps:
             app_list = apps['app']
-        host_info = ''
-        if self.verbose:
-            host_info = " at '{0}:{1}'".format(self.host, self.port)
         if not isList(app_list):
             raise UnknownError("non-list returned for json_data[apps][app] by Yarn Resource Manager{0}"\
-                               .format(host_info))
+                               .format(self.get_host_info()))
         num_apps = len(app_list)
-        log.info("processing {0:d} apps returned by Yarn Resource Manager{1}".format(num_apps, host_info))
+        log.info("processing {0:d} apps returned by Yarn Resource Manager{1}".format(num_apps, self.get_host_info()))
         if self.list_apps:
             self.print_apps(app_list)
             sys.exit(ERRORS['UNKNOWN'])
         return app_list
 
+    def validate_app_stream(self):
+        """Applies the same validation as get_app_list() to the streamed response once its apps are consumed"""
+        containers = self.json_stream_containers
+        # apps were passed from parse_json() having already been validated by get_app_list()
+        if containers is None:
+            return
+        if 'apps' not in containers:
+            raise UnknownError("'apps' field not returned by Yarn Resource Manager{0}. {1}"\
+                               .format(self.get_host_info(), support_msg_api()))
+        # "apps": null is returned when there are no running apps
+        if containers['apps'] == 'null':
+            return
+        if containers.get('apps.app', 'start_array') != 'start_array':
+            raise UnknownError("non-list returned for json_data[apps][app] by Yarn Resource Manager{0}"\
+                               .format(self.get_host_info()))
+
     def app_selector(self, app):
         name = app['name']
         queue = app['queue']
@@ -175,14 +210,18 @@ class CheckHadoopYarnLongRunningApps(RestNagiosPlugin):
             return False
         return True
 
-    def check_app_elapsed_times(self, app_list):
+    def check_app_elapsed_times(self, apps):
+        """Takes a list or iterator of apps, returns a tuple of
+        (num apps breaching SLA, num matching apps, max elapsed secs, max threshold msg, total num apps)"""
+        num_apps = 0
         num_apps_breaching_sla = 0
         max_elapsed = 0
         matching_apps = 0
         max_threshold_msg = ''
         # save msg as check_thresholds appends to it which we want to reset in this case
         msg = self.msg
-        for app in app_list:
+        for app in apps:
+            num_apps += 1
             if not self.app_selector(app):
                 continue
             name = app['name']
@@ -202,7 +241,8 @@ class CheckHadoopYarnLongRunningApps(RestNagiosPlugin):
             max_threshold_msg = ' ' + max_threshold_msg
         # restore msg prefix as check_thresholds appends every threshold breach
         self.msg = msg
-        return (num_apps_breaching_sla, matching_apps, max_elapsed, max_threshold_msg)
+        log.info('processed %s apps returned by Yarn Resource Manager', num_apps)
+        return (num_apps_breaching_sla, matching_apps, max_elapsed, max_threshold_msg, num_apps)
 
     @staticmethod
     def print_apps(app_list):
@@ -51,14 +51,14 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import plural
+    from harisekhon.utils import plural, ERRORS
     from check_hadoop_yarn_long_running_apps import CheckHadoopYarnLongRunningApps
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.5.1'
+__version__ = '0.6.1'
 
 
 class CheckHadoopYarnLongRunningSparkShells(CheckHadoopYarnLongRunningApps):
@@ -88,12 +88,17 @@ class CheckHadoopYarnLongRunningSparkShells(CheckHadoopYarnLongRunningApps):
         super(CheckHadoopYarnLongRunningApps, self).process_options()  # pylint: disable=bad-super-call
         self.process_options_common()
 
-    def parse_json(self, json_data):
-        app_list = self.get_app_list(json_data)
-        (num_shells_breaching_sla, num_matching_apps, max_elapsed, max_threshold_msg) = \
-                                                                                self.check_app_elapsed_times(app_list)
+    def parse_json_stream(self, apps):
+        if self.list_apps:
+            app_list = list(apps)
+            self.validate_app_stream()
+            self.print_apps(app_list)
+            sys.exit(ERRORS['UNKNOWN'])
+        (num_shells_breaching_sla, num_matching_apps, max_elapsed, max_threshold_msg, num_apps) = \
+                                                                                self.check_app_elapsed_times(apps)
+        self.validate_app_stream()
         self.msg += '{0}, checked {1} Spark Shell{2} out of {3} running apps'\
-                   .format(num_shells_breaching_sla, num_matching_apps, plural(num_matching_apps), len(app_list)) + \
+                   .format(num_shells_breaching_sla, num_matching_apps, plural(num_matching_apps), num_apps) + \
                    ', longest running Spark Shell = {0} secs{1}'\
                    .format(max_elapsed, max_threshold_msg)
         self.msg += ' | num_spark_shells_breaching_SLA={0} max_elapsed_spark_shell_time={1}{2}'\
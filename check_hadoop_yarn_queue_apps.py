@@ -55,6 +55,7 @@ try:
     from harisekhon.utils import log, isInt, isList, validate_int, validate_regex, plural
     from harisekhon.utils import ERRORS, UnknownError
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -63,7 +64,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4.1'
 
 
-class CheckHadoopYarnQueueApps(RestNagiosPlugin):
+class CheckHadoopYarnQueueApps(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -41,6 +41,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log_option
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -49,7 +50,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckYarnResourceManagerMasterState(RestNagiosPlugin):
+class CheckYarnResourceManagerMasterState(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -52,15 +52,20 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_hbase_master_status import HBaseMasterStatusMixin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.1'
+__version__ = '0.2'
 
 
-class CheckHBaseBalancerEnabled(RestNagiosPlugin):
+class CheckHBaseBalancerEnabled(FastJsonMixin, TimingsMixin, HBaseMasterStatusMixin, ResponseCacheMixin,
+                                RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -76,12 +81,15 @@ class CheckHBaseBalancerEnabled(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckHBaseBalancerEnabled, self).add_options()
+        self.add_cache_options()
 
     def process_options(self):
         super(CheckHBaseBalancerEnabled, self).process_options()
+        self.process_cache_options()
 
-    def parse(self, req):
-        if 'Load Balancer is not enabled' in req.content:
+    def run(self):
+        snapshot = self.get_master_status(self.host, self.port, self.protocol)
+        if snapshot['balancer']['not_enabled']:
             self.warning()
             self.msg = 'HBase balancer is not enabled!'
         else:
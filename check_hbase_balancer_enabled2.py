@@ -39,32 +39,29 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import logging
 import os
-import re
 import sys
 import traceback
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    print(traceback.format_exc(), end='')
-    sys.exit(4)
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import log
     from harisekhon import RestNagiosPlugin
+    from lib_hbase_master_status import HBaseMasterStatusMixin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.3'
 
 
-class CheckHBaseBalancerEnabled(RestNagiosPlugin):
+class CheckHBaseBalancerEnabled(FastJsonMixin, TimingsMixin, HBaseMasterStatusMixin, ResponseCacheMixin,
+                                RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -80,22 +77,20 @@ class CheckHBaseBalancerEnabled(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckHBaseBalancerEnabled, self).add_options()
+        self.add_cache_options()
 
     def process_options(self):
         super(CheckHBaseBalancerEnabled, self).process_options()
+        self.process_cache_options()
 
-    def parse(self, req):
-        soup = BeautifulSoup(req.content, 'html.parser')
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug("BeautifulSoup prettified:\n{0}\n{1}".format(soup.prettify(), '='*80))
-        link = soup.find('div', {'class': 'alert alert-warning'}, text=re.compile('balancer', re.I))
-        if link is None:
+    def run(self):
+        snapshot = self.get_master_status(self.host, self.port, self.protocol)
+        text = snapshot['balancer']['warning']
+        if text is None:
             self.ok()
             self.msg = 'HBase balancer is enabled'
         else:
             self.warning()
-            text = link.get_text()
-            text = ' '.join([_.strip() for _ in text.split('\n')])
             self.msg = 'HBase balancer is not enabled! {}'.format(text)
 
 
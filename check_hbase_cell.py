@@ -27,6 +27,12 @@ Checks:
    raises warning/critical if the value is outside thresholds or not a floating point number
 5. outputs the conect and query times to a given precision for reporting and graphing
 6. optionally outputs the cell's value for graphing purposes
+7. optionally reads the cell --samples times over the one connection and outputs the min / p50 / p95 / p99 / max read
+   times as perfdata, so that a single slow read eg. during a GC pause doesn't dominate the reported latency
+8. optionally checks a list of cells given as --cell table,row,column[,expected_regex] and / or in a --cells-file
+   of the same, one per line, reading them with one batch get per table over the one connection instead of one
+   plugin run per cell, outputting each cell's status, value and read time (the time of its table's batch get)
+   as well as the number of cells OK / failed and per table read times as perfdata
 
 Tested on Apache HBase 0.95, 0.96, 0.98, 0.99, 1.0, 1.1, 1.2, 1.3, 1.4, 2.0, 2.1
 
@@ -37,10 +43,13 @@ from __future__ import division
 from __future__ import print_function
 #from __future__ import unicode_literals
 
+import array
+import math
 import os
 import re
 import sys
 import socket
+import threading
 import time
 import traceback
 try:
@@ -67,6 +76,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, qquit, ERRORS, isFloat, isList, support_msg_api
     from harisekhon.utils import validate_host, validate_port, validate_regex, validate_units, validate_int
+    from harisekhon.utils import validate_file, plural
     from harisekhon.hbase.utils import validate_hbase_table, validate_hbase_rowkey, validate_hbase_column_qualifier
     from harisekhon import NagiosPlugin
 except ImportError:
@@ -75,7 +85,49 @@ except ImportError:
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.7'
+__version__ = '0.9'
+
+# perfdata suffix and nearest rank percentile output for --samples
+SAMPLE_STATS = (('min', 0), ('p50', 50), ('p95', 95), ('p99', 99), ('max', 100))
+
+
+def nearest_rank(sorted_values, pct):
+    """Nearest rank percentile of an already sorted sequence of numbers"""
+    index = int(math.ceil(pct / 100.0 * len(sorted_values))) - 1
+    return sorted_values[max(index, 0)]
+
+
+class LatencySamples(object):
+    """Fixed size buffer of query times in ms
+
+    Preallocated as a C array of doubles so 10,000 samples take 80KB, rather than a list of 10,000 float objects"""
+
+    def __init__(self, size):
+        self.buffer = array.array('d', [0.0]) * size
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        self.buffer[self.count] = value
+        self.count += 1
+
+    def values(self):
+        return self.buffer[:self.count]
+
+    def percentiles(self, pcts):
+        """Returns the nearest rank percentiles for the given list of percentages, sorting the samples once"""
+        values = sorted(self.values())
+        return [nearest_rank(values, pct) for pct in pcts]
+
+    @classmethod
+    def merge(cls, samples_list):
+        merged = cls(0)
+        for samples in samples_list:
+            merged.buffer.extend(samples.values())
+        merged.count = len(merged.buffer)
+        return merged
 
 
 class CheckHBaseCell(NagiosPlugin):
@@ -95,6 +147,15 @@ class CheckHBaseCell(NagiosPlugin):
         self.regex = None
         self.precision = None
         self.timings = {}
+        # check_hbase_write_spray.py records timings from concurrent threads
+        self.timings_lock = threading.Lock()
+        self.num_samples = 1
+        # LatencySamples for each column and action when --samples > 1
+        self.samples = {}
+        # (table, row, column, expected regex) for each --cell / --cells-file entry
+        self.cells = []
+        # (table, row, column, value, query time, error) for each of the cells read
+        self.cell_results = []
         self.graph = False
         self.units = None
         self.list_tables = False
@@ -116,8 +177,20 @@ class CheckHBaseCell(NagiosPlugin):
                      "between floats and non-floats will result in variable numbers of perfdata tokens which will " +
                      "break PNP4Nagios")
         self.add_opt('-u', '--units', help="Units to use if graphing cell's value. Optional")
+        self.add_samples_options()
+        self.add_opt('--cell', action='append', metavar='table,row,column[,expected_regex]',
+                     help='Cell to check, can be given multiple times instead of --table / --row / --column to ' +
+                     'check a list of cells using one batch get per table, --expected is used for cells without ' +
+                     'an expected regex of their own')
+        self.add_opt('--cells-file', help='File of cells to check, one table,row,column[,expected_regex] per line, ' +
+                     'blank lines and lines starting with # are ignored, can be combined with --cell')
         self.add_opt('-l', '--list', action='store_true', help='List tables and exit')
 
+    def add_samples_options(self):
+        self.add_opt('-s', '--samples', default=1, metavar='int',
+                     help='Number of times to run each query over the one connection, outputting the min / p50 / ' +
+                     'p95 / p99 / max query times as perfdata (default: 1)')
+
     def process_options(self):
         self.no_args()
         self.host = self.get_opt('host')
@@ -131,7 +204,11 @@ class CheckHBaseCell(NagiosPlugin):
         validate_host(self.host)
         validate_port(self.port)
         self.list_tables = self.get_opt('list')
-        if not self.list_tables:
+        self.cells = self.get_cells()
+        if self.cells:
+            if self.get_opt('table') or self.row or self.column or self.graph:
+                self.usage('--cell / --cells-file cannot be combined with --table / --row / --column / --graph')
+        elif not self.list_tables:
             self.table = self.get_opt('table')
             validate_hbase_table(self.table, 'hbase')
             validate_hbase_rowkey(self.row)
@@ -142,6 +219,40 @@ class CheckHBaseCell(NagiosPlugin):
             validate_units(self.units)
         self.validate_thresholds(optional=True, positive=False)
         validate_int(self.precision, 'precision', 0, 10)
+        self.process_samples_options()
+
+    def process_samples_options(self):
+        num_samples = self.get_opt('samples')
+        validate_int(num_samples, 'samples', 1, 10000)
+        self.num_samples = int(num_samples)
+
+    def get_cells(self):
+        """Returns the list of (table, row, column, expected regex) from --cell and --cells-file"""
+        specs = list(self.get_opt('cell') or [])
+        cells_file = self.get_opt('cells_file')
+        if cells_file:
+            validate_file(cells_file, 'cells')
+            with open(cells_file) as filehandle:
+                for line in filehandle:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        specs.append(line)
+        cells = []
+        for spec in specs:
+            # the expected regex is last so that it may contain commas
+            parts = spec.split(',', 3)
+            if len(parts) < 3:
+                self.usage("invalid cell '{0}', must be in the format table,row,column[,expected_regex]"\
+                           .format(spec))
+            (table, row, column) = [_.strip() for _ in parts[:3]]
+            validate_hbase_table(table, 'hbase')
+            validate_hbase_rowkey(row)
+            validate_hbase_column_qualifier(column)
+            expected = parts[3] if len(parts) > 3 else self.regex
+            if expected:
+                validate_regex(expected, 'expected value')
+            cells.append((table, row, column, expected))
+        return cells
 
     def run(self):
         initial_start = time.time()
@@ -151,8 +262,12 @@ class CheckHBaseCell(NagiosPlugin):
                 tables = self.get_tables()
                 print('HBase Tables:\n\n' + '\n'.join(tables))
                 sys.exit(ERRORS['UNKNOWN'])
-            table_conn = self.get_table_conn()
-            self.check_read(table_conn, self.row, self.column)
+            if self.cells:
+                self.check_cells()
+            else:
+                table_conn = self.get_table_conn()
+                for _ in range(self.num_samples):
+                    self.check_read(table_conn, self.row, self.column)
             log.info('finished, closing connection')
             self.conn.close()
         except HBaseIOError as _:
@@ -166,7 +281,10 @@ class CheckHBaseCell(NagiosPlugin):
         except (socket.error, socket.timeout, ThriftException) as _:
             qquit('CRITICAL', _)
         total_time = (time.time() - initial_start) * 1000
-        self.output(connect_time, total_time)
+        if self.cells:
+            self.output_cells(connect_time, total_time)
+        else:
+            self.output(connect_time, total_time)
 
     def connect(self):
         log.info('connecting to HBase Thrift Server at %s:%s', self.host, self.port)
@@ -226,11 +344,142 @@ class CheckHBaseCell(NagiosPlugin):
             log.info("checking cell's value is exactly expected value '{0}'".format(expected))
             if value != expected:
                 qquit('CRITICAL', "cell value '{0}' (expected '{1}') for {2}".format(value, expected, cell_info))
-        self.timings[column] = self.timings.get(column, {})
-        self.timings[column]['read'] = max(self.timings[column].get('read', 0), query_time)
+        self.record_timing(column, 'read', query_time)
         self.value = value
         return (value, query_time)
 
+    def check_cells(self):
+        """Reads all the --cell / --cells-file cells using one batch get per table over the one connection"""
+        tables = {}
+        for cell in self.cells:
+            tables.setdefault(cell[0], []).append(cell)
+        for table in sorted(tables):
+            cells = tables[table]
+            # dedupe preserving order
+            rows = list(dict.fromkeys([_[1] for _ in cells]))
+            columns = list(dict.fromkeys([_[2] for _ in cells]))
+            results = None
+            query_time = None
+            error = None
+            log.info("checking table '%s'", table)
+            try:
+                if not self.conn.is_table_enabled(table):
+                    error = 'table not enabled'
+                else:
+                    table_conn = self.conn.table(table)
+                    for _ in range(self.num_samples):
+                        log.info("getting %s rows %s columns %s from table '%s'", len(rows), rows, columns, table)
+                        start = time.time()
+                        results = table_conn.rows(rows, columns=columns)
+                        query_time = (time.time() - start) * 1000
+                        log.info('batch read in %s ms', query_time)
+                        self.record_timing(table, 'read', query_time)
+            except HBaseIOError as _:
+                if 'TableNotFoundException' in _.message:
+                    error = 'table does not exist'
+                elif 'NoSuchColumnFamilyException' in _.message:
+                    error = 'column family does not exist'
+                else:
+                    error = str(_)
+            if error is not None:
+                for (_, row, column, _) in cells:
+                    self.cell_results.append((table, row, column, None, query_time, error))
+                continue
+            log.debug('rows returned: %s', results)
+            if not isList(results):
+                qquit('UNKNOWN', 'non-list returned for rows. ' + support_msg_api())
+            row_data = {}
+            for (row, data) in results:
+                row_data[self.decode(row)] = dict([(self.decode(key), self.decode(value))
+                                                   for (key, value) in data.items()])
+            for (_, row, column, expected) in cells:
+                value = row_data.get(row, {}).get(column)
+                error = None
+                if value is None:
+                    error = 'no cell value found'
+                elif expected and not re.search(expected, value):
+                    error = "expected regex '{0}'".format(expected)
+                self.cell_results.append((table, row, column, value, query_time, error))
+
+    @staticmethod
+    def decode(value):
+        if isinstance(value, bytes):
+            return value.decode('utf-8', 'replace')
+        return value
+
+    def record_timing(self, column, action, query_time):
+        """Keeps the max query time for each column and action, and all of them with --samples, thread safe"""
+        with self.timings_lock:
+            self.timings[column] = self.timings.get(column, {})
+            self.timings[column][action] = max(self.timings[column].get(action, 0), query_time)
+            if self.num_samples > 1:
+                samples = self.samples.setdefault(column, {})
+                if action not in samples:
+                    samples[action] = LatencySamples(self.num_samples)
+                samples[action].add(query_time)
+
+    @staticmethod
+    def percentile(values, pct):
+        """Nearest rank percentile of a list of numbers"""
+        return nearest_rank(sorted(values), pct)
+
+    def samples_output(self, actions):
+        """Returns a tuple of message and perfdata of the --samples stats for each action across all columns"""
+        msg = ', {0} samples'.format(self.num_samples)
+        perfdata = ''
+        for action in actions:
+            samples = LatencySamples.merge([self.samples[column][action] for column in sorted(self.samples)])
+            stats = samples.percentiles([pct for (_, pct) in SAMPLE_STATS])
+            msg += ' {0}'.format(action)
+            for ((name, _), query_time) in zip(SAMPLE_STATS, stats):
+                msg += ' {0}={1:0.{precision}f}ms'.format(name, query_time, precision=self.precision)
+                perfdata += ' {0}_time_{1}={2:0.{precision}f}ms'.format(action, name, query_time,
+                                                                        precision=self.precision)
+        return (msg, perfdata)
+
+    def output_cells(self, connect_time, total_time):
+        precision = self.precision
+        num_cells = len(self.cell_results)
+        num_failed = len([_ for _ in self.cell_results if _[5] is not None])
+        num_tables = len(set([_[0] for _ in self.cell_results]))
+        if num_failed:
+            self.critical()
+        self.msg = '{0}/{1} HBase cell{2} OK across {3} table{4}'.format(num_cells - num_failed, num_cells,
+                                                                       plural(num_cells), num_tables,
+                                                                       plural(num_tables))
+        if num_failed:
+            self.msg += ', {0} FAILED'.format(num_failed)
+        self.msg += ':'
+        for (table, row, column, value, query_time, error) in self.cell_results:
+            cell_info = " table '{0}' row '{1}' column '{2}'".format(table, row, column)
+            if value is not None:
+                cell_info += " = '{0}'".format(value)
+            self.msg += cell_info
+            if error is not None:
+                self.msg += ' CRITICAL ({0})'.format(error)
+            elif isFloat(value):
+                self.check_thresholds(value)
+            if query_time is not None:
+                self.msg += ' {0:0.{precision}f}ms'.format(query_time, precision=precision)
+            self.msg += ','
+        # sum of the slowest batch get of each table
+        query_time = sum([self.timings[table]['read'] for table in self.timings])
+        perfdata = ''
+        perfdata += ' total_time={0:0.{precision}f}ms'.format(total_time, precision=precision)
+        perfdata += ' connect_time={0:0.{precision}f}ms'.format(connect_time, precision=precision)
+        perfdata += ' query_time={0:0.{precision}f}ms'.format(query_time, precision=precision)
+        self.msg += perfdata
+        if self.samples:
+            (samples_msg, samples_perfdata) = self.samples_output(['read'])
+            self.msg += samples_msg
+            perfdata += samples_perfdata
+        self.msg += ' | cells={0} cells_failed={1}'.format(num_cells, num_failed)
+        self.msg += perfdata
+        if len(self.timings) > 1:
+            for table in sorted(self.timings):
+                self.msg += " '{0}_query_time'={1:0.{precision}f}ms".format(table, self.timings[table]['read'],
+                                                                          precision=precision)
+
     def output(self, connect_time, total_time):
         precision = self.precision
         cell_info = "HBase table '{0}' row '{1}' column '{2}'".format(self.table, self.row, self.column)
@@ -247,6 +496,10 @@ class CheckHBaseCell(NagiosPlugin):
         perfdata += ' query_time={0:0.{precision}f}ms'.format(query_time, precision=precision)
         # show the timings at the end of the user output as well as in the graphing perfdata section
         self.msg += ',' + perfdata
+        if self.samples:
+            (samples_msg, samples_perfdata) = self.samples_output(['read'])
+            self.msg += samples_msg
+            perfdata += samples_perfdata
         self.msg += ' |'
         if self.graph:
             if isFloat(value):
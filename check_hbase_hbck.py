@@ -21,17 +21,20 @@
 Nagios Plugin to check the output of HBase hbck and raise an alert if there are any inconsistencies
 
 In order to constrain the runtime of this plugin you must run the HBase HBCK separately and have this plugin check the
-output file results. Recommend you do not use any extra switches as it'll enlarge the output and slow down the plugin
-by forcing it to parse all the extra noise. As the 'hbase' user run this periodically (via cron):
+output file results. As the 'hbase' user run this periodically (via cron):
 
-hbase hbck &> /tmp/hbase-hbck.log.tmp && tail -n30 /tmp/hbase-hbck.log.tmp > /tmp/hbase-hbck.log
+hbase hbck &> /tmp/hbase-hbck.log.tmp && mv -f /tmp/hbase-hbck.log.tmp /tmp/hbase-hbck.log
 
-Then have the plugin check the results separately (the tail stops the log getting too big and slowing the plugin down
-if there are lots of inconsistencies which will end up enlarging the output - it gives us just the bit we need, which
-is the summary at the end):
+Then have the plugin check the results separately:
 
 ./check_hbase_hbck.py -f /tmp/hbase-hbck.log
 
+The log is memory mapped and scanned backwards from the end, where hbck writes its summary, so even hundreds of MB of
+hbck output on large clusters don't slow the plugin down. If there are inconsistencies the scan continues back through
+just the ERROR lines counted in the summary, to output the number of inconsistencies per table and per category
+(hole_in_region_chain, not_deployed etc.) as perfdata. If you only keep the end of the log, eg. with tail -n30 as
+previously recommended, the summary is still checked but per table and category details will be missing.
+
 Tested on Hortonworks HDP 2.3 (HBase 1.1.2) and Apache HBase 0.90, 0.92, 0.94, 0.95, 0.96, 0.98, 0.99, 1.0, 1.1, 1.2, 1.3, 1.4, 2.0, 2.1
 
 See similar check_hadoop_hdfs_fsck.pl for HDFS
@@ -44,6 +47,7 @@ from __future__ import print_function
 #from __future__ import unicode_literals
 
 #import logging
+import mmap
 import os
 import re
 import sys
@@ -62,7 +66,28 @@ except ImportError:
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.3'
+
+# hbck error messages to the category of inconsistency, the first match wins so more specific messages are listed first
+HBCK_ERROR_CATEGORIES = [(category, re.compile(regex, re.I)) for (category, regex) in (
+    ('not_in_meta_or_hdfs', br'not on HDFS or in (?:hbase:meta|\.?META\.?)'),
+    ('not_in_meta', br'on HDFS, but not listed in (?:hbase:meta|\.?META\.?)|not in (?:hbase:meta|\.?META\.?), but'),
+    ('not_in_hdfs', br'found in (?:hbase:meta|\.?META\.?), but not in HDFS'),
+    ('should_not_be_deployed', br'should not be deployed'),
+    ('lingering_split_parent', br'is a split parent'),
+    ('multi_deployed', br'multiply assigned'),
+    ('server_does_not_match_meta', br'but found on region server'),
+    ('not_deployed', br'not deployed on any region ?server'),
+    ('hole_in_region_chain', br'hole in the region chain'),
+    ('dupe_startkeys', br'same start ?key'),
+    ('overlap_in_region_chain', br'overlap'),
+    ('first_region_startkey_not_empty', br'first region should start with an empty key'),
+    ('last_region_endkey_not_empty', br'last region should end with an empty key'),
+    ('degenerate_region', br'same start and end key'),
+    ('orphan_hdfs_region', br'orphan'),
+    ('empty_meta_cell', br'REGIONINFO_QUALIFIER'),
+    ('lingering_reference_hfile', br'lingering reference'),
+)]
 
 
 class CheckHBaseHbck(NagiosPlugin):
@@ -75,8 +100,13 @@ class CheckHBaseHbck(NagiosPlugin):
         self.unknown()
         self.msg = 'msg not defined'
         self.max_file_age = None
-        self.re_status = re.compile(r'^Status:\s*(.+?)\s*$')
-        self.re_inconsistencies = re.compile(r'^\s*(\d+)\s+inconsistencies\s+detected\.?\s*$')
+        self.re_status = re.compile(br'^Status:\s*(.+?)\s*$')
+        self.re_inconsistencies = re.compile(br'^\s*(\d+)\s+inconsistencies\s+detected\.?\s*$')
+        # not counted in the number of inconsistencies, follows the region chain errors of that table
+        self.re_table_inconsistency = re.compile(br'^ERROR: Found inconsistency in table (\S+)')
+        self.re_region_table = re.compile(br'meta => ([^,\s]+),|hdfs => \S*/data/([^/\s]+)/([^/\s]+)/')
+        self.table_inconsistencies = {}
+        self.category_inconsistencies = {}
 
     def add_options(self):
         self.add_opt('-f', '--file', metavar='<hbck.log>',
@@ -96,22 +126,17 @@ class CheckHBaseHbck(NagiosPlugin):
 
     def parse(self, filename):
         try:
-            num_inconsistencies = None
-            hbck_status = None
             log.info('opening file %s', filename)
-            with open(filename) as filehandle:
-                log.info('parsing file')
-                for line in filehandle:
-                    match = self.re_inconsistencies.match(line)
-                    if match:
-                        num_inconsistencies = match.group(1)
-                        log.info('num inconsistencies = %s', hbck_status)
-                        continue
-                    match = self.re_status.match(line)
-                    if match:
-                        hbck_status = match.group(1)
-                        log.info('hbck status = %s', hbck_status)
-                        break
+            with open(filename, 'rb') as filehandle:
+                # can't mmap an empty file
+                if os.fstat(filehandle.fileno()).st_size == 0:
+                    self.parse_error('failed to find hbck status result')
+                content = mmap.mmap(filehandle.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    log.info('parsing file backwards from the end')
+                    (hbck_status, num_inconsistencies) = self.parse_lines(self.reverse_lines(content))
+                finally:
+                    content.close()
             if hbck_status is None:
                 self.parse_error('failed to find hbck status result')
             if num_inconsistencies is None:
@@ -130,12 +155,86 @@ class CheckHBaseHbck(NagiosPlugin):
                 self.msg += '!'
             else:
                 self.msg += '.'
+            if self.table_inconsistencies:
+                self.msg += ' Inconsistencies per table: ' + \
+                            ', '.join(['{0} = {1}'.format(table, self.table_inconsistencies[table])
+                                       for table in sorted(self.table_inconsistencies)]) + '.'
             age = self.check_file_age(filename)
             self.msg += ' | hbase_num_inconsistencies={0};0;0'.format(num_inconsistencies)
             self.msg += ' hbck_log_file_age={0};{1};;'.format(age, self.max_file_age)
-        except IOError as _:
+            for category in sorted(self.category_inconsistencies):
+                self.msg += ' hbase_{0}={1}'.format(category, self.category_inconsistencies[category])
+            for table in sorted(self.table_inconsistencies):
+                self.msg += " 'hbase_num_inconsistencies {0}'={1}".format(table, self.table_inconsistencies[table])
+        except (IOError, ValueError) as _:
             qquit('UNKNOWN', _)
 
+    @staticmethod
+    def reverse_lines(content):
+        """Yields the lines of the memory mapped file from the end backwards without reading the rest of it"""
+        end = len(content)
+        while end > 0:
+            start = content.rfind(b'\n', 0, end) + 1
+            yield content[start:end]
+            end = start - 1
+
+    def parse_lines(self, lines):
+        """Parses hbck log lines given in reverse order, returning a tuple of (status, num inconsistencies)
+        and collecting the inconsistencies per table and category from the ERROR lines"""
+        hbck_status = None
+        num_inconsistencies = None
+        num_errors = 0
+        # the table of region chain errors which don't name it
+        table = None
+        for line in lines:
+            if hbck_status is None:
+                match = self.re_status.match(line)
+                if match:
+                    hbck_status = match.group(1).decode('utf-8', 'replace')
+                    log.info('hbck status = %s', hbck_status)
+                continue
+            if num_inconsistencies is None:
+                match = self.re_inconsistencies.match(line)
+                if match:
+                    num_inconsistencies = match.group(1).decode('utf-8')
+                    log.info('num inconsistencies = %s', num_inconsistencies)
+                    if not isInt(num_inconsistencies) or int(num_inconsistencies) == 0:
+                        break
+                continue
+            if not line.startswith(b'ERROR:'):
+                continue
+            match = self.re_table_inconsistency.match(line)
+            if match:
+                table = match.group(1).decode('utf-8', 'replace')
+                continue
+            self.add_error(line, table)
+            num_errors += 1
+            # stop once all the errors counted in the summary have been seen instead of reading the rest of the log
+            if num_errors >= int(num_inconsistencies):
+                log.info('found all %s errors', num_errors)
+                break
+        return (hbck_status, num_inconsistencies)
+
+    def add_error(self, line, table=None):
+        log.debug('error: %s', line)
+        match = self.re_region_table.search(line)
+        if match:
+            if match.group(1):
+                table = match.group(1).decode('utf-8', 'replace')
+            else:
+                (namespace, table) = [_.decode('utf-8', 'replace') for _ in match.group(2, 3)]
+                if namespace != 'default':
+                    table = namespace + ':' + table
+        if table is None:
+            table = 'unknown'
+        self.table_inconsistencies[table] = self.table_inconsistencies.get(table, 0) + 1
+        category = 'other'
+        for (name, regex) in HBCK_ERROR_CATEGORIES:
+            if regex.search(line):
+                category = name
+                break
+        self.category_inconsistencies[category] = self.category_inconsistencies.get(category, 0) + 1
+
     def check_file_age(self, filename):
         log.info('checking hbck log file age')
         now = int(time.time())
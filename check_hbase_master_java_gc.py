@@ -21,6 +21,9 @@ Nagios Plugin to check HBase Master Java GC last duration via JMX API
 
 Thresholds apply to Java Garbage Collection last duration in seconds
 
+With --rate checks the percentage of time spent in GC and the collections per minute since the previous run instead,
+with the thresholds applying to the GC time percentage (see lib_java_gc.py)
+
 Tested on Apache HBase 0.95, 0.96, 0.98, 1.0, 1.1, 1.2, 1.3, 1.4, 2.0, 2.1
 
 """
@@ -44,7 +47,7 @@ except ImportError:
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.1'
+__version__ = '0.2'
 
 
 class CheckHBaseMasterJavaGC(CheckHadoopNameNodeJavaGC):
@@ -60,6 +63,7 @@ class CheckHBaseMasterJavaGC(CheckHadoopNameNodeJavaGC):
     def add_options(self):
         # This is what I meant to do pylint, set the default thresholds lower
         super(CheckHadoopNameNodeJavaGC, self).add_options()  # pylint: disable=bad-super-call
+        self.add_gc_options()
         self.add_thresholds(default_warning=2, default_critical=10)
 
 
@@ -30,12 +30,10 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import logging
 import os
 import sys
 import traceback
 try:
-    from bs4 import BeautifulSoup
     import requests
 except ImportError:
     print(traceback.format_exc(), end='')
@@ -47,12 +45,13 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, qquit, support_msg
     from harisekhon import VersionNagiosPlugin
+    from lib_html_extract import extract_table, id_regex
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.3'
+__version__ = '0.4'
 
 
 class CheckHBaseMasterVersion(VersionNagiosPlugin):
@@ -77,34 +76,31 @@ class CheckHBaseMasterVersion(VersionNagiosPlugin):
         log.debug("content:\n%s\n%s\n%s", '='*80, req.content.strip(), '='*80)
         if req.status_code != 200:
             qquit('CRITICAL', '%s %s' % (req.status_code, req.reason))
-        soup = BeautifulSoup(req.content, 'html.parser')
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug('BeautifulSoup prettified:\n{0}\n{1}'.format(soup.prettify(), '='*80))
-        version = self.parse_version(soup)
+        # the attributes table is at the end of the page, seeks straight to it rather than parsing the whole page
+        rows = extract_table(req.content, id_regex('attributes_table', 'table'))
+        version = self.parse_version(rows)
         return version
 
-    def parse_version(self, soup):
+    def parse_version(self, rows):
         version = None
         try:
-            attributes_table = soup.find('table', {'id':'attributes_table'})
-            rows = attributes_table.findAll('tr')
             num_rows = len(rows)
             self.sanity_check(num_rows > 5, 'too few rows ({0})'.format(num_rows))
-            headers = rows[0].findAll('th')
+            headers = rows[0].th
             num_headers = len(headers)
             self.sanity_check(num_headers > 2, 'too few header columns ({0})'.format(num_headers))
-            self.sanity_check(headers[0].text.strip() == 'Attribute Name',
+            self.sanity_check(headers[0] == 'Attribute Name',
                               'header first column does not match expected \'Attribute Name\'')
-            self.sanity_check(headers[1].text.strip() == 'Value',
+            self.sanity_check(headers[1] == 'Value',
                               'header second column does not match expected \'Value\'')
             for row in rows:
-                cols = row.findAll('td')
+                cols = row.td
                 num_cols = len(cols)
                 if num_cols == 0:
                     continue
                 self.sanity_check(num_cols > 2, 'too few columns ({0})'.format(num_cols))
-                if cols[0].text.strip() == 'HBase Version':
-                    version = cols[1].text.split(',')[0]
+                if cols[0] == 'HBase Version':
+                    version = cols[1].split(',')[0]
                     break
         except (AttributeError, TypeError):
             qquit('UNKNOWN', 'failed to find parse HBase output. {0}\n{1}'\
@@ -31,35 +31,30 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import logging
 import os
-import re
 import sys
 import traceback
-try:
-    from bs4 import BeautifulSoup
-    import requests
-except ImportError:
-    print(traceback.format_exc(), end='')
-    sys.exit(4)
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import log, qquit, support_msg
+    from harisekhon.utils import log
     from harisekhon.utils import validate_host, validate_port
-    from harisekhon.utils import isInt
     from harisekhon import NagiosPlugin
+    from lib_hbase_master_status import HBaseMasterStatusMixin, get_section
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2.0'
+__version__ = '0.3.0'
 
 
-class CheckHBaseRegionBalance(NagiosPlugin):
+class CheckHBaseRegionBalance(FastJsonMixin, TimingsMixin, HBaseMasterStatusMixin, ResponseCacheMixin, NagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -70,11 +65,11 @@ class CheckHBaseRegionBalance(NagiosPlugin):
         self.server_min_regions = ('uninitialized_host', None)
         self.server_max_regions = ('uninitialized_host', None)
         self.status = 'OK'
-        self.total_regex = re.compile(r'^Total:\d+')
 
     def add_options(self):
         self.add_hostoption(name='HBase Master', default_host='localhost', default_port=16010)
         self.add_thresholds(default_warning=10, default_critical=20)
+        self.add_cache_options()
 
     def run(self):
         self.no_args()
@@ -83,18 +78,10 @@ class CheckHBaseRegionBalance(NagiosPlugin):
         validate_host(host)
         validate_port(port)
         self.validate_thresholds(integer=False)
+        self.process_cache_options()
 
-        url = 'http://%(host)s:%(port)s/master-status' % locals()
-        log.debug('GET %s', url)
-        try:
-            req = requests.get(url)
-        except requests.exceptions.RequestException as _:
-            qquit('CRITICAL', _)
-        log.debug("response: %s %s", req.status_code, req.reason)
-        log.debug("content:\n%s\n%s\n%s", '='*80, req.content.strip(), '='*80)
-        if req.status_code != 200:
-            qquit('CRITICAL', ("%s %s" % (req.status_code, req.reason)))
-        self.parse_output(req.content)
+        snapshot = self.get_master_status(host, port)
+        self.process_regionservers(get_section(snapshot, 'regionservers'))
         log.info('server with min regions = %s regions on %s', self.server_min_regions[1], self.server_min_regions[0])
         log.info('server with max regions = %s regions on %s', self.server_max_regions[1], self.server_max_regions[0])
         imbalance = self.calculate_imbalance()
@@ -111,51 +98,14 @@ class CheckHBaseRegionBalance(NagiosPlugin):
                         / max(self.server_max_regions[1], 1) * 100
         return '{0:.2f}'.format(max_imbalance)
 
-    def parse_output(self, content):
-        soup = BeautifulSoup(content, 'html.parser')
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug("BeautifulSoup prettified:\n{0}\n{1}".format(soup.prettify(), '='*80))
-        # shorter to just catch NoneType attribute error when tag not found and returns None
-        try:
-            basestats = soup.find('div', {'id': 'tab_baseStats'})
-            table = basestats.find('table')
-            #for table in basestats:
-            rows = table.findAll('tr')
-            headers = rows[0].findAll('th')
-            header_server = headers[0].text
-            # HBase 1.1 in HDP 2.3: ServerName | Start time | Requests Per Second | Num. Regions
-            # HBase 1.2 (Apache):   ServerName | Start time | Version | Requests per Second | Num. Regions
-            # HBase 1.4 (Apache):   ServerName | Start time | Last Contact | Version | Requests Per Second | Num. Regions
-            num_regions_index = len(headers) - 1
-            header_num_regions = headers[num_regions_index].text
-            if header_server != 'ServerName':
-                qquit('UNKNOWN', "Table headers in Master UI have changed" +
-                      " (got {0}, expected 'ServerName'). ".format(header_server) + support_msg())
-            if header_num_regions != 'Num. Regions':
-                qquit('UNKNOWN', "Table headers in Master UI have changed" +
-                      " (got {0}, expected 'Num. Regions'). ".format(header_num_regions) + support_msg())
-            log.debug('%-50s\tnum_regions', 'server')
-            for row in rows[1:]:
-                # this can be something like:
-                # 21689588ba40,16201,1473775984259
-                # so don't apply isHost() validation because it'll fail FQDN / IP address checks
-                cols = row.findAll('td')
-                server = cols[0].text
-                if self.total_regex.match(server):
-                    continue
-                num_regions = cols[num_regions_index].text
-                if not isInt(num_regions):
-                    qquit('UNKNOWN', "parsing error - got '{0}' for num regions".format(num_regions) +
-                          " for server '{}', was expecting integer.".format(server) +
-                          " UI format must have changed" + support_msg())
-                num_regions = int(num_regions)
-                log.debug('%-50s\t%s', server, num_regions)
-                if self.server_min_regions[1] is None or num_regions < self.server_min_regions[1]:
-                    self.server_min_regions = (server, num_regions)
-                if self.server_max_regions[1] is None or num_regions > self.server_max_regions[1]:
-                    self.server_max_regions = (server, num_regions)
-        except (AttributeError, TypeError, IndexError):
-            qquit('UNKNOWN', 'failed to find parse output')
+    def process_regionservers(self, regionservers):
+        log.debug('%-50s\tnum_regions', 'server')
+        for (server, _, num_regions) in regionservers:
+            log.debug('%-50s\t%s', server, num_regions)
+            if self.server_min_regions[1] is None or num_regions < self.server_min_regions[1]:
+                self.server_min_regions = (server, num_regions)
+            if self.server_max_regions[1] is None or num_regions > self.server_max_regions[1]:
+                self.server_max_regions = (server, num_regions)
 
 
 if __name__ == '__main__':
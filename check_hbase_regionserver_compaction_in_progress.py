@@ -24,6 +24,14 @@ Raises Warning if any compaction is running - use this to check that no major co
 Set your enterprise monitoring alerting schedule to ignore warning status during off-peak scheduled
 compaction time.
 
+Thresholds apply to the RegionServer's compaction queue length (default warning: 0 ie. any compaction in progress)
+
+With --master checks the whole cluster instead, discovering all live RegionServers from the HMaster JMX (or its UI for
+older HBase versions) and querying each of their narrow RegionServer Server JMX bean concurrently on --port, then
+outputs the total compaction queue length, the number of RegionServers over the warning / critical thresholds and the
+--top RegionServers with the longest compaction queues. Use --cache-ttl to only discover RegionServers from the
+HMaster once per TTL.
+
 See also check_hbase_table_compaction_in_progress.py which checks for compactions on a table by table basis.
 
 Tested on Hortonworks HDP 2.3 (HBase 1.1.2) and Apache HBase 0.95, 0.96, 0.98, 0.99, 1.0, 1.1, 1.2, 1.3, 1.4, 2.0, 2.1
@@ -35,8 +43,10 @@ from __future__ import division
 from __future__ import print_function
 #from __future__ import unicode_literals
 
+import json
 import logging
 import os
+import signal
 import sys
 import traceback
 srcdir = os.path.abspath(os.path.dirname(__file__))
@@ -44,18 +54,21 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import log, qquit, jsonpp
-    from harisekhon.utils import support_msg_api, isInt
+    from harisekhon.utils import log, jsonpp, plural, validate_host, validate_port, validate_int
+    from harisekhon.utils import support_msg_api, isInt, CriticalError, UnknownError
     from harisekhon import RestNagiosPlugin
+    from lib_hbase_master_status import HBaseMasterStatusMixin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.3'
+__version__ = '0.4.1'
 
 
-class CheckHBaseCompactionInProgress(RestNagiosPlugin):
+class CheckHBaseCompactionInProgress(TimingsMixin, HBaseMasterStatusMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -68,19 +81,138 @@ class CheckHBaseCompactionInProgress(RestNagiosPlugin):
         self.path = '/jmx?qry=Hadoop:service=HBase,name=RegionServer,sub=Server'
         self.json = True
         self.auth = False
+        self.master_host = None
+        self.master_port = 16010
+        self.top = 10
+        self.concurrency = 50
         self.msg = 'msg not defined'
         self.ok()
 
+    def add_options(self):
+        super(CheckHBaseCompactionInProgress, self).add_options()
+        self.add_opt('-M', '--master', metavar='host[:port]',
+                     help='HBase Master to discover all live RegionServers from to check each of them on --port ' + \
+                          'instead of --host (default port: 16010)')
+        self.add_opt('--top', metavar='N', default=10,
+                     help='Number of RegionServers with the longest compaction queues to output with --master ' + \
+                          '(default: 10)')
+        self.add_opt('--concurrency', metavar='N', default=50,
+                     help='Max number of RegionServers to query concurrently with --master (default: 50)')
+        self.add_thresholds(default_warning=0)
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckHBaseCompactionInProgress, self).process_options()
+        master = self.get_opt('master')
+        if master:
+            (self.master_host, _, master_port) = master.partition(':')
+            validate_host(self.master_host, 'HBase Master')
+            if master_port:
+                validate_port(master_port, 'HBase Master')
+                self.master_port = int(master_port)
+            top = self.get_opt('top')
+            validate_int(top, 'top', 1, 10000)
+            self.top = int(top)
+            concurrency = self.get_opt('concurrency')
+            validate_int(concurrency, 'concurrency', 1, 10000)
+            self.concurrency = int(concurrency)
+            if sys.version_info < (3, 7):
+                self.usage('--master requires Python 3.7+')
+        self.validate_thresholds(simple='upper', optional=True)
+        self.process_cache_options()
+
+    def run(self):
+        if self.master_host:
+            self.check_cluster()
+        else:
+            super(CheckHBaseCompactionInProgress, self).run()
+
     def parse_json(self, json_data):
         compaction_queue_size = self.parse(json_data)
         self.msg = 'HBase RegionServer compaction '
         if compaction_queue_size > 0:
-            self.warning()
             self.msg += 'in progress'
         else:
             self.msg += 'not in progress'
         self.msg += ', compactionQueueSize = {0}'.format(compaction_queue_size)
-        self.msg += ' | compactionQueueSize={0};0;0'.format(compaction_queue_size)
+        self.check_thresholds(compaction_queue_size)
+        self.msg += ' | compactionQueueSize={0}{1}'.format(compaction_queue_size, self.get_perf_thresholds())
+
+    def check_cluster(self):
+        regionservers = self.get_live_regionservers(self.master_host, self.master_port, self.protocol)
+        if not regionservers:
+            raise CriticalError('no live RegionServers found by HBase Master {0}:{1}'\
+                                .format(self.master_host, self.master_port))
+        log.info('found %s live RegionServers', len(regionservers))
+        # Python 3 only, only imported for --master so the single RegionServer check still runs on Python 2
+        from lib_fetch_all import fetch_all
+        from lib_plugin_runner import get_plugin_timeout
+        timeout = get_plugin_timeout(sys.argv[1:])
+        # each RegionServer is bounded by the timeout, leave time to aggregate before the self-timeout
+        signal.alarm(timeout + 5)
+        urls = ['{0}://{1}:{2}{3}'.format(self.protocol, _, self.port, self.path) for _ in regionservers]
+        results = [(regionserver,) + self.parse_response(*response)
+                   for (regionserver, response) in zip(regionservers, fetch_all(urls, self.concurrency, timeout))]
+        self.process_cluster(results)
+
+    def parse_response(self, req, error):
+        """Returns a tuple of (compaction queue length, error) from a RegionServer's response"""
+        if error is not None:
+            return (None, error)
+        if req.status_code != 200:
+            return (None, '{0} {1}'.format(req.status_code, req.reason))
+        try:
+            return (self.parse(json.loads(req.content)), None)
+        except (ValueError, UnknownError) as _:
+            return (None, str(_))
+
+    def process_cluster(self, results):
+        queues = [(regionserver, queue) for (regionserver, queue, error) in results if error is None]
+        failed = [(regionserver, error) for (regionserver, _, error) in results if error is not None]
+        if not queues:
+            raise CriticalError('failed to query all {0} RegionServers, eg. {1}: {2}'\
+                                .format(len(failed), failed[0][0], failed[0][1]))
+        warning_threshold = None
+        critical_threshold = None
+        if self.get_opt('warning') is not None:
+            warning_threshold = self.get_threshold('warning').get_simple()
+        if self.get_opt('critical') is not None:
+            critical_threshold = self.get_threshold('critical').get_simple()
+        num_warning = 0
+        num_critical = 0
+        for (_, queue) in queues:
+            if critical_threshold is not None and queue > critical_threshold:
+                num_critical += 1
+            elif warning_threshold is not None and queue > warning_threshold:
+                num_warning += 1
+        if num_critical:
+            self.critical()
+        elif num_warning:
+            self.warning()
+        elif failed:
+            self.unknown()
+        # longest queues first, then by name for stable output
+        queues.sort(key=lambda _: (-_[1], _[0]))
+        total = sum([queue for (_, queue) in queues])
+        compacting = len([_ for _ in queues if _[1] > 0])
+        self.msg = 'HBase compaction queue total = {0} across {1} RegionServer{2}, {3} compacting'\
+                   .format(total, len(queues), plural(queues), compacting)
+        if warning_threshold is not None:
+            self.msg += ', warning {0} > {1}'.format(num_warning, warning_threshold)
+        if critical_threshold is not None:
+            self.msg += ', critical {0} > {1}'.format(num_critical, critical_threshold)
+        if failed:
+            self.msg += ', {0} failed to query ({1})'\
+                        .format(len(failed), ', '.join(['{0}: {1}'.format(*_) for _ in failed[:self.top]]))
+        if compacting:
+            self.msg += ', top {0}: {1}'.format(min(self.top, compacting),
+                                               ', '.join(['{0}={1}'.format(*_)
+                                                          for _ in queues[:self.top] if _[1] > 0]))
+        self.msg += ' | total_compaction_queue={0} max_compaction_queue={1}{2}'\
+                    .format(total, queues[0][1], self.get_perf_thresholds())
+        self.msg += ' regionservers={0} regionservers_compacting={1} regionservers_warning={2}'\
+                    .format(len(results), compacting, num_warning)
+        self.msg += ' regionservers_critical={0} regionservers_failed={1}'.format(num_critical, len(failed))
 
     @staticmethod
     def parse(json_data):
@@ -96,11 +228,11 @@ class CheckHBaseCompactionInProgress(RestNagiosPlugin):
                         log.debug('%s', jsonpp(bean))
                     compaction_queue_size = bean['compactionQueueLength']
                     if not isInt(compaction_queue_size):
-                        qquit('UNKNOWN', 'non-integer returned for compactionQueueLength! ' + support_msg_api())
+                        raise UnknownError('non-integer returned for compactionQueueLength! ' + support_msg_api())
                     return compaction_queue_size
         except KeyError as _:
-            qquit('UNKNOWN', _ + ': failed to parse HBase Master jmx info. ' + support_msg_api())
-        qquit('UNKNOWN', 'RegionServer mbean not found, double check this is pointing to an HBase RegionServer')
+            raise UnknownError('{0}: failed to parse HBase RegionServer jmx info. {1}'.format(_, support_msg_api()))
+        raise UnknownError('RegionServer mbean not found, double check this is pointing to an HBase RegionServer')
 
 
 if __name__ == '__main__':
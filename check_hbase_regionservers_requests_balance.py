@@ -18,6 +18,15 @@
 
 Nagios Plugin to check HBase RegionServer requests imbalance via the HMaster UI
 
+By default uses the instantaneous Requests Per Second of each RegionServer, which is noisy and can flap.
+
+With --window uses the average requests per second of each RegionServer over that many secs instead, calculated from
+the deltas of their read + write request counters. A small ring buffer of counter samples per RegionServer is kept
+in a local --state-file across runs. Until the state file has samples older than the window, the average is taken
+over the samples there are, and on the first run the instantaneous Requests Per Second is used. RegionServers without
+an earlier sample, eg. newly started or restarted ones, use their instantaneous Requests Per Second until they have one
+and how many did is reported.
+
 Tested on Apache HBase 0.95, 0.96, 0.98, 1.0, 1.1, 1.2, 1.3, 1.4, 2.0, 2.1
 
 """
@@ -27,32 +36,38 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-#import logging
-#import json
+import json
 import os
 import sys
+import tempfile
 import traceback
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    print(traceback.format_exc(), end='')
-    sys.exit(4)
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import isInt, support_msg, UnknownError, plural
+    from harisekhon.utils import log, plural, sec2human, validate_int
     from harisekhon import RestNagiosPlugin
+    from lib_hbase_master_status import HBaseMasterStatusMixin, get_section
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.3.0'
+__version__ = '0.5.1'
+
+STATE_FILE_TEMPLATE = 'nagios_plugins_hbase_requests_balance.{uid}.{host}.{port}.json'
+# bump when the state file format changes to ignore state written by older versions
+STATE_VERSION = 1
+# cap on samples per RegionServer in case of running much more often than the window, bounding the state file
+MAX_SAMPLES = 100
 
 
-class CheckHBaseRegionServerBalance(RestNagiosPlugin):
+class CheckHBaseRegionServerBalance(FastJsonMixin, TimingsMixin, HBaseMasterStatusMixin, ResponseCacheMixin,
+                                    RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -64,59 +79,108 @@ class CheckHBaseRegionServerBalance(RestNagiosPlugin):
         self.path = '/master-status'
         self.auth = False
         self.json = False
+        self.window = 0
+        self.state_file = None
         self.msg = 'HBase msg not defined'
 
     def add_options(self):
         super(CheckHBaseRegionServerBalance, self).add_options()
+        self.add_cache_options()
+        self.add_opt('-W', '--window', metavar='secs', default=0,
+                     help='Calculate imbalance from the average requests per second over this many secs using the ' + \
+                          'RegionServers request counters sampled across runs, eg. 300 (default: 0 = instantaneous)')
+        self.add_opt('--state-file', metavar='file',
+                     help='File to keep the request counter samples in between runs for --window ' + \
+                          '(default: {0})'.format(os.path.join(tempfile.gettempdir(),
+                                                               STATE_FILE_TEMPLATE.format(uid='<uid>', host='<host>',
+                                                                                          port='<port>'))))
         self.add_thresholds(default_warning=50)
 
     def process_options(self):
         super(CheckHBaseRegionServerBalance, self).process_options()
+        self.process_cache_options()
+        window = self.get_opt('window')
+        validate_int(window, 'window', 0, 86400)
+        self.window = int(window)
+        self.state_file = self.get_opt('state_file')
+        if not self.state_file:
+            self.state_file = os.path.join(tempfile.gettempdir(),
+                                           STATE_FILE_TEMPLATE.format(uid=os.getuid(), host=self.host, port=self.port))
         self.validate_thresholds(percent=True, optional=True)
 
-    def parse(self, req):
-        soup = BeautifulSoup(req.content, 'html.parser')
-        #if log.isEnabledFor(logging.DEBUG):
-        #    log.debug("BeautifulSoup prettified:\n%s\n%s", soup.prettify(), '='*80)
-        # this masks underlying exception
-        #try:
-        tab = soup.find('div', {'id':'tab_baseStats'})
-        table = tab.find_next('table')
-        rows = table.findChildren('tr')
-        if len(rows) < 2:
-            raise UnknownError('no regionserver rows found in base stats table! {}'.format(support_msg()))
-        # HBase 1.1 in HDP 2.3: ServerName | Start time | Requests Per Second | Num. Regions
-        # HBase 1.2 (Apache):   ServerName | Start time | Version | Requests per Second | Num. Regions
-        # HBase 1.4 (Apache):   ServerName | Start time | Last Contact | Version | Requests Per Second | Num. Regions
-        th_list = rows[0].findChildren('th')
-        if len(th_list) < 4:
-            raise UnknownError('no table header for base stats table!')
-        expected_header = 'Requests Per Second'
-        col_index = len(th_list) - 2
-        found_header = th_list[col_index].text
-        if found_header != expected_header:
-            raise UnknownError("wrong table header found for column 4! Expected '{}' but got '{}'. {}"\
-                               .format(expected_header, found_header, support_msg()))
+    def run(self):
+        snapshot = self.get_master_status(self.host, self.port, self.protocol)
         stats = {}
-        for row in rows[1:]:
-            cols = row.findChildren('td')
-            if len(cols) < 4:
-                raise UnknownError('4th column in table not found! {}'.format(support_msg()))
-            regionserver = cols[0].text.strip().split(',')[0]
-            if 'Total:' in regionserver:
-                break
-            reqs_per_sec = cols[col_index].text.strip()
-            if not isInt(reqs_per_sec):
-                raise UnknownError("non-integer found in Requests Per Second column for regionserver '{}'. {}"\
-                                   .format(regionserver, support_msg()))
-            # fix for this is to cast string '1.0' to float and then cast to int
-            # ValueError: invalid literal for int() with base 10: '1.0'
-            stats[regionserver] = int(float(reqs_per_sec))
-        self.process_stats(stats)
-        #except (AttributeError, TypeError):
-        #    raise UnknownError('failed to parse HBase Master UI status page. {}'.format(support_msg()))
-
-    def process_stats(self, stats):
+        for (regionserver, reqs_per_sec, _) in get_section(snapshot, 'regionservers'):
+            stats[regionserver.split(',')[0]] = reqs_per_sec
+        if not self.window:
+            self.process_stats(stats)
+            return
+        (rates, span) = self.get_windowed_rates(get_section(snapshot, 'request_counts'), snapshot['time'])
+        if rates:
+            # RegionServers started or restarted since the previous run have no earlier sample to average from yet
+            unsampled = [_ for _ in stats if _ not in rates]
+            for regionserver in unsampled:
+                log.info('no earlier request counter sample for %s, using its instantaneous requests per second',
+                         regionserver)
+                rates[regionserver] = stats[regionserver]
+            self.process_stats(rates, span, len(unsampled))
+        else:
+            log.info('no earlier request counter samples in state file yet, using instantaneous requests per second')
+            self.process_stats(stats)
+
+    def load_state(self):
+        try:
+            with open(self.state_file) as filehandle:
+                state = json.load(filehandle)
+            if state.get('version') == STATE_VERSION:
+                return state['regionservers']
+            log.info('ignoring state file of different version %s', state.get('version'))
+        except (IOError, OSError) as _:
+            log.info('no state file loaded: %s', _)
+        except (ValueError, KeyError, AttributeError) as _:
+            log.warning("ignoring corrupt state file '%s': %s", self.state_file, _)
+        return {}
+
+    def save_state(self, samples):
+        # write to a temp file and rename so concurrent runs never read a partially written file
+        try:
+            (filehandle, tmp) = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.state_file)),
+                                                 prefix=os.path.basename(self.state_file) + '.')
+            with os.fdopen(filehandle, 'w') as filehandle:
+                json.dump({'version': STATE_VERSION, 'regionservers': samples}, filehandle, separators=(',', ':'))
+            os.rename(tmp, self.state_file)
+        except (IOError, OSError) as _:
+            log.warning("failed to write state file '%s': %s", self.state_file, _)
+
+    def get_windowed_rates(self, request_counts, now):
+        """Returns a tuple of ({regionserver host: average requests per sec over the window}, span secs) updating
+        the ring buffer of [time, request count] samples per RegionServer in the state file"""
+        state = self.load_state()
+        samples = {}
+        rates = {}
+        span = 0
+        # samples are kept for RegionServers in the current page only, keyed on the server name including its start
+        # code so that a restarted RegionServer starts a fresh buffer rather than calculating a negative delta
+        for (regionserver, count) in request_counts:
+            buffer = [_ for _ in state.get(regionserver, []) if _[0] < now]
+            if buffer and count < buffer[-1][1]:
+                log.info('request counter went backwards for %s, resetting its samples', regionserver)
+                buffer = []
+            # keep only the latest sample at or before the start of the window as the baseline, plus those in it
+            while len(buffer) > 1 and buffer[1][0] <= now - self.window:
+                buffer.pop(0)
+            buffer = buffer[-MAX_SAMPLES + 1:]
+            if buffer:
+                (start, start_count) = buffer[0]
+                rates[regionserver.split(',')[0]] = int((count - start_count) / (now - start))
+                span = max(span, now - start)
+            buffer.append([now, count])
+            samples[regionserver] = buffer
+        self.save_state(samples)
+        return (rates, span)
+
+    def process_stats(self, stats, span=None, num_unsampled=0):
         lowest_requests = None
         highest_requests = None
         lowest_regionserver = None
@@ -139,6 +203,11 @@ class CheckHBaseRegionServerBalance(RestNagiosPlugin):
         num_regionservers = len(stats)
         self.msg = 'HBase RegionServers reqs/sec imbalance = {:.0f}% across {} RegionServer{}'\
                    .format(imbalance, num_regionservers, plural(num_regionservers))
+        if span is not None:
+            self.msg += ' averaged over {}'.format(sec2human(int(span)))
+        if num_unsampled:
+            self.msg += ' ({} RegionServer{} without earlier samples at instantaneous reqs/sec)'\
+                        .format(num_unsampled, plural(num_unsampled))
         self.check_thresholds(imbalance)
         if self.verbose or not self.is_ok():
             self.msg += ' [min reqs/sec={} on {} / max reqs/sec={} on {}]'\
@@ -34,12 +34,10 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import logging
 import os
 import sys
 import traceback
 try:
-    from bs4 import BeautifulSoup
     import requests
 except ImportError:
     print(traceback.format_exc(), end='')
@@ -53,12 +51,13 @@ try:
     from harisekhon.utils import CriticalError, UnknownError
     from harisekhon.utils import validate_host, validate_port, validate_database_tablename
     from harisekhon import NagiosPlugin
+    from lib_html_extract import extract_table, heading_regex
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.6.1'
+__version__ = '0.7.0'
 
 
 class CheckHBaseTableCompacting(NagiosPlugin):
@@ -70,6 +69,7 @@ class CheckHBaseTableCompacting(NagiosPlugin):
         # super().__init__()
         self.msg = 'msg not defined'
         self.ok()
+        self.table_attributes_regex = heading_regex('Table Attributes')
 
     def add_options(self):
         self.add_hostoption(name='HBase Master', default_host='localhost', default_port=16010)
@@ -96,10 +96,10 @@ class CheckHBaseTableCompacting(NagiosPlugin):
         if req.status_code != 200:
             info = ''
             #if req.status_code == '500' and 'TableNotFoundException' in req.content:
-            if 'TableNotFoundException' in req.content:
+            if 'TableNotFoundException' in req.text:
                 info = 'table not found'
             raise CriticalError("%s %s %s" % (req.status_code, req.reason, info))
-        elif 'Table not found' in req.content:
+        elif 'Table not found' in req.text:
             raise CriticalError("table '{}' not found".format(table))
         is_table_compacting = self.parse_is_table_compacting(req.content)
         self.msg = 'HBase table \'{0}\' '.format(table)
@@ -110,35 +110,23 @@ class CheckHBaseTableCompacting(NagiosPlugin):
             self.msg += 'has no compaction in progress'
 
     def parse_is_table_compacting(self, content):
-        soup = BeautifulSoup(content, 'html.parser')
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug("BeautifulSoup prettified:\n{0}\n{1}".format(soup.prettify(), '='*80))
-        try:
-            headings = soup.findAll('h2')
-            for heading in headings:
-                log.debug("checking heading '%s'", heading)
-                if heading.get_text() == 'Table Attributes':
-                    log.debug('found Table Attributes section header')
-                    table = heading.find_next('table')
-                    return self.parse_table(table)
+        # only reads as far as the end of the Table Attributes table, not the regions listing after it
+        rows = extract_table(content, self.table_attributes_regex)
+        if rows is None:
             raise UnknownError('parse error - failed to find Table Attributes section in JSP. ' + support_msg())
-        except (AttributeError, TypeError):
-            raise UnknownError('failed to parse output. ' + support_msg())
+        log.debug('found Table Attributes section header')
+        return self.parse_table(rows)
 
     @staticmethod
-    def parse_table(table):
-        """ Take a Beautiful soup table as argument and parse it for compaction information
+    def parse_table(rows):
+        """ Take the rows of the Table Attributes table as argument and parse them for compaction information
         return True if compacting or False otherwise """
-        log.debug('checking first following table')
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug('table:\n%s\n%s', table.prettify(), '='*80)
-        rows = table.findChildren('tr')
         if len(rows) < 3:
             raise UnknownError('parse error - less than the 3 expected rows in table attributes')
-        col_names = rows[0].findChildren('th')
+        col_names = rows[0].th
         if len(col_names) < 3:
             raise UnknownError('parse error - less than the 3 expected column headings')
-        first_col = col_names[0].get_text().strip()
+        first_col = col_names[0]
         if first_col != 'Attribute Name':
             raise UnknownError( \
                   'parse error - expected first column header to be \'{0}\' but got \'\' instead. '\
@@ -149,19 +137,19 @@ class CheckHBaseTableCompacting(NagiosPlugin):
         # if table does not exist
         found_compaction = False
         for row in rows[1:]:
-            cols = row.findChildren('td')
-            if cols[0].get_text().strip() == 'Compaction':
+            cols = row.td
+            if cols and cols[0] == 'Compaction':
                 found_compaction = True
         if not found_compaction:
             raise CriticalError('Compaction table attribute not found, perhaps table does not exist?')
         # ===========
         for row in rows[1:]:
-            cols = row.findChildren('td')
+            cols = row.td
             if len(cols) < 3:
                 raise UnknownError('parse error - less than the 3 expected columns in table attributes:  ' + \
                                    '{0}. {1}'.format(cols, support_msg()))
-            if cols[0].get_text().strip() == 'Compaction':
-                compaction_state = cols[1].get_text().strip()
+            if cols[0] == 'Compaction':
+                compaction_state = cols[1]
                 # NONE when enabled, Unknown when disabled
                 log.info('compaction state = %s', compaction_state)
                 for _ in ('NONE', 'Unknown'):
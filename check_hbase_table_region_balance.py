@@ -24,6 +24,10 @@ Checks:
    (to check for table hotspotting)
 2. if no --table is specified then checks the balance of total regions across all RegionServers
    to check for general region hotspotting (indicative of failure to rebalance)
+3. if --all-tables is specified then checks the balance of regions across RegionServers for every table, reporting
+   the worst balanced tables with per table perfdata. This builds the region counts of all tables from a single
+   batched scan of hbase:meta instead of querying the regions of each table in turn, which on clusters with
+   thousands of tables is thousands of Thrift calls
 
 See also check_hbase_region_balance.py which parses the HMaster UI instead of using the Thrift API
 and checks the balance of total regions across all RegionServers
@@ -64,14 +68,14 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, qquit, ERRORS, support_msg_api
-    from harisekhon.utils import validate_host, validate_port
+    from harisekhon.utils import validate_host, validate_port, validate_int
     from harisekhon import NagiosPlugin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.3'
+__version__ = '0.4'
 
 
 class CheckHBaseTableRegionBalance(NagiosPlugin):
@@ -88,10 +92,19 @@ class CheckHBaseTableRegionBalance(NagiosPlugin):
         self.server_max_regions = (None, 0)
         self.status = 'OK'
         self.table = None
+        self.all_tables = False
+        self.top = None
+        self.batch_size = None
 
     def add_options(self):
         self.add_hostoption(name='HBase Thrift', default_host='localhost', default_port=9090)
         self.add_opt('-T', '--table', help='Table to check')
+        self.add_opt('-A', '--all-tables', action='store_true',
+                     help='Check the region balance of every table from a single scan of hbase:meta')
+        self.add_opt('--top', default=10,
+                     help='Number of worst balanced tables to output with --all-tables, 0 for all (default: 10)')
+        self.add_opt('-B', '--batch-size', default=1000,
+                     help='Number of rows to fetch per Thrift call when scanning hbase:meta (default: 1000)')
         self.add_opt('-l', '--list-tables', action='store_true', help='List tables and exit')
         self.add_thresholds(default_warning=10, default_critical=20)
 
@@ -100,8 +113,18 @@ class CheckHBaseTableRegionBalance(NagiosPlugin):
         host = self.get_opt('host')
         port = self.get_opt('port')
         self.table = self.get_opt('table')
+        self.all_tables = self.get_opt('all_tables')
         validate_host(host)
         validate_port(port)
+        if self.all_tables:
+            if self.table:
+                self.usage('--table and --all-tables are mutually exclusive')
+            top = self.get_opt('top')
+            validate_int(top, 'top', 0)
+            self.top = int(top)
+            batch_size = self.get_opt('batch_size')
+            validate_int(batch_size, 'batch size', 1, 100000)
+            self.batch_size = int(batch_size)
         self.validate_thresholds(integer=False)
 
         try:
@@ -110,6 +133,9 @@ class CheckHBaseTableRegionBalance(NagiosPlugin):
             self.conn = happybase.Connection(host=host, port=int(port), timeout=10 * 1000)  # ms
         except (socket.error, socket.timeout, ThriftException, HBaseIOError) as _:
             qquit('CRITICAL', 'error connecting: {0}'.format(_))
+        if self.all_tables and not self.get_opt('list_tables'):
+            self.check_all_tables()
+            return
         tables = self.conn.tables()
         if len(tables) < 1:
             qquit('CRITICAL', 'no HBase tables found!')
@@ -126,7 +152,8 @@ class CheckHBaseTableRegionBalance(NagiosPlugin):
         log.info('finished, closing connection')
         self.conn.close()
 
-        imbalance = self.calculate_imbalance()
+        (imbalance, self.server_min_regions, self.server_max_regions) = \
+            self.calculate_imbalance(self.server_region_counts)
 
         self.msg = '{0}% region imbalance'.format(imbalance)
         self.check_thresholds(imbalance)
@@ -156,18 +183,82 @@ class CheckHBaseTableRegionBalance(NagiosPlugin):
         except KeyError as _:
             qquit('UNKNOWN', 'failed to process region information. ' + support_msg_api())
 
-    def calculate_imbalance(self):
-        for server in self.server_region_counts:
-            num_regions = self.server_region_counts[server]
-            if self.server_max_regions[0] is None or num_regions > self.server_max_regions[1]:
-                self.server_max_regions = (server, num_regions)
-            if self.server_min_regions[0] is None or num_regions < self.server_min_regions[1]:
-                self.server_min_regions = (server, num_regions)
-        log.info('server with min regions = %s regions on %s', self.server_min_regions[1], self.server_min_regions[0])
-        log.info('server with max regions = %s regions on %s', self.server_max_regions[1], self.server_max_regions[0])
-        imbalance = (self.server_max_regions[1] - self.server_min_regions[1]) \
-                         / max(self.server_max_regions[1], 1) * 100
-        return imbalance
+    def check_all_tables(self):
+        table_server_region_counts = self.scan_meta()
+        log.info('finished, closing connection')
+        self.conn.close()
+        if not table_server_region_counts:
+            qquit('CRITICAL', 'no table regions found in hbase:meta!')
+        results = []
+        for table in table_server_region_counts:
+            server_region_counts = table_server_region_counts[table]
+            log.debug("table '%s'", table)
+            (imbalance, server_min_regions, server_max_regions) = self.calculate_imbalance(server_region_counts)
+            results.append((imbalance, table, server_min_regions[1], server_max_regions[1]))
+            for server in server_region_counts:
+                self.server_region_counts[server] = self.server_region_counts.get(server, 0)
+                self.server_region_counts[server] += server_region_counts[server]
+        # worst balanced first, then by table name for stable output
+        results.sort(key=lambda _: (-_[0], _[1]))
+        (imbalance, table, min_regions, max_regions) = results[0]
+        self.msg = "{0}% worst region imbalance for table '{1}' (min = {2}, max = {3})"\
+                   .format(imbalance, table, min_regions, max_regions)
+        self.check_thresholds(imbalance)
+        self.msg += ' between HBase RegionServers hosting the most vs least number of regions'
+        (total_imbalance, _, _) = self.calculate_imbalance(self.server_region_counts)
+        self.msg += ', {0}% region imbalance across all {1} tables'.format(total_imbalance, len(results))
+        if self.top:
+            results = results[:self.top]
+        if len(results) > 1:
+            self.msg += ', worst tables: ' + ', '.join(["'{0}' = {1}%".format(_[1], _[0]) for _ in results])
+        self.msg += " | '% region imbalance'={0}%".format(total_imbalance)
+        self.msg += self.get_perf_thresholds()
+        for (imbalance, table, min_regions, max_regions) in results:
+            self.msg += " '{0} % region imbalance'={1}%".format(table, imbalance)
+            self.msg += self.get_perf_thresholds()
+            self.msg += " '{0} min_regions'={1} '{0} max_regions'={2}".format(table, min_regions, max_regions)
+
+    def scan_meta(self):
+        """Returns a dict of table to dict of server to region count from a single scan of hbase:meta"""
+        table_server_region_counts = {}
+        try:
+            meta = self.conn.table('hbase:meta')
+            log.info('scanning hbase:meta in batches of %s rows', self.batch_size)
+            # split parents stay in hbase:meta with info:splitA / info:splitB until cleaned up but are offline,
+            # so skip them as Thrift getTableRegions does
+            for (row, data) in meta.scan(columns=[b'info:server', b'info:splitA'], batch_size=self.batch_size):
+                server = data.get(b'info:server')
+                if not server or b'info:splitA' in data:
+                    continue
+                # row key is <table>,<start key>,<region id>.<encoded region name>.
+                table = row.split(b',', 1)[0].decode('utf-8')
+                # info:server is host:port, use host to match server_name from Thrift regions() in other modes
+                server = server.decode('utf-8').rsplit(':', 1)[0]
+                log.debug("table '%s' region '%s' server '%s'", table, row, server)
+                server_region_counts = table_server_region_counts.setdefault(table, {})
+                server_region_counts[server] = server_region_counts.get(server, 0) + 1
+        except (socket.error, socket.timeout, ThriftException, HBaseIOError) as _:
+            qquit('CRITICAL', _)
+        except UnicodeDecodeError:
+            qquit('UNKNOWN', 'failed to decode hbase:meta row. ' + support_msg_api())
+        log.info('found %s tables in hbase:meta', len(table_server_region_counts))
+        return table_server_region_counts
+
+    @staticmethod
+    def calculate_imbalance(server_region_counts):
+        server_min_regions = (None, 0)
+        server_max_regions = (None, 0)
+        for server in server_region_counts:
+            num_regions = server_region_counts[server]
+            if server_max_regions[0] is None or num_regions > server_max_regions[1]:
+                server_max_regions = (server, num_regions)
+            if server_min_regions[0] is None or num_regions < server_min_regions[1]:
+                server_min_regions = (server, num_regions)
+        log.info('server with min regions = %s regions on %s', server_min_regions[1], server_min_regions[0])
+        log.info('server with max regions = %s regions on %s', server_max_regions[1], server_max_regions[0])
+        imbalance = (server_max_regions[1] - server_min_regions[1]) \
+                         / max(server_max_regions[1], 1) * 100
+        return (imbalance, server_min_regions, server_max_regions)
 
 
 if __name__ == '__main__':
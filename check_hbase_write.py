@@ -25,6 +25,9 @@ Checks:
 3. table is writable - writes one unique qualifier value to each column family detected
 4. checks connect / write / read / delete times in milliseconds against thresholds
 5. outputs perfdata of connect / write / read / delete times
+6. optionally repeats the write / read / delete --samples times over the one connection, each to a unique row, and
+   outputs the min / p50 / p95 / p99 / max times of each as perfdata, checking thresholds against a chosen
+   --percentile instead of the slowest so that a single GC pause doesn't flip the alert
 
 Raises Critical if the table is not enabled or does not exist or if the write fails
 
@@ -74,7 +77,7 @@ except ImportError:
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.5'
+__version__ = '0.6'
 
 
 class CheckHBaseWrite(CheckHBaseCell):
@@ -93,6 +96,7 @@ class CheckHBaseWrite(CheckHBaseCell):
         self.column_qualifier = '{0}#{1}#{2}'.format(self._prog, now, random_alnum(5))
         self.value = '{0}#{1}'.format(now, random_alnum(10))
         self.num_column_families = None
+        self.threshold_percentile = 100
         self.list_tables = False
         self.msg = 'msg not defined'
         self.ok()
@@ -103,8 +107,15 @@ class CheckHBaseWrite(CheckHBaseCell):
         self.add_thresholds(default_warning=20, default_critical=1000)
         self.add_opt('-p', '--precision', default=2, metavar='int',
                      help='Precision for query timing in decimal places (default: 2)')
+        self.add_samples_options()
         self.add_opt('-l', '--list', action='store_true', help='List tables and exit')
 
+    def add_samples_options(self):
+        super(CheckHBaseWrite, self).add_samples_options()
+        self.add_opt('--percentile', default=100, metavar='pct',
+                     help='Percentile of the --samples query times to check against the thresholds, ' +
+                     '100 being the slowest (default: 100)')
+
     def process_options(self):
         self.no_args()
         self.host = self.get_opt('host')
@@ -121,6 +132,13 @@ class CheckHBaseWrite(CheckHBaseCell):
         log_option('unique column qualifier', self.column)
         log_option('unique generated value', self.value)
         validate_int(self.precision, 'precision', 0, 10)
+        self.process_samples_options()
+
+    def process_samples_options(self):
+        super(CheckHBaseWrite, self).process_samples_options()
+        threshold_percentile = self.get_opt('percentile')
+        validate_int(threshold_percentile, 'percentile', 1, 100)
+        self.threshold_percentile = int(threshold_percentile)
 
     def run(self):
         initial_start = time.time()
@@ -154,11 +172,18 @@ class CheckHBaseWrite(CheckHBaseCell):
         families = table_conn.families()
         self.num_column_families = len(families)
         log.info('found %s column families: %s', self.num_column_families, families)
+        if self.num_samples > 1:
+            # unique row per sample so that a write can't land in the same millisecond as the previous sample's delete
+            # and be masked by its tombstone
+            rows = ['{0}#{1}'.format(self.row, _) for _ in range(self.num_samples)]
+        else:
+            rows = [self.row]
         for column_family in sorted(families):
             column = '{0}:{1}'.format(column_family, self.column_qualifier)
-            self.check_write(table_conn, self.row, column)
-            self.check_read(table_conn, self.row, column, self.value)
-            self.check_delete(table_conn, self.row, column)
+            for row in rows:
+                self.check_write(table_conn, row, column)
+                self.check_read(table_conn, row, column, self.value)
+                self.check_delete(table_conn, row, column)
 
     def check_write(self, table_conn, row, column):
         log.info("writing cell to row '%s' column '%s'", row, column)
@@ -166,8 +191,7 @@ class CheckHBaseWrite(CheckHBaseCell):
         table_conn.put(row, {column: self.value})
         query_time = (time.time() - start_time) * 1000
         log.info('query write in %s ms', query_time)
-        self.timings[column] = self.timings.get(column, {})
-        self.timings[column]['write'] = max(self.timings[column].get('write', 0), query_time)
+        self.record_timing(column, 'write', query_time)
         return query_time
 
     def check_delete(self, table_conn, row, column):
@@ -176,8 +200,7 @@ class CheckHBaseWrite(CheckHBaseCell):
         table_conn.delete(row, [column])
         query_time = (time.time() - start_time) * 1000
         log.info('query delete in %s ms', query_time)
-        self.timings[column] = self.timings.get(column, {})
-        self.timings[column]['delete'] = max(self.timings[column].get('delete', 0), query_time)
+        self.record_timing(column, 'delete', query_time)
         return query_time
 
     def output(self, connect_time, total_time):
@@ -188,7 +211,10 @@ class CheckHBaseWrite(CheckHBaseCell):
         self.msg += " total_time={0:0.{precision}f}ms".format(total_time, precision=precision)
         self.msg += " connect_time={connect_time:0.{precision}f}ms".format(connect_time=connect_time,
                                                                            precision=precision)
-        self.msg += ", column family "
+        if self.samples:
+            self.msg += ", p{0} of {1} samples per column family ".format(self.threshold_percentile, self.num_samples)
+        else:
+            self.msg += ", column family "
         perfdata = " | total_time={total_time:0.{precision}f}ms connect_time={connect_time:0.{precision}f}ms"\
                    .format(total_time=total_time, connect_time=connect_time, precision=precision)
         for cf_qf in self.timings:
@@ -196,10 +222,12 @@ class CheckHBaseWrite(CheckHBaseCell):
             self.msg += "'{0}'".format(column)
             for action in ['write', 'read', 'delete']:
                 query_time = self.timings[cf_qf][action]
+                if self.samples:
+                    (query_time,) = self.samples[cf_qf][action].percentiles([self.threshold_percentile])
                 self.msg += " {0}_time={1:0.{precision}f}ms".format(action,
                                                                     query_time,
                                                                     precision=precision)
-                self.check_thresholds(self.timings[cf_qf][action])
+                self.check_thresholds(query_time)
                 perfdata += " '{0}_{1}_time'={2:0.{precision}f}ms".format(column,
                                                                           action,
                                                                           query_time,
@@ -207,6 +235,10 @@ class CheckHBaseWrite(CheckHBaseCell):
                 perfdata += self.get_perf_thresholds()
             self.msg += ', '
         self.msg = self.msg.rstrip(', ')
+        if self.samples:
+            (samples_msg, samples_perfdata) = self.samples_output(['write', 'read', 'delete'])
+            self.msg += samples_msg
+            perfdata += samples_perfdata
         self.msg += perfdata
 
 
@@ -24,7 +24,12 @@ Checks:
 2. table is enabled
 3. table is writable - writes one unique qualifier value to each column family detected for every region in the table
 4. checks connect & max write / read / delete times in milliseconds against thresholds
-5. outputs perfdata of connect & max write / read / delete times
+5. outputs perfdata of connect & max write / read / delete times, and the 50th / 90th / 99th percentiles of the write
+   / read / delete times across all regions
+
+Regions are probed concurrently by --num-threads threads, each using a Thrift connection from a pool, so that a full
+spray of tables with thousands of regions completes within a normal check interval. Use --num-threads 1 to probe one
+region at a time
 
 Raises Critical if the table is not enabled or does not exist or if any write / read / delete fails
 
@@ -40,18 +45,16 @@ from __future__ import print_function
 import logging
 import os
 import sys
+import time
 import traceback
-#from multiprocessing.pool import ThreadPool
-# prefer this to the blocking semantics of Queue.get() in this case
-# see pytools/find_active_server.py for usage of Queue.get()
-#from collections import deque
+from multiprocessing.pool import ThreadPool
 srcdir = os.path.abspath(os.path.dirname(__file__))
 libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from harisekhon.utils import log, qquit, plural\
-                                 #, validate_int #, support_msg_api
+    import happybase
+    from harisekhon.utils import log, log_option, qquit, plural, validate_int, CriticalError
     from check_hbase_write import CheckHBaseWrite
 except ImportError:
     print('harisekhon module import error - did you try copying this program out without the adjacent pylib?\n\n'
@@ -59,7 +62,7 @@ except ImportError:
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.3.1'
 
 
 class CheckHBaseWriteSpray(CheckHBaseWrite):
@@ -73,17 +76,30 @@ class CheckHBaseWriteSpray(CheckHBaseWrite):
         self.num_column_families = None
         self.msg = 'msg not defined'
         self.num_threads = None
+        self.pool = None
+        # all region probe times for each action, for percentiles
+        self.region_timings = {'write': [], 'read': [], 'delete': []}
+        self.slowest_region = (None, 0)
         self.ok()
 
     def add_options(self):
         super(CheckHBaseWriteSpray, self).add_options()
-        #self.add_opt('-n', '--num-threads', default=10i0, type='int',
-        #             help='Number or parallel threads to speed up processing (default: 100)')
+        self.add_opt('-n', '--num-threads', default=10, metavar='int',
+                     help='Number of regions to probe in parallel, each with its own Thrift connection ' + \
+                          '(default: 10)')
 
     def process_options(self):
         super(CheckHBaseWriteSpray, self).process_options()
-        #self.num_threads = self.get_opt('num_threads')
-        #validate_int(self.num_threads, 'num threads', 1, 100)
+        self.num_threads = self.get_opt('num_threads')
+        validate_int(self.num_threads, 'num threads', 1, 100)
+        self.num_threads = int(self.num_threads)
+
+    # every region probe is already a sample, see the region percentiles in output()
+    def add_samples_options(self):
+        pass
+
+    def process_samples_options(self):
+        pass
 
     def check_table(self):
         log.info('checking table \'%s\'', self.table)
@@ -99,37 +115,59 @@ class CheckHBaseWriteSpray(CheckHBaseWrite):
         if log.isEnabledFor(logging.DEBUG):
             #log.debug('regions list:\n%s', '\n'.join([_['name'] for _ in regions]))
             log.debug('regions list: \n%s', '\n'.join([str(_) for _ in regions]))
-        for column_family in sorted(families):
-            column = '{0}:{1}'.format(column_family, self.column_qualifier)
-            for region in regions:
-                self.check_region(table_conn, column, region)
-            # Parallelizing this check doesn't seem to save much time, must be losing too much time in code compared to
-            # the speed of HBase
-            # TODO: variable safe locking in check_hbase_write.py
-#            if self.num_threads == 1:
-#                for region in regions:
-#                    self.check_region(table_conn, column, region)
-#            else:
-#                # parallelize at the region level
-#                log.info('creating thread pool')
-#                pool = ThreadPool(processes=self.num_threads)
-#                log.info('creating queue')
-#                queue = deque()
-#                for region in regions:
-#                    #log.info('scheduling test of region: %s', region)
-#                    pool.apply_async(queue.append((self.check_region(table_conn, column, region))))
-#                log.info('waiting for region tests to complete')
-#                try:
-#                    while True:
-#                        queue.popleft()
-#                except IndexError:
-#                    log.info('all threads finished')
-
-    def check_region(self, table_conn, column, region):
+        self.num_threads = min(self.num_threads, max(self.num_regions, 1))
+        log_option('num threads', self.num_threads)
+        # connections are opened lazily by the pool as threads need them
+        # cast port to int to avoid low level socket module TypeError for ports > 32000
+        self.pool = happybase.ConnectionPool(size=self.num_threads, host=self.host, port=int(self.port),
+                                             timeout=10 * 1000)  # ms
+        probes = [('{0}:{1}'.format(column_family, self.column_qualifier), region)
+                  for column_family in sorted(families)
+                  for region in regions]
+        threads = ThreadPool(self.num_threads)
+        try:
+            # raises the first failure, in the main thread so it's handled as per the single write check
+            for _ in threads.imap_unordered(lambda probe: self.check_region(*probe), probes):
+                pass
+        finally:
+            # drops the remaining probes rather than waiting for them
+            threads.terminate()
+
+    def check_region(self, column, region):
+        """Writes, reads back and deletes a cell in the given region, called concurrently from the thread pool
+
+        Raises exceptions rather than calling qquit() which doesn't exit from a thread"""
         row = region['start_key'] + self.row
-        self.check_write(table_conn, row, column)
-        self.check_read(table_conn, row, column, self.value)
-        self.check_delete(table_conn, row, column)
+        region_name = region.get('name', row)
+        region_timings = {}
+        with self.pool.connection() as conn:
+            table_conn = conn.table(self.table)
+            start = time.time()
+            table_conn.put(row, {column: self.value})
+            region_timings['write'] = (time.time() - start) * 1000
+            start = time.time()
+            cells = table_conn.cells(row, column, versions=1)
+            region_timings['read'] = (time.time() - start) * 1000
+            value = cells[0] if cells else None
+            if isinstance(value, bytes) and not isinstance(self.value, bytes):
+                value = value.decode('utf-8')
+            if value != self.value:
+                raise CriticalError("cell value '{0}' (expected '{1}') for HBase table '{2}' row '{3}' column '{4}'"\
+                                    .format(value, self.value, self.table, row, column) + \
+                                    " in region '{0}'".format(region_name))
+            start = time.time()
+            table_conn.delete(row, [column])
+            region_timings['delete'] = (time.time() - start) * 1000
+        log.info("region '%s' column '%s' write %.2f ms, read %.2f ms, delete %.2f ms",
+                 region_name, column, region_timings['write'], region_timings['read'], region_timings['delete'])
+        total = sum(region_timings.values())
+        for action in region_timings:
+            self.record_timing(column, action, region_timings[action])
+        with self.timings_lock:
+            for action in region_timings:
+                self.region_timings[action].append(region_timings[action])
+            if total > self.slowest_region[1]:
+                self.slowest_region = (region_name, total)
 
     def output(self, connect_time, total_time):
         self.msg = "HBase write spray to {0} column {1} x {2} region{3}".format(self.num_column_families,
@@ -138,6 +176,7 @@ class CheckHBaseWriteSpray(CheckHBaseWrite):
                                                                                 else 'family',
                                                                                 self.num_regions,
                                                                                 plural(self.num_regions))
+        self.msg += " with {0} thread{1}".format(self.num_threads, plural(self.num_threads))
         precision = self.precision
         self.msg += " total_time={0:0.{precision}f}ms".format(total_time, precision=precision)
         self.msg += " connect_time={connect_time:0.{precision}f}ms".format(connect_time=connect_time,
@@ -161,6 +200,18 @@ class CheckHBaseWriteSpray(CheckHBaseWrite):
                 perfdata += self.get_perf_thresholds()
             self.msg += ', '
         self.msg = self.msg.rstrip(', ')
+        if self.region_timings['write']:
+            self.msg += ', region percentiles:'
+            for action in ['write', 'read', 'delete']:
+                self.msg += ' {0}'.format(action)
+                for pct in (50, 90, 99):
+                    query_time = self.percentile(self.region_timings[action], pct)
+                    self.msg += " p{0}={1:0.{precision}f}ms".format(pct, query_time, precision=precision)
+                    perfdata += " {0}_time_p{1}={2:0.{precision}f}ms".format(action, pct, query_time,
+                                                                              precision=precision)
+            if self.verbose:
+                self.msg += ", slowest region '{0}' {1:0.{precision}f}ms"\
+                            .format(self.slowest_region[0], self.slowest_region[1], precision=precision)
         self.msg += perfdata
 
 
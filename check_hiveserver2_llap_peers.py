@@ -43,6 +43,7 @@ try:
     from harisekhon.utils import UnknownError, support_msg_api
     from harisekhon.utils import isList, validate_regex, plural
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -51,7 +52,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.5'
 
 
-class CheckHiveServer2InteractivePeers(RestNagiosPlugin):
+class CheckHiveServer2InteractivePeers(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -42,6 +42,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import UnknownError
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -50,7 +51,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4'
 
 
-class CheckInfluxDBApiPing(RestNagiosPlugin):
+class CheckInfluxDBApiPing(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -38,7 +38,8 @@ import sys
 import time
 import traceback
 try:
-    import jenkins
+    from lib_lazy_import import lazy_import
+    jenkins = lazy_import('jenkins')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -50,6 +51,7 @@ try:
     from harisekhon.utils import log, ERRORS, WarningError, CriticalError, UnknownError, sec2human, jsonpp
     from harisekhon.utils import validate_chars, validate_int, isInt, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -58,7 +60,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckJenkinsJob(RestNagiosPlugin):
+class CheckJenkinsJob(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
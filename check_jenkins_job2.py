@@ -44,15 +44,16 @@ try:
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import validate_chars, validate_int, isInt
     from harisekhon.utils import WarningError, UnknownError, ERRORS, sec2human, support_msg_api
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.3'
 
 
-class CheckJenkinsJob(RestNagiosPlugin):
+class CheckJenkinsJob(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -81,7 +82,8 @@ class CheckJenkinsJob(RestNagiosPlugin):
         self.list_jobs = self.get_opt('list')
         self.age = self.get_opt('age')
         if self.list_jobs:
-            self.path = '/api/json'
+            # only fetch the job names rather than every job's details
+            self.path = '/api/json?tree=jobs[name]'
         else:
             validate_chars(self.job, 'job', r'A-Za-z0-9\s\._-')
             self.path = '/job/{job}/api/json'.format(job=self.job)
@@ -39,15 +39,16 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import validate_chars, ERRORS, UnknownError
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.3'
 
 
-class CheckJenkinsJob(RestNagiosPlugin):
+class CheckJenkinsJob(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -74,7 +75,8 @@ class CheckJenkinsJob(RestNagiosPlugin):
         self.job = self.get_opt('job')
         self.list_jobs = self.get_opt('list')
         if self.list_jobs:
-            self.path = '/api/json'
+            # only fetch the job names rather than every job's details
+            self.path = '/api/json?tree=jobs[name]'
         else:
             validate_chars(self.job, 'job', r'A-Za-z0-9\s\._-')
             self.path = '/job/{job}/api/json'.format(job=self.job)
@@ -42,15 +42,16 @@ try:
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import validate_chars
     from harisekhon.utils import ERRORS
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.3'
 
 
-class CheckJenkinsJobColor(RestNagiosPlugin):
+class CheckJenkinsJobColor(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -61,7 +62,8 @@ class CheckJenkinsJobColor(RestNagiosPlugin):
         self.default_port = 8080
         self.json = True
         self.msg = self.name + ' job '
-        self.path = '/api/json'
+        # only fetch the job names for --list rather than every job's details
+        self.path = '/api/json?tree=jobs[name]'
         self.job = None
         self.list_jobs = False
 
@@ -41,7 +41,8 @@ import sys
 import time
 import traceback
 try:
-    import jenkins
+    from lib_lazy_import import lazy_import
+    jenkins = lazy_import('jenkins')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -52,6 +53,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, ERRORS, CriticalError, jsonpp, validate_chars
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -60,7 +62,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckJenkinsJobCount(RestNagiosPlugin):
+class CheckJenkinsJobCount(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -37,7 +37,8 @@ import sys
 import time
 import traceback
 try:
-    import jenkins
+    from lib_lazy_import import lazy_import
+    jenkins = lazy_import('jenkins')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -49,6 +50,7 @@ try:
     from harisekhon.utils import log, ERRORS, CriticalError, jsonpp
     from harisekhon.utils import validate_chars
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -57,7 +59,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckJenkinsJobExists(RestNagiosPlugin):
+class CheckJenkinsJobExists(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -40,15 +40,16 @@ try:
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import validate_chars, isFloat
     from harisekhon.utils import ERRORS, UnknownError
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.3'
+__version__ = '0.4'
 
 
-class CheckJenkinsJobHealthReport(RestNagiosPlugin):
+class CheckJenkinsJobHealthReport(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -59,7 +60,8 @@ class CheckJenkinsJobHealthReport(RestNagiosPlugin):
         self.default_port = 8080
         self.json = True
         self.msg = self.name + ' job '
-        self.path = '/api/json'
+        # only fetch the job names for --list rather than every job's details
+        self.path = '/api/json?tree=jobs[name]'
         self.job = None
         self.list_jobs = False
 
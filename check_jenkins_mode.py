@@ -38,16 +38,17 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.1'
+__version__ = '0.2'
 
 
 # pylint: disable=too-few-public-methods
-class CheckJenkinsMode(RestNagiosPlugin):
+class CheckJenkinsMode(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -56,7 +57,8 @@ class CheckJenkinsMode(RestNagiosPlugin):
         # super().__init__()
         self.name = 'Jenkins'
         self.default_port = 8080
-        self.path = '/api/json'
+        # only fetch the one field rather than the whole root object which lists every job
+        self.path = '/api/json?tree=mode'
         self.json = True
         self.msg = self.name + ' mode = '
 
@@ -35,7 +35,8 @@ import sys
 import time
 import traceback
 try:
-    import jenkins
+    from lib_lazy_import import lazy_import
+    jenkins = lazy_import('jenkins')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -47,6 +48,7 @@ try:
     from harisekhon.utils import log, ERRORS, CriticalError, UnknownError, \
                                  jsonpp, validate_chars, isInt, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -55,7 +57,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckJenkinsNode(RestNagiosPlugin):
+class CheckJenkinsNode(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -35,7 +35,8 @@ import sys
 import time
 import traceback
 try:
-    import jenkins
+    from lib_lazy_import import lazy_import
+    jenkins = lazy_import('jenkins')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -46,6 +47,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, CriticalError, jsonpp
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -54,7 +56,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckJenkinsQueuedBuilds(RestNagiosPlugin):
+class CheckJenkinsQueuedBuilds(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -39,16 +39,17 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
     from harisekhon.utils import UnknownError, support_msg_api
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.1'
+__version__ = '0.2'
 
 
 # pylint: disable=too-few-public-methods
-class CheckJenkinsSecurityEnabled(RestNagiosPlugin):
+class CheckJenkinsSecurityEnabled(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -57,7 +58,8 @@ class CheckJenkinsSecurityEnabled(RestNagiosPlugin):
         # super().__init__()
         self.name = 'Jenkins'
         self.default_port = 8080
-        self.path = '/api/json'
+        # only fetch the one field rather than the whole root object which lists every job
+        self.path = '/api/json?tree=useSecurity'
         self.json = True
         self.msg = self.name + ' security enabled = '
 
@@ -39,7 +39,8 @@ libdir = os.path.join(srcdir, 'pylib')
 sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
-    from bs4 import BeautifulSoup
+    from lib_lazy_import import lazy_from_import
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -46,8 +46,9 @@ import random
 import sys
 import traceback
 try:
-    from kafka import KafkaConsumer, KafkaProducer
-    from kafka.common import KafkaError, TopicPartition
+    from lib_lazy_import import lazy_import
+    kafka = lazy_import('kafka')
+    kafka_common = lazy_import('kafka.common')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -167,7 +168,7 @@ class CheckKafka(PubSubNagiosPlugin):
             if list_topics:
                 self.print_topics()
                 sys.exit(ERRORS['UNKNOWN'])
-        except KafkaError:
+        except kafka_common.KafkaError:
             raise CriticalError(self.exception_msg())
 
         self.topic = self.get_opt('topic')
@@ -181,11 +182,11 @@ class CheckKafka(PubSubNagiosPlugin):
         # because this could fail to retrieve partition metadata and we want it to throw CRITICAL if so
         try:
             self.process_partitions(list_partitions)
-        except KafkaError:
+        except kafka_common.KafkaError:
             err = self.exception_msg()
             raise CriticalError(err)
 
-        self.topic_partition = TopicPartition(self.topic, self.partition)
+        self.topic_partition = kafka_common.TopicPartition(self.topic, self.partition)
         self.acks = self.get_opt('acks')
         if self.acks == 'all':
             log_option('acks', self.acks)
@@ -215,7 +216,7 @@ class CheckKafka(PubSubNagiosPlugin):
             super(CheckKafka, self).run()
         #except KafkaError as _:
             #raise CriticalError(_)
-        except KafkaError:
+        except kafka_common.KafkaError:
             err = self.exception_msg()
             raise CriticalError(err)
 
@@ -226,7 +227,7 @@ class CheckKafka(PubSubNagiosPlugin):
         return err
 
     def get_topics(self):
-        self.consumer = KafkaConsumer(
+        self.consumer = kafka.KafkaConsumer(
             bootstrap_servers=self.brokers,
             client_id=self.client_id,
             #request_timeout_ms=self.timeout_ms + 1, # must be larger than session timeout
@@ -240,7 +241,7 @@ class CheckKafka(PubSubNagiosPlugin):
             print(topic)
 
     def get_topic_partitions(self, topic):
-        self.consumer = KafkaConsumer(
+        self.consumer = kafka.KafkaConsumer(
             topic,
             bootstrap_servers=self.brokers,
             client_id=self.client_id,
@@ -261,7 +262,7 @@ class CheckKafka(PubSubNagiosPlugin):
         print()
 
     def subscribe(self):
-        self.consumer = KafkaConsumer(
+        self.consumer = kafka.KafkaConsumer(
             #self.topic,
             bootstrap_servers=self.brokers,
             # client_id=self.client_id,
@@ -296,7 +297,7 @@ class CheckKafka(PubSubNagiosPlugin):
 
     def publish(self):
         log.debug('creating producer')
-        self.producer = KafkaProducer(
+        self.producer = kafka.KafkaProducer(
             bootstrap_servers=self.brokers,
             client_id=self.client_id,
             acks=self.acks,
@@ -37,6 +37,7 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -45,7 +46,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2.1'
 
 
-class CheckKubernetesHealth(RestNagiosPlugin):
+class CheckKubernetesHealth(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -52,6 +52,7 @@ try:
     from harisekhon.utils import UnknownError, support_msg_api
     from harisekhon.utils import isDict, isList
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -60,7 +61,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckLogstashHotThreads(RestNagiosPlugin):
+class CheckLogstashHotThreads(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -48,6 +48,9 @@ try:
     from harisekhon.utils import ERRORS, UnknownError, support_msg_api
     from harisekhon.utils import validate_chars
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -56,7 +59,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.6'
 
 
-class CheckLogstashPipeline(RestNagiosPlugin):
+class CheckLogstashPipeline(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -76,6 +79,7 @@ class CheckLogstashPipeline(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckLogstashPipeline, self).add_options()
+        self.add_cache_options()
         self.add_opt('-i', '--pipeline', default='main', help='Pipeline to expect is configured (default: main)')
         self.add_opt('-d', '--dead-letter-queue-enabled', action='store_true',
                      help='Check dead letter queue is enabled on pipeline (optional, only applies to Logstash 6+)')
@@ -86,6 +90,7 @@ class CheckLogstashPipeline(RestNagiosPlugin):
 
     def process_options(self):
         super(CheckLogstashPipeline, self).process_options()
+        self.process_cache_options()
         self.pipeline = self.get_opt('pipeline')
         validate_chars(self.pipeline, 'pipeline', 'A-Za-z0-9_-')
         # slightly more efficient to not return the potential list of other pipelines but the error is less informative
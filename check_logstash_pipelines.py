@@ -47,6 +47,9 @@ try:
     #from harisekhon.utils import log
     from harisekhon.utils import ERRORS
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -55,7 +58,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.6'
 
 
-class CheckLogstashPipelines(RestNagiosPlugin):
+class CheckLogstashPipelines(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -75,6 +78,7 @@ class CheckLogstashPipelines(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckLogstashPipelines, self).add_options()
+        self.add_cache_options()
         self.add_opt('-5', '--logstash-5', action='store_true',
                      help='Logstash 5.x (has a slightly different API endpoint to 6.x)')
         self.add_opt('-l', '--list', action='store_true', help='List pipelines and exit (only for Logstash 6+)')
@@ -82,6 +86,7 @@ class CheckLogstashPipelines(RestNagiosPlugin):
 
     def process_options(self):
         super(CheckLogstashPipelines, self).process_options()
+        self.process_cache_options()
         if self.get_opt('logstash_5'):
             self.path = self.path.rstrip('s')
             if self.get_opt('list'):
@@ -48,6 +48,7 @@ try:
     from harisekhon.utils import ERRORS, UnknownError, support_msg_api
     from harisekhon.utils import validate_chars, isList
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -56,7 +57,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckLogstashPlugins(RestNagiosPlugin):
+class CheckLogstashPlugins(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
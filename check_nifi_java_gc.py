@@ -21,6 +21,9 @@ Nagios Plugin to check Nifi Java GC last collection time via its API
 
 Thresholds apply to Java Garbage Collection last collection time in seconds
 
+With --rate checks the percentage of time spent in GC and the collections per minute since the previous run instead,
+with the thresholds applying to the GC time percentage (see lib_java_gc.py)
+
 Tested on Apache Nifi 1.7
 
 """
@@ -40,15 +43,19 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import isInt, CriticalError
     from harisekhon import RestNagiosPlugin
+    from lib_java_gc import Collector, JavaGCMixin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.2'
+__version__ = '0.3'
 
 
-class CheckNifiJavaGc(RestNagiosPlugin):
+class CheckNifiJavaGc(FastJsonMixin, TimingsMixin, JavaGCMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -64,14 +71,21 @@ class CheckNifiJavaGc(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckNifiJavaGc, self).add_options()
+        self.add_cache_options()
+        self.add_gc_options()
         self.add_thresholds(default_warning=3, default_critical=10)
 
     def process_options(self):
         super(CheckNifiJavaGc, self).process_options()
+        self.process_cache_options()
+        self.process_gc_options()
         self.validate_thresholds(integer=False)
 
     def parse_json(self, json_data):
         gcs = json_data['systemDiagnostics']['aggregateSnapshot']['garbageCollection']
+        if self.rate:
+            self.check_gc_rate([Collector(_['name'], _['collectionCount'], _['collectionMillis']) for _ in gcs])
+            return
         gc_millis = max([_['collectionMillis'] for _ in gcs])
         if not isInt(gc_millis):
             raise CriticalError('collectionMillis \'{}\' is not an integer!!'.format(gc_millis))
@@ -38,6 +38,9 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import isFloat, CriticalError
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -47,7 +50,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckNifiProcessorLoadAverage(RestNagiosPlugin):
+class CheckNifiProcessorLoadAverage(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -63,10 +66,12 @@ class CheckNifiProcessorLoadAverage(RestNagiosPlugin):
 
     def add_options(self):
         super(CheckNifiProcessorLoadAverage, self).add_options()
+        self.add_cache_options()
         self.add_thresholds(default_warning=0.7, default_critical=0.9)
 
     def process_options(self):
         super(CheckNifiProcessorLoadAverage, self).process_options()
+        self.process_cache_options()
         self.validate_thresholds(integer=False, min=0, max=1)
 
     def parse_json(self, json_data):
@@ -38,6 +38,9 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import isInt, CriticalError
     from harisekhon import RestNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -47,7 +50,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckNifiStatus(RestNagiosPlugin):
+class CheckNifiStatus(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -61,6 +64,14 @@ class CheckNifiStatus(RestNagiosPlugin):
         self.auth = 'optional'
         self.msg = 'Nifi message not defined'
 
+    def add_options(self):
+        super(CheckNifiStatus, self).add_options()
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckNifiStatus, self).process_options()
+        self.process_cache_options()
+
     def parse_json(self, json_data):
         processors = json_data['systemDiagnostics']['aggregateSnapshot']['availableProcessors']
         if not isInt(processors):
@@ -37,6 +37,9 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestVersionNagiosPlugin
+    from lib_response_cache import ResponseCacheMixin
+    from lib_json import FastJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -46,7 +49,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckNifiVersion(RestVersionNagiosPlugin):
+class CheckNifiVersion(FastJsonMixin, TimingsMixin, ResponseCacheMixin, RestVersionNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -60,6 +63,14 @@ class CheckNifiVersion(RestVersionNagiosPlugin):
         self.auth = 'optional'
         self.msg = 'Nifi message not defined'
 
+    def add_options(self):
+        super(CheckNifiVersion, self).add_options()
+        self.add_cache_options()
+
+    def process_options(self):
+        super(CheckNifiVersion, self).process_options()
+        self.process_cache_options()
+
     # must be a method for inheritance to work
     def parse_json(self, json_data):  # pylint: disable=no-self-use
         return json_data['systemDiagnostics']['aggregateSnapshot']['versionInfo']['niFiVersion']
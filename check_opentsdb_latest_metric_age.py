@@ -44,6 +44,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, isList, CriticalError, UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -52,7 +53,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckOpenTSDBLatestMetricAge(RestNagiosPlugin):
+class CheckOpenTSDBLatestMetricAge(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
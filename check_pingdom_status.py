@@ -51,6 +51,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, isInt, ERRORS, jsonpp
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -59,7 +60,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3.0'
 
 
-class CheckPingdomStatus(RestNagiosPlugin):
+class CheckPingdomStatus(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -48,6 +48,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -56,7 +57,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3.0'
 
 
-class CheckPingdomStatuses(RestNagiosPlugin):
+class CheckPingdomStatuses(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -45,6 +45,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import CriticalError
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -54,7 +55,7 @@ __version__ = '0.2'
 
 
 # pylint: disable=too-few-public-methods
-class CheckPrestoCoordinator(RestNagiosPlugin):
+class CheckPrestoCoordinator(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -46,6 +46,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import validate_regex
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -54,7 +55,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckPrestoEnvironment(RestNagiosPlugin):
+class CheckPrestoEnvironment(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -44,6 +44,9 @@ Warning / Critical thresholds apply to the number of running / failed / blocked
 graph perfdata of the number of recently running / failed / blocked / queued queries
 as well as query time to retrieve this information
 
+The queries are decoded from the response one at a time as it downloads and only the last N matching queries are
+kept, so memory stays flat with a long query history (uses the ijson module if installed)
+
 Will get a '404 Not Found' if you try to run it against a Presto Worker as this information
 is only available via the Presto Coordinator API
 
@@ -62,7 +65,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 from collections import OrderedDict
-import logging
 import os
 import re
 import sys
@@ -74,15 +76,21 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, ERRORS, UnknownError, support_msg_api, isList, validate_regex, validate_int
     from harisekhon import RestNagiosPlugin
+    from lib_json import FastJsonMixin
+    from lib_json_stream import StreamingJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.7.0'
+__version__ = '0.8.0'
+
 
+class CheckPrestoQueries(StreamingJsonMixin, FastJsonMixin, TimingsMixin, RestNagiosPlugin):
 
-class CheckPrestoQueries(RestNagiosPlugin):
+    json_stream_prefix = 'item'
+    json_stream_check_containers = True
 
     def __init__(self):
         # Python 2.x
@@ -221,9 +229,26 @@ class CheckPrestoQueries(RestNagiosPlugin):
 
     def parse_json(self, json_data):
         if not isList(json_data):
-            raise UnknownError('non-list returned by Presto for queries. {0}'.format(support_msg_api()))
-        matching_queries = []
-        for query_item in json_data:
+            self.raise_non_list()
+        self.check_queries(*self.get_last_n_matching_queries(json_data))
+
+    def parse_json_stream(self, items):
+        (last_n_matching_queries, num_matching_queries) = self.get_last_n_matching_queries(items)
+        if self.json_stream_containers.get('') != 'start_array':
+            self.raise_non_list()
+        self.check_queries(last_n_matching_queries, num_matching_queries)
+
+    @staticmethod
+    def raise_non_list():
+        raise UnknownError('non-list returned by Presto for queries. {0}'.format(support_msg_api()))
+
+    def get_last_n_matching_queries(self, query_items):
+        """Takes a list or iterator of queries, returns a tuple of (last --num matching queries, num matching queries)
+
+        Only keeps the last --num matching queries in memory, Presto lists the most recent queries first"""
+        last_n_matching_queries = []
+        num_matching_queries = 0
+        for query_item in query_items:
             query = query_item['query']
             log.info('query: %s', query)
             if self.exclude and self.exclude.search(query):
@@ -233,20 +258,21 @@ class CheckPrestoQueries(RestNagiosPlugin):
                 if not self.include.search(query):
                     continue
                 log.info("including query: %s", query)
-            matching_queries.append(query_item)
-        num_matching_queries = len(matching_queries)
-        # limit searching to last --num queries
+            num_matching_queries += 1
+            # logged as each matching query is streamed as they aren't all kept to log afterwards
+            log.info('%s query found: %s', self.state_selector, query)
+            # limit searching to last --num queries
+            if len(last_n_matching_queries) < self.num:
+                last_n_matching_queries.append(query_item)
         if num_matching_queries < self.num:
             log.info('number of matching queries %d is less than query limit of %d', num_matching_queries, self.num)
-            self.num = num_matching_queries
-        last_n_matching_queries = matching_queries[0:self.num]
+        return (last_n_matching_queries, num_matching_queries)
+
+    def check_queries(self, last_n_matching_queries, num_matching_queries):
         if self.list:
             self.list_queries(last_n_matching_queries)
         selected_queries = [query_item for query_item in last_n_matching_queries \
                             if query_item['state'] in self.state_selector]
-        if log.isEnabledFor(logging.INFO):
-            for query_item in matching_queries:
-                log.info('%s query found: %s', self.state_selector, query_item['query'])
         num_selected_queries = len(selected_queries)
         self.msg = 'Presto SQL - {0} {1} queries'.format(num_selected_queries, self.state_selector[0].lower())
         self.check_thresholds(num_selected_queries)
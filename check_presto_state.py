@@ -46,6 +46,7 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -55,7 +56,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckPrestoState(RestNagiosPlugin):
+class CheckPrestoState(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
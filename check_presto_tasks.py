@@ -27,6 +27,9 @@ This isn't efficent at all as it must get the full list of tasks from the node w
 summary information anywhere that I can see (please let me know and I'll write an update if this changes),
 but this plugin still completes in 500ms including parsing time
 
+The tasks are decoded from the response one at a time as it downloads and only the unfinished ones are kept, so
+memory doesn't grow with the size of the task list (uses the ijson module if installed)
+
 Significant task history may cause this plugin to take longer to return, so watch the graph
 on query time from the perfdata that is output
 
@@ -59,7 +62,7 @@ except ImportError:
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.1'
+__version__ = '0.2'
 
 
 class CheckPrestoTasks(CheckPrestoUnfinishedQueries):
@@ -81,7 +84,7 @@ class CheckPrestoTasks(CheckPrestoUnfinishedQueries):
         self.add_thresholds(default_warning=10000, default_critical=50000)
 
     def filter(self, items):
-        """Take a list of queries or tasks and return only the non-finished ones"""
+        """Take a list or iterator of tasks and return a list of only the non-finished ones"""
         return [task for task in items if not task['complete'] or \
                                           task['taskStatus']['state'] not in self.finished_states]
 
@@ -29,6 +29,9 @@ This isn't efficent as it must get the full query list and parse for non-complet
 doesn't expose this summary information anywhere that I can see (please let me know and I'll write an update if this
 changes), but this plugin still fetches in 120-150ms and completes in 300-700ms in my tests including parsing time
 
+The queries are decoded from the response one at a time as it downloads and only the unfinished ones are kept, so
+memory stays flat with a long query history (uses the ijson module if installed)
+
 Significant query history may cause this plugin to take longer to return, so watch the graph
 on query time from the perfdata that is output
 
@@ -59,15 +62,21 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import UnknownError, support_msg_api, isList
     from harisekhon import RestNagiosPlugin
+    from lib_json import FastJsonMixin
+    from lib_json_stream import StreamingJsonMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
 
 __author__ = 'Hari Sekhon'
-__version__ = '0.3.0'
+__version__ = '0.4.0'
+
 
+class CheckPrestoUnfinishedQueries(StreamingJsonMixin, FastJsonMixin, TimingsMixin, RestNagiosPlugin):
 
-class CheckPrestoUnfinishedQueries(RestNagiosPlugin):
+    json_stream_prefix = 'item'
+    json_stream_check_containers = True
 
     def __init__(self):
         # Python 2.x
@@ -95,14 +104,25 @@ class CheckPrestoUnfinishedQueries(RestNagiosPlugin):
         self.validate_thresholds()
 
     def filter(self, items):
-        """Take a list of queries and return only the non-finished ones"""
+        """Take a list or iterator of queries and return a list of only the non-finished ones"""
         return [query for query in items if query['state'] not in self.finished_states]
 
     def parse_json(self, json_data):
         if not isList(json_data):
-            raise UnknownError('non-list returned by Presto for {type}. {msg}'.format(
-                type=self.query_type, msg=support_msg_api()))
-        current_queries = self.filter(json_data)
+            self.raise_non_list()
+        self.check_current_queries(self.filter(json_data))
+
+    def parse_json_stream(self, items):
+        current_queries = self.filter(items)
+        if self.json_stream_containers.get('') != 'start_array':
+            self.raise_non_list()
+        self.check_current_queries(current_queries)
+
+    def raise_non_list(self):
+        raise UnknownError('non-list returned by Presto for {type}. {msg}'.format(
+            type=self.query_type, msg=support_msg_api()))
+
+    def check_current_queries(self, current_queries):
         num_queries = len(current_queries)
         self.msg = 'Presto SQL - {0} current {1}'.format(num_queries, self.query_type)
         self.check_thresholds(num_queries)
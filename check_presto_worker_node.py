@@ -55,6 +55,8 @@ try:
     from harisekhon.utils import ERRORS, UnknownError, CriticalError, support_msg_api, \
                                  isList, isFloat, validate_float
     from harisekhon import RestNagiosPlugin
+    from lib_multi_host import MultiHostMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -63,7 +65,10 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3.0'
 
 
-class CheckPrestoWorker(RestNagiosPlugin):
+class CheckPrestoWorker(TimingsMixin, MultiHostMixin, RestNagiosPlugin):
+
+    # --hosts fan-out queries the coordinator about each worker node
+    multi_host_option = '--node'
 
     def __init__(self):
         # Python 2.x
@@ -62,6 +62,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import UnknownError, support_msg_api, isList
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -70,7 +71,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckPrestoWorkerNodes(RestNagiosPlugin):
+class CheckPrestoWorkerNodes(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
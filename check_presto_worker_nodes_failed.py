@@ -49,6 +49,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import UnknownError, support_msg_api, isList, plural
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -57,7 +58,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckPrestoWorkerNodesFailed(RestNagiosPlugin):
+class CheckPrestoWorkerNodesFailed(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
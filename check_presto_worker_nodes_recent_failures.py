@@ -53,6 +53,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, UnknownError, support_msg_api, isList, validate_float, isFloat
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -61,7 +62,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3.1'
 
 
-class CheckPrestoWorkersFailures(RestNagiosPlugin):
+class CheckPrestoWorkersFailures(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
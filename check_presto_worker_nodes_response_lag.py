@@ -56,6 +56,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, UnknownError, support_msg_api, isList, validate_int
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -64,7 +65,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3'
 
 
-class CheckPrestoWorkersResponseLag(RestNagiosPlugin):
+class CheckPrestoWorkersResponseLag(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -39,6 +39,7 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -48,7 +49,7 @@ __version__ = '0.1'
 
 
 # pylint: disable=too-few-public-methods
-class CheckPrometheusTelegraf(RestNagiosPlugin):
+class CheckPrometheusTelegraf(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -47,6 +47,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import getenvs, validate_chars
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -55,7 +56,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckRabbitMQAliveness(RestNagiosPlugin):
+class CheckRabbitMQAliveness(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
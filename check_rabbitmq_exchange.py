@@ -41,6 +41,7 @@ try:
     from harisekhon.utils import getenvs, isDict, isList, validate_chars, \
                                  CriticalError, UnknownError, ERRORS, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -49,7 +50,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3'
 
 
-class CheckRabbitMQExchange(RestNagiosPlugin):
+class CheckRabbitMQExchange(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
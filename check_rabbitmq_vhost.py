@@ -44,6 +44,7 @@ try:
     from harisekhon.utils import getenvs, isList, validate_chars, \
                                  UnknownError, ERRORS, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -52,7 +53,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3'
 
 
-class CheckRabbitMQVhost(RestNagiosPlugin):
+class CheckRabbitMQVhost(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -60,6 +60,7 @@ try:
     from harisekhon.utils import isList
     from harisekhon.utils import ERRORS, CriticalError, UnknownError
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -68,7 +69,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.3.2'
 
 
-class CheckRangerPolicy(RestNagiosPlugin):
+class CheckRangerPolicy(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -43,6 +43,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log_option, isList, UnknownError, support_msg_api
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -52,7 +53,7 @@ __version__ = '0.2'
 
 
 # pylint: disable=too-many-instance-attributes
-class CheckSeleniumHubNodes(RestNagiosPlugin):
+class CheckSeleniumHubNodes(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
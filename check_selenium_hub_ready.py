@@ -41,6 +41,8 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log_option
     from harisekhon import RestNagiosPlugin
+    from lib_multi_host import MultiHostMixin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -49,7 +51,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.1'
 
 
-class CheckSeleniumHubReady(RestNagiosPlugin):
+class CheckSeleniumHubReady(TimingsMixin, MultiHostMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
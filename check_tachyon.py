@@ -36,7 +36,8 @@ import os
 import re
 import sys
 try:
-    from bs4 import BeautifulSoup
+    from lib_lazy_import import lazy_from_import
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
     import requests
 except ImportError:
     print(_)
@@ -35,7 +35,8 @@ import os
 import sys
 import traceback
 try:
-    from bs4 import BeautifulSoup
+    from lib_lazy_import import lazy_from_import
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -45,6 +46,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, UnknownError, support_msg
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -53,7 +55,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4.0'
 
 
-class CheckTachyonDeadWorkers(RestNagiosPlugin):
+class CheckTachyonDeadWorkers(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -31,7 +31,8 @@ import os
 import re
 import sys
 try:
-    from bs4 import BeautifulSoup
+    from lib_lazy_import import lazy_from_import
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
 except ImportError:
     print(_)
     sys.exit(4)
@@ -41,6 +42,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import log, UnknownError
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print('module import failed: %s' % _, file=sys.stderr)
     print("Did you remember to build the project by running 'make'?", file=sys.stderr)
@@ -51,7 +53,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.4.0'
 
 
-class CheckTachyonRunningWorkers(RestNagiosPlugin):
+class CheckTachyonRunningWorkers(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -36,7 +36,8 @@ import re
 import sys
 import traceback
 try:
-    from bs4 import BeautifulSoup
+    from lib_lazy_import import lazy_from_import
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
     import requests
 except ImportError:
     print(traceback.format_exc(), end='')
@@ -34,7 +34,8 @@ from __future__ import print_function
 import os
 import sys
 try:
-    from bs4 import BeautifulSoup
+    from lib_lazy_import import lazy_from_import
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
 except ImportError:
     print(_)
     sys.exit(4)
@@ -44,6 +45,7 @@ try:
     # pylint: disable=wrong-import-position
     from harisekhon.utils import ERRORS, UnknownError, CriticalError, validate_host, isInt, support_msg, code_error
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print('module import failed: %s' % _, file=sys.stderr)
     print("Did you remember to build the project by running 'make'?", file=sys.stderr)
@@ -54,7 +56,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2.1'
 
 
-class CheckTachyonWorkerHeartbeat(RestNagiosPlugin):
+class CheckTachyonWorkerHeartbeat(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
@@ -44,6 +44,7 @@ sys.path.append(libdir)
 try:
     # pylint: disable=wrong-import-position
     from harisekhon import RestNagiosPlugin
+    from lib_timings import TimingsMixin
 except ImportError:
     print(traceback.format_exc(), end='')
     sys.exit(4)
@@ -52,7 +53,7 @@ __author__ = 'Hari Sekhon'
 __version__ = '0.2'
 
 
-class CheckVaultHighAvailability(RestNagiosPlugin):
+class CheckVaultHighAvailability(TimingsMixin, RestNagiosPlugin):
 
     def __init__(self):
         # Python 2.x
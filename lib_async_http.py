@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 13:02:15 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing an asyncio HTTP transport for RestNagiosPlugin subclasses
+
+Splits a plugin run into 3 phases so that a single thread can keep thousands of checks in flight:
+
+1. prepare - runs the plugin in-process up to the point it makes its HTTP request via self.request, which records
+             the request instead of making it
+2. fetch   - performs the recorded request on the event loop
+3. finish  - runs a fresh instance of the plugin again with self.request returning the fetched response, so its
+             unchanged parse_json() / parse(), thresholds and output all behave exactly as normal
+
+Plugins which make several requests (eg. custom run() methods) are handled by repeating 2 & 3 for each new request.
+
+The prepare and finish phases are CPU only and run in the event loop's thread, which must be the main thread as the
+plugins set their SIGALRM self-timeout. Their stdout, sys.exit(), alarm and log level are isolated per run.
+
+Only plain HTTP(S) with optional basic auth is done natively, anything else (eg. Kerberos auth objects) falls back to
+the requests library in a worker thread.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import asyncio
+import base64
+import datetime
+import os
+import ssl
+import sys
+import time
+import traceback
+from urllib.parse import urlsplit
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+    from harisekhon.utils import log, ERRORS
+    from lib_plugin_runner import PluginResult, get_plugin_timeout, run_in_process
+    from lib_request_recorder import ReplayRequestHandler, Suspend
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+USER_AGENT = 'Hari Sekhon Nagios Plugins (async)'
+
+async def fetch(method, url, headers=None, auth=None, data=None, timeout=10, verify=True):
+    """Performs an HTTP/1.1 request on the event loop and returns a requests.Response"""
+    return await asyncio.wait_for(_fetch(method, url, headers, auth, data, verify), timeout)
+
+
+async def _fetch(method, url, headers, auth, data, verify):
+    start_time = time.time()
+    parsed = urlsplit(url)
+    https = parsed.scheme == 'https'
+    port = parsed.port or (443 if https else 80)
+    context = None
+    if https:
+        context = ssl.create_default_context()
+        if not verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+    (reader, writer) = await asyncio.open_connection(parsed.hostname, port, ssl=context)
+    try:
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        request_headers = CaseInsensitiveDict({
+            'Host': parsed.netloc.rsplit('@', 1)[-1],
+            'User-Agent': USER_AGENT,
+            'Accept': '*/*',
+            'Accept-Encoding': 'identity',
+            'Connection': 'close',
+        })
+        if auth:
+            credentials = '{0}:{1}'.format(auth[0], auth[1]).encode('utf-8')
+            request_headers['Authorization'] = 'Basic ' + base64.b64encode(credentials).decode('ascii')
+        request_headers.update(headers or {})
+        body = b''
+        if data is not None:
+            body = data if isinstance(data, bytes) else str(data).encode('utf-8')
+            request_headers['Content-Length'] = str(len(body))
+        lines = ['{0} {1} HTTP/1.1'.format(method.upper(), path)]
+        lines += ['{0}: {1}'.format(key, value) for key, value in request_headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+        status_line = (await reader.readline()).decode('latin-1').strip()
+        parts = status_line.split(' ', 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+            raise IOError("invalid HTTP status line '{0}' from {1}".format(status_line, parsed.netloc))
+        response_headers = CaseInsensitiveDict()
+        while True:
+            line = (await reader.readline()).decode('latin-1').rstrip('\r\n')
+            if not line:
+                break
+            (key, _, value) = line.partition(':')
+            key = key.strip()
+            value = value.strip()
+            if key in response_headers:
+                value = response_headers[key] + ', ' + value
+            response_headers[key] = value
+        status_code = int(parts[1])
+        elapsed = time.time() - start_time
+        if method.upper() == 'HEAD' or status_code in (204, 304) or 100 <= status_code < 200:
+            content = b''
+        elif 'chunked' in response_headers.get('Transfer-Encoding', '').lower():
+            content = await _read_chunked(reader)
+        elif 'Content-Length' in response_headers:
+            content = await reader.readexactly(int(response_headers['Content-Length']))
+        else:
+            content = await reader.read()
+    finally:
+        writer.close()
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.reason = parts[2] if len(parts) > 2 else ''
+    response.headers = response_headers
+    response.url = url
+    response.encoding = get_encoding_from_headers(response_headers)
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+async def _read_chunked(reader):
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b';', 1)[0].strip(), 16)
+        if size == 0:
+            # trailers
+            while (await reader.readline()).strip():
+                pass
+            break
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
+    return b''.join(chunks)
+
+
+def _fetch_blocking(request, timeout):
+    kwargs = dict(request.kwargs)
+    kwargs.pop('_args', None)
+    return requests.request(request.method, request.url, timeout=timeout, **kwargs)
+
+
+async def fetch_request(request, timeout):
+    """Performs the HttpRequest natively, or via the requests library in a worker thread if it uses anything else"""
+    kwargs = request.kwargs
+    auth = kwargs.get('auth')
+    unsupported = set(kwargs) - set(['auth', 'headers', 'data', 'verify'])
+    if unsupported or (auth is not None and not isinstance(auth, (tuple, list))):
+        log.debug('falling back to requests library in thread for %s %s', request.method, request.url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _fetch_blocking, request, timeout)
+    return await fetch(request.method, request.url,
+                       headers=kwargs.get('headers'),
+                       auth=auth,
+                       data=kwargs.get('data'),
+                       timeout=timeout,
+                       verify=kwargs.get('verify', True))
+
+
+class AsyncRestRunner(object):
+
+    def __init__(self, max_connections=500, max_requests=10, share_responses=False):
+        self.max_connections = max_connections
+        # guards against plugins requesting endlessly varying urls
+        self.max_requests = max_requests
+        self._semaphore = None
+        # identical requests from concurrent runs, eg. --hosts fan-out of workers all queried via the same
+        # coordinator, share a single fetch
+        self._shared = {} if share_responses else None
+
+    @property
+    def semaphore(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        return self._semaphore
+
+    async def run(self, plugin_class, argv, name=None):
+        """Runs plugin_class with argv (argv[0] being the program name) and returns a PluginResult"""
+        start_time = time.time()
+        timeout = get_plugin_timeout(argv[1:])
+        responses = {}
+        for _ in range(self.max_requests + 1):
+            (result, request) = self.run_plugin(plugin_class, argv, responses)
+            if request is None:
+                result.name = name
+                result.runtime = time.time() - start_time
+                return result
+            responses[request.key] = await self.fetch_shared(request, timeout)
+        return PluginResult(ERRORS['UNKNOWN'],
+                            'UNKNOWN: plugin made more than {0} requests'.format(self.max_requests),
+                            name=name, runtime=time.time() - start_time)
+
+    async def fetch_shared(self, request, timeout):
+        if self._shared is None:
+            return await self.fetch(request, timeout)
+        if request.key not in self._shared:
+            self._shared[request.key] = asyncio.ensure_future(self.fetch(request, timeout))
+        return await asyncio.shield(self._shared[request.key])
+
+    async def fetch(self, request, timeout):
+        async with self.semaphore:
+            try:
+                return await fetch_request(request, timeout)
+            except asyncio.TimeoutError:
+                return IOError('request to {0} timed out after {1} secs'.format(request.url, timeout))
+            except (IOError, OSError, ValueError, asyncio.IncompleteReadError,
+                    requests.exceptions.RequestException) as _:
+                return _
+
+    @staticmethod
+    def run_plugin(plugin_class, argv, responses):
+        """Runs the plugin in-process, returns a tuple of (PluginResult, None) if it completed
+        or (None, HttpRequest) if it needs another request fetching first"""
+
+        def prepare(plugin):
+            plugin.request = ReplayRequestHandler(plugin.request, responses)
+
+        try:
+            return (run_in_process(plugin_class, argv, prepare), None)
+        except Suspend as _:
+            return (None, _.request)
+
+
+def is_rest_plugin(plugin_class):
+    """Returns whether plugin_class can be run by AsyncRestRunner
+
+    Excludes StreamingJsonMixin plugins, which make their requests directly with the requests library to parse the
+    response as it downloads, so would block the event loop"""
+    try:
+        from harisekhon import RestNagiosPlugin  # pylint: disable=import-outside-toplevel
+        from lib_json_stream import StreamingJsonMixin  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return False
+    return isinstance(plugin_class, type) and issubclass(plugin_class, RestNagiosPlugin) \
+        and not issubclass(plugin_class, StreamingJsonMixin)
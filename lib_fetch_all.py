@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-19 11:02:17 +0100 (Mon, 19 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library to GET a list of URLs concurrently on an asyncio event loop (see lib_async_http.py), eg. the same JMX bean
+from every RegionServer in a cluster
+
+Python 3 only, so plugins should only import this on the code paths which use it to keep their other checks working
+on Python 2
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import asyncio
+import os
+import sys
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from lib_async_http import fetch
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+
+def fetch_all(urls, concurrency, timeout):
+    """Returns a list of (response, error) in the same order as urls, fetching at most concurrency at a time each
+    within timeout secs, where response is None and error is a message if it failed"""
+    return asyncio.run(_fetch_all(urls, concurrency, timeout))
+
+
+async def _fetch_all(urls, concurrency, timeout):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get(url):
+        async with semaphore:
+            try:
+                return (await fetch('get', url, timeout=timeout), None)
+            except asyncio.TimeoutError:
+                return (None, 'timed out after {0} secs'.format(timeout))
+            except (IOError, OSError, ValueError, asyncio.IncompleteReadError) as _:
+                return (None, str(_))
+
+    return await asyncio.gather(*[get(_) for _ in urls])
@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 21:14:36 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing a single pass parser of the HBase Master UI /master-status page into a compact snapshot of all the
+metrics used by the HBase Master UI plugins:
+
+    check_hbase_balancer_enabled.py
+    check_hbase_balancer_enabled2.py
+    check_hbase_num_regions_in_transition.py
+    check_hbase_region_balance.py
+    check_hbase_region_longest_migration_time.py
+    check_hbase_regions_stuck_in_transition.py
+    check_hbase_regionserver_compaction_in_progress.py (--master)
+    check_hbase_regionservers_requests_balance.py
+
+Snapshot:
+
+    {
+        'version': SNAPSHOT_VERSION,
+        'regionservers': [[server, requests_per_sec, num_regions], ...],
+        'request_counts': [[server, read + write request count since RegionServer start], ...],
+        'regions_in_transition': {'count': N, 'stuck': N, 'longest_time': ms or None},
+        'balancer': {'warning': alert text or None, 'not_enabled': bool},
+        'master_version': HBase version or None,
+        'errors': {section: error message},
+        'time': epoch secs the page was fetched,
+    }
+
+The page is parsed with lib_html_extract.py, seeking to and reading only the RegionServers base stats table, the
+Regions in Transition table, Requests table and any warning alerts rather than building a DOM of the whole page.
+
+A section which fails to parse is recorded in errors and only fails the plugins which use that section.
+
+With --cache-ttl the snapshot is cached in the shared response cache instead of the page, so the multi-MB page of a
+large cluster is fetched and parsed only once per TTL by whichever of these plugins runs first, the rest just load
+a few KB of JSON.
+
+The regions in transition plugins instead query the narrow HMaster AssignmentManager JMX bean, a few hundred bytes,
+via get_regions_in_transition(). As some HBase versions report zero there despite regions being in transition
+(HBASE-16636), JMX is only trusted for an HBase version once it has agreed with the HTML Master UI on a non-zero number
+of regions in transition. Both reporting none proves nothing as that is also what an affected version reports on a
+healthy cluster, so until then JMX is checked against the HTML snapshot whenever it reports regions in transition, and
+at most every JMX_RECHECK_SECS while it reports none. The HTML snapshot is always used once the bug's signature of
+regions long in transition missing from JMX has been seen. The result of this detection is cached per HBase version in
+the cache directory so upgrades are re-checked automatically.
+
+Cluster-wide plugins discover the live RegionServers via get_live_regionservers() from the HMaster Server JMX bean,
+falling back to the RegionServers in the snapshot for HBase versions without it.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import os
+import re
+import sys
+import time
+import traceback
+try:
+    import requests
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import log, isDict, isInt, isFloat, support_msg, support_msg_api
+    from harisekhon.utils import CriticalError, UnknownError
+    from lib_html_extract import extract_table, extract_text, class_regex, heading_regex, id_regex
+    from lib_response_cache import ResponseCache
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+# bump when the snapshot format changes to ignore snapshots cached by older versions
+SNAPSHOT_VERSION = 3
+
+BALANCER_NOT_ENABLED = 'Load Balancer is not enabled'
+
+BASE_STATS_REGEX = id_regex('tab_baseStats', 'div')
+REQUEST_STATS_REGEX = id_regex('tab_requestStats', 'div')
+RIT_REGEX = heading_regex('Regions in Transition')
+ALERT_REGEX = class_regex('alert alert-warning', 'div')
+ATTRIBUTES_REGEX = id_regex('attributes_table', 'table')
+
+# HBase 1.x registers the bean as 'AssignmentManger' (sic), HBase 2.x as 'AssignmentManager'
+ASSIGNMENT_MANAGER_JMX_QUERY = 'Hadoop:service=HBase,name=Master,sub=AssignmentMan*'
+MASTER_SERVER_JMX_QUERY = 'Hadoop:service=HBase,name=Master,sub=Server'
+
+# the HMaster only updates the JMX regions in transition metrics periodically, so only regions which have been in
+# transition longer than this in the HTML but not in JMX are taken as the HBASE-16636 bug rather than JMX lagging
+JMX_RIT_LAG_MILLIS = 120000
+
+# JMX detection results per HBase version are re-checked against the HTML Master UI after this many secs
+JMX_DETECTION_TTL = 7 * 86400
+
+# while undetected, JMX reporting no regions in transition is checked against the HTML Master UI at most this often
+JMX_RECHECK_SECS = 900
+
+RIT_SOURCES = ('auto', 'jmx', 'html')
+
+
+def parse_master_status(content):
+    """Parses the /master-status page content into a snapshot dict"""
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'regionservers': None,
+        'request_counts': None,
+        'regions_in_transition': None,
+        'balancer': {
+            'warning': parse_balancer_warning(content),
+            'not_enabled': BALANCER_NOT_ENABLED in content,
+        },
+        'master_version': parse_master_version(content),
+        'errors': {},
+        'time': None,
+    }
+    for (section, parser) in (('regionservers', parse_regionservers),
+                              ('request_counts', parse_request_counts),
+                              ('regions_in_transition', parse_regions_in_transition)):
+        try:
+            snapshot[section] = parser(content)
+        except UnknownError as _:
+            snapshot['errors'][section] = str(_)
+        except (TypeError, IndexError, ValueError):
+            snapshot['errors'][section] = 'failed to parse {0} from HBase Master UI status page. {1}'\
+                                          .format(section.replace('_', ' '), support_msg())
+    return snapshot
+
+
+def get_section(snapshot, section):
+    """Returns the given section of the snapshot, raising UnknownError if it failed to parse"""
+    error = snapshot['errors'].get(section)
+    if error:
+        raise UnknownError(error)
+    return snapshot[section]
+
+
+def parse_regionservers(content):
+    rows = extract_table(content, BASE_STATS_REGEX)
+    if not rows:
+        raise UnknownError('failed to find RegionServers base stats table in HBase Master UI. {0}'\
+                           .format(support_msg()))
+    headers = rows[0].th
+    # HBase 1.1 in HDP 2.3: ServerName | Start time | Requests Per Second | Num. Regions
+    # HBase 1.2 (Apache):   ServerName | Start time | Version | Requests per Second | Num. Regions
+    # HBase 1.4 (Apache):   ServerName | Start time | Last Contact | Version | Requests Per Second | Num. Regions
+    if len(headers) < 4:
+        raise UnknownError('no table header for base stats table! {0}'.format(support_msg()))
+    for (index, expected) in ((0, 'ServerName'), (-2, 'Requests Per Second'), (-1, 'Num. Regions')):
+        if headers[index].lower() != expected.lower():
+            raise UnknownError("Table headers in Master UI have changed (got '{0}', expected '{1}'). {2}"\
+                               .format(headers[index], expected, support_msg()))
+    regionservers = []
+    for row in rows[1:]:
+        cols = row.td
+        if len(cols) < len(headers):
+            raise UnknownError('{0} columns found for base stats table row, expected {1}. {2}'\
+                               .format(len(cols), len(headers), support_msg()))
+        # this can be something like:
+        # 21689588ba40,16201,1473775984259
+        # so don't apply isHost() validation because it'll fail FQDN / IP address checks
+        server = cols[0]
+        if server.startswith('Total:'):
+            continue
+        (requests_per_sec, num_regions) = cols[-2:]
+        # requests per sec can be '1.0'
+        if not isFloat(requests_per_sec):
+            raise UnknownError("non-numeric '{0}' found in Requests Per Second column for regionserver '{1}'. {2}"\
+                               .format(requests_per_sec, server, support_msg()))
+        if not isInt(num_regions):
+            raise UnknownError("parsing error - got '{0}' for num regions for server '{1}', "\
+                               .format(num_regions, server) +
+                               'was expecting integer. UI format must have changed. ' + support_msg())
+        regionservers.append([server, int(float(requests_per_sec)), int(num_regions)])
+    if not regionservers:
+        raise UnknownError('no regionserver rows found in base stats table! {0}'.format(support_msg()))
+    return regionservers
+
+
+def parse_request_counts(content):
+    rows = extract_table(content, REQUEST_STATS_REGEX)
+    if not rows:
+        raise UnknownError('failed to find RegionServers requests table in HBase Master UI. {0}'.format(support_msg()))
+    # HBase 1.x: ServerName | Request Per Second | Read Request Count | Write Request Count
+    # HBase 2.x: ServerName | Request Per Second | Read Request Count | Filtered Read Request Count |
+    #            Write Request Count
+    headers = [_.lower() for _ in rows[0].th]
+    try:
+        columns = [headers.index(_) for _ in ('servername', 'read request count', 'write request count')]
+    except ValueError:
+        raise UnknownError("Requests table headers in Master UI have changed (got '{0}'). {1}"\
+                           .format(', '.join(rows[0].th), support_msg()))
+    request_counts = []
+    for row in rows[1:]:
+        cols = row.td
+        if len(cols) < len(headers):
+            raise UnknownError('{0} columns found for requests table row, expected {1}. {2}'\
+                               .format(len(cols), len(headers), support_msg()))
+        (server, reads, writes) = [cols[_] for _ in columns]
+        if server.startswith('Total:'):
+            continue
+        for count in (reads, writes):
+            if not isInt(count):
+                raise UnknownError("non-integer '{0}' found in requests table for regionserver '{1}'. {2}"\
+                                   .format(count, server, support_msg()))
+        request_counts.append([server, int(reads) + int(writes)])
+    return request_counts
+
+
+def parse_regions_in_transition(content):
+    # could also collect lines after 'Regions-in-transition' if parsing /dump
+    # sample:
+    # hbase:meta,,1.1588230740 state=PENDING_OPEN, \
+    # ts=Tue Nov 24 08:26:45 UTC 2015 (1098s ago), server=amb2.service.consul,16020,1448353564099
+    rows = extract_table(content, RIT_REGEX)
+    # looks like HMaster UI doesn't print this section if there are no regions in transition, must assume zero
+    if rows is None:
+        return {'count': 0, 'stuck': 0, 'longest_time': None}
+    log.debug('found Regions in Transition section header')
+    regions_in_transition = {'count': None, 'stuck': None, 'longest_time': None}
+    for row in rows:
+        cols = row.td
+        if not cols:
+            # header row
+            continue
+        if cols[0] == 'Regions in Transition':
+            regions_in_transition['count'] = rit_int(cols[1], 'regions in transition')
+        elif cols[0].startswith('Regions in Transition for more than '):
+            regions_in_transition['stuck'] = rit_int(cols[1], 'regions stuck in transition')
+        # <hex> region rows have Region, State, RIT time (ms)
+        elif len(cols) == 3:
+            rit_time = rit_int(cols[2], 'region in transition time')
+            if regions_in_transition['longest_time'] is None or rit_time > regions_in_transition['longest_time']:
+                regions_in_transition['longest_time'] = rit_time
+        else:
+            raise UnknownError('unexpected number of columns ({0}) for regions in transition table. {1}'\
+                               .format(len(cols), support_msg()))
+    return regions_in_transition
+
+
+def rit_int(value, name):
+    if not isInt(value):
+        raise UnknownError("parse error - got non-integer '{0}' for {1} when parsing HMaster UI"\
+                           .format(value, name))
+    return int(value)
+
+
+def parse_balancer_warning(content):
+    for match in ALERT_REGEX.finditer(content):
+        text = extract_text(content, ALERT_REGEX, match.start())
+        if re.search('balancer', text, re.I):
+            return text
+    return None
+
+
+def parse_master_version(content):
+    for row in extract_table(content, ATTRIBUTES_REGEX) or []:
+        if len(row.td) > 1 and row.td[0] == 'HBase Version':
+            return row.td[1].split(',')[0]
+    return None
+
+
+def parse_jmx_regions_in_transition(bean):
+    """Returns the regions in transition in the snapshot format from the HMaster AssignmentManager JMX bean"""
+    regions_in_transition = {}
+    for (key, name) in (('count', 'ritCount'), ('stuck', 'ritCountOverThreshold'), ('longest_time', 'ritOldestAge')):
+        value = bean.get(name)
+        if not isInt(str(value)):
+            raise UnknownError("non-integer '{0}' parsed for {1} in HMaster JMX. {2}"\
+                               .format(value, name, support_msg_api()))
+        regions_in_transition[key] = int(value)
+    if not regions_in_transition['count']:
+        regions_in_transition['longest_time'] = None
+    return regions_in_transition
+
+
+def parse_live_regionservers(bean):
+    """Returns the list of live RegionServer host names from the HMaster Server JMX bean or None if not present
+
+    tag.liveRegionServers is of the form 'host1,16020,1473775984259;host2,16020,1473775984261'"""
+    live_regionservers = bean.get('tag.liveRegionServers')
+    if live_regionservers is None:
+        return None
+    return [_.split(',')[0] for _ in str(live_regionservers).split(';') if _.strip()]
+
+
+def detect_jmx_rit_bug(jmx_rit, html_rit):
+    """Returns True if JMX shows the HBASE-16636 signature of reporting zero while the HTML Master UI lists regions
+    long in transition, False if JMX and the HTML Master UI both report regions in transition, or None if it can't be
+    told yet, eg. both report none as an affected version also does on a healthy cluster, or one of them is lagging"""
+    if jmx_rit['count'] and html_rit['count']:
+        return False
+    if not jmx_rit['count'] and html_rit['count'] and html_rit['longest_time'] is not None and \
+            html_rit['longest_time'] >= JMX_RIT_LAG_MILLIS:
+        return True
+    return None
+
+
+class HBaseMasterStatusMixin(object):
+    """Mixin for the HBase Master UI plugins to get the /master-status snapshot via get_master_status()
+
+    List it before ResponseCacheMixin, if process_cache_options() enabled the cache the snapshot is cached
+
+    Plugins using get_regions_in_transition() call add_rit_source_option() from add_options() and
+    process_rit_source_option() from process_options() / run()"""
+
+    rit_source = 'auto'
+
+    def add_rit_source_option(self):
+        self.add_opt('--source', default='auto',
+                     help='Where to get regions in transition from: auto (JMX if verified against the HTML Master UI '
+                     'for this HBase version, else the HTML Master UI), jmx or html (default: auto)')
+
+    def process_rit_source_option(self):
+        source = self.get_opt('source')
+        if source not in RIT_SOURCES:
+            self.usage('invalid --source given, must be one of: {0}'.format(', '.join(RIT_SOURCES)))
+        log.info('regions in transition source = %s', source)
+        self.rit_source = source
+
+    def get_master_status(self, host, port, protocol='http'):
+        url = '{0}://{1}:{2}/master-status'.format(protocol, host, port)
+        cache = getattr(self, 'response_cache', None)
+        if cache is None:
+            return self.fetch_master_status(url)
+        # distinct key to the raw page so the two never collide
+        key = cache.key(url + '#snapshot')
+        # held while fetching so concurrent plugins wait for the first one's snapshot instead of each fetching
+        with cache.lock(key):
+            snapshot = cache.get_data(key, self.response_cache_ttl)
+            if snapshot is not None and snapshot.get('version') == SNAPSHOT_VERSION:
+                return snapshot
+            snapshot = self.fetch_master_status(url)
+            cache.put_data(key, url, snapshot)
+        return snapshot
+
+    def fetch_master_status(self, url):
+        log.debug('GET %s', url)
+        try:
+            req = requests.get(url)
+        except requests.exceptions.RequestException as _:
+            raise CriticalError(_)
+        log.debug("response: %s %s", req.status_code, req.reason)
+        log.debug("content:\n%s\n%s\n%s", '='*80, req.content.strip(), '='*80)
+        if req.status_code != 200:
+            raise CriticalError('{0} {1}'.format(req.status_code, req.reason))
+        snapshot = self.parse_master_status(req.content)
+        snapshot['time'] = time.time()
+        return snapshot
+
+    # method so that TimingsMixin can time it as the parse phase
+    @staticmethod
+    def parse_master_status(content):
+        return parse_master_status(content)
+
+    def get_regions_in_transition(self, host, port, protocol='http'):
+        """Returns the regions in transition section of the snapshot, from the AssignmentManager JMX bean where
+        that is known to work for this HBase version, else the /master-status snapshot"""
+        if self.rit_source == 'html':
+            return get_section(self.get_master_status(host, port, protocol), 'regions_in_transition')
+        base_url = '{0}://{1}:{2}'.format(protocol, host, port)
+        if self.rit_source == 'jmx':
+            bean = self.fetch_jmx_bean(base_url, ASSIGNMENT_MANAGER_JMX_QUERY)
+            if bean is None:
+                raise UnknownError('AssignmentManager bean not found in HMaster JMX, try --source html')
+            return parse_jmx_regions_in_transition(bean)
+        cache = self.get_detection_cache()
+        # the server name includes the start code so the version is looked up again after every restart / upgrade
+        server = self.fetch_jmx_bean(base_url, MASTER_SERVER_JMX_QUERY) or {}
+        server_name = server.get('tag.serverName') or '{0}:{1}'.format(host, port)
+        version = None
+        jmx_bug = None
+        if cache is not None:
+            version = cache.get_data(cache.key(base_url + '#version#' + server_name), JMX_DETECTION_TTL)
+            if version is not None:
+                jmx_bug = cache.get_data(cache.key('hbase-master-rit-jmx-bug#' + version), JMX_DETECTION_TTL)
+        log.info('HBase Master version = %s, JMX regions in transition bug = %s', version, jmx_bug)
+        jmx_rit = None
+        if not jmx_bug:
+            bean = self.fetch_jmx_bean(base_url, ASSIGNMENT_MANAGER_JMX_QUERY)
+            if bean is not None:
+                jmx_rit = parse_jmx_regions_in_transition(bean)
+                if jmx_bug is False:
+                    return jmx_rit
+                if not jmx_rit['count'] and cache is not None and \
+                        cache.get_data(self.html_checked_key(cache, base_url, server_name), JMX_RECHECK_SECS):
+                    log.info('JMX reports no regions in transition, trusting it as already checked against the HTML '
+                             'Master UI within the last %s secs', JMX_RECHECK_SECS)
+                    return jmx_rit
+        snapshot = self.get_master_status(host, port, protocol)
+        html_rit = get_section(snapshot, 'regions_in_transition')
+        if cache is None:
+            return html_rit
+        if jmx_bug is None:
+            # older versions without the bean can only use the HTML Master UI
+            jmx_bug = True if jmx_rit is None else detect_jmx_rit_bug(jmx_rit, html_rit)
+            if jmx_bug is None:
+                log.info('JMX regions in transition bug not determined yet, checked against the HTML Master UI')
+                cache.put_data(self.html_checked_key(cache, base_url, server_name), base_url, time.time())
+            else:
+                self.save_jmx_rit_bug(cache, base_url, server_name, version or snapshot.get('master_version'),
+                                      jmx_bug)
+        return html_rit
+
+    @staticmethod
+    def html_checked_key(cache, base_url, server_name):
+        """Key of when JMX was last checked against the HTML Master UI while the detection is undetermined"""
+        return cache.key(base_url + '#rit-html-checked#' + server_name)
+
+    @staticmethod
+    def save_jmx_rit_bug(cache, base_url, server_name, version, jmx_bug):
+        """Caches the JMX regions in transition bug detection result for the HBase version of the server, where the
+        version is not known without the HTML Master UI the server name is used in its place until the next restart"""
+        if version is None:
+            version = server_name
+        cache.put_data(cache.key(base_url + '#version#' + server_name), base_url, version)
+        log.info('detected JMX regions in transition bug = %s for HBase version %s', jmx_bug, version)
+        cache.put_data(cache.key('hbase-master-rit-jmx-bug#' + version), base_url, jmx_bug)
+
+    def get_live_regionservers(self, host, port, protocol='http'):
+        """Returns the list of live RegionServer host names from the HMaster JMX, else the /master-status snapshot"""
+        base_url = '{0}://{1}:{2}'.format(protocol, host, port)
+        bean = self.fetch_jmx_bean(base_url, MASTER_SERVER_JMX_QUERY)
+        regionservers = None
+        if bean is not None:
+            regionservers = parse_live_regionservers(bean)
+        if regionservers is None:
+            log.info('live RegionServers not found in HMaster JMX, falling back to HBase Master UI')
+            snapshot = self.get_master_status(host, port, protocol)
+            regionservers = [_[0].split(',')[0] for _ in get_section(snapshot, 'regionservers')]
+        # dedupe preserving order
+        return list(dict.fromkeys(regionservers))
+
+    def get_detection_cache(self):
+        if self.response_cache is not None:
+            return self.response_cache
+        try:
+            return ResponseCache(self.get_opt('cache_dir'), int(self.get_opt('cache_max_size')))
+        except (OSError, ValueError) as _:
+            log.warning('failed to use cache dir for JMX detection results, checking against HTML every run: %s', _)
+            return None
+
+    def fetch_jmx_bean(self, base_url, query):
+        """Returns the first bean matching the query from the /jmx servlet or None if not found or on error"""
+        url = '{0}/jmx?qry={1}'.format(base_url, query)
+        log.debug('GET %s', url)
+        try:
+            req = self.http_get(url)
+        except requests.exceptions.RequestException as _:
+            log.info('failed to query JMX: %s', _)
+            return None
+        log.debug("response: %s %s", req.status_code, req.reason)
+        log.debug("content:\n%s\n%s\n%s", '='*80, req.content.strip(), '='*80)
+        if req.status_code != 200:
+            return None
+        try:
+            beans = json.loads(req.text)['beans']
+        except (ValueError, KeyError, TypeError):
+            return None
+        prefix = query.rstrip('*')
+        for bean in beans:
+            if isDict(bean) and str(bean.get('name', '')).startswith(prefix):
+                return bean
+        return None
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 23:58:41 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing a field selective decoder for the LiveNodes, DeadNodes and DecomNodes attributes of the NameNode JMX
+NameNodeInfo bean
+
+These are JSON documents embedded as strings within the JMX JSON, mapping each datanode to a dict of ~16 fields. On a
+large cluster decoding them builds tens of thousands of dicts when the plugins only need one or two of the fields, eg.
+
+    usedSpace   - check_hadoop_hdfs_balance.py
+    numBlocks   - check_hadoop_datanodes_block_balance.py
+    lastContact - check_hadoop_datanode_last_contact.py
+
+so decode_nodes() scans the string for just the requested fields instead, returning the node names and the values of
+each field in compact parallel arrays.
+
+Falls back to decoding the whole document with json.loads() if it is not the usual flat structure, eg. contains
+escaped strings or nested values, so the results are always the same as indexing the fully decoded dicts.
+
+See benchmarks/benchmark_hdfs_nodes.py for the CPU time and memory saved on cluster-scale payloads.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import json
+import os
+import re
+import sys
+import traceback
+from array import array
+from bisect import bisect_right
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import log
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+# only valid for the fast path where the content is checked to contain no backslash escapes
+FIELD_VALUE_REGEX = r'"{field}"\s*:\s*("[^"]*"|[^,}}\s]+)'
+
+MISSING = object()
+
+
+class Nodes(object):
+    """Datanode names and the values of the requested fields in parallel arrays, ie. the field values of names[i] are
+    at index i of each field's array, nodes['usedSpace'][i]
+
+    Integer fields are stored as array('q') and any other fields as lists of the decoded values"""
+
+    __slots__ = ('names', 'fields')
+
+    def __init__(self, names, fields):
+        self.names = names
+        self.fields = fields
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __getitem__(self, field):
+        return self.fields[field]
+
+    def items(self, field):
+        """Returns an iterator of (node name, value) tuples for the given field"""
+        return zip(self.names, self.fields[field])
+
+
+def decode_nodes(content, fields, strict=True):
+    """Decodes the node names and only the given fields of each node from a LiveNodes / DeadNodes / DecomNodes JSON
+    string, returning a Nodes object
+
+    Raises KeyError if a node is missing one of the fields, or returns None for it if strict=False, eg. DecomNodes
+    don't have lastContact, and ValueError on invalid JSON, as indexing the fully decoded dicts would"""
+    nodes = _scan_nodes(content, fields, strict)
+    if nodes is None:
+        log.debug('not a flat JSON object of nodes, decoding whole document')
+        nodes = _decode_nodes(content, fields, strict)
+    return nodes
+
+
+def _scan_nodes(content, fields, strict):
+    content = content.strip()
+    # escapes or arrays could confuse the scan so leave them to json.loads()
+    if '\\' in content or '[' in content or content[:1] != '{' or content[-1:] != '}':
+        return None
+    # every other '{' must open a node's fields, preceded by the node's name, and the fields must not contain any
+    # nested objects or braces inside strings, without copying the content as it may be many MB
+    names = []
+    starts = []
+    find = content.find
+    rfind = content.rfind
+    pos = find('{', 1)
+    while pos > 0:
+        end = rfind('"', 0, pos)
+        start = rfind('"', 0, end)
+        if start < 0 or (content[end + 1:pos] != ':' and content[end + 1:pos].strip() != ':'):
+            return None
+        # the previous node's fields must have closed first, otherwise this is a nested object
+        if starts and rfind('}', starts[-1], start) < 0:
+            return None
+        names.append(content[start + 1:end])
+        starts.append(pos)
+        pos = find('{', pos + 1)
+    if content.count('}') != len(names) + 1:
+        return None
+    columns = {}
+    for field in fields:
+        values = [MISSING] * len(names)
+        for match in re.finditer(FIELD_VALUE_REGEX.format(field=re.escape(field)), content):
+            index = bisect_right(starts, match.start()) - 1
+            if index < 0:
+                return None
+            # a duplicate key takes the last value, same as json.loads()
+            values[index] = match.group(1)
+        if MISSING in values:
+            if strict:
+                raise KeyError(field)
+            columns[field] = [None if _ is MISSING else _decode_value(_) for _ in values]
+            continue
+        try:
+            values = [int(_) for _ in values]
+        except ValueError:
+            values = [_decode_value(_) for _ in values]
+        columns[field] = _compact(values)
+    return Nodes(names, columns)
+
+
+def _decode_value(token):
+    if token[0] == '"':
+        return token[1:-1]
+    try:
+        return int(token)
+    except ValueError:
+        # floats, true, false, null
+        return json.loads(token)
+
+
+def _decode_nodes(content, fields, strict):
+    # json.loads() rather than a saved reference so it is the FastJsonMixin backend
+    data = json.loads(content)
+    if not isinstance(data, dict) or [_ for _ in data.values() if not isinstance(_, dict)]:
+        raise ValueError('expected a JSON object of node objects')
+    names = list(data)
+    columns = {}
+    for field in fields:
+        if strict:
+            columns[field] = _compact([data[name][field] for name in names])
+        else:
+            columns[field] = _compact([data[name].get(field) for name in names])
+    return Nodes(names, columns)
+
+
+def _compact(values):
+    # bool is an int subclass but must stay True / False
+    if values and not [_ for _ in values if type(_) is not int]:  # pylint: disable=unidiomatic-typecheck
+        try:
+            return array('q', values)
+        except OverflowError:
+            pass
+    return values
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-19 01:12:07 +0100 (Mon, 19 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing the HDFS rack resilience analysis shared by check_hadoop_hdfs_rack_resilience.py and
+check_ambari_cluster_hdfs_rack_resilience.py, plus the parsers of the rack topology from the 'hdfs dfsadmin
+-printTopology' output and from the NameNode JMX
+
+The NameNode JMX path avoids starting a JVM for the 'hdfs' command on every check. The topology only changes when
+DataNodes are added, removed or restarted into another rack, so it is cached on local disk keyed on a fingerprint of
+the NameNode's DataNode counts from the small FSNamesystemState bean, only fetching the LiveNodes when the fingerprint
+changes or the cached topology expires.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import hashlib
+import os
+import re
+import sys
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import log, plural, support_msg, support_msg_api, ip_regex, host_regex, UnknownError
+    from lib_hdfs_nodes import decode_nodes
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+DEFAULT_RACK = '/default-rack'
+
+# only fetches the one attribute rather than the whole multi-MB NameNodeInfo bean
+JMX_LIVE_NODES_PATH = '/jmx?get=Hadoop:service=NameNode,name=NameNodeInfo::LiveNodes'
+JMX_FS_STATE_PATH = '/jmx?qry=Hadoop:service=NameNode,name=FSNamesystemState'
+
+# any of these changing means DataNodes have joined, left or been restarted, so the topology may have changed
+FINGERPRINT_ATTRIBUTES = (
+    'NumLiveDataNodes',
+    'NumDeadDataNodes',
+    'NumDecomLiveDataNodes',
+    'NumDecomDeadDataNodes',
+    'NumDecommissioningDataNodes',
+)
+
+# bump when the cached topology format changes to ignore topologies cached by older versions
+TOPOLOGY_CACHE_VERSION = 1
+
+RACK_REGEX = re.compile(r'^Rack:\s+(.+?)\s*$')
+NODE_REGEX = re.compile(r'^\s+({ip})(?::\d+)?\s+\(({host})\)\s*$'.format(ip=ip_regex, host=host_regex))
+HOST_REGEX = re.compile(r'^{host}$'.format(host=host_regex))
+LOCATION_REGEX = re.compile(r'^/\S*$')
+
+
+def parse_topology(output):
+    """Returns a dict of {rack: [hosts]} from the output of 'hdfs dfsadmin -printTopology'"""
+    racks = {}
+    rack = None
+    for line in output.split('\n'):
+        match = RACK_REGEX.match(line)
+        if match:
+            rack = match.group(1)
+            log.info('found rack: %s', rack)
+            continue
+        # ignore early warning lines sometimes output by JVM
+        # only continue from point where we find at least first Rack definition
+        if not rack:
+            continue
+        match = NODE_REGEX.match(line)
+        if match:
+            #ip = match.group(1)
+            host = match.group(2)
+            log.info('found host: %s', host)
+            if rack not in racks:
+                racks[rack] = []
+            racks[rack].append(host)
+        elif not line:
+            continue
+        else:
+            raise UnknownError('parsing error. {}'.format(support_msg()))
+    if not rack:
+        raise UnknownError('no rack information found - parse error. {}'.format(support_msg()))
+    return racks
+
+
+def parse_jmx_topology(json_data):
+    """Returns a dict of {rack: [hosts]} from the location of each of the NameNode JMX LiveNodes"""
+    try:
+        live_nodes = json_data['beans'][0]['LiveNodes']
+        nodes = decode_nodes(live_nodes, ['location'], strict=False)
+    except (KeyError, IndexError, TypeError, ValueError) as _:
+        raise UnknownError('failed to parse LiveNodes from NameNode JMX: {0}. {1}'.format(_, support_msg_api()))
+    racks = {}
+    for (name, location) in nodes.items('location'):
+        if location is None:
+            raise UnknownError("NameNode JMX LiveNodes does not include the DataNodes' rack 'location' in this " + \
+                               "version of Hadoop, use 'hdfs dfsadmin' instead")
+        # keyed on host:xferPort
+        host = name.rsplit(':', 1)[0]
+        if not HOST_REGEX.match(host) or not LOCATION_REGEX.match(location):
+            raise UnknownError("parsing error, unrecognized node '{0}' in rack '{1}'. {2}"\
+                               .format(host, location, support_msg_api()))
+        log.info("found host '%s' in rack '%s'", host, location)
+        if location not in racks:
+            racks[location] = []
+        racks[location].append(host)
+    if not racks:
+        raise UnknownError('no live DataNodes found in NameNode JMX to get rack information from')
+    return racks
+
+
+def topology_fingerprint(json_data):
+    """Returns a fingerprint of the NameNode's DataNodes from the JMX FSNamesystemState bean which changes if the
+    rack topology may have changed"""
+    try:
+        bean = json_data['beans'][0]
+        values = [bean[_] for _ in FINGERPRINT_ATTRIBUTES]
+    except (KeyError, IndexError, TypeError) as _:
+        raise UnknownError('failed to parse FSNamesystemState from NameNode JMX: {0}. {1}'\
+                           .format(_, support_msg_api()))
+    return hashlib.sha1(','.join([str(_) for _ in values]).encode('utf-8')).hexdigest()
+
+
+class HdfsRackResilienceMixin(object):
+    """Mixin providing check_rack_resilience() to check a dict of {rack: [hosts]}"""
+
+    def check_rack_resilience(self, racks):
+        """Warns if there are less than 2 racks or any nodes left in the default rack"""
+        num_racks = len(racks)
+        self.msg = '{} rack{} configured'.format(num_racks, plural(num_racks))
+        if num_racks < 2:
+            self.warning()
+            self.msg += ' (no rack resilience!)'
+        num_nodes_left_in_default_rack = 0
+        if DEFAULT_RACK in racks:
+            self.warning()
+            num_nodes_left_in_default_rack = len(racks[DEFAULT_RACK])
+            msg = "{num} node{plural} left in '{default_rack}'!"\
+                  .format(num=num_nodes_left_in_default_rack,
+                          plural=plural(num_nodes_left_in_default_rack),
+                          default_rack=DEFAULT_RACK)
+            if self.verbose:
+                msg += ' [{}]'.format(', '.join(racks[DEFAULT_RACK]))
+            self.msg = msg + ' - ' + self.msg
+        self.msg += ' | hdfs_racks={};2 nodes_in_default_rack={};0'\
+                    .format(num_racks, num_nodes_left_in_default_rack)
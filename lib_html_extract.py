@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 22:03:19 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing fast event driven extraction of tables and text from HTML pages such as the HBase Master UI
+
+Instead of building a BeautifulSoup DOM of the whole page, which takes seconds for the multi-MB pages of large
+clusters, the page is searched for a regex anchor such as a section heading or an element id and from there only the
+table structure tags are scanned, SAX style, collecting the cells of the target table and stopping as soon as it
+closes.
+
+    rows = extract_table(content, heading_regex('Table Attributes'))
+
+Rows are returned as Row(th=[...], td=[...]) of the text of their header and data cells, with tags removed, entities
+unescaped and surrounding whitespace stripped, the same as BeautifulSoup get_text().strip().
+
+This is intended for the machine generated pages of server UIs, it doesn't special case tags inside HTML comments or
+scripts.
+
+See benchmarks/benchmark_html_extract.py for comparisons against BeautifulSoup on generated cluster-scale pages.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import re
+from collections import namedtuple
+try:
+    from html import unescape
+except ImportError:
+    # Python 2
+    from HTMLParser import HTMLParser
+    unescape = HTMLParser().unescape
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+Row = namedtuple('Row', ['th', 'td'])
+
+TABLE_TAGS_REGEX = re.compile(r'<(/?)(table|tr|td|th)\b[^>]*>', re.I)
+START_TAG_REGEX = re.compile(r'<([a-z][a-z0-9]*)\b[^>]*>', re.I)
+TAG_REGEX = re.compile(r'<[^>]*>')
+
+
+def heading_regex(text, tag='h2'):
+    """Returns a regex anchor matching a heading of the given text, allowing for nested tags such as <a name=...>"""
+    return re.compile(r'<{tag}\b[^>]*>\s*(?:<[^>]+>\s*)*{text}\s*(?:<[^>]+>\s*)*</{tag}>'\
+                      .format(tag=tag, text=re.escape(text)), re.I)
+
+
+def id_regex(element_id, tag='[a-z]+'):
+    """Returns a regex anchor matching the start tag of the element with the given id"""
+    return re.compile(r'<{tag}\s[^>]*\bid=["\']{id}["\']'.format(tag=tag, id=re.escape(element_id)), re.I)
+
+
+def class_regex(class_name, tag='[a-z]+'):
+    """Returns a regex anchor matching the start tags of elements with exactly the given class attribute"""
+    return re.compile(r'<{tag}\s[^>]*\bclass=["\']{cls}["\']'.format(tag=tag, cls=re.escape(class_name)), re.I)
+
+
+def get_text(fragment):
+    """Returns the text of an HTML fragment with tags removed, entities unescaped and surrounding whitespace stripped"""
+    if '<' in fragment:
+        fragment = TAG_REGEX.sub('', fragment)
+    if '&' in fragment:
+        fragment = unescape(fragment)
+    return fragment.strip()
+
+
+def _decode(content):
+    if isinstance(content, bytes):
+        return content.decode('utf-8', 'replace')
+    return content
+
+
+def extract_table(content, anchor, start=0):
+    """Returns the list of Rows of the first table from the first match of the anchor regex at or after start,
+    or None if the anchor isn't found"""
+    content = _decode(content)
+    match = anchor.search(content, start)
+    if match is None:
+        return None
+    rows = []
+    depth = 0
+    row = None
+    cell = None
+    cell_start = None
+    for tag_match in TABLE_TAGS_REGEX.finditer(content, match.start()):
+        (end, tag) = tag_match.groups()
+        tag = tag.lower()
+        if tag == 'table':
+            if not end:
+                depth += 1
+                continue
+            # stray end tag before the target table
+            if depth == 0:
+                continue
+            depth -= 1
+            # the text of nested tables is kept in the enclosing cell, same as BeautifulSoup get_text()
+            if depth:
+                continue
+        elif depth != 1:
+            continue
+        # end tags are optional in HTML so any table tag at this level ends the current cell
+        if cell is not None:
+            getattr(row, cell).append(get_text(content[cell_start:tag_match.start()]))
+            cell = None
+        if tag == 'table':
+            # stop as soon as the target table has been read
+            break
+        elif end:
+            if tag == 'tr' and row is not None:
+                rows.append(row)
+                row = None
+        elif tag == 'tr':
+            if row is not None:
+                rows.append(row)
+            row = Row([], [])
+        else:
+            if row is None:
+                row = Row([], [])
+            cell = tag
+            cell_start = tag_match.end()
+    if row is not None:
+        rows.append(row)
+    return rows
+
+
+def extract_text(content, anchor, start=0):
+    """Returns the text of the element starting at the first match of the anchor regex at or after start,
+    with whitespace collapsed, or None if the anchor isn't found"""
+    content = _decode(content)
+    match = anchor.search(content, start)
+    if match is None:
+        return None
+    start_tag = START_TAG_REGEX.match(content, match.start())
+    if start_tag is None:
+        return None
+    tag_regex = re.compile(r'<(/?){0}\b[^>]*>'.format(start_tag.group(1)), re.I)
+    depth = 0
+    end = len(content)
+    for tag_match in tag_regex.finditer(content, match.start()):
+        depth += -1 if tag_match.group(1) else 1
+        if depth == 0:
+            end = tag_match.start()
+            break
+    return ' '.join(get_text(content[start_tag.end():end]).split())
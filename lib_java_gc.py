@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-19 00:21:37 +0100 (Mon, 19 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing the Java GC rate checks shared by the Java GC plugins
+
+The last GC duration is a single pause which says little about whether a JVM is struggling, whereas the percentage of
+time spent in GC and the number of collections per minute over an interval show a JVM heading towards a GC death
+spiral long before a long pause.
+
+Every JVM garbage collector exposes its cumulative CollectionCount and CollectionTime since the JVM started, eg. in the
+JMX beans returned by the tiny java.lang:type=GarbageCollector,* query. These are kept per collector in a local state
+file between runs, and each run reports the deltas over the interval since the previous run.
+
+Also provides the sweep of a whole tier of JVMs discovered from their master service, eg. all the DataNodes, querying
+each one's GC and heap beans concurrently with a deadline per JVM and reporting the worst JVMs and the distribution
+across them rather than each JVM needing its own service check. The concurrent querying is in lib_java_gc_sweep.py,
+which is Python 3 only and so only imported when sweeping.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import math
+import os
+import signal
+import sys
+import tempfile
+import time
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    import requests
+    from harisekhon.utils import log, isInt, plural, sec2human, validate_float, validate_int
+    from harisekhon.utils import CriticalError, UnknownError, support_msg_api
+    from lib_request_recorder import record_request
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.3.0'
+
+# JMX queries for only the garbage collector and heap beans instead of the whole of /jmx
+JMX_GC_PATH = '/jmx?qry=java.lang:type=GarbageCollector,*'
+JMX_GC_BEAN_PREFIX = 'java.lang:type=GarbageCollector,name='
+JMX_MEMORY_PATH = '/jmx?qry=java.lang:type=Memory'
+JMX_MEMORY_BEAN = 'java.lang:type=Memory'
+
+STATE_FILE_TEMPLATE = 'nagios_plugins_java_gc.{uid}.{host}.{port}.json'
+SWEEP_STATE_FILE_TEMPLATE = 'nagios_plugins_java_gc_sweep.{uid}.{host}.{port}.json'
+# bump when the state file format changes to ignore state written by older versions
+STATE_VERSION = 1
+
+
+class Collector(object):
+    """A JVM garbage collector's cumulative counters, plus its last GC duration in millis if known"""
+
+    __slots__ = ('name', 'count', 'time', 'last_duration')
+
+    def __init__(self, name, count, time_millis, last_duration=None):
+        self.name = name
+        self.count = count
+        self.time = time_millis
+        self.last_duration = last_duration
+
+
+def parse_jmx_collectors(json_data):
+    """Returns a list of Collectors from the java.lang:type=GarbageCollector beans of a JMX response"""
+    collectors = []
+    for bean in json_data['beans']:
+        if 'name' in bean and bean['name'].startswith(JMX_GC_BEAN_PREFIX):
+            last_duration = None
+            last_gc_info = bean.get('LastGcInfo')
+            if last_gc_info and 'duration' in last_gc_info and isInt(last_gc_info['duration']):
+                last_duration = int(last_gc_info['duration'])
+            collectors.append(Collector(bean['name'][len(JMX_GC_BEAN_PREFIX):],
+                                        bean.get('CollectionCount'),
+                                        bean.get('CollectionTime'),
+                                        last_duration))
+    return collectors
+
+
+def parse_jmx_heap_used_pct(json_data):
+    """Returns the percentage of the max heap used from the java.lang:type=Memory bean of a JMX response"""
+    for bean in json_data['beans']:
+        if bean.get('name') == JMX_MEMORY_BEAN:
+            heap = bean['HeapMemoryUsage']
+            maximum = heap['max']
+            # max is -1 if not defined, in which case the heap can only grow to what is committed
+            if not isInt(maximum) or int(maximum) < 1:
+                maximum = heap['committed']
+            if not isInt(heap['used']) or not isInt(maximum) or int(maximum) < 1:
+                raise UnknownError('non-integer or zero HeapMemoryUsage returned: {0}. {1}'\
+                                   .format(heap, support_msg_api()))
+            return int(heap['used']) / int(maximum) * 100
+    raise UnknownError('{0} JMX bean not found'.format(JMX_MEMORY_BEAN))
+
+
+def gc_deltas(previous, counters, now):
+    """Returns a tuple of ({collector: [count delta, time delta]}, interval secs) since the previous sample of
+    {'time': secs, 'collectors': counters}, or (None, None) if there is no usable previous sample to compare against"""
+    if not previous or 'time' not in previous or 'collectors' not in previous:
+        return (None, None)
+    interval = now - previous['time']
+    if interval <= 0:
+        log.info('previous GC counters are not older than these, ignoring them')
+        return (None, None)
+    deltas = {}
+    for (name, (count, millis)) in counters.items():
+        if name not in previous['collectors']:
+            log.info("collector '%s' not in previous GC counters, JVM GC settings changed", name)
+            return (None, None)
+        (previous_count, previous_millis) = previous['collectors'][name]
+        if count < previous_count or millis < previous_millis:
+            log.info("collector '%s' counters went backwards, JVM restarted", name)
+            return (None, None)
+        deltas[name] = [count - previous_count, millis - previous_millis]
+    return (deltas, interval)
+
+
+def gc_time_pct(deltas, interval):
+    return sum([_[1] for _ in deltas.values()]) / (interval * 1000) * 100
+
+
+def percentile(values, pct):
+    """Returns the nearest rank percentile of a sorted list"""
+    return values[max(int(math.ceil(pct / 100 * len(values))) - 1, 0)]
+
+
+class JavaGCMixin(object):
+    """Mixin for the Java GC plugins to add the --rate and --state-file options, and the cluster sweep options
+
+    Call add_gc_options() / process_gc_options() from add_options() / process_options() and pass the Collectors
+    from the response to check_gc_rate() when self.rate is set. The plugin's -w / -c thresholds then apply to the
+    percentage of time spent in GC over the interval. The message is prefixed by self.name, or its first element if a
+    list.
+
+    To sweep a whole tier of JVMs discovered from a master service instead, set self.gc_sweep to the master's
+    (host, port) before process_gc_options(), call add_gc_sweep_options() / process_gc_sweep_options() too and pass
+    the list of discovered (host, port) to sweep_gc(), with self.gc_sweep_role naming them, eg. 'DataNode'. Call
+    record_sweep_request() first so the sweep's requests use the same auth and SSL verification as the plugin's."""
+
+    def __init__(self, *args, **kwargs):
+        # Python 2.x
+        super(JavaGCMixin, self).__init__(*args, **kwargs)
+        # Python 3.x
+        # super().__init__(*args, **kwargs)
+        self.rate = False
+        self.state_file = None
+        self.gc_sweep = None
+        self.gc_sweep_role = 'JVM'
+        self.top = 10
+        self.concurrency = 50
+        self.host_timeout = 5
+        self.heap_warning = None
+        self.heap_critical = None
+        self.sweep_request = {}
+
+    def add_gc_options(self):
+        self.add_opt('--rate', action='store_true',
+                     help='Check the percentage of time spent in GC and collections per minute since the previous ' + \
+                          'run, from the collectors cumulative counters kept in --state-file, instead of the last ' + \
+                          'GC time. Thresholds then apply to the GC time percentage. The first run only records a ' + \
+                          'baseline')
+        self.add_opt('--state-file', metavar='file',
+                     help='File to keep the GC counters in between runs for --rate, must be different per JVM or ' + \
+                          'sweep ' + \
+                          '(default: {0})'.format(os.path.join(tempfile.gettempdir(),
+                                                               STATE_FILE_TEMPLATE.format(uid='<uid>', host='<host>',
+                                                                                          port='<port>'))))
+
+    def process_gc_options(self):
+        self.rate = self.get_opt('rate')
+        self.state_file = self.get_opt('state_file')
+        if not self.state_file:
+            if self.gc_sweep:
+                (host, port) = self.gc_sweep
+                state_file = SWEEP_STATE_FILE_TEMPLATE.format(uid=os.getuid(), host=host, port=port)
+            else:
+                state_file = STATE_FILE_TEMPLATE.format(uid=os.getuid(), host=self.host, port=self.port)
+            self.state_file = os.path.join(tempfile.gettempdir(), state_file)
+
+    def add_gc_sweep_options(self):
+        self.add_opt('--top', metavar='N', default=10,
+                     help='Number of worst JVMs to output when sweeping (default: 10)')
+        self.add_opt('--concurrency', metavar='N', default=50,
+                     help='Max number of JVMs to query concurrently when sweeping (default: 50)')
+        self.add_opt('--host-timeout', metavar='secs', default=5,
+                     help='Deadline for querying each JVM when sweeping, those which miss it are counted as ' + \
+                          'failed (default: 5)')
+        self.add_opt('--heap-warning', metavar='percent',
+                     help='Warning threshold for the percentage of max heap used by any JVM when sweeping')
+        self.add_opt('--heap-critical', metavar='percent',
+                     help='Critical threshold for the percentage of max heap used by any JVM when sweeping')
+
+    def process_gc_sweep_options(self):
+        if sys.version_info < (3, 7):
+            self.usage('{0} sweep requires Python 3.7+'.format(self.gc_sweep_role))
+        for name in ('top', 'concurrency', 'host_timeout'):
+            validate_int(self.get_opt(name), name.replace('_', ' '), 1, 10000)
+            setattr(self, name, int(self.get_opt(name)))
+        for name in ('heap_warning', 'heap_critical'):
+            if self.get_opt(name) is not None:
+                validate_float(self.get_opt(name), name.replace('_', ' '), 0, 100)
+                setattr(self, name, float(self.get_opt(name)))
+
+    def load_gc_state(self):
+        try:
+            with open(self.state_file) as filehandle:
+                state = json.load(filehandle)
+            if state.get('version') == STATE_VERSION:
+                return state
+            log.info('ignoring state file of different version %s', state.get('version'))
+        except (IOError, OSError) as _:
+            log.info('no state file loaded: %s', _)
+        except (ValueError, KeyError, AttributeError) as _:
+            log.warning("ignoring corrupt state file '%s': %s", self.state_file, _)
+        return None
+
+    def save_gc_state(self, state):
+        # write to a temp file and rename so concurrent runs never read a partially written file
+        try:
+            (filehandle, tmp) = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.state_file)),
+                                                 prefix=os.path.basename(self.state_file) + '.')
+            with os.fdopen(filehandle, 'w') as filehandle:
+                state['version'] = STATE_VERSION
+                json.dump(state, filehandle, separators=(',', ':'))
+            os.rename(tmp, self.state_file)
+        except (IOError, OSError) as _:
+            log.warning("failed to write state file '%s': %s", self.state_file, _)
+
+    @staticmethod
+    def get_counters(collectors):
+        counters = {}
+        for collector in collectors:
+            # the JMX spec allows -1 for collectors which don't implement the counters
+            if collector.count == -1 or collector.time == -1:
+                log.info("collector '%s' doesn't implement the GC counters, skipping", collector.name)
+                continue
+            for (name, value) in (('CollectionCount', collector.count), ('CollectionTime', collector.time)):
+                if not isInt(value):
+                    raise UnknownError("non-integer {0} '{1}' returned for Java GC collector '{2}'. {3}"\
+                                       .format(name, value, collector.name, support_msg_api()))
+            counters[collector.name] = [int(collector.count), int(collector.time)]
+        if not counters:
+            raise UnknownError('no Java GC collectors found')
+        return counters
+
+    def get_deltas(self, counters, now):
+        """Returns a tuple of ({collector: [count delta, time delta]}, interval secs) since the previous run, or
+        (None, None) if there is no usable previous run to compare against, then saves the counters for the next"""
+        state = self.load_gc_state()
+        self.save_gc_state({'time': now, 'collectors': counters})
+        return gc_deltas(state, counters, now)
+
+    def check_gc_rate(self, collectors):
+        name = self.name[0] if isinstance(self.name, list) else self.name
+        counters = self.get_counters(collectors)
+        (deltas, interval) = self.get_deltas(counters, time.time())
+        self.ok()
+        if deltas is None:
+            self.msg = '{0} Java GC counters baseline recorded for {1} collector{2}, '\
+                       .format(name, len(counters), plural(len(counters))) + \
+                       'GC rate will be checked from the next run'
+            return
+        gc_count = sum([_[0] for _ in deltas.values()])
+        time_pct = '{0:.2f}'.format(gc_time_pct(deltas, interval))
+        collections_per_min = '{0:.2f}'.format(gc_count / interval * 60)
+        self.msg = '{0} Java GC time = {1}%'.format(name, time_pct)
+        self.check_thresholds(time_pct)
+        self.msg += ', {0} collections/min over the last {1}'.format(collections_per_min, sec2human(int(interval)))
+        if self.verbose:
+            self.msg += ' [{0}]'.format(', '.join(['{0} = {1:.2f}% {2:.2f}/min'\
+                                                   .format(collector,
+                                                           deltas[collector][1] / (interval * 1000) * 100,
+                                                           deltas[collector][0] / interval * 60)
+                                                   for collector in sorted(deltas)]))
+        self.msg += ' | gc_time_pct={0}%{1} collections_per_min={2} interval={3:d}s'\
+                    .format(time_pct, self.get_perf_thresholds(), collections_per_min, int(interval))
+
+    def record_sweep_request(self, run):
+        """Records the auth, headers and SSL verification, eg. --ssl-noverify, of the request the plugin's own
+        RestNagiosPlugin run() makes, to make all of the sweep's requests with"""
+        request = record_request(self, run)
+        self.sweep_request = dict(request.kwargs) if request is not None else {}
+        for _ in ('_args', 'timeout'):
+            self.sweep_request.pop(_, None)
+
+    def query_sweep_master(self, path, name):
+        """Returns the content of the response from the sweep's master service at path"""
+        url = '{0}://{1}:{2}{3}'.format(self.protocol, self.gc_sweep[0], self.gc_sweep[1], path)
+        log.debug('GET %s', url)
+        try:
+            req = requests.get(url, timeout=self.host_timeout, **self.sweep_request)
+        except requests.exceptions.RequestException as _:
+            raise CriticalError('failed to query {0}: {1}'.format(name, _))
+        if req.status_code != 200:
+            raise CriticalError('{0} returned {1} {2}'.format(name, req.status_code, req.reason))
+        return req.content
+
+    def sweep_gc(self, hosts):
+        """Queries the GC and heap JMX beans of all the given (host, port) JVMs concurrently and checks the worst"""
+        if not hosts:
+            raise CriticalError('no live {0}s found by {1}:{2}'.format(self.gc_sweep_role, *self.gc_sweep))
+        log.info('found %s %ss', len(hosts), self.gc_sweep_role)
+        # Python 3 only, see module docstring
+        from lib_java_gc_sweep import query_gc_hosts
+        from lib_plugin_runner import get_plugin_timeout
+        timeout = get_plugin_timeout(sys.argv[1:])
+        # the sweep is bounded by the timeout, leave time to aggregate before the self-timeout
+        signal.alarm(timeout + 5)
+        results = query_gc_hosts(hosts, self.protocol, self.sweep_request, self.concurrency, self.host_timeout,
+                                 timeout)
+        self.process_gc_sweep(results)
+
+    def get_sweep_gc_values(self, results):
+        """Returns a tuple of ({host: GC time % since the previous sweep, or last GC duration secs}, failed) where
+        the value is None for JVMs without a previous sweep to compare against when using --rate"""
+        values = {}
+        failed = []
+        state = None
+        if self.rate:
+            state = self.load_gc_state() or {}
+            if not isinstance(state.get('hosts'), dict):
+                state = {'hosts': {}}
+        now = time.time()
+        for (host, collectors, _, error) in results:
+            if error is not None:
+                failed.append((host, error))
+                continue
+            if self.rate:
+                try:
+                    counters = self.get_counters(collectors)
+                except UnknownError as _:
+                    failed.append((host, str(_)))
+                    continue
+                (deltas, interval) = gc_deltas(state['hosts'].get(host), counters, now)
+                state['hosts'][host] = {'time': now, 'collectors': counters}
+                values[host] = gc_time_pct(deltas, interval) if deltas else None
+                continue
+            durations = [_.last_duration for _ in collectors if _.last_duration is not None]
+            if not durations:
+                failed.append((host, 'no Java GC times found'))
+                continue
+            values[host] = max(durations) / 1000
+        if self.rate:
+            # keeps the counters of JVMs which failed to respond this time so they aren't rebaselined
+            self.save_gc_state(state)
+        return (values, failed)
+
+    def process_gc_sweep(self, results):
+        name = self.name[0] if isinstance(self.name, list) else self.name
+        role = self.gc_sweep_role
+        (values, failed) = self.get_sweep_gc_values(results)
+        heaps = dict([(host, heap) for (host, _, heap, _) in results if host in values])
+        if not values:
+            raise CriticalError('failed to query all {0} {1}s, eg. {2}: {3}'\
+                                .format(len(failed), role, failed[0][0], failed[0][1]))
+        (unit, label, perf_label) = ('s', 'GC last duration', 'gc_duration')
+        if self.rate:
+            (unit, label, perf_label) = ('%', 'GC time', 'gc_time_pct')
+        warning_threshold = None
+        critical_threshold = None
+        if self.get_opt('warning') is not None:
+            warning_threshold = self.get_threshold('warning').get_simple()
+        if self.get_opt('critical') is not None:
+            critical_threshold = self.get_threshold('critical').get_simple()
+        counts = dict([(_, 0) for _ in ('warning', 'critical', 'heap_warning', 'heap_critical')])
+        for host in values:
+            for (prefix, value, warning, critical) in (('', values[host], warning_threshold, critical_threshold),
+                                                       ('heap_', heaps[host], self.heap_warning, self.heap_critical)):
+                if value is None:
+                    continue
+                if critical is not None and value > critical:
+                    counts[prefix + 'critical'] += 1
+                elif warning is not None and value > warning:
+                    counts[prefix + 'warning'] += 1
+        self.ok()
+        if counts['critical'] or counts['heap_critical']:
+            self.critical()
+        elif counts['warning'] or counts['heap_warning']:
+            self.warning()
+        elif failed:
+            self.unknown()
+        gc_values = sorted([_ for _ in values.values() if _ is not None])
+        heap_values = sorted(heaps.values())
+        baselined = len(values) - len(gc_values)
+        self.msg = '{0} Java {1} across {2} {3}{4}'.format(name, label, len(values), role, plural(values))
+        if gc_values:
+            if self.rate:
+                self.msg += ' since the previous sweep'
+            self.msg += ': max = {0:.2f}{unit}, p95 = {1:.2f}{unit}, median = {2:.2f}{unit}'\
+                        .format(gc_values[-1], percentile(gc_values, 95), percentile(gc_values, 50), unit=unit)
+        if baselined:
+            self.msg += ', {0} baselined until the next sweep'.format(baselined)
+        if gc_values and warning_threshold is not None:
+            self.msg += ', warning {0} > {1}'.format(counts['warning'], warning_threshold)
+        if gc_values and critical_threshold is not None:
+            self.msg += ', critical {0} > {1}'.format(counts['critical'], critical_threshold)
+        self.msg += ', heap used max = {0:.1f}%, p95 = {1:.1f}%, median = {2:.1f}%'\
+                    .format(heap_values[-1], percentile(heap_values, 95), percentile(heap_values, 50))
+        if self.heap_warning is not None:
+            self.msg += ', heap warning {0} > {1}'.format(counts['heap_warning'], self.heap_warning)
+        if self.heap_critical is not None:
+            self.msg += ', heap critical {0} > {1}'.format(counts['heap_critical'], self.heap_critical)
+        if failed:
+            self.msg += ', {0} failed to query ({1})'\
+                        .format(len(failed), ', '.join(['{0}: {1}'.format(*_) for _ in failed[:self.top]]))
+        # worst GC first, then fullest heap, then by name for stable output
+        worst = sorted(values, key=lambda _: (values[_] is None, -(values[_] or 0), -heaps[_], _))[:self.top]
+        self.msg += ', top {0}: {1}'.format(len(worst), ', '.join([
+            '{0}={1} heap={2:.1f}%'.format(host,
+                                           'baselined' if values[host] is None else \
+                                           '{0:.2f}{1}'.format(values[host], unit),
+                                           heaps[host])
+            for host in worst]))
+        # same labels every run, 'U' for unknown while all the JVMs are still baselined for --rate
+        gc_perf = ['U'] * 3
+        if gc_values:
+            gc_perf = ['{0:.2f}{1}'.format(_, unit)
+                       for _ in (gc_values[-1], percentile(gc_values, 95), percentile(gc_values, 50))]
+        self.msg += ' | {0}_max={1}{2} {0}_p95={3} {0}_median={4}'\
+                    .format(perf_label, gc_perf[0], self.get_perf_thresholds(), gc_perf[1], gc_perf[2])
+        self.msg += ' heap_used_pct_max={0:.1f}%;{1};{2} heap_used_pct_p95={3:.1f}% heap_used_pct_median={4:.1f}%'\
+                    .format(heap_values[-1], '' if self.heap_warning is None else self.heap_warning,
+                            '' if self.heap_critical is None else self.heap_critical,
+                            percentile(heap_values, 95), percentile(heap_values, 50))
+        self.msg += ' {0}s={1} {0}s_warning={2} {0}s_critical={3} {0}s_heap_warning={4} {0}s_heap_critical={5}'\
+                    .format(role.lower(), len(results), counts['warning'], counts['critical'],
+                            counts['heap_warning'], counts['heap_critical'])
+        self.msg += ' {0}s_failed={1}'.format(role.lower(), len(failed))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-19 10:38:05 +0100 (Mon, 19 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library querying the GC and heap JMX beans of a whole tier of JVMs concurrently on an asyncio event loop for the
+Java GC sweep of lib_java_gc.py
+
+Python 3 only, imported by JavaGCMixin only when sweeping
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import json
+import os
+import sys
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import UnknownError
+    from lib_async_http import fetch_request
+    from lib_request_recorder import HttpRequest
+    from lib_java_gc import JMX_GC_PATH, JMX_MEMORY_PATH, parse_jmx_collectors, parse_jmx_heap_used_pct
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+
+# pylint: disable=too-many-arguments
+def query_gc_hosts(hosts, protocol, request_kwargs, concurrency, host_timeout, timeout):
+    """Returns a list of (host:port, Collectors, heap used %, error) querying the given (host, port) JVMs
+    concurrently, each within host_timeout and all within timeout"""
+    return asyncio.run(_query_gc_hosts(hosts, protocol, request_kwargs, concurrency, host_timeout, timeout))
+
+
+async def _query_gc_hosts(hosts, protocol, request_kwargs, concurrency, host_timeout, timeout):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_beans(host, port):
+        reqs = []
+        for path in (JMX_GC_PATH, JMX_MEMORY_PATH):
+            url = '{0}://{1}:{2}{3}'.format(protocol, host, port, path)
+            reqs.append(await fetch_request(HttpRequest('get', url, request_kwargs), host_timeout))
+        return reqs
+
+    async def query(host, port):
+        async with semaphore:
+            try:
+                # the deadline covers both requests to the JVM
+                reqs = await asyncio.wait_for(fetch_beans(host, port), host_timeout)
+            except asyncio.TimeoutError:
+                return 'timed out after {0} secs'.format(host_timeout)
+            except (IOError, OSError, ValueError, asyncio.IncompleteReadError) as _:
+                return str(_)
+        for req in reqs:
+            if req.status_code != 200:
+                return '{0} {1}'.format(req.status_code, req.reason)
+        try:
+            return (parse_jmx_collectors(json.loads(reqs[0].content)),
+                    parse_jmx_heap_used_pct(json.loads(reqs[1].content)))
+        except (ValueError, KeyError, TypeError, AttributeError, UnknownError) as _:
+            return 'failed to parse JMX: {0}'.format(_)
+
+    names = ['{0}:{1}'.format(*_) for _ in hosts]
+    tasks = [asyncio.ensure_future(query(*_)) for _ in hosts]
+    (_, pending) = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+    results = []
+    for (name, task) in zip(names, tasks):
+        if task in pending:
+            results.append((name, None, None, 'not queried within the {0} secs timeout'.format(timeout)))
+        elif isinstance(task.result(), tuple):
+            results.append((name,) + task.result() + (None,))
+        else:
+            results.append((name, None, None, task.result()))
+    return results
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 18:02:47 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing a pluggable JSON decoder, using the fastest JSON module installed
+
+Backends in order of preference:
+
+    orjson   - https://github.com/ijl/orjson
+    ujson    - https://github.com/ultrajson/ultrajson
+    simdjson - https://github.com/TkTech/pysimdjson
+    json     - standard library, always available
+
+The backend can be forced with $NAGIOS_PLUGINS_JSON_BACKEND or the --json-backend option of plugins using
+FastJsonMixin, eg. to work around a backend bug in a given deployment.
+
+All backends raise ValueError subclasses on invalid JSON so existing error handling works unchanged.
+
+See benchmarks/benchmark_json_backends.py to compare them on cluster-scale payloads.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import functools
+import importlib
+import json
+import os
+import sys
+import traceback
+from contextlib import contextmanager
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import log, log_option
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+BACKENDS = ('orjson', 'ujson', 'simdjson', 'json')
+
+# saved before any patching by FastJsonMixin
+stdlib_loads = json.loads
+
+
+def get_backends():
+    """Returns a list of the names of the installed backends, in order of preference"""
+    return [_ for _ in BACKENDS if get_loads(_, quiet=True) is not None]
+
+
+def get_loads(backend, quiet=False):
+    """Returns the loads function of the given backend, or None if it isn't installed"""
+    if backend not in BACKENDS:
+        raise ValueError("invalid json backend '{0}', must be one of: {1}".format(backend, ', '.join(BACKENDS)))
+    if backend == 'json':
+        return stdlib_loads
+    try:
+        module = importlib.import_module(backend)
+    except ImportError:
+        if not quiet:
+            log.debug("json backend '%s' not installed", backend)
+        return None
+    return module.loads
+
+
+def get_backend(backend=None):
+    """Returns a tuple of (backend name, loads function)
+
+    backend defaults to $NAGIOS_PLUGINS_JSON_BACKEND, 'auto' or unset picks the first installed in BACKENDS"""
+    if backend is None:
+        backend = os.getenv('NAGIOS_PLUGINS_JSON_BACKEND', 'auto')
+    if backend != 'auto':
+        func = get_loads(backend)
+        if func is None:
+            raise ImportError("json backend '{0}' is not installed".format(backend))
+        return (backend, func)
+    for backend in BACKENDS:
+        func = get_loads(backend)
+        if func is not None:
+            return (backend, func)
+    # not reached as json is always available
+    return ('json', stdlib_loads)
+
+
+def make_loads(backend_loads):
+    """Returns a drop in replacement for json.loads() using backend_loads
+
+    Calls with any options such as object_pairs_hook, which the fast backends don't support, go to the standard
+    library json.loads(). json.load() passes all its options through as None so those still use backend_loads"""
+    if backend_loads is stdlib_loads:
+        return stdlib_loads
+
+    @functools.wraps(stdlib_loads)
+    def loads(content, **kwargs):
+        if [_ for _ in kwargs.values() if _ is not None]:
+            return stdlib_loads(content, **kwargs)
+        return backend_loads(content)
+    return loads
+
+
+@contextmanager
+def use_json_backend(backend_loads):
+    """Substitutes json.loads() for the duration of the context, including for the json decoding done by pylib"""
+    original = json.loads
+    json.loads = make_loads(backend_loads)
+    try:
+        yield
+    finally:
+        json.loads = original
+
+
+class FastJsonMixin(object):
+    """Mixin for plugins to decode JSON with the fastest installed backend and add the --json-backend option
+
+    Wraps the instance's run() so it also covers the decoding of the response by RestNagiosPlugin and any json.loads()
+    calls in the plugin itself, eg. of the JSON string embedded in the NameNodeInfo JMX bean's LiveNodes.
+
+    List it before TimingsMixin so that --timings decode_time measures the chosen backend."""
+
+    def __init__(self, *args, **kwargs):
+        super(FastJsonMixin, self).__init__(*args, **kwargs)
+        self.json_backend = None
+        self.run = self._fast_json_run(self.run)
+
+    def add_default_opts(self):
+        super(FastJsonMixin, self).add_default_opts()
+        # validated by get_backend() rather than choices, which optparse also applies to the default from
+        # $NAGIOS_PLUGINS_JSON_BACKEND, failing with a traceback instead of usage
+        self.add_opt('--json-backend', default=os.getenv('NAGIOS_PLUGINS_JSON_BACKEND', 'auto'),
+                     help='JSON decoder to use, auto picks the fastest installed: {0} '.format(', '.join(BACKENDS)) + \
+                          '($NAGIOS_PLUGINS_JSON_BACKEND, default: auto)')
+
+    def _fast_json_run(self, run):
+        @functools.wraps(run)
+        def fast_json_run(*args, **kwargs):
+            try:
+                (self.json_backend, backend_loads) = get_backend(self.get_opt('json_backend'))
+            except (ImportError, ValueError) as _:
+                self.usage(_)
+            log_option('json backend', self.json_backend)
+            with use_json_backend(backend_loads):
+                return run(*args, **kwargs)
+        return fast_json_run
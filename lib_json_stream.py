@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 17:38:05 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing streaming JSON decoding of very large REST API responses
+
+Decodes only the items at a given prefix, one at a time as the response body downloads, so memory stays flat however
+large the response and parsing overlaps the network transfer, eg. tens of MB of Yarn apps or Elasticsearch tasks.
+
+Prefixes use the ijson notation of dot separated keys with 'item' for each element of an array, plus '*' for any key
+or array element, eg.
+
+    apps.app.item   - each Yarn app in {"apps": {"app": [...]}}
+    nodes.*         - each Elasticsearch node in {"nodes": {"<node_id>": {...}, ...}}
+    nodes.*.tasks.* - each task of each node
+
+Uses the ijson module, falling back to decoding the whole response if it isn't installed.
+
+The request is made with the same method, url, headers, auth and SSL verification the plugin's RestNagiosPlugin run()
+would pass to its RequestHandler, plus the plugin's --timeout, so Kerberos and --ssl-noverify work as normal.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import json
+import os
+import re
+import sys
+import traceback
+from abc import ABCMeta, abstractmethod
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    import requests
+    import urllib3
+    from harisekhon.utils import log, CriticalError, UnknownError, support_msg_api
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+try:
+    import ijson
+    JSON_ERRORS = (ValueError, KeyError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    JSON_ERRORS = (ValueError, KeyError)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+
+def prefix_regex(prefix):
+    return re.compile('^' + r'\.'.join([r'[^.]+' if _ == '*' else re.escape(_) for _ in prefix.split('.')]) + '$')
+
+
+def iter_json_items(fileobj, prefix, keys=False, containers=None):
+    """Yields each value in the JSON document read from fileobj at prefix, or (key, value) tuples if keys=True
+    where the key is the map key or array index of the value
+
+    If a containers dict is given it is filled in with the ijson event of each prefix leading to the items as they are
+    seen, eg. {'': 'start_map', 'apps': 'start_map', 'apps.app': 'start_array'} for apps.app.item, or 'null' for
+    {"apps": null}, so that the plugin can validate the structure of the response once the items are consumed"""
+    if ijson is None:
+        log.info('ijson module not installed, decoding whole response')
+        return _iter_decoded_items(json.load(fileobj), prefix.split('.'), keys, containers=containers)
+    if '*' not in prefix and not keys and containers is None:
+        return _ijson_call(ijson.items, fileobj, prefix)
+    return _iter_ijson_items(fileobj, prefix_regex(prefix), keys, containers, _parent_prefixes(prefix))
+
+
+def _parent_prefixes(prefix):
+    segments = prefix.split('.')
+    return set(['.'.join(segments[:_]) for _ in range(len(segments))])
+
+
+def _ijson_call(func, *args):
+    try:
+        # floats rather than Decimals, same as the json module
+        return func(*args, use_float=True)
+    except TypeError:
+        # ijson < 3.1
+        return func(*args)
+
+
+def _iter_ijson_items(fileobj, regex, keys, containers=None, parents=()):
+    events = _ijson_call(ijson.parse, fileobj)
+    # current map key or array index at each depth
+    path_keys = []
+    for (prefix, event, value) in events:
+        if containers is not None and prefix in parents and prefix not in containers and event != 'map_key':
+            containers[prefix] = event
+        if event == 'map_key':
+            path_keys[-1] = value
+            continue
+        if event in ('end_map', 'end_array'):
+            path_keys.pop()
+            continue
+        key = None
+        if path_keys:
+            key = path_keys[-1]
+            if isinstance(key, int):
+                path_keys[-1] = key + 1
+        if regex.match(prefix):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth = 1
+                for (_, event, value) in events:
+                    builder.event(event, value)
+                    if event in ('start_map', 'start_array'):
+                        depth += 1
+                    elif event in ('end_map', 'end_array'):
+                        depth -= 1
+                        if depth == 0:
+                            break
+            yield (key, builder.value) if keys else builder.value
+        elif event == 'start_map':
+            path_keys.append(None)
+        elif event == 'start_array':
+            path_keys.append(0)
+
+
+# the ijson events for the types of the decoded values
+DECODED_EVENTS = ((dict, 'start_map'), (list, 'start_array'), (type(None), 'null'), (bool, 'boolean'),
+                  (int, 'number'), (float, 'number'))
+
+
+def _iter_decoded_items(data, segments, keys, key=None, containers=None, path=None):
+    if not segments:
+        yield (key, data) if keys else data
+        return
+    if containers is not None:
+        path = '' if path is None else path
+        if path not in containers:
+            containers[path] = 'string'
+            for (value_type, event) in DECODED_EVENTS:
+                if isinstance(data, value_type):
+                    containers[path] = event
+                    break
+    segment = segments[0]
+    if isinstance(data, list) and segment in ('item', '*'):
+        children = enumerate(data)
+    elif isinstance(data, dict) and segment == '*':
+        children = data.items()
+    elif isinstance(data, dict) and segment in data:
+        children = [(segment, data[segment])]
+    else:
+        children = []
+    for (child_key, child) in children:
+        child_path = None
+        if containers is not None:
+            child_path = '{0}.{1}'.format(path, segment) if path else segment
+        for _ in _iter_decoded_items(child, segments[1:], keys, child_key, containers, child_path):
+            yield _
+
+
+# Python 2 and 3 compatible equivalent of metaclass=ABCMeta
+class StreamingJsonMixin(ABCMeta(str('StreamingJsonMixinBase'), (object,), {})):
+    """Mixin for RestNagiosPlugin subclasses to decode their JSON response incrementally
+
+    Set json_stream_prefix and implement the required parse_json_stream(items) which is passed an iterator of the
+    items at that prefix, or of (key, item) tuples if json_stream_keys is set. The items must be consumed within
+    parse_json_stream() as they are being read from the still downloading response. Set json_stream_check_containers
+    to have self.json_stream_containers filled in as per iter_json_items() to validate the response structure.
+
+    The request the plugin would make through its RequestHandler is made directly with the requests library instead,
+    as the RequestHandler reads the whole response, so it isn't served from the response cache and --async-http
+    batches run the plugin in a forked child as normal rather than on the event loop."""
+
+    json_stream_prefix = None
+    json_stream_keys = False
+    json_stream_check_containers = False
+    json_stream_containers = None
+
+    def run(self):
+        from lib_request_recorder import record_request
+        # the request the plugin's RestNagiosPlugin run() would make
+        request = record_request(self, super(StreamingJsonMixin, self).run)
+        if request is None:
+            raise UnknownError('no request made by {0}. {1}'.format(self.__class__.__name__, support_msg_api()))
+        (method, url) = (request.method, request.url)
+        kwargs = dict(request.kwargs)
+        args = kwargs.pop('_args', ())
+        kwargs['stream'] = True
+        kwargs.setdefault('timeout', self.timeout)
+        log.debug('%s %s (streaming)', method.upper(), url)
+        try:
+            req = requests.request(method, url, *args, **kwargs)
+        except requests.exceptions.RequestException as _:
+            raise CriticalError(_)
+        try:
+            log.debug('response: %s %s', req.status_code, req.reason)
+            if req.status_code != 200:
+                raise CriticalError('{0} {1}'.format(req.status_code, req.reason))
+            # transparently gunzip
+            req.raw.decode_content = True
+            if self.json_stream_check_containers:
+                self.json_stream_containers = {}
+            try:
+                self.parse_json_stream(iter_json_items(req.raw, self.json_stream_prefix, keys=self.json_stream_keys,
+                                                       containers=self.json_stream_containers))
+            except JSON_ERRORS as _:
+                raise UnknownError('failed to parse json response from {0}:{1}: {2}: {3}. {4}'\
+                                   .format(self.host, self.port, type(_).__name__, _, support_msg_api()))
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as _:
+                raise CriticalError('error reading response from {0}:{1}: {2}'.format(self.host, self.port, _))
+        finally:
+            req.close()
+
+    @abstractmethod
+    def parse_json_stream(self, items):
+        """Required hook, passed the iterator of items at json_stream_prefix to check"""
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 15:02:37 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing lazy imports of heavy modules so plugins only pay their import cost on the code paths which use them
+
+eg. --help, --list-* and option validation failures no longer import BeautifulSoup, boto3, kafka, jenkins or GitPython
+
+    boto3 = lazy_import('boto3')
+    BeautifulSoup = lazy_from_import('bs4', 'BeautifulSoup')
+
+The module is only located at this point, not imported, so a missing module still raises ImportError straight away
+in the plugin's usual import try block. The real import happens on first attribute access or call.
+
+Names used in except clauses must be accessed via the lazy module at that point, eg. 'except kafka_common.KafkaError'
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import importlib
+import sys
+import traceback
+try:
+    from importlib.util import find_spec
+except ImportError:
+    # Python 2
+    import imp
+    find_spec = None
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+
+def _find(name):
+    top_level = name.split('.', 1)[0]
+    if top_level in sys.modules:
+        return
+    if find_spec is None:
+        imp.find_module(top_level)
+    elif find_spec(top_level) is None:
+        raise ImportError("No module named '{0}'".format(top_level))
+
+
+def _import(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        # same as the plugins' eager import handling
+        print(traceback.format_exc(), end='')
+        sys.exit(4)
+
+
+class LazyModule(object):
+
+    def __init__(self, name):
+        self.__dict__['_lazy_name'] = name
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            module = _import(self.__dict__['_lazy_name'])
+            self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self.__dict__['_lazy_module'] is None:
+            return "<lazy module '{0}' (not yet imported)>".format(self.__dict__['_lazy_name'])
+        return repr(self.__dict__['_lazy_module'])
+
+
+class LazyAttribute(object):
+
+    def __init__(self, module, name):
+        self._lazy_module = LazyModule(module)
+        self._lazy_attr_name = name
+        self._lazy_attr = None
+
+    def _load(self):
+        if self._lazy_attr is None:
+            self._lazy_attr = getattr(self._lazy_module, self._lazy_attr_name)
+        return self._lazy_attr
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('_lazy_'):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __repr__(self):
+        if self._lazy_attr is None:
+            return "<lazy '{0}' from module '{1}' (not yet imported)>"\
+                   .format(self._lazy_attr_name, self._lazy_module.__dict__['_lazy_name'])
+        return repr(self._lazy_attr)
+
+
+def lazy_import(name):
+    """Returns a proxy for module 'name' which imports it on first attribute access"""
+    _find(name)
+    return LazyModule(name)
+
+
+def lazy_from_import(module, name):
+    """Returns a proxy for 'from module import name' which imports it on first call or attribute access"""
+    _find(module)
+    return LazyAttribute(module, name)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 16:54:19 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing a --hosts / --hosts-file fan-out mode to RestNagiosPlugin based plugins
+
+Runs the plugin against every host concurrently on an asyncio event loop (see lib_async_http.py), with the same
+options as given for the single host check, then aggregates the results into a single check:
+
+- worst status of all hosts (default)
+- or N of M with --hosts-min-ok, OK if at least N hosts are OK, otherwise CRITICAL
+
+Each host's perfdata is output prefixed with the host name, along with counts of hosts in each state.
+
+Hosts may be given as host:port to override the port per host.
+
+The asyncio fan-out itself is in lib_multi_host_async.py, which is only imported once --hosts / --hosts-file are given
+so the usual single host checks still run on Python 2.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import os
+import re
+import signal
+import sys
+import time
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import log, log_option, qquit, plural, validate_int, validate_file
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.2.0'
+
+# options consumed by the fan-out which must not be passed on to the per host runs
+MULTI_HOST_OPTIONS = ('--hosts', '--hosts-file', '--hosts-min-ok', '--hosts-concurrency')
+
+# CRITICAL takes precedence over UNKNOWN as per the usual Nagios plugin status escalation
+STATUS_PRECEDENCE = ('OK', 'WARNING', 'UNKNOWN', 'CRITICAL')
+
+# 'label with spaces'=value or label=value
+PERFDATA_REGEX = re.compile(r"('(?:[^']|'')+'|[^\s=']+)=(\S*)")
+
+
+class MultiHostMixin(object):
+    """Mixin for RestNagiosPlugin subclasses to add the --hosts, --hosts-file, --hosts-min-ok and --hosts-concurrency
+    options
+
+    Plugins which query one server about another node, eg. the Presto coordinator about a worker, can set
+    multi_host_option to that option instead, eg. '--node'"""
+
+    multi_host_option = '--host'
+
+    def add_options(self):
+        super(MultiHostMixin, self).add_options()
+        self.add_opt('--hosts', metavar='host1,host2,...',
+                     help='Run this check against each of these hosts concurrently and aggregate the results, ' + \
+                          'using {0} for each'.format(self.multi_host_option))
+        self.add_opt('--hosts-file', metavar='file',
+                     help='File of hosts to check, one per line, as per --hosts')
+        self.add_opt('--hosts-min-ok', metavar='N',
+                     help='Aggregate status is OK if at least N hosts are OK, otherwise CRITICAL ' + \
+                          '(default: worst status of all hosts)')
+        self.add_opt('--hosts-concurrency', metavar='N', default=50,
+                     help='Max number of hosts to query concurrently (default: 50)')
+
+    def process_options(self):
+        hosts = self.get_hosts()
+        if not hosts:
+            super(MultiHostMixin, self).process_options()
+            return
+        if sys.version_info < (3, 7):
+            self.usage('--hosts / --hosts-file require Python 3.7+')
+        min_ok = self.get_opt('hosts_min_ok')
+        if min_ok is not None:
+            validate_int(min_ok, 'hosts min ok', 1, len(hosts))
+            min_ok = int(min_ok)
+        concurrency = self.get_opt('hosts_concurrency')
+        validate_int(concurrency, 'hosts concurrency', 1, 10000)
+        log_option('hosts', hosts)
+        self.check_hosts(hosts, int(concurrency), min_ok)
+
+    def get_hosts(self):
+        hosts = []
+        if self.get_opt('hosts'):
+            hosts += [_.strip() for _ in self.get_opt('hosts').split(',')]
+        hosts_file = self.get_opt('hosts_file')
+        if hosts_file:
+            validate_file(hosts_file, 'hosts')
+            with open(hosts_file) as filehandle:
+                for line in filehandle:
+                    hosts.append(line.split('#', 1)[0].strip())
+        # dedupe preserving order
+        seen = set()
+        return [_ for _ in hosts if _ and not (_ in seen or seen.add(_))]
+
+    @staticmethod
+    def strip_multi_host_args(args):
+        stripped = []
+        skip = False
+        for arg in args:
+            if skip:
+                skip = False
+                continue
+            if arg in MULTI_HOST_OPTIONS:
+                skip = True
+                continue
+            if arg.split('=', 1)[0] in MULTI_HOST_OPTIONS:
+                continue
+            stripped.append(arg)
+        return stripped
+
+    def host_argv(self, host):
+        argv = [sys.argv[0]] + self.strip_multi_host_args(sys.argv[1:])
+        # appended last so they take precedence over any single host options also given
+        if self.multi_host_option == '--host' and re.match(r'^[^:]+:\d+$', host):
+            (host, port) = host.split(':')
+            return argv + ['--host', host, '--port', port]
+        return argv + [self.multi_host_option, host]
+
+    def check_hosts(self, hosts, concurrency, min_ok=None):
+        # Python 3 only, see module docstring
+        from lib_multi_host_async import run_hosts
+        from lib_plugin_runner import get_plugin_timeout
+        timeout = get_plugin_timeout(sys.argv[1:])
+        # each host is bounded by the timeout once it gets a concurrency slot, so hosts beyond --hosts-concurrency
+        # run in successive waves, leave time to aggregate before the self-timeout
+        waves = -(-len(hosts) // concurrency)
+        signal.alarm(timeout * waves + 5)
+        start_time = time.time()
+        results = run_hosts(self.__class__, [(_, self.host_argv(_)) for _ in hosts], concurrency, timeout)
+        log.info('checked %s hosts in %.2f secs', len(hosts), time.time() - start_time)
+        self.aggregate(results, min_ok)
+
+    @staticmethod
+    def prefix_perfdata(host, perfdata):
+        return ' '.join(["'{0} {1}'={2}".format(host, label.strip("'"), value)
+                         for (label, value) in PERFDATA_REGEX.findall(perfdata)])
+
+    def aggregate(self, results, min_ok=None):
+        counts = dict([(status, 0) for status in STATUS_PRECEDENCE])
+        worst = 'OK'
+        for result in results:
+            status = result.status if result.status in counts else 'UNKNOWN'
+            counts[status] += 1
+            if STATUS_PRECEDENCE.index(status) > STATUS_PRECEDENCE.index(worst):
+                worst = status
+        if min_ok is not None:
+            status = 'OK' if counts['OK'] >= min_ok else 'CRITICAL'
+        else:
+            status = worst
+        msg = '{0}/{1} host{2} OK'.format(counts['OK'], len(results), plural(results))
+        if min_ok is not None:
+            msg += ' (min {0} required)'.format(min_ok)
+        for state in ('WARNING', 'CRITICAL', 'UNKNOWN'):
+            if counts[state]:
+                msg += ', {0} {1}'.format(counts[state], state)
+        failed = [_ for _ in results if _.status != 'OK']
+        if failed:
+            msg += ' - ' + ', '.join(['{0}: {1}'.format(_.name, _.message.split('\n')[0]) for _ in failed])
+        msg += " | 'hosts ok'={0} 'hosts warning'={1} 'hosts critical'={2} 'hosts unknown'={3}"\
+               .format(counts['OK'], counts['WARNING'], counts['CRITICAL'], counts['UNKNOWN'])
+        for result in results:
+            perfdata = self.prefix_perfdata(result.name, result.perfdata)
+            if perfdata:
+                msg += ' ' + perfdata
+        qquit(status, msg)
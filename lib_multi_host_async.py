@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-19 10:12:41 +0100 (Mon, 19 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library running the --hosts / --hosts-file fan-out of lib_multi_host.py on an asyncio event loop
+
+Python 3 only, imported by MultiHostMixin only once hosts are given
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import asyncio
+import os
+import sys
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import ERRORS
+    from lib_async_http import AsyncRestRunner
+    from lib_plugin_runner import PluginResult
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+
+def run_hosts(plugin_class, host_argvs, concurrency, timeout):
+    """Runs plugin_class once per (host, argv) concurrently and returns the list of PluginResults in the same order"""
+    return asyncio.run(_run_hosts(plugin_class, host_argvs, concurrency, timeout))
+
+
+async def _run_hosts(plugin_class, host_argvs, concurrency, timeout):
+    runner = AsyncRestRunner(max_connections=concurrency, share_responses=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_host(host, argv):
+        # only start each host's timeout once it has a --hosts-concurrency slot, otherwise hosts queued behind
+        # slow ones would time out without ever being queried
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(runner.run(plugin_class, argv, name=host), timeout)
+            except asyncio.TimeoutError:
+                return PluginResult(ERRORS['UNKNOWN'], 'UNKNOWN: timed out after {0} secs'.format(timeout),
+                                    name=host)
+
+    return await asyncio.gather(*[run_host(host, argv) for (host, argv) in host_argvs])
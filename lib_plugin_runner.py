@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 10:12:41 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library to run the Python Nagios Plugins in this repo from a long running pre-warmed interpreter
+
+Plugins are imported on demand into the parent process and kept loaded, so their heavy dependencies (harisekhon,
+requests, bs4, boto3, happybase etc.) are only imported once. Each check is then run in a forked child of the warm
+parent, which costs a fraction of a millisecond instead of a full interpreter startup + imports.
+
+Running in a forked child rather than a thread is deliberate - the plugins rely on process global state:
+
+- sys.argv for option parsing
+- SIGALRM for their own --timeout self-termination, which only works in the main thread
+- sys.exit() / qquit() to return their result
+- stdout for their output
+
+so a child gets its own copy of all of these and can't take down or pollute the parent.
+
+Used by plugin_runner_daemon.py and plugin_batch_runner.py
+
+Also provides run_in_process() to run a plugin class within the current process where the caller needs to substitute
+parts of it, eg. lib_async_http.py and check_hadoop_hdfs_health.py
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import asyncio
+import errno
+import importlib.util
+import io
+import os
+import re
+import signal
+import sys
+import time
+import traceback
+import types
+from contextlib import redirect_stdout, redirect_stderr
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import log, ERRORS
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+# plugins import each other as modules eg. check_hbase_write_spray.py -> check_hbase_cell.py
+if srcdir not in sys.path:
+    sys.path.insert(0, srcdir)
+
+STATUSES = dict([(code, status) for status, code in ERRORS.items()])
+
+
+class PluginLoadError(Exception):
+    pass
+
+
+class Plugin(object):
+
+    def __init__(self, path, module, code, source=''):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.module = module
+        self.code = code
+        self.main_class = None
+        # every plugin ends with eg. CheckHadoopHDFSSpace().main()
+        match = re.search(r'^\s+(\w+)\(\)\.main\(\)', source, re.M)
+        if match:
+            self.main_class = getattr(module, match.group(1), None)
+
+
+class PluginResult(object):
+
+    def __init__(self, returncode, output, name=None, runtime=None):
+        self.returncode = returncode
+        self.output = output
+        self.name = name
+        self.runtime = runtime
+
+    @property
+    def status(self):
+        return STATUSES.get(self.returncode, 'UNKNOWN')
+
+    @property
+    def message(self):
+        return self.output.split('|', 1)[0].strip()
+
+    @property
+    def perfdata(self):
+        if '|' not in self.output:
+            return ''
+        return self.output.split('|', 1)[1].strip()
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'returncode': self.returncode,
+            'status': self.status,
+            'output': self.output,
+            'runtime': self.runtime,
+        }
+
+
+def get_plugin_timeout(argv, default=10):
+    """Returns the plugin's own self-timeout from its args, or the default if not specified"""
+    timeout = None
+    for index, arg in enumerate(argv):
+        if arg in ('-t', '--timeout') and index + 1 < len(argv):
+            timeout = argv[index + 1]
+        elif arg.startswith('--timeout='):
+            timeout = arg.split('=', 1)[1]
+        elif re.match(r'^-t\d+$', arg):
+            timeout = arg[2:]
+    try:
+        return int(timeout)
+    except (TypeError, ValueError):
+        return default
+
+
+def run_in_process(plugin_class, argv, prepare=None):
+    """Runs plugin_class with argv (argv[0] being the program name) in this process and returns a PluginResult
+
+    prepare(plugin) is called on the new plugin instance before its main(), eg. to substitute its request handler.
+
+    The plugin's stdout, sys.exit(), SIGALRM self-timeout and log level are isolated from the caller. Exceptions not
+    derived from Exception are left to propagate to the caller, after restoring the caller's state"""
+    stdout = io.StringIO()
+    saved_argv = sys.argv
+    saved_log_level = log.level
+    saved_handler = signal.getsignal(signal.SIGALRM)
+    remaining_alarm = signal.alarm(0)
+    start_time = time.time()
+    returncode = ERRORS['UNKNOWN']
+    try:
+        sys.argv = list(argv)
+        with redirect_stdout(stdout), redirect_stderr(stdout):
+            try:
+                plugin = plugin_class()
+                if prepare is not None:
+                    prepare(plugin)
+                plugin.main()
+                returncode = 0
+            except SystemExit as _:
+                returncode = _.code if isinstance(_.code, int) else (0 if _.code is None else 1)
+            except Exception:  # pylint: disable=broad-except
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, saved_handler)
+        if remaining_alarm:
+            signal.alarm(max(1, int(remaining_alarm - (time.time() - start_time))))
+        log.setLevel(saved_log_level)
+        sys.argv = saved_argv
+    return PluginResult(returncode, stdout.getvalue(), runtime=time.time() - start_time)
+
+
+class PluginLoader(object):
+
+    def __init__(self, plugin_dir=None):
+        self.plugin_dir = os.path.abspath(plugin_dir or srcdir)
+        if self.plugin_dir not in sys.path:
+            sys.path.insert(0, self.plugin_dir)
+        self.plugins = {}
+
+    def resolve(self, name):
+        path = name
+        if not os.path.isabs(path):
+            path = os.path.join(self.plugin_dir, path)
+        path = os.path.abspath(path)
+        if not path.endswith('.py'):
+            raise PluginLoadError("plugin '{0}' is not a python program".format(name))
+        if not os.path.isfile(path):
+            raise PluginLoadError("plugin '{0}' not found".format(name))
+        return os.path.realpath(path)
+
+    def load(self, name):
+        path = self.resolve(name)
+        if path in self.plugins:
+            return self.plugins[path]
+        module_name = os.path.basename(path)[:-3]
+        log.info("loading plugin '%s'", path)
+        start_time = time.time()
+        try:
+            with open(path) as filehandle:
+                source = filehandle.read()
+            code = compile(source, path, 'exec')
+            # may already have been imported as a base class of another plugin eg. check_hbase_cell
+            module = sys.modules.get(module_name)
+            if module is None or os.path.realpath(getattr(module, '__file__', '') or '') != path:
+                spec = importlib.util.spec_from_file_location(module_name, path)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+        # plugins print the import traceback and exit 4 if a dependency is missing
+        except SystemExit as _:
+            sys.modules.pop(module_name, None)
+            raise PluginLoadError("plugin '{0}' exited with code {1} while loading".format(name, _.code))
+        except Exception as _:  # pylint: disable=broad-except
+            sys.modules.pop(module_name, None)
+            raise PluginLoadError("failed to load plugin '{0}': {1}".format(name, _))
+        log.info("loaded plugin '%s' in %.2f secs", path, time.time() - start_time)
+        plugin = Plugin(path, module, code, source)
+        self.plugins[path] = plugin
+        return plugin
+
+    def preload(self, names):
+        for name in names:
+            try:
+                self.load(name)
+            except PluginLoadError as _:
+                log.warning(_)
+
+
+class PluginRunner(object):
+
+    def __init__(self, loader=None, max_workers=100, grace=5):
+        self.loader = loader or PluginLoader()
+        self.max_workers = max_workers
+        self.grace = grace
+        self._semaphore = None
+
+    @property
+    def semaphore(self):
+        # created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return self._semaphore
+
+    async def run(self, argv, environ=None, cwd=None, timeout=None):
+        """Runs a plugin command line eg. ['check_hadoop_hdfs_space.py', '-H', 'nn1'] and returns a PluginResult"""
+        name = os.path.basename(argv[0]) if argv else None
+        try:
+            if not argv:
+                raise PluginLoadError('no plugin specified')
+            plugin = self.loader.load(argv[0])
+        except PluginLoadError as _:
+            return PluginResult(ERRORS['UNKNOWN'], 'UNKNOWN: {0}'.format(_), name=name)
+        if timeout is None:
+            timeout = get_plugin_timeout(argv[1:])
+        async with self.semaphore:
+            return await self.run_forked(plugin, argv[1:], environ, cwd, timeout + self.grace)
+
+    async def run_forked(self, plugin, args, environ, cwd, deadline):
+        start_time = time.time()
+        (read_fd, write_fd) = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            os.close(read_fd)
+            _exec_plugin(plugin, args, environ, cwd, write_fd)
+        os.close(write_fd)
+        timed_out = False
+        try:
+            output = await asyncio.wait_for(_read_fd(read_fd), deadline)
+        except asyncio.TimeoutError:
+            timed_out = True
+            log.warning("plugin '%s' (pid %s) exceeded deadline of %s secs, killing", plugin.name, pid, deadline)
+            _kill(pid)
+            output = b''
+        finally:
+            os.close(read_fd)
+        status = await _reap(pid)
+        output = output.decode('utf-8', 'replace')
+        runtime = time.time() - start_time
+        if timed_out:
+            return PluginResult(ERRORS['UNKNOWN'],
+                                "UNKNOWN: plugin timed out after {0:d} secs".format(int(deadline)),
+                                name=plugin.name, runtime=runtime)
+        if os.WIFSIGNALED(status):
+            return PluginResult(ERRORS['UNKNOWN'],
+                                'UNKNOWN: plugin killed by signal {0}. {1}'.format(os.WTERMSIG(status), output),
+                                name=plugin.name, runtime=runtime)
+        return PluginResult(os.WEXITSTATUS(status), output, name=plugin.name, runtime=runtime)
+
+
+async def _read_fd(fd):
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    chunks = []
+    os.set_blocking(fd, False)
+
+    def reader():
+        try:
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    loop.remove_reader(fd)
+                    if not future.done():
+                        future.set_result(b''.join(chunks))
+                    return
+                chunks.append(chunk)
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    loop.add_reader(fd, reader)
+    try:
+        return await future
+    finally:
+        loop.remove_reader(fd)
+
+
+async def _reap(pid):
+    while True:
+        try:
+            (_pid, status) = os.waitpid(pid, os.WNOHANG)
+        except OSError as _:
+            if _.errno == errno.ECHILD:
+                return 0
+            raise
+        if _pid == pid:
+            return status
+        await asyncio.sleep(0.002)
+
+
+def _kill(pid):
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _exec_plugin(plugin, args, environ, cwd, write_fd):  # pragma: no cover
+    """Runs in the forked child as if the plugin had been executed as __main__, never returns"""
+    returncode = ERRORS['UNKNOWN']
+    try:
+        # the parent's event loop signal handlers write to its wakeup fd, which the child has inherited
+        signal.set_wakeup_fd(-1)
+        for signum in (signal.SIGALRM, signal.SIGINT, signal.SIGTERM, signal.SIGCHLD, signal.SIGPIPE):
+            signal.signal(signum, signal.SIG_DFL)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        if environ is not None:
+            os.environ.clear()
+            os.environ.update(environ)
+        if cwd:
+            os.chdir(cwd)
+        sys.argv = [plugin.path] + list(args)
+        # usage messages are prefixed with the program name which was evaluated in the parent
+        for module_name, module in list(sys.modules.items()):
+            if module_name.startswith('harisekhon') and hasattr(module, 'prog'):
+                setattr(module, 'prog', plugin.name)
+        main = types.ModuleType('__main__')
+        main.__file__ = plugin.path
+        main.__builtins__ = __builtins__
+        sys.modules['__main__'] = main
+        exec(plugin.code, main.__dict__)  # pylint: disable=exec-used
+        returncode = 0
+    except SystemExit as _:
+        if _.code is None:
+            returncode = 0
+        elif isinstance(_.code, int):
+            returncode = _.code
+        else:
+            print(_.code, file=sys.stderr)
+            returncode = 1
+    except BaseException:  # pylint: disable=broad-except
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(returncode & 0xFF)  # pylint: disable=protected-access
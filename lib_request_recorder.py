@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-19 11:24:52 +0100 (Mon, 19 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library to record the HTTP requests a RestNagiosPlugin makes via its RequestHandler instead of making them, and to
+replay already fetched responses to it
+
+Used by the asyncio transport of lib_async_http.py and by the JSON streaming of lib_json_stream.py to make the
+request the plugin would make, with the same method, url, headers, auth and SSL verification, some other way.
+
+Kept separate from lib_async_http.py as it also works on Python 2.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import os
+import sys
+import traceback
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # Python 2
+    from collections import Mapping
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon.utils import CriticalError
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+# RequestHandler methods which make a request
+REQUEST_METHODS = ('get', 'post', 'put', 'head', 'delete')
+
+try:
+    # Python 2
+    # pylint: disable=undefined-variable
+    PLAIN_TYPES = (basestring, bool, int, long, float)
+except NameError:
+    PLAIN_TYPES = (str, bytes, bool, int, float)
+
+
+def stable_repr(value):
+    """Returns a repr of the request argument value which is the same each time the plugin makes the request
+
+    Objects other than plain values and containers, eg. requests auth objects such as HTTPKerberosAuth, default to a
+    repr containing their id which changes on each run, so are represented by their type instead"""
+    if value is None or isinstance(value, PLAIN_TYPES):
+        return repr(value)
+    if isinstance(value, Mapping):
+        return '{' + ', '.join(sorted(['{0}: {1}'.format(stable_repr(k), stable_repr(v))
+                                       for (k, v) in value.items()])) + '}'
+    if isinstance(value, (tuple, list)):
+        return '(' + ', '.join([stable_repr(_) for _ in value]) + ')'
+    return '<{0}.{1}>'.format(type(value).__module__, type(value).__name__)
+
+
+class HttpRequest(object):
+
+    def __init__(self, method, url, kwargs):
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+
+    @property
+    def key(self):
+        return (self.method, self.url, stable_repr(self.kwargs))
+
+
+class Suspend(BaseException):
+    """Raised through the plugin's main() when it makes a request that hasn't been fetched yet
+
+    Deliberately a BaseException so it isn't caught by the plugins' or framework's generic exception handling"""
+
+    def __init__(self, request):
+        super(Suspend, self).__init__(request.url)
+        self.request = request
+
+
+class ReplayRequestHandler(object):
+    """Stands in for the plugin's RequestHandler, returning already fetched responses or suspending the plugin at the
+    first request which hasn't been fetched yet
+
+    Attributes the plugin sets on self.request, eg. a custom check_response_code, are set on this wrapper and take
+    precedence over the wrapped RequestHandler's"""
+
+    def __init__(self, handler, responses):
+        self._handler = handler
+        self._responses = responses
+
+    def __getattr__(self, name):
+        if name in REQUEST_METHODS:
+            return lambda url, *args, **kwargs: self._request(name, url, args, kwargs)
+        return getattr(self._handler, name)
+
+    def req(self, method, url, *args, **kwargs):
+        # otherwise the wrapped handler's req() would make the request
+        return self._request(method.lower(), url, args, kwargs)
+
+    def _request(self, method, url, args, kwargs):
+        if args:
+            kwargs = dict(kwargs)
+            kwargs['_args'] = args
+        request = HttpRequest(method, url, kwargs)
+        if request.key not in self._responses:
+            raise Suspend(request)
+        response = self._responses[request.key]
+        if isinstance(response, Exception):
+            raise CriticalError(response)
+        # instance attributes first so an override set by the plugin in process_options() applies
+        check_response_code = getattr(self, 'check_response_code', None)
+        if callable(check_response_code):
+            check_response_code(response)
+        return response
+
+
+def record_request(plugin, run):
+    """Calls run(), eg. the plugin's RestNagiosPlugin run(), and returns the HttpRequest it makes via plugin.request
+    without making it, or None if it didn't make one"""
+    handler = plugin.request
+    plugin.request = ReplayRequestHandler(handler, {})
+    try:
+        run()
+    except Suspend as _:
+        return _.request
+    finally:
+        plugin.request = handler
+    return None
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 14:10:52 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing an opt-in shared TTL cache of HTTP responses for plugins which poll the same expensive endpoints
+
+eg. several plugins each fetch the multi-MB NameNodeInfo JMX bean, Apache Drill /cluster.json, NiFi
+/nifi-api/system-diagnostics, HBase /master-status and Logstash /_node/pipelines
+
+Responses are cached on local disk keyed on URL + request headers + auth (user + hash of password, the password itself
+is never stored), shared between all plugins run by the same user.
+
+A lock is held per cache key while fetching, so a burst of plugins hitting the same busy server at once costs just
+one request, the rest waiting for it and then reading the cached response. Only HTTP 200 responses are cached.
+
+The cache is bounded by total size, evicting the least recently used responses first along with their lock files.
+
+Plugins can also cache compact JSON data parsed out of a large response instead of the response itself with
+put_data() / get_data(), eg. the HBase Master UI snapshot in lib_hbase_master_status.py.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import errno
+import fcntl
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import traceback
+from contextlib import contextmanager
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    from harisekhon.utils import log, log_option, validate_int, validate_dirname
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'nagios_plugins_cache.{0}'.format(os.getuid()))
+DEFAULT_MAX_SIZE_MB = 256
+
+
+class ResponseCache(object):
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_size_mb=DEFAULT_MAX_SIZE_MB):
+        self.directory = directory
+        self.max_size = max_size_mb * 1024 * 1024
+        try:
+            os.makedirs(self.directory, 0o700)
+        except OSError as _:
+            if _.errno != errno.EEXIST:
+                raise
+
+    @staticmethod
+    def key(url, auth=None, headers=None):
+        digest = hashlib.sha256(url.encode('utf-8'))
+        if headers:
+            digest.update(repr(sorted(headers.items())).encode('utf-8'))
+        if isinstance(auth, (tuple, list)) and len(auth) == 2:
+            digest.update(str(auth[0]).encode('utf-8'))
+            digest.update(hashlib.sha256(str(auth[1]).encode('utf-8')).digest())
+        elif auth is not None:
+            # eg. Kerberos - key on the type of auth and the principal in the environment
+            digest.update(type(auth).__name__.encode('utf-8'))
+            digest.update(os.getenv('KRB5CCNAME', '').encode('utf-8'))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.cache')
+
+    def lock_path(self, key=None):
+        return os.path.join(self.directory, (key or '') + '.lock')
+
+    @contextmanager
+    def lock(self, key=None):
+        """Exclusive lock per key, or for the whole cache if no key is given"""
+        lockfile = self.lock_path(key)
+        while True:
+            filehandle = open(lockfile, 'a')
+            fcntl.flock(filehandle, fcntl.LOCK_EX)
+            # evict() may have removed the lock file while we were waiting on it, in which case lock the new one
+            if self.is_current_lock(filehandle, lockfile):
+                break
+            filehandle.close()
+        try:
+            yield
+        finally:
+            fcntl.flock(filehandle, fcntl.LOCK_UN)
+            filehandle.close()
+
+    @staticmethod
+    def is_current_lock(filehandle, lockfile):
+        """Returns whether the open lock file is still the one at the lockfile path"""
+        try:
+            stat = os.stat(lockfile)
+        except OSError:
+            return False
+        open_stat = os.fstat(filehandle.fileno())
+        return (open_stat.st_dev, open_stat.st_ino) == (stat.st_dev, stat.st_ino)
+
+    def read(self, key, ttl):
+        """Returns a tuple of (metadata, content) of the cache entry if it is no older than ttl secs, else None"""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as filehandle:
+                metadata = json.loads(filehandle.readline().decode('utf-8'))
+                age = time.time() - metadata['created']
+                if age > ttl:
+                    log.debug('cached response for %s is stale (%.1f secs old > %s secs ttl)',
+                              metadata['url'], age, ttl)
+                    return None
+                content = filehandle.read()
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        # mark as recently used for LRU eviction
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        log.info('using cached response for %s (%.1f secs old)', metadata['url'], age)
+        return (metadata, content)
+
+    def write(self, key, metadata, content):
+        metadata['created'] = time.time()
+        (filehandle, tmp_path) = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(filehandle, 'wb') as tmp:
+                tmp.write(json.dumps(metadata).encode('utf-8') + b'\n')
+                tmp.write(content)
+            os.rename(tmp_path, self.path(key))
+        except (IOError, OSError) as _:
+            log.warning('failed to write response cache file: %s', _)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        self.evict()
+
+    def get(self, key, ttl):
+        entry = self.read(key, ttl)
+        if entry is None:
+            return None
+        (metadata, content) = entry
+        if 'status_code' not in metadata:
+            return None
+        response = requests.models.Response()
+        response.status_code = metadata['status_code']
+        response.reason = metadata.get('reason')
+        response.url = metadata['url']
+        response.headers = CaseInsensitiveDict(metadata.get('headers', {}))
+        response.encoding = metadata.get('encoding')
+        response._content = content  # pylint: disable=protected-access
+        return response
+
+    def put(self, key, response):
+        metadata = {
+            'url': response.url,
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': dict(response.headers),
+            'encoding': response.encoding,
+        }
+        self.write(key, metadata, response.content)
+
+    def get_data(self, key, ttl):
+        """Returns data cached by put_data() if it is no older than ttl secs, else None"""
+        entry = self.read(key, ttl)
+        if entry is None:
+            return None
+        try:
+            return json.loads(entry[1].decode('utf-8'))
+        except ValueError:
+            return None
+
+    def put_data(self, key, url, data):
+        """Caches JSON serializable data derived from the response of url, eg. a parsed snapshot"""
+        self.write(key, {'url': url}, json.dumps(data).encode('utf-8'))
+
+    def remove(self, key):
+        """Removes the cache entry and its lock file unless its lock is held, eg. while it's being fetched, returns
+        whether it was removed"""
+        lockfile = self.lock_path(key)
+        try:
+            filehandle = open(lockfile, 'a')
+        except (IOError, OSError) as _:
+            log.debug('failed to open lock file %s: %s', lockfile, _)
+            return False
+        with filehandle:
+            try:
+                fcntl.flock(filehandle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except (IOError, OSError):
+                log.debug('not evicting %s as it is in use', key)
+                return False
+            if not self.is_current_lock(filehandle, lockfile):
+                return False
+            # the lock file goes last while still holding its lock, processes waiting on it then retry on a new one
+            for path in (self.path(key), lockfile):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+        return True
+
+    def evict(self):
+        with self.lock():
+            entries = []
+            total_size = 0
+            cache_keys = set()
+            lock_keys = set()
+            for filename in os.listdir(self.directory):
+                (key, ext) = os.path.splitext(filename)
+                # the whole cache lock is named just '.lock'
+                if ext == '.lock' and key:
+                    lock_keys.add(key)
+                if ext != '.cache':
+                    continue
+                path = os.path.join(self.directory, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                cache_keys.add(key)
+                entries.append((stat.st_mtime, stat.st_size, key))
+                total_size += stat.st_size
+            # least recently used first
+            for (_, size, key) in sorted(entries):
+                if total_size <= self.max_size:
+                    break
+                log.debug('evicting cached response %s', key)
+                if self.remove(key):
+                    total_size -= size
+            # lock files of responses which weren't cached, eg. errors
+            for key in lock_keys - cache_keys:
+                self.remove(key)
+
+
+class CachingRequestHandler(object):
+    """Wraps a RequestHandler or the requests module, serving GET requests from the ResponseCache"""
+
+    def __init__(self, handler, cache, ttl):
+        self._handler = handler
+        self._cache = cache
+        self._ttl = ttl
+
+    def __getattr__(self, name):
+        return getattr(self._handler, name)
+
+    def req(self, method, url, *args, **kwargs):
+        if method.lower() == 'get':
+            return self.get(url, *args, **kwargs)
+        return self._handler.req(method, url, *args, **kwargs)
+
+    def get(self, url, *args, **kwargs):
+        key = self._cache.key(url, auth=kwargs.get('auth'), headers=kwargs.get('headers'))
+        with self._cache.lock(key):
+            response = self._cache.get(key, self._ttl)
+            if response is not None:
+                return response
+            response = self._handler.get(url, *args, **kwargs)
+            if response.status_code == 200:
+                self._cache.put(key, response)
+            return response
+
+
+class ResponseCacheMixin(object):
+    """Mixin for plugins to add the --cache-* options
+
+    Call add_cache_options() from add_options() and process_cache_options() from process_options(). For
+    RestNagiosPlugin subclasses self.request is then transparently cached, other plugins use self.http_get()"""
+
+    response_cache = None
+    response_cache_ttl = 0
+
+    def add_cache_options(self):
+        self.add_opt('--cache-ttl', metavar='secs', default=os.getenv('NAGIOS_PLUGINS_CACHE_TTL', 0),
+                     help='Cache the HTTP response for this many secs, shared with other plugins querying the ' + \
+                          'same URL ($NAGIOS_PLUGINS_CACHE_TTL, default: 0 = disabled)')
+        self.add_opt('--cache-dir', metavar='dir', default=os.getenv('NAGIOS_PLUGINS_CACHE_DIR', DEFAULT_CACHE_DIR),
+                     help='Response cache directory ($NAGIOS_PLUGINS_CACHE_DIR, default: {0})'\
+                          .format(DEFAULT_CACHE_DIR))
+        self.add_opt('--cache-max-size', metavar='MB',
+                     default=os.getenv('NAGIOS_PLUGINS_CACHE_MAX_SIZE', DEFAULT_MAX_SIZE_MB),
+                     help='Max size of the response cache in MB before evicting least recently used responses ' + \
+                          '($NAGIOS_PLUGINS_CACHE_MAX_SIZE, default: {0})'.format(DEFAULT_MAX_SIZE_MB))
+
+    def process_cache_options(self):
+        ttl = self.get_opt('cache_ttl')
+        validate_int(ttl, 'cache ttl', 0, 86400)
+        self.response_cache_ttl = int(ttl)
+        if not self.response_cache_ttl:
+            return
+        cache_dir = self.get_opt('cache_dir')
+        validate_dirname(cache_dir, 'cache')
+        max_size = self.get_opt('cache_max_size')
+        validate_int(max_size, 'cache max size', 1, 1024 * 1024)
+        log_option('cache dir', cache_dir)
+        self.response_cache = ResponseCache(cache_dir, int(max_size))
+        request = getattr(self, 'request', None)
+        if request is not None:
+            self.request = CachingRequestHandler(request, self.response_cache, self.response_cache_ttl)
+
+    def http_get(self, url, **kwargs):
+        if self.response_cache is None:
+            return requests.get(url, **kwargs)
+        return CachingRequestHandler(requests, self.response_cache, self.response_cache_ttl).get(url, **kwargs)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 16:12:44 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Library providing a --timings option to plugins which appends the time spent in each phase of the check as perfdata
+
+Phases, each excluding the time of the other phases nested within it:
+
+    dns_time        - hostname resolution
+    connect_time    - TCP connect
+    tls_time        - TLS handshake
+    ttfb_time       - from sending the request to receiving the response headers, ie. server processing time
+    download_time   - reading the response body
+    decode_time     - JSON decoding
+    parse_time      - the plugin's parse_json() / parse() eg. BeautifulSoup HTML parsing and data extraction
+    thresholds_time - threshold evaluation
+    total_time      - the whole check
+
+The network phases are timed by instrumenting the socket, ssl, urllib3 and requests libraries for the duration of the
+check, so they cover RestNagiosPlugin's RequestHandler, direct use of requests and the docker library alike.
+
+Only the phases the check actually went through are output.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import functools
+import json
+import os
+import socket
+import ssl
+import sys
+import time
+import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    import requests
+    import urllib3.util.connection
+    from harisekhon.utils import log
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+PHASES = ('dns', 'connect', 'tls', 'ttfb', 'download', 'decode', 'parse', 'thresholds')
+
+
+class PhaseTimer(object):
+
+    def __init__(self):
+        self.timings = OrderedDict()
+        # time spent in nested phases, one accumulator per currently open phase
+        self._nested = []
+
+    @contextmanager
+    def phase(self, name):
+        start = time.time()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.time() - start
+            nested = self._nested.pop()
+            self.add(name, elapsed - nested)
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def add(self, name, secs):
+        self.timings[name] = self.timings.get(name, 0.0) + secs
+
+    def wrap(self, name, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return timed
+
+    def wrap_request(self, func):
+        """Wraps requests.Session.request, splitting its own time into ttfb and download
+
+        requests sets response.elapsed to the time until the headers are parsed, which includes the nested dns,
+        connect and tls phases, the body is read after that"""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            before = sum([self.timings.get(_, 0.0) for _ in ('dns', 'connect', 'tls')])
+            with self.phase('download'):
+                response = func(*args, **kwargs)
+            network = sum([self.timings.get(_, 0.0) for _ in ('dns', 'connect', 'tls')]) - before
+            elapsed = getattr(response, 'elapsed', None)
+            if elapsed is not None:
+                ttfb = min(max(elapsed.total_seconds() - network, 0.0), self.timings['download'])
+                self.timings['download'] -= ttfb
+                self.add('ttfb', ttfb)
+            return response
+        return timed
+
+    @contextmanager
+    def instrument(self):
+        """Instruments the network and JSON libraries for the duration of the context"""
+        patches = [
+            (socket, 'getaddrinfo', self.wrap('dns', socket.getaddrinfo)),
+            (urllib3.util.connection, 'create_connection',
+             self.wrap('connect', urllib3.util.connection.create_connection)),
+            (ssl.SSLContext, 'wrap_socket', self.wrap('tls', ssl.SSLContext.wrap_socket)),
+            (requests.sessions.Session, 'request', self.wrap_request(requests.sessions.Session.request)),
+            (json, 'loads', self.wrap('decode', json.loads)),
+        ]
+        originals = [(obj, name, getattr(obj, name)) for (obj, name, _) in patches]
+        for (obj, name, func) in patches:
+            setattr(obj, name, func)
+        try:
+            yield
+        finally:
+            for (obj, name, func) in originals:
+                setattr(obj, name, func)
+
+    def perfdata(self, total):
+        perfdata = ['{0}_time={1:.3f}ms'.format(name, self.timings[name] * 1000)
+                    for name in PHASES if name in self.timings]
+        perfdata.append('total_time={0:.3f}ms'.format(total * 1000))
+        return ' '.join(perfdata)
+
+
+class TimingsMixin(object):
+    """Mixin for plugins to add the --timings option
+
+    Works for any NagiosPlugin subclass without further changes as it wraps the instance's own run(), parse_json(),
+    parse(), parse_master_status() and check_thresholds() methods, whichever the plugin has"""
+
+    def __init__(self, *args, **kwargs):
+        super(TimingsMixin, self).__init__(*args, **kwargs)
+        self.timer = None
+        self.run = self._timed_run(self.run)
+
+    def add_default_opts(self):
+        super(TimingsMixin, self).add_default_opts()
+        self.add_opt('--timings', action='store_true', default=os.getenv('NAGIOS_PLUGINS_TIMINGS'),
+                     help='Append perfdata of the time spent in each phase of the check, eg. dns, connect, ' + \
+                          'tls, ttfb, download, decode, parse ($NAGIOS_PLUGINS_TIMINGS)')
+
+    def _timed_run(self, run):
+        @functools.wraps(run)
+        def timed_run(*args, **kwargs):
+            if not self.get_opt('timings'):
+                return run(*args, **kwargs)
+            self.timer = PhaseTimer()
+            for (method, phase) in (('parse_json', 'parse'), ('parse', 'parse'),
+                                    ('parse_master_status', 'parse'), ('check_thresholds', 'thresholds')):
+                func = getattr(self, method, None)
+                if callable(func):
+                    setattr(self, method, self.timer.wrap(phase, func))
+            start = time.time()
+            with self.timer.instrument():
+                result = run(*args, **kwargs)
+            self.add_timings_perfdata(time.time() - start)
+            return result
+        return timed_run
+
+    def add_timings_perfdata(self, total):
+        perfdata = self.timer.perfdata(total)
+        log.info('timings: %s', perfdata)
+        if '|' in self.msg:
+            self.msg += ' ' + perfdata
+        else:
+            self.msg += ' | ' + perfdata
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 12:05:37 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Batch executor to run hundreds of Python Nagios Plugin checks concurrently from a single process
+
+Takes a JSON or YAML manifest of plugin command lines and runs them on a bounded worker pool, streaming one result
+per check as each completes, either in Nagios passive check result format (to write to the Nagios / Icinga external
+command file) or as JSON lines.
+
+Each plugin is imported once into this process and then each check is run in a forked child of it, so there is no
+interpreter startup or import cost per check, and a plugin calling sys.exit() / qquit(), hanging or crashing only
+affects its own result. Each check's own --timeout is respected, with a grace period after which it is killed and
+returned as UNKNOWN.
+
+With --async-http, checks using RestNagiosPlugin based plugins are instead run in-process with their HTTP requests
+made on a single asyncio event loop (see lib_async_http.py), so thousands can be in flight at once without a process
+or thread each. Other plugins, including those streaming their JSON responses (see lib_json_stream.py), are still run
+in forked children as above.
+
+Manifest format - a list of checks, or a dict with a 'checks' key containing the list. Each check can be either a
+command line string or a dict with a 'command' string or list and optional 'host' and 'service' names for the
+passive result, which otherwise default to the plugin's --host argument and the plugin name:
+
+    checks:
+      - check_hadoop_datanode_java_gc.py -H dn001 -w 10 -c 20
+      - host: dn002
+        service: DataNode GC
+        command: check_hadoop_datanode_java_gc.py -H dn002 -w 10 -c 20
+
+Plugins with relative paths are found next to this program.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import asyncio
+import json
+import os
+import shlex
+import sys
+import time
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon import CLI
+    from harisekhon.utils import log, log_option, qquit, validate_file, validate_int, isList, isDict, isStr
+    from lib_plugin_runner import PluginLoader, PluginRunner, PluginLoadError
+    from lib_async_http import AsyncRestRunner, is_rest_plugin
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+
+class Check(object):
+
+    def __init__(self, argv, host=None, service=None):
+        self.argv = argv
+        self.host = host or self.get_host_arg(argv) or 'localhost'
+        self.service = service or os.path.basename(argv[0]).rsplit('.', 1)[0]
+
+    @staticmethod
+    def get_host_arg(argv):
+        for index, arg in enumerate(argv):
+            if arg in ('-H', '--host') and index + 1 < len(argv):
+                return argv[index + 1]
+            if arg.startswith('--host='):
+                return arg.split('=', 1)[1]
+        return None
+
+
+class PluginBatchRunner(CLI):
+
+    def __init__(self):
+        # Python 2.x
+        super(PluginBatchRunner, self).__init__()
+        # Python 3.x
+        # super().__init__()
+        # self-timeout for the whole batch, individual checks are bounded by their own --timeout
+        self.timeout_default = 600
+        self.formats = ('nagios', 'json')
+        self.format = None
+        self.checks = []
+        self.runner = None
+        self.async_runner = None
+        self.output = sys.stdout
+        self.counts = {}
+
+    def add_options(self):
+        self.add_opt('-m', '--manifest', help='JSON or YAML manifest file of plugin checks to run')
+        self.add_opt('-f', '--format', default='nagios',
+                     help='Output format: {0} (default: nagios passive check results)'.format(', '.join(self.formats)))
+        self.add_opt('-o', '--output',
+                     help='File to append results to, eg. the Nagios external command file (default: stdout)')
+        self.add_opt('-n', '--max-workers', default=50,
+                     help='Max number of checks to run concurrently (default: 50)')
+        self.add_opt('-g', '--grace', default=5,
+                     help="Secs to wait on top of each check's own --timeout before killing it (default: 5)")
+        self.add_opt('-a', '--async-http', action='store_true',
+                     help='Run RestNagiosPlugin based checks in-process with their HTTP requests made on ' + \
+                          'an asyncio event loop')
+        self.add_opt('-C', '--max-connections', default=500,
+                     help='Max number of concurrent HTTP requests in --async-http mode (default: 500)')
+
+    def process_options(self):
+        self.no_args()
+        manifest = self.get_opt('manifest')
+        validate_file(manifest, 'manifest')
+        self.format = self.get_opt('format')
+        if self.format not in self.formats:
+            self.usage('--format must be one of: {0}'.format(', '.join(self.formats)))
+        max_workers = self.get_opt('max_workers')
+        validate_int(max_workers, 'max workers', 1, 10000)
+        grace = self.get_opt('grace')
+        validate_int(grace, 'grace', 0, 3600)
+        self.runner = PluginRunner(PluginLoader(srcdir), max_workers=int(max_workers), grace=int(grace))
+        if self.get_opt('async_http'):
+            max_connections = self.get_opt('max_connections')
+            validate_int(max_connections, 'max connections', 1, 100000)
+            self.async_runner = AsyncRestRunner(max_connections=int(max_connections))
+        self.checks = self.parse_manifest(manifest)
+        log_option('number of checks', len(self.checks))
+
+    @staticmethod
+    def load_manifest(manifest):
+        with open(manifest) as filehandle:
+            content = filehandle.read()
+        if manifest.endswith('.yaml') or manifest.endswith('.yml'):
+            try:
+                import yaml  # pylint: disable=import-outside-toplevel
+            except ImportError:
+                qquit('UNKNOWN', 'PyYAML module not installed, required for YAML manifests')
+            return yaml.safe_load(content)
+        return json.loads(content)
+
+    def parse_manifest(self, manifest):
+        try:
+            data = self.load_manifest(manifest)
+        except ValueError as _:
+            qquit('UNKNOWN', "invalid manifest '{0}': {1}".format(manifest, _))
+        if isDict(data):
+            data = data.get('checks')
+        if not isList(data):
+            qquit('UNKNOWN', "invalid manifest '{0}', expected a list of checks".format(manifest))
+        checks = []
+        for item in data:
+            host = None
+            service = None
+            if isDict(item):
+                host = item.get('host')
+                service = item.get('service')
+                item = item.get('command')
+            if isStr(item):
+                argv = shlex.split(item)
+            elif isList(item):
+                argv = [str(_) for _ in item]
+            else:
+                argv = None
+            if not argv:
+                qquit('UNKNOWN', "invalid check in manifest '{0}': {1}".format(manifest, item))
+            checks.append(Check(argv, host=host, service=service))
+        return checks
+
+    def run(self):
+        output = self.get_opt('output')
+        start_time = time.time()
+        if output:
+            self.output = open(output, 'a')
+        try:
+            asyncio.run(self.run_checks())
+        finally:
+            if output:
+                self.output.close()
+        log.info('ran %s checks in %.2f secs: %s', len(self.checks), time.time() - start_time,
+                 ', '.join(['{0}={1}'.format(status, self.counts[status]) for status in sorted(self.counts)]))
+
+    async def run_check(self, check):
+        if self.async_runner is not None:
+            try:
+                plugin = self.runner.loader.load(check.argv[0])
+            except PluginLoadError:
+                # the fork runner returns the load error as the result
+                plugin = None
+            if plugin is not None and is_rest_plugin(plugin.main_class):
+                result = await self.async_runner.run(plugin.main_class,
+                                                     [plugin.path] + check.argv[1:],
+                                                     name=plugin.name)
+                return (check, result)
+        result = await self.runner.run(check.argv)
+        return (check, result)
+
+    async def run_checks(self):
+        for future in asyncio.as_completed([self.run_check(_) for _ in self.checks]):
+            (check, result) = await future
+            self.counts[result.status] = self.counts.get(result.status, 0) + 1
+            self.output_result(check, result)
+
+    def output_result(self, check, result):
+        timestamp = int(time.time())
+        if self.format == 'json':
+            data = result.to_dict()
+            data['host'] = check.host
+            data['service'] = check.service
+            data['timestamp'] = timestamp
+            line = json.dumps(data)
+        else:
+            line = '[{timestamp}] PROCESS_SERVICE_CHECK_RESULT;{host};{service};{returncode};{output}'\
+                   .format(timestamp=timestamp,
+                           host=check.host,
+                           service=check.service,
+                           returncode=result.returncode,
+                           output=result.output.strip().replace('\n', '\\n'))
+        self.output.write(line + '\n')
+        self.output.flush()
+
+
+if __name__ == '__main__':
+    PluginBatchRunner().main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 11:20:56 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Client shim to run any Python Nagios Plugin in this repo via plugin_runner_daemon.py
+
+Put 'plugin_runner_client.py' at the front of any python nagios plugin command line and it will pass it to the
+daemon to run and return the plugin's output and exit code as if it had been executed directly.
+
+If the daemon isn't running the plugin is executed directly instead, so existing command definitions keep working.
+
+Deliberately uses only the Python standard library as its own startup time is the whole point.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import json
+import os
+import re
+import socket
+import sys
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.0'
+
+srcdir = os.path.abspath(os.path.dirname(__file__))
+prog = os.path.basename(sys.argv[0])
+
+DEFAULT_SOCKET = os.path.join(os.environ.get('TMPDIR', '/tmp'), 'nagios_plugin_runner.{0}.sock'.format(os.getuid()))
+
+UNKNOWN = 3
+
+
+def usage():
+    print('usage: {prog} <nagios_plugin.py> <plugin_args> ...\n\n'.format(prog=prog) +
+          'Runs the given plugin via plugin_runner_daemon.py, connecting on $PLUGIN_RUNNER_SOCKET ' +
+          '(default: {0})'.format(DEFAULT_SOCKET))
+    sys.exit(UNKNOWN)
+
+
+def resolve(plugin):
+    if os.path.isabs(plugin):
+        return plugin
+    if os.sep in plugin or os.path.isfile(plugin):
+        return os.path.abspath(plugin)
+    return os.path.join(srcdir, plugin)
+
+
+def get_timeout(args, default=10):
+    timeout = default
+    for index, arg in enumerate(args):
+        if arg in ('-t', '--timeout') and index + 1 < len(args):
+            timeout = args[index + 1]
+        elif arg.startswith('--timeout='):
+            timeout = arg.split('=', 1)[1]
+        elif re.match(r'^-t\d+$', arg):
+            timeout = arg[2:]
+    try:
+        return int(timeout)
+    except ValueError:
+        return default
+
+
+def execute(plugin, args):
+    os.execv(sys.executable, [sys.executable, plugin] + args)
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1].startswith('-'):
+        usage()
+    plugin = resolve(sys.argv[1])
+    args = sys.argv[2:]
+    socket_path = os.getenv('PLUGIN_RUNNER_SOCKET', DEFAULT_SOCKET)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except (IOError, OSError):
+        sock.close()
+        execute(plugin, args)
+    request = {
+        'argv': [plugin] + args,
+        'env': dict(os.environ),
+        'cwd': os.getcwd(),
+    }
+    # plugin's own timeout + daemon's kill grace + margin
+    sock.settimeout(get_timeout(args) + 30)
+    try:
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        result = json.loads(b''.join(chunks).decode('utf-8'))
+    except socket.timeout:
+        print('UNKNOWN: timed out waiting for plugin runner daemon on {0}'.format(socket_path))
+        sys.exit(UNKNOWN)
+    except (IOError, OSError, ValueError) as _:
+        print('UNKNOWN: error communicating with plugin runner daemon on {0}: {1}'.format(socket_path, _))
+        sys.exit(UNKNOWN)
+    finally:
+        sock.close()
+    sys.stdout.write(result.get('output', ''))
+    sys.stdout.flush()
+    sys.exit(result.get('returncode', UNKNOWN))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+#  coding=utf-8
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 10:47:03 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn
+#  and optionally send me feedback to help steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+"""
+
+Persistent Nagios Plugin runner daemon to avoid the Python interpreter startup and import costs of every check
+
+Listens on a local unix socket, imports the requested check_*.py plugins on demand and keeps them loaded, then runs
+each check in a forked child of this warm process and returns the exit code, output and perfdata to the client.
+
+Use plugin_runner_client.py in your Nagios command definitions in front of the usual plugin command line:
+
+    plugin_runner_client.py check_hadoop_hdfs_space.py -H namenode -w 80 -c 90
+
+The client falls back to executing the plugin normally if this daemon isn't running, so it is safe to deploy the
+command definitions first.
+
+The socket is created only accessible to the user running this daemon, which must be the same user as the Nagios
+checks since the plugins are run with the environment and working directory passed by the client.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+#from __future__ import unicode_literals
+
+import asyncio
+import json
+import os
+import signal
+import sys
+import traceback
+srcdir = os.path.abspath(os.path.dirname(__file__))
+libdir = os.path.join(srcdir, 'pylib')
+sys.path.append(libdir)
+try:
+    # pylint: disable=wrong-import-position
+    from harisekhon import CLI
+    from harisekhon.utils import log, log_option, validate_int, ERRORS
+    from lib_plugin_runner import PluginLoader, PluginRunner, PluginResult
+except ImportError:
+    print(traceback.format_exc(), end='')
+    sys.exit(4)
+
+__author__ = 'Hari Sekhon'
+__version__ = '0.1.1'
+
+DEFAULT_SOCKET = os.path.join(os.environ.get('TMPDIR', '/tmp'), 'nagios_plugin_runner.{0}.sock'.format(os.getuid()))
+
+
+class PluginRunnerDaemon(CLI):
+
+    def __init__(self):
+        # Python 2.x
+        super(PluginRunnerDaemon, self).__init__()
+        # Python 3.x
+        # super().__init__()
+        self.socket = None
+        self.runner = None
+        self.server = None
+        self.requests = 0
+
+    def add_options(self):
+        self.add_opt('-s', '--socket', default=os.getenv('PLUGIN_RUNNER_SOCKET', DEFAULT_SOCKET),
+                     help='Unix socket path to listen on ($PLUGIN_RUNNER_SOCKET, default: {0})'.format(DEFAULT_SOCKET))
+        self.add_opt('-p', '--preload',
+                     help='Comma separated list of plugins to import at startup rather than on first use, ' + \
+                          'or "all" for all check_*.py plugins next to this program')
+        self.add_opt('-n', '--max-workers', default=100,
+                     help='Max number of plugins running concurrently (default: 100)')
+        self.add_opt('-g', '--grace', default=5,
+                     help="Secs to wait on top of each plugin's own --timeout before killing it (default: 5)")
+
+    def process_options(self):
+        self.no_args()
+        self.socket = self.get_opt('socket')
+        log_option('socket', self.socket)
+        max_workers = self.get_opt('max_workers')
+        validate_int(max_workers, 'max workers', 1, 10000)
+        grace = self.get_opt('grace')
+        validate_int(grace, 'grace', 0, 3600)
+        self.runner = PluginRunner(PluginLoader(srcdir), max_workers=int(max_workers), grace=int(grace))
+        preload = self.get_opt('preload')
+        if preload:
+            if preload == 'all':
+                plugins = sorted([_ for _ in os.listdir(srcdir) if _.startswith('check_') and _.endswith('.py')])
+            else:
+                plugins = [_.strip() for _ in preload.split(',') if _.strip()]
+            log_option('preload', plugins)
+            self.runner.loader.preload(plugins)
+
+    def run(self):
+        # long running - disable the default self-timeout
+        signal.alarm(0)
+        if os.path.exists(self.socket):
+            log.info('removing stale socket %s', self.socket)
+            os.unlink(self.socket)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, loop.stop)
+        umask = os.umask(0o177)
+        try:
+            self.server = loop.run_until_complete(asyncio.start_unix_server(self.handle, path=self.socket))
+        finally:
+            os.umask(umask)
+        log.info('listening on %s', self.socket)
+        try:
+            loop.run_forever()
+        finally:
+            log.info('shutting down after %s requests', self.requests)
+            self.server.close()
+            if os.path.exists(self.socket):
+                os.unlink(self.socket)
+        sys.exit(ERRORS['OK'])
+
+    async def handle(self, reader, writer):
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line.decode('utf-8'))
+            except ValueError as _:
+                result = PluginResult(ERRORS['UNKNOWN'], 'UNKNOWN: invalid request to plugin runner daemon: {0}'\
+                                                         .format(_))
+            else:
+                result = await self.process_request(request)
+            writer.write(json.dumps(result.to_dict()).encode('utf-8') + b'\n')
+            await writer.drain()
+        except (IOError, OSError) as _:
+            log.warning('client connection error: %s', _)
+        finally:
+            writer.close()
+
+    async def process_request(self, request):
+        if request.get('ping'):
+            return PluginResult(ERRORS['OK'], 'OK: plugin runner daemon version {0}, {1} plugins loaded, {2} requests'\
+                                              .format(__version__, len(self.runner.loader.plugins), self.requests))
+        argv = request.get('argv')
+        if not isinstance(argv, list) or not argv:
+            return PluginResult(ERRORS['UNKNOWN'], 'UNKNOWN: no plugin command line passed to plugin runner daemon')
+        self.requests += 1
+        log.info('request %s: %s', self.requests, ' '.join(argv))
+        return await self.runner.run([str(_) for _ in argv],
+                                     environ=request.get('env'),
+                                     cwd=request.get('cwd'))
+
+
+if __name__ == '__main__':
+    PluginRunnerDaemon().main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env bash
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 15:48:26 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn and optionally send me feedback to help improve or steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+set -euo pipefail
+[ -n "${DEBUG:-}" ] && set -x
+srcdir="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
+
+cd "$srcdir/..";
+
+# shellcheck disable=SC1090
+. "$srcdir/utils.sh"
+
+section "B e n c h m a r k s"
+
+# local tests with no dependencies, same as the adapter tests
+
+echo "Testing cold start import time budget of plugins with heavy optional dependencies"
+run ./benchmarks/benchmark_import_time.py -r 1 \
+    check_hbase_region_balance.py \
+    check_aws_api_ping.py \
+    check_kafka.py \
+    check_jenkins_job.py \
+    check_git_checkout_branch.py
+
+run_fail 2 ./benchmarks/benchmark_import_time.py -r 1 --budget 1 check_git_checkout_branch.py
+
+run_usage ./benchmarks/benchmark_import_time.py --help
+
+echo "Testing JSON decoder backends on small generated payloads"
+run ./benchmarks/benchmark_json_backends.py -n 100 -a 100 -q 100 -r 1
+
+run ./benchmarks/benchmark_json_backends.py -b json -n 100 -a 100 -q 100 -r 1
+
+run_usage ./benchmarks/benchmark_json_backends.py -b nonexistent
+
+run_usage ./benchmarks/benchmark_json_backends.py --help
+
+echo "Testing plugins parse small generated payloads served by the local stub server"
+run ./benchmarks/benchmark_parse.py -n 10 -a 10 -s 10 -q 10
+
+run ./benchmarks/benchmark_parse.py -n 10 -a 10 -s 10 -q 10 --include presto --json
+
+run_usage ./benchmarks/benchmark_parse.py --include nonexistent
+
+run_usage ./benchmarks/benchmark_parse.py --help
+
+echo "Testing event driven HTML extraction against BeautifulSoup on small generated HBase UI pages"
+run ./benchmarks/benchmark_html_extract.py -s 10 -i 5 -g 10 -r 1
+
+run_usage ./benchmarks/benchmark_html_extract.py --help
+
+echo "Testing field selective decoding of HDFS LiveNodes against full JSON decoding on small generated payloads"
+run ./benchmarks/benchmark_hdfs_nodes.py -n 10,100 -r 1
+
+run ./benchmarks/benchmark_hdfs_nodes.py -n 10 -b json -r 1
+
+run_usage ./benchmarks/benchmark_hdfs_nodes.py -b nonexistent
+
+run_usage ./benchmarks/benchmark_hdfs_nodes.py --help
+
+# defined and tracked in bash-tools/lib/utils.sh
+# shellcheck disable=SC2154
+echo "Completed $run_count Benchmark tests"
+echo
+echo "All Benchmark tests completed successfully"
+echo
+echo
@@ -61,6 +61,8 @@ if is_docker_available; then
 
     run ./check_docker_api_ping.py
 
+    run_grep ' total_time=[[:digit:].]\+ms$' ./check_docker_api_ping.py --timings
+
     echo "checking connection refused:"
     DOCKER_HOST=tcp://127.0.0.1:23760 ERRCODE=2 run_grep 'Connection refused' ./check_docker_api_ping.py
 
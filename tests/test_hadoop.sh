@@ -308,6 +308,13 @@ EOF
     #docker exec $DOCKER_CONTAINER pip install docker
     ERRCODE="0 1" docker_exec check_hadoop_hdfs_rack_resilience.py
 
+    # the second run uses the topology cached by the first, UNKNOWN on Hadoop versions without the rack in LiveNodes
+    run_fail "0 1 3" ./check_hadoop_hdfs_rack_resilience.py --namenode "$HADOOP_HOST:$HADOOP_NAMENODE_PORT"
+    run_fail "0 1 3" ./check_hadoop_hdfs_rack_resilience.py --namenode "$HADOOP_HOST:$HADOOP_NAMENODE_PORT" -v
+    run_fail "0 1 3" ./check_hadoop_hdfs_rack_resilience.py --namenode "$HADOOP_HOST:$HADOOP_NAMENODE_PORT" --topology-cache-ttl 0
+
+    run_fail 2 ./check_hadoop_hdfs_rack_resilience.py --namenode "$HADOOP_HOST:1"
+
     run "$perl" -T ./check_hadoop_hdfs_space.pl
 
     run_conn_refused "$perl" -T ./check_hadoop_hdfs_space.pl
@@ -316,6 +323,37 @@ EOF
 
     run_conn_refused ./check_hadoop_hdfs_space.py
 
+    echo "Testing shared response cache between NameNodeInfo plugins:"
+    cache_dir="$(mktemp -d /tmp/nagios_plugins_cache.XXXXXX)"
+
+    run ./check_hadoop_hdfs_space.py --cache-ttl 60 --cache-dir "$cache_dir"
+
+    run_grep 'using cached response for ' ./check_hadoop_hdfs_balance.py -w 5 -c 10 --cache-ttl 60 --cache-dir "$cache_dir" -vv
+
+    run_grep 'using cached response for ' ./check_hadoop_datanodes_block_balance.py -w 5 -c 10 --cache-ttl 60 --cache-dir "$cache_dir" -vv
+
+    rm -fr "$cache_dir"
+
+    echo "Testing NameNodeInfo multi-check from one JMX fetch:"
+    run ./check_hadoop_hdfs_health.py --balance-warning 5 --balance-critical 10 \
+                                      --block-balance-warning 5 --block-balance-critical 10
+
+    run ./check_hadoop_hdfs_health.py --checks space,corrupt-files,failed-namedirs -v
+
+    run ./check_hadoop_hdfs_health.py --datanode "$hostname" --balance-warning 5 --balance-critical 10 \
+                                      --block-balance-warning 5 --block-balance-critical 10
+
+    run_fail 3 ./check_hadoop_hdfs_health.py --checks last-contact --datanode "nonexistentnode"
+
+    run_grep ';HDFS Space;0;OK: ' ./check_hadoop_hdfs_health.py --passive --checks space,balance --balance-warning 5 --balance-critical 10
+
+    run_usage ./check_hadoop_hdfs_health.py --checks space,nonexistentcheck
+
+    run_conn_refused ./check_hadoop_hdfs_health.py
+
+    echo "Testing per phase --timings perfdata:"
+    run_grep ' dns_time=[[:digit:].]\+ms connect_time=[[:digit:].]\+ms ttfb_time=.* total_time=[[:digit:].]\+ms$' ./check_hadoop_hdfs_space.py --timings
+
     # XXX: these ports must be left as this plugin is generic and has no default port, nor does it pick up any environment variables more specific than $PORT
     run "$perl" -T ./check_hadoop_jmx.pl --all -P "$HADOOP_NAMENODE_PORT"
 
@@ -380,6 +418,30 @@ EOF
     run_conn_refused ./check_hadoop_resource_manager_java_gc.py
     run_conn_refused ./check_hadoop_node_manager_java_gc.py
 
+    echo "Testing Java GC --rate, the first run records the baseline:"
+    run ./check_hadoop_namenode_java_gc.py --rate -w 100 -c 100
+    run ./check_hadoop_namenode_java_gc.py --rate -w 100 -c 100
+    run ./check_hadoop_datanode_java_gc.py --rate -w 100 -c 100
+    run ./check_hadoop_datanode_java_gc.py --rate -w 100 -c 100 -v
+
+    echo "Testing Java GC sweep of the DataNodes / NodeManagers discovered from the NameNode / Resource Manager:"
+    # discovered nodes may advertise container addresses not reachable from here, which are reported as UNKNOWN
+    run_fail "0 3" ./check_hadoop_datanode_java_gc.py --namenode "$HADOOP_HOST:$HADOOP_NAMENODE_PORT" -P "$HADOOP_DATANODE_PORT"
+    run_fail "0 3" ./check_hadoop_node_manager_java_gc.py --resource-manager "$HADOOP_HOST:$HADOOP_YARN_RESOURCE_MANAGER_PORT" --heap-warning 95 --heap-critical 99 --top 3
+    run_fail "0 3" ./check_hadoop_datanode_java_gc.py --namenode "$HADOOP_HOST:$HADOOP_NAMENODE_PORT" --rate -w 100 -c 100
+    run_fail "0 3" ./check_hadoop_datanode_java_gc.py --namenode "$HADOOP_HOST:$HADOOP_NAMENODE_PORT" --rate -w 100 -c 100
+
+    run_fail 3 ./check_hadoop_datanode_java_gc.py --namenode "$HADOOP_HOST:$HADOOP_NAMENODE_PORT" --hosts "$HADOOP_HOST"
+
+    run_fail 2 ./check_hadoop_datanode_java_gc.py --namenode "$HADOOP_HOST:1"
+
+    echo "Testing --hosts fan-out:"
+    run ./check_hadoop_datanode_java_gc.py --hosts "$HADOOP_HOST,127.0.0.1"
+
+    run_fail 2 ./check_hadoop_datanode_java_gc.py --hosts "$HADOOP_HOST,nonexistenthost"
+
+    run ./check_hadoop_datanode_java_gc.py --hosts "$HADOOP_HOST,nonexistenthost" --hosts-min-ok 1
+
     # ================================================
     check_newer_plugins
 
@@ -239,6 +239,13 @@ EOF
 
     run_fail 2 ./check_hbase_hbck.py -f tests/data/hbck-inconsistencies.log -a 3
 
+    # just the summary, without the ERROR lines for per table and category perfdata
+    tail -n 30 tests/data/hbck-inconsistencies.log > /tmp/hbck-inconsistencies-tail.log
+
+    run_fail 2 ./check_hbase_hbck.py -f /tmp/hbck-inconsistencies-tail.log -a 0
+
+    rm -f /tmp/hbck-inconsistencies-tail.log
+
     run_fail 3 ./check_hbase_hbck.py -f nonexistent_file
 
     run ./check_hbase_master_java_gc.py -w 10 -c 10
@@ -250,6 +257,10 @@ EOF
     run_conn_refused ./check_hbase_master_java_gc.py
     run_conn_refused ./check_hbase_regionserver_java_gc.py
 
+    echo "Testing Java GC --rate, the first run records the baseline:"
+    run ./check_hbase_master_java_gc.py --rate -w 100 -c 100
+    run ./check_hbase_master_java_gc.py --rate -w 100 -c 100
+
 # ============================================================================ #
 
     # HBase versions 1.0 and <= 0.96 don't seem to report when balancer is disabled in UI
@@ -447,6 +458,11 @@ EOF
         run_fail 3 ./check_hbase_regionserver_compaction_in_progress.py
     else
         run ./check_hbase_regionserver_compaction_in_progress.py
+
+        # RegionServers are discovered by their container hostnames which may not resolve from outside Docker
+        run_fail "0 3" ./check_hbase_regionserver_compaction_in_progress.py --master "$HBASE_HOST:$HBASE_MASTER_PORT" --top 5
+
+        run_fail "0 3" ./check_hbase_regionserver_compaction_in_progress.py --master "$HBASE_HOST:$HBASE_MASTER_PORT" -w 10 -c 100
     fi
 
     echo "ensuring Stargate Server is properly online before running this test:"
@@ -471,6 +487,60 @@ EOF
 
     run_conn_refused ./check_hbase_regionservers_requests_balance.py
 
+    if ! [[ "$version" =~ ^0\.9[0-4]$ ]]; then
+        echo "Testing windowed requests balance from request counters sampled across runs:"
+        state_file="$(mktemp /tmp/hbase_requests_balance.XXXXXX)"
+        rm -f "$state_file"
+
+        # first run has no earlier samples so falls back to the instantaneous requests per second
+        run ./check_hbase_regionservers_requests_balance.py --window 300 --state-file "$state_file"
+
+        sleep 2
+
+        run ./check_hbase_regionservers_requests_balance.py --window 300 --state-file "$state_file" -v
+
+        run_usage ./check_hbase_regionservers_requests_balance.py --window -1
+
+        rm -f "$state_file"
+    fi
+
+    if ! [[ "$version" =~ ^0\.9[0-4]$ ]]; then
+        echo "Testing shared HMaster status snapshot cache between HBase Master UI plugins:"
+        cache_dir="$(mktemp -d /tmp/nagios_plugins_cache.XXXXXX)"
+
+        run ./check_hbase_region_balance.py --cache-ttl 60 --cache-dir "$cache_dir"
+
+        run ./check_hbase_num_regions_in_transition.py --cache-ttl 60 --cache-dir "$cache_dir"
+
+        run ./check_hbase_regions_stuck_in_transition.py --cache-ttl 60 --cache-dir "$cache_dir"
+
+        run ./check_hbase_regionservers_requests_balance.py --cache-ttl 60 --cache-dir "$cache_dir" -vv
+
+        rm -fr "$cache_dir"
+    fi
+
+    if ! [[ "$version" =~ ^0\.9[0-4]$ ]]; then
+        echo "Testing regions in transition checks from JMX with detection of HBASE-16636 against the HTML Master UI:"
+        cache_dir="$(mktemp -d /tmp/nagios_plugins_cache.XXXXXX)"
+
+        run ./check_hbase_num_regions_in_transition.py --source jmx
+
+        run ./check_hbase_num_regions_in_transition.py --source html
+
+        run_usage ./check_hbase_num_regions_in_transition.py --source nonexistent
+
+        # JMX and the HTML both reporting no regions in transition on a healthy cluster must not be cached as JMX being
+        # trusted, as that is also what versions affected by HBASE-16636 report, so consecutive runs stay undetermined
+        # and only check against the HTML page periodically
+        run_grep 'JMX regions in transition bug not determined yet, checked against the HTML Master UI' ./check_hbase_num_regions_in_transition.py --cache-dir "$cache_dir" -vv
+
+        run_grep 'JMX regions in transition bug = None' ./check_hbase_regions_stuck_in_transition.py --cache-dir "$cache_dir" -vv
+
+        run_grep 'trusting it as already checked against the HTML Master UI' ./check_hbase_region_longest_migration_time.py --cache-dir "$cache_dir" -vv
+
+        rm -fr "$cache_dir"
+    fi
+
 # ============================================================================ #
 
     for x in "$perl -T ./check_hbase_cell.pl" ./check_hbase_cell.py "$perl -T ./check_hbase_cell_stargate.pl"; do
@@ -521,6 +591,30 @@ EOF
         run "$perl" -T ./check_hbase_cell_thrift.pl -T t1 -R r1 -C cf1:q1 -e "$uniq_val"
     fi
 
+    if ! [[ "$version" =~ ^0\.9[0-4]$ ]]; then
+        run ./check_hbase_cell.py -T t1 -R r1 -C cf1:q1 -e "$uniq_val" --samples 20
+
+        run ./check_hbase_cell.py --cell "t1,r1,cf1:q1,$uniq_val" --cell "t1,r2,cf1:q1,test" --cell "t1,r3,cf1:q1,5"
+
+        cells_file="$(mktemp /tmp/hbase_cells.XXXXXX)"
+        printf '# canary cells\n\nt1,r1,cf1:q1,%s\nt1,r2,cf1:q1\n' "$uniq_val" > "$cells_file"
+        run ./check_hbase_cell.py --cells-file "$cells_file" --cell "t1,r3,cf1:q1" --samples 5
+
+        run_fail 1 ./check_hbase_cell.py --cells-file "$cells_file" --cell "t1,r3,cf1:q1" -w 4 -c 10
+
+        run_fail 2 ./check_hbase_cell.py --cells-file "$cells_file" --cell "t1,nonExistentRow,cf1:q1"
+
+        run_fail 2 ./check_hbase_cell.py --cells-file "$cells_file" --cell "NonExistentTable,r1,cf1:q1"
+
+        run_fail 2 ./check_hbase_cell.py --cell "t1,r2,cf1:q1,wrongValue"
+
+        run_usage ./check_hbase_cell.py --cell "t1,r1"
+
+        run_usage ./check_hbase_cell.py --cells-file "$cells_file" -T t1 -R r1 -C cf1:q1
+
+        rm -f "$cells_file"
+    fi
+
 # ============================================================================ #
 
     # HBase <= 0.94 gets CRITICAL: IOError(message='t1')
@@ -528,6 +622,8 @@ EOF
         run_fail "0 2" ./check_hbase_write.py -T t1 -w 500 --precision 3
     else
         run ./check_hbase_write.py -T t1 -w 500 --precision 3
+
+        run ./check_hbase_write.py -T t1 -w 500 --precision 3 --samples 20 --percentile 95
     fi
 
     run_conn_refused ./check_hbase_write.py -T t1 -w 100 --precision 3
@@ -543,6 +639,10 @@ EOF
 
     run_fail 2 ./check_hbase_write.py -T NonExistentTable
 
+    run_usage ./check_hbase_write.py -T t1 --samples 0
+
+    run_usage ./check_hbase_write.py -T t1 --samples 10 --percentile 101
+
 # ============================================================================ #
 
     # setting hbase write --warning millisecs high as I want these tests to pass even on a loaded workstation or CI server
@@ -570,6 +670,10 @@ EOF
     # write to 100 regions...
     run ./check_hbase_write_spray.py -T HexStringSplitTable -w 700 --precision 3 -t 60
 
+    run ./check_hbase_write_spray.py -T HexStringSplitTable -w 700 --precision 3 -t 60 --num-threads 1
+
+    run ./check_hbase_write_spray.py -T HexStringSplitTable -w 700 --precision 3 -t 60 --num-threads 50
+
     run_fail 2 ./check_hbase_write_spray.py -T DisabledTable -t 5
 
     run_fail 2 ./check_hbase_write_spray.py -T NonExistentTable -t 5
@@ -631,6 +735,11 @@ EOF
 
         run ./check_hbase_table_region_balance.py -T DisabledTable
 
+        # HBase <= 0.94 has .META. rather than hbase:meta
+        run_grep "worst region imbalance for table '" ./check_hbase_table_region_balance.py --all-tables
+
+        run_grep "worst region imbalance for table '" ./check_hbase_table_region_balance.py --all-tables --top 0 --batch-size 2
+
     fi
 
     # all tables
@@ -642,6 +751,8 @@ EOF
 
     run_fail 3 ./check_hbase_table_region_balance.py --list-tables
 
+    run_usage ./check_hbase_table_region_balance.py --all-tables -T t1
+
     docker_exec check_hbase_table_rowcount.pl -T t1 --hbase-bin /hbase/bin/hbase -w 3:3 -c 3:3 -t 60
 
     if is_zookeeper_built; then
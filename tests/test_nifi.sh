@@ -83,6 +83,10 @@ test_nifi(){
 
     run_conn_refused ./check_nifi_java_gc.py
 
+    echo "Testing Java GC --rate, the first run records the baseline:"
+    run ./check_nifi_java_gc.py --rate -w 100 -c 100
+    run ./check_nifi_java_gc.py --rate -w 100 -c 100
+
     # ============================================================================ #
 
     run ./check_nifi_processor_load_average.py
@@ -0,0 +1,121 @@
+#!/usr/bin/env bash
+#  vim:ts=4:sts=4:sw=4:et
+#
+#  Author: Hari Sekhon
+#  Date: 2026-10-18 11:41:19 +0100 (Sun, 18 Oct 2026)
+#
+#  https://github.com/HariSekhon/Nagios-Plugins
+#
+#  License: see accompanying Hari Sekhon LICENSE file
+#
+#  If you're using my code you're welcome to connect with me on LinkedIn and optionally send me feedback to help improve or steer this or other code I publish
+#
+#  https://www.linkedin.com/in/HariSekhon
+#
+
+set -euo pipefail
+[ -n "${DEBUG:-}" ] && set -x
+srcdir="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
+
+cd "$srcdir/..";
+
+# shellcheck disable=SC1090
+. "$srcdir/utils.sh"
+
+section "P l u g i n   R u n n e r   D a e m o n"
+
+# local tests with no dependencies, same as the adapter tests
+
+PLUGIN_RUNNER_SOCKET="$(mktemp -u /tmp/nagios_plugin_runner.sock.XXXXXX)"
+export PLUGIN_RUNNER_SOCKET
+
+current_branch="$(git branch | grep '^\*' | sed 's/^*[[:space:]]*//;s/[()]//g')"
+
+echo "Testing client falls back to executing the plugin directly when the daemon isn't running"
+run ./plugin_runner_client.py ./check_git_checkout_branch.py -d . -b "$current_branch"
+
+run_fail 2 ./plugin_runner_client.py ./check_git_checkout_branch.py -d . -b nonexistentbranch
+
+./plugin_runner_daemon.py --preload check_git_checkout_branch.py &
+daemon_pid=$!
+# shellcheck disable=SC2064
+trap "kill $daemon_pid &>/dev/null || :; rm -f '$PLUGIN_RUNNER_SOCKET'" EXIT
+
+for _ in {1..20}; do
+    [ -S "$PLUGIN_RUNNER_SOCKET" ] && break
+    sleep 0.5
+done
+hr
+
+echo "Testing via the daemon"
+run ./plugin_runner_client.py ./check_git_checkout_branch.py -d . -b "$current_branch"
+
+run_fail 2 ./plugin_runner_client.py ./check_git_checkout_branch.py -d . -b nonexistentbranch
+
+run_grep "^CRITICAL: git branch '.*' checked out, expecting branch 'nonexistentbranch'" ./plugin_runner_client.py ./check_git_checkout_branch.py -d . -b nonexistentbranch
+
+run_usage ./plugin_runner_client.py ./check_git_checkout_branch.py --help
+
+run_fail 3 ./plugin_runner_client.py nonexistent_plugin.py
+
+run_usage ./plugin_runner_client.py
+
+kill "$daemon_pid"
+wait "$daemon_pid" || :
+
+hr
+echo "Testing batch runner"
+for manifest in tests/data/plugin_batch_manifest.yaml tests/data/plugin_batch_manifest.json; do
+    run_grep '^\[[[:digit:]]\+\] PROCESS_SERVICE_CHECK_RESULT;localhost;check_git_checkout_branch;2;CRITICAL: ' ./plugin_batch_runner.py -m "$manifest"
+
+    run_grep '^\[[[:digit:]]\+\] PROCESS_SERVICE_CHECK_RESULT;gitserver;Git Branch;2;CRITICAL: ' ./plugin_batch_runner.py -m "$manifest"
+
+    run_grep '^\[[[:digit:]]\+\] PROCESS_SERVICE_CHECK_RESULT;localhost;check_git_checkout_branch;3;.*usage: ' ./plugin_batch_runner.py -m "$manifest"
+
+    run_grep '"host": "gitserver", "service": "Git Branch"' ./plugin_batch_runner.py -m "$manifest" -f json -n 1
+
+    run_grep ';check_git_checkout_branch;2;CRITICAL: ' ./plugin_batch_runner.py -m "$manifest" --async-http
+done
+
+run_usage ./plugin_batch_runner.py -m nonexistent_manifest.yaml
+
+hr
+echo "Testing async HTTP transport uses the check_response_code set by the plugin on self.request"
+http_port="$(python3 -c 'import socket; s = socket.socket(); s.bind(("127.0.0.1", 0)); print(s.getsockname()[1])')"
+python3 -m http.server --bind 127.0.0.1 "$http_port" &>/dev/null &
+http_pid=$!
+manifest="$(mktemp /tmp/plugin_batch_manifest.XXXXXX.json)"
+# shellcheck disable=SC2064
+trap "kill $http_pid &>/dev/null || :; rm -f '$manifest' '$PLUGIN_RUNNER_SOCKET'" EXIT
+echo "{\"checks\": [\"./check_couchdb_database_exists.py -H 127.0.0.1 -P $http_port -d nonexistentdb\"]}" > "$manifest"
+sleep 1
+
+# the plugin's own check_response_code reports the missing database instead of the generic 404
+run_grep ";check_couchdb_database_exists;2;CRITICAL: CouchDB database 'nonexistentdb' does not exist" ./plugin_batch_runner.py -m "$manifest" --async-http
+
+kill "$http_pid"
+rm -f "$manifest"
+
+hr
+echo "Testing async HTTP transport replays responses to requests made with auth objects"
+# each run of the plugin creates a new auth object, eg. HTTPKerberosAuth, whose default repr contains its id
+run python3 -c "
+from requests.auth import HTTPDigestAuth
+from lib_request_recorder import ReplayRequestHandler, Suspend
+responses = {}
+handler = ReplayRequestHandler(None, responses)
+try:
+    handler.get('http://127.0.0.1/', auth=HTTPDigestAuth('user', 'password'))
+    raise AssertionError('request not suspended')
+except Suspend as _:
+    responses[_.request.key] = 'fetched response'
+assert handler.get('http://127.0.0.1/', auth=HTTPDigestAuth('user', 'password')) == 'fetched response'
+"
+
+# defined and tracked in bash-tools/lib/utils.sh
+# shellcheck disable=SC2154
+echo "Completed $run_count Plugin Runner tests"
+echo
+echo "All Plugin Runner tests completed successfully"
+echo
+echo